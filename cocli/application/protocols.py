@@ -11,7 +11,8 @@ class SearchProvider(Protocol):
         filters: Optional[Dict[str, Any]] = None,
         sort_by: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[str] = None
     ) -> List[SearchResult]:
         ...
 
@@ -53,7 +54,9 @@ class WorkerServiceProvider(Protocol):
 class ReportingServiceProvider(Protocol):
     campaign_name: str
     def get_environment_status(self) -> Dict[str, Any]: ...
-    def get_campaign_stats(self, campaign_name: Optional[str] = None) -> Dict[str, Any]: ...
+    def get_campaign_stats(
+        self, campaign_name: Optional[str] = None, recount: bool = False, background: bool = False
+    ) -> Dict[str, Any]: ...
     async def get_cluster_health(self) -> List[Dict[str, Any]]: ...
     def get_index_stats(self, campaign_name: Optional[str] = None) -> Dict[str, Any]: ...
     def save_cached_report(self, campaign_name: str, report_type: str, data: Dict[str, Any]) -> None: ...
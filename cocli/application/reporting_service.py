@@ -70,14 +70,18 @@ class ReportingService:
             "s3_data_root": s3_bucket
         }
 
-    def get_campaign_stats(self, campaign_name: Optional[str] = None) -> Dict[str, Any]:
+    def get_campaign_stats(
+        self, campaign_name: Optional[str] = None, recount: bool = False, background: bool = False
+    ) -> Dict[str, Any]:
         """
         Returns a comprehensive dictionary of campaign statistics.
-        Caches the result to disk.
+        Caches the result to disk. `recount` recounts every queue and listing
+        instead of reading the incrementally maintained counts; `background`
+        recounts stale counts on a thread instead (long-lived callers only).
         """
         target_campaign = campaign_name or self.campaign_name
         try:
-            stats = get_campaign_stats(target_campaign)
+            stats = get_campaign_stats(target_campaign, recount=recount, background=background)
             stats['last_updated'] = datetime.now(timezone.utc).isoformat()
             stats['campaign_name'] = target_campaign
             
@@ -223,6 +223,7 @@ class ServiceContainer(BaseModel):
         sort_by: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> List[SearchResult]:
         return self.search_service(
             search_query=search_query,
@@ -233,6 +234,7 @@ class ServiceContainer(BaseModel):
             sort_by=sort_by,
             limit=limit,
             offset=offset,
+            after=after,
         )
 
     def get_template_counts(
@@ -10,13 +10,17 @@ from typing import Any, Dict, List, Optional, Set
 from playwright.async_api import async_playwright, Browser, BrowserContext
 
 from ..core.queue.factory import get_queue_manager
+from ..core.queue.lease_buffer import LeaseBuffer
 from ..scrapers.google.google_maps import scrape_google_maps
 from ..models.campaigns.queues.gm_list import ScrapeTask
 from ..models.campaigns.indexes.google_maps_list_item import GoogleMapsListItem
 from ..models.campaigns.queues.gm_details import GmItemTask
 from ..models.campaigns.queues.base import QueueMessage
-from ..core.config import load_campaign_config
-from ..utils.playwright_utils import setup_optimized_context
+from ..core.config import load_campaign_config, load_scraper_settings
+from ..scrapers.google.gm_scraper.coordinator import new_maps_context
+from ..utils.playwright_utils import setup_optimized_context, setup_stealth_context
+from ..utils.browser_manager import BrowserContextPool, ContextFactory
+from ..enrichment.http_fast_path import HttpFetcher
 from ..utils.headers import ANTI_BOT_HEADERS, USER_AGENT
 from ..core.text_utils import slugify
 
@@ -39,6 +43,34 @@ class WorkerService:
             or self.aws_config.get("cocli_data_bucket_name") 
             or f"cocli-data-{self.campaign_name}"
         )
+        # Tasks claimed per poll round trip (0 = one per worker loop)
+        self.lease_batch_size = int(self.config.get("prospecting", {}).get("lease_batch_size", 0))
+
+    def _context_pool(self, browser: Browser, workers: int, context_factory: ContextFactory) -> BrowserContextPool:
+        """One warm context per worker loop, tuned by `prospecting.browser_pool` in the campaign config."""
+        pool_config = self.config.get("prospecting", {}).get("browser_pool", {})
+        return BrowserContextPool(
+            browser,
+            context_factory,
+            size=max(1, workers),
+            max_uses=int(pool_config.get("max_uses", 50)),
+            max_process_rss_mb=pool_config.get("max_process_rss_mb"),
+        )
+
+    def _http_fetcher(self) -> Optional[HttpFetcher]:
+        """Shared session for browserless enrichment, tuned by `prospecting.http_enrichment`."""
+        http_config = self.config.get("prospecting", {}).get("http_enrichment", {})
+        if not http_config.get("enabled", True):
+            return None
+        return HttpFetcher(
+            max_connections=int(http_config.get("max_connections", 100)),
+            per_host=int(http_config.get("per_host", 4)),
+        )
+
+    def _lease_buffer(self, queue: Any, workers: int) -> LeaseBuffer:
+        block = self.lease_batch_size or max(1, workers)
+        # Keep the local frontier topped up from S3 so the buffer never waits on a drain
+        return LeaseBuffer(queue, block_size=block, prefetch_low_watermark=max(50, block * 4))
 
     async def _watch_remote_config(self) -> None:
         """Watches for config updates received via gossip."""
@@ -189,7 +221,8 @@ class WorkerService:
     async def _run_scrape_task_loop(
         self,
         browser: Browser,
-        scrape_queue: Any,
+        context_pool: BrowserContextPool,
+        scrape_leases: LeaseBuffer,
         gm_list_item_queue: Any,
         s3_client: Any,
         debug: bool,
@@ -207,14 +240,13 @@ class WorkerService:
                 logger.error(f"Browser check failed: {e}")
                 break
 
-            tasks: List[ScrapeTask] = await asyncio.to_thread(scrape_queue.poll, batch_size=1)
-            if not tasks:
+            task: Optional[ScrapeTask] = await scrape_leases.get()
+            if task is None:
                 if once:
                     return
                 await asyncio.sleep(5)
                 continue
 
-            task = tasks[0]
             grid_tiles = None
             if task.tile_id:
                 grid_tiles = [{"id": task.tile_id, "center_lat": task.latitude, "center_lon": task.longitude, "center": {"lat": task.latitude, "lon": task.longitude}}]
@@ -236,6 +268,7 @@ class WorkerService:
                         s3_client=s3_client,
                         s3_bucket=self.bucket_name,
                         processed_by=self.processed_by,
+                        context_pool=context_pool,
                     ):
                         if not list_item.place_id:
                             continue
@@ -255,39 +288,37 @@ class WorkerService:
                     except Exception as res_err:
                         logger.warning(f"Failed to write batch result log: {res_err}")
 
-                scrape_queue.ack(task)
+                await scrape_leases.ack(task)
                 if once:
                     return
             except Exception as e:
                 logger.error(f"Task Failed: {e}")
-                scrape_queue.nack(task)
+                await scrape_leases.nack(task)
                 if "Target page, context or browser has been closed" in str(e):
                     break
 
     async def _run_details_task_loop(
         self,
-        context: BrowserContext,
-        gm_list_item_queue: Any,
+        context_pool: BrowserContextPool,
+        details_leases: LeaseBuffer,
         enrichment_queue: Any,
         s3_client: Any,
         debug: bool,
         once: bool,
     ) -> None:
         while True:
-            if not context.browser or not context.browser.is_connected():
+            if not context_pool.browser.is_connected():
                 break
 
-            tasks: List[GmItemTask] = await asyncio.to_thread(gm_list_item_queue.poll, batch_size=1)
-            if not tasks:
+            task: Optional[GmItemTask] = await details_leases.get()
+            if task is None:
                 if once:
                     return
                 await asyncio.sleep(5)
                 continue
 
-            task = tasks[0]
             try:
-                page = await context.new_page()
-                try:
+                async with context_pool.page() as page:
                     from .processors.google_maps import GoogleMapsDetailsProcessor
                     processor = GoogleMapsDetailsProcessor(processed_by=self.processed_by)
                     final_prospect_data = await processor.process(task, page, debug=debug)
@@ -295,25 +326,24 @@ class WorkerService:
                     if final_prospect_data and final_prospect_data.domain:
                         enrichment_queue.push(QueueMessage(domain=str(final_prospect_data.domain), company_slug=slugify(final_prospect_data.name), campaign_name=task.campaign_name, force_refresh=task.force_refresh, ack_token=None))
                     
-                    gm_list_item_queue.ack(task)
-                finally:
-                    await page.close()
+                    await details_leases.ack(task)
                 if once:
                     return
             except Exception as e:
                 logger.error(f"Detail Task Failed: {e}")
-                gm_list_item_queue.nack(task)
+                await details_leases.nack(task)
                 if once:
                     return
                 break
 
     async def _run_enrichment_task_loop(
         self,
-        context: BrowserContext,
-        enrichment_queue: Any,
+        context_pool: BrowserContextPool,
+        enrichment_leases: LeaseBuffer,
         debug: bool,
         once: bool,
         s3_client: Optional[Any] = None,
+        http_fetcher: Optional[HttpFetcher] = None,
     ) -> None:
         from ..core.enrichment import enrich_company_website
         from ..models.companies.company import Company
@@ -325,32 +355,32 @@ class WorkerService:
             return
 
         while True:
-            tasks: List[QueueMessage] = await asyncio.to_thread(enrichment_queue.poll, batch_size=1)
-            if not tasks:
+            task: Optional[QueueMessage] = await enrichment_leases.get()
+            if task is None:
                 if once:
                     return
                 await asyncio.sleep(5)
                 continue
 
-            task = tasks[0]
             try:
                 company = Company.get(task.company_slug) or Company(name=task.company_slug, domain=task.domain, slug=task.company_slug)
                 website_data = await enrich_company_website(
-                    browser=context, 
+                    browser=context_pool, 
                     company=company, 
                     campaign=campaign_obj, 
                     force=task.force_refresh, 
                     debug=debug,
-                    processed_by=self.processed_by
+                    processed_by=self.processed_by,
+                    http_fetcher=http_fetcher,
                 )
                 if website_data:
                     website_data.save(task.company_slug)
-                enrichment_queue.ack(task)
+                await enrichment_leases.ack(task)
                 if once:
                     return
             except Exception as e:
                 logger.error(f"Enrichment Task Failed: {e}")
-                enrichment_queue.nack(task)
+                await enrichment_leases.nack(task)
                 if once:
                     return
                 break
@@ -380,33 +410,56 @@ class WorkerService:
             s3_client = self.get_s3_client()
             scrape_q = get_queue_manager("scrape", use_cloud=True, queue_type="scrape", campaign_name=self.campaign_name, s3_client=s3_client)
             details_q = get_queue_manager("details", use_cloud=True, queue_type="gm_list_item", campaign_name=self.campaign_name, s3_client=s3_client)
-            tasks = [self._run_scrape_task_loop(browser, scrape_q, details_q, s3_client, debug, once, headless, workers) for _ in range(workers)]
-            await asyncio.gather(*tasks)
+            settings = load_scraper_settings()
+
+            async def maps_context(b: Browser) -> BrowserContext:
+                return await new_maps_context(b, settings.browser_width, settings.browser_height)
+
+            async with self._context_pool(browser, workers, maps_context) as context_pool, \
+                    self._lease_buffer(scrape_q, workers) as scrape_leases:
+                tasks = [self._run_scrape_task_loop(browser, context_pool, scrape_leases, details_q, s3_client, debug, once, headless, workers) for _ in range(workers)]
+                await asyncio.gather(*tasks)
             await browser.close()
 
     async def run_details_worker(self, headless: bool, debug: bool, once: bool = False, workers: int = 1, role: str = "full") -> None:
         self.role = role
         async with async_playwright() as p:
             browser = await self._launch_browser(p, headless)
-            context = await browser.new_context(user_agent=USER_AGENT, extra_http_headers=ANTI_BOT_HEADERS)
-            await setup_optimized_context(context)
+
+            async def details_context(b: Browser) -> BrowserContext:
+                context = await b.new_context(user_agent=USER_AGENT, extra_http_headers=ANTI_BOT_HEADERS)
+                await setup_optimized_context(context)
+                return context
+
             s3_client = self.get_s3_client()
             details_q = get_queue_manager("details", use_cloud=True, queue_type="gm_list_item", campaign_name=self.campaign_name, s3_client=s3_client)
             enrich_q = get_queue_manager("enrichment", use_cloud=True, queue_type="enrichment", campaign_name=self.campaign_name, s3_client=s3_client)
-            tasks = [self._run_details_task_loop(context, details_q, enrich_q, s3_client, debug, once) for _ in range(workers)]
-            await asyncio.gather(*tasks)
+            async with self._context_pool(browser, workers, details_context) as context_pool, \
+                    self._lease_buffer(details_q, workers) as details_leases:
+                tasks = [self._run_details_task_loop(context_pool, details_leases, enrich_q, s3_client, debug, once) for _ in range(workers)]
+                await asyncio.gather(*tasks)
             await browser.close()
 
     async def run_enrichment_worker(self, headless: bool, debug: bool, once: bool = False, workers: int = 1) -> None:
         async with async_playwright() as p:
             browser = await self._launch_browser(p, headless)
-            context = await browser.new_context(user_agent=USER_AGENT, extra_http_headers=ANTI_BOT_HEADERS)
-            from ..utils.playwright_utils import setup_stealth_context
-            await setup_stealth_context(context)
+
+            async def enrichment_context(b: Browser) -> BrowserContext:
+                context = await b.new_context(user_agent=USER_AGENT, extra_http_headers=ANTI_BOT_HEADERS)
+                await setup_stealth_context(context)
+                return context
+
             s3_client = self.get_s3_client()
             enrich_q = get_queue_manager("enrichment", use_cloud=True, queue_type="enrichment", campaign_name=self.campaign_name, s3_client=s3_client)
-            tasks = [self._run_enrichment_task_loop(context, enrich_q, debug, once, s3_client) for _ in range(workers)]
-            await asyncio.gather(*tasks)
+            http_fetcher = self._http_fetcher()
+            async with self._context_pool(browser, workers, enrichment_context) as context_pool, \
+                    self._lease_buffer(enrich_q, workers) as enrichment_leases:
+                try:
+                    tasks = [self._run_enrichment_task_loop(context_pool, enrichment_leases, debug, once, s3_client, http_fetcher) for _ in range(workers)]
+                    await asyncio.gather(*tasks)
+                finally:
+                    if http_fetcher:
+                        await http_fetcher.close()
             await browser.close()
 
     async def _push_supervisor_heartbeat(self, s3_client: Any, s: Dict[int, asyncio.Task[Any]], d: Dict[int, asyncio.Task[Any]], e: Dict[int, asyncio.Task[Any]]) -> None:
@@ -246,14 +246,14 @@ def coverage_gap(
     report_data = []
     scraped_count = 0
     
+    tiles = []
     for tile in target_tiles:
         lat = tile.get("center_lat") or tile.get("center", {}).get("lat")
         lon = tile.get("center_lon") or tile.get("center", {}).get("lon")
-        tile_id = tile.get("id")
-        
+
         if lat is None or lon is None:
             continue
-            
+
         step = DEFAULT_GRID_STEP_DEG
         half_step = step / 2.0
         bounds = {
@@ -262,18 +262,27 @@ def coverage_gap(
             "lon_min": float(lon) - half_step,
             "lon_max": float(lon) + half_step
         }
-        
+        tiles.append((tile.get("id"), lat, lon, bounds))
+
+    # One batched index query per phrase instead of one per tile and phrase
+    all_bounds = [bounds for _, _, _, bounds in tiles]
+    matches_by_phrase = {
+        phrase: scrape_index.query_many(phrase, all_bounds, overlap_threshold_percent=90.0)
+        for phrase in search_phrases
+    }
+
+    for i, (tile_id, lat, lon, bounds) in enumerate(tiles):
         latest_date: Optional[datetime] = None
         matching_phrase: Optional[str] = None
-        
+
         for phrase in search_phrases:
-            match = scrape_index.is_area_scraped(phrase, bounds, overlap_threshold_percent=90.0)
+            match = matches_by_phrase[phrase][i]
             if match:
                 scraped_area, _ = match
                 if latest_date is None or scraped_area.scrape_date > latest_date:
                     latest_date = scraped_area.scrape_date
                     matching_phrase = phrase
-        
+
         if latest_date:
             scraped_count += 1
             
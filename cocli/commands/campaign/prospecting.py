@@ -4,8 +4,10 @@ import logging
 import toml
 import json
 import csv
-from typing import Optional, List, Dict, Any, cast, Annotated
+from typing import Optional, List, Dict, Any, Iterator, cast, Annotated
 from pathlib import Path
+
+import numpy as np
 from rich.console import Console
 from rich.progress import (
     Progress,
@@ -24,7 +26,12 @@ from cocli.core.scrape_index import ScrapeIndex
 from cocli.core.text_utils import slugify
 from cocli.core.location_prospects_index import LocationProspectsIndex
 from cocli.core.queue.factory import get_queue_manager
-from cocli.planning.generate_grid import get_campaign_grid_tiles
+from cocli.planning.generate_grid import (
+    TilePlan,
+    get_campaign_grid_tiles,
+    get_campaign_tile_plan,
+    tile_ids_to_keys,
+)
 from cocli.models.campaigns.queues.gm_list import ScrapeTask
 from cocli.models.companies.company import Company
 from cocli.scrapers.google.google_maps import scrape_google_maps
@@ -283,6 +290,68 @@ async def pipeline(
                 stop_event.set()
 
 
+def _pending_tiles(
+    plan: TilePlan,
+    phrase: str,
+    scrape_index: ScrapeIndex,
+    ttl_days: int,
+    require_tile_id: bool,
+) -> np.ndarray:
+    """
+    Mask of planned tiles still to scrape for a phrase. Tiles with a fresh
+    witness are removed with one set difference; only the remainder goes
+    through the legacy tile files and the 90% overlap check.
+    """
+    mask = plan.uncovered(tile_ids_to_keys(scrape_index.witness_tile_ids(phrase, ttl_days=ttl_days)))
+    tile_ids = plan.tile_ids()
+    remaining = [
+        i for i in np.flatnonzero(mask).tolist()
+        if not scrape_index.is_tile_scraped(phrase, tile_ids[i], ttl_days=ttl_days)
+    ]
+    mask[:] = False
+    if not remaining:
+        return mask
+
+    center_lats, center_lons = plan.centers()
+    bounds = [
+        {
+            "lat_min": center_lats[i] - 0.05,
+            "lat_max": center_lats[i] + 0.05,
+            "lon_min": center_lons[i] - 0.05,
+            "lon_max": center_lons[i] + 0.05,
+        }
+        for i in remaining
+    ]
+    matches = scrape_index.query_many(phrase, bounds, overlap_threshold_percent=90.0)
+    for i, match in zip(remaining, matches):
+        mask[i] = not (match and (not require_tile_id or match[0].tile_id))
+    return mask
+
+
+def _iter_scrape_tasks(
+    plan: TilePlan,
+    search_phrases: List[str],
+    pending: Dict[str, np.ndarray],
+    campaign_name: str,
+) -> Iterator[ScrapeTask]:
+    """Builds the pending gm-list tasks one at a time, tile by tile."""
+    any_pending = np.logical_or.reduce([pending[p] for p in search_phrases])
+    tile_ids = plan.tile_ids()
+    center_lats, center_lons = plan.centers()
+    for i in np.flatnonzero(any_pending).tolist():
+        for phrase in search_phrases:
+            if pending[phrase][i]:
+                yield ScrapeTask(
+                    latitude=LatScale1(root=float(center_lats[i])),
+                    longitude=LonScale1(root=float(center_lons[i])),
+                    zoom=13,
+                    search_phrase=phrase,
+                    campaign_name=campaign_name,
+                    tile_id=tile_ids[i],
+                    ack_token=None,
+                )
+
+
 @app.command(name="queue-scrapes")
 def queue_scrapes(
     campaign_name: Optional[str] = typer.Argument(None),
@@ -309,57 +378,24 @@ def queue_scrapes(
         config = toml.load(f)
     search_phrases = config.get("prospecting", {}).get("queries", [])
 
-    grid_tiles = get_campaign_grid_tiles(campaign_name)
-    tasks_to_queue = []
-    total_combinations = 0
+    plan = get_campaign_tile_plan(campaign_name)
+    pending: Dict[str, np.ndarray] = {}
+    total_combinations = len(plan) * len(search_phrases)
 
-    if grid_tiles:
+    if len(plan):
         scrape_index = ScrapeIndex()
-
-        total_combinations = len(grid_tiles) * len(search_phrases)
-
-        for tile in grid_tiles:
-            lat = tile.get("center_lat") or tile.get("center", {}).get("lat")
-            lon = tile.get("center_lon") or tile.get("center", {}).get("lon")
-            tile_id = tile.get("id")
-            if lat and lon and tile_id:
-                # bounds for 0.1 degree tile
-                bounds = {
-                    "lat_min": float(lat) - 0.05,
-                    "lat_max": float(lat) + 0.05,
-                    "lon_min": float(lon) - 0.05,
-                    "lon_max": float(lon) + 0.05,
-                }
-                for phrase in search_phrases:
-                    if not force:
-                        # 1. Direct Tile Check (Fastest)
-                        match_area = scrape_index.is_tile_scraped(
-                            phrase, tile_id, ttl_days=30
-                        )
-                        if match_area:
-                            continue
-
-                        # 2. Overlap Check (Legacy and Robustness)
-                        match = scrape_index.is_area_scraped(
-                            phrase, bounds, overlap_threshold_percent=90.0
-                        )
-                        if match and (include_legacy or match[0].tile_id):
-                            continue
-
-                    tasks_to_queue.append(
-                        ScrapeTask(
-                            latitude=LatScale1(root=float(lat)),
-                            longitude=LonScale1(root=float(lon)),
-                            zoom=13,
-                            search_phrase=phrase,
-                            campaign_name=campaign_name,
-                            tile_id=tile.get("id"),
-                            ack_token=None,
-                        )
-                    )
+        for phrase in search_phrases:
+            if force:
+                pending[phrase] = np.ones(len(plan), dtype=bool)
+            else:
+                pending[phrase] = _pending_tiles(
+                    plan, phrase, scrape_index, ttl_days=30,
+                    require_tile_id=not include_legacy,
+                )
+    pending_count = sum(int(mask.sum()) for mask in pending.values())
 
     if dry_run:
-        covered = total_combinations - len(tasks_to_queue)
+        covered = total_combinations - pending_count
         covered_pct = (
             (covered / total_combinations * 100) if total_combinations > 0 else 0
         )
@@ -369,11 +405,11 @@ def queue_scrapes(
             f"  Already Covered:                {covered} ({covered_pct:.1f}%)"
         )
         console.print(
-            f"  [bold yellow]Remaining to Scrape:            {len(tasks_to_queue)}[/bold yellow]"
+            f"  [bold yellow]Remaining to Scrape:            {pending_count}[/bold yellow]"
         )
         return
 
-    if tasks_to_queue:
+    if pending_count:
         # Silence verbose libraries
         logging.getLogger("botocore").setLevel(logging.WARNING)
         logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -401,16 +437,16 @@ def queue_scrapes(
             console=console,
         ) as progress:
             task_id = progress.add_task(
-                f"[cyan]Pushing {len(tasks_to_queue)} tasks...[/cyan]",
-                total=len(tasks_to_queue),
+                f"[cyan]Pushing {pending_count} tasks...[/cyan]",
+                total=pending_count,
             )
 
-            for task in tasks_to_queue:
+            for task in _iter_scrape_tasks(plan, search_phrases, pending, campaign_name):
                 queue_manager.push(task)
                 progress.advance(task_id)
 
         console.print(
-            f"[bold green]Successfully queued {len(tasks_to_queue)} scrape tasks.[/bold green]"
+            f"[bold green]Successfully queued {pending_count} scrape tasks.[/bold green]"
         )
     else:
         console.print(
@@ -453,10 +489,10 @@ def queue_batch(
         config = toml.load(f)
     search_phrases = config.get("prospecting", {}).get("queries", [])
 
-    grid_tiles = get_campaign_grid_tiles(campaign_name)
+    grid_tiles = get_campaign_tile_plan(campaign_name)
     tasks_to_queue = []
 
-    if grid_tiles:
+    if len(grid_tiles):
         scrape_index = ScrapeIndex()
 
         for tile in grid_tiles:
@@ -10,11 +10,12 @@ console = Console()
 
 @app.command()
 def compile_enrichment(
-    campaign: Optional[str] = typer.Option(None, "--campaign", "-c", help="Campaign name to filter by")
+    campaign: Optional[str] = typer.Option(None, "--campaign", "-c", help="Campaign name to filter by"),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w", help="Processes used to load companies (default: CPU count)"),
 ) -> None:
     """
     Compiles enrichment data from various sources into the main company _index.md files.
     """
     compiler = EnrichmentCompiler()
-    compiler.run(campaign_name=campaign)
+    compiler.run(campaign_name=campaign, workers=workers)
     console.print("[bold green]Enrichment compilation complete.[/bold green]")
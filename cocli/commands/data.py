@@ -514,3 +514,29 @@ def queue_compact(
             f"[red]Error: Unknown queue '{queue_name}'. Currently supported: gm-list[/red]"
         )
         raise typer.Exit(1)
+
+
+@queue_app.command(name="rebuild-catalog")
+def queue_rebuild_catalog(
+    campaign: str = typer.Option("roadmap", "--campaign", "-c", help="Campaign name"),
+    queue_name: str = typer.Argument(
+        ..., help="Queue name to reindex (e.g., gm-details, enrichment)"
+    ),
+) -> None:
+    """Rebuild a queue's pending-task catalog from its pending directory tree.
+
+    Example: cocli data queue rebuild-catalog gm-details
+    """
+    from cocli.core.paths import paths
+    from cocli.core.queue.pending_catalog import PendingCatalog
+
+    queue_base = paths.queue(campaign, queue_name)
+    if not (queue_base / "pending").exists():
+        console.print(f"[red]Error: No pending directory for queue '{queue_name}'[/red]")
+        raise typer.Exit(1)
+
+    catalog = PendingCatalog(queue_base / "pending", queue_base / "pending.catalog.usv")
+    count = catalog.rebuild()
+    console.print(
+        f"[green]Rebuilt catalog for '{queue_name}': {count} pending tasks.[/green]"
+    )
@@ -5,6 +5,7 @@ import yaml
 
 from cocli.core.utils import generate_company_hash
 from cocli.core.config import get_companies_dir
+from cocli.core.lookup_index import LookupIndex
 
 logger = logging.getLogger(__name__)
 app = typer.Typer()
@@ -41,6 +42,14 @@ def deduplicate(
         logger.info("No companies found to deduplicate.")
         raise typer.Exit()
 
+    # Companies sharing a domain or place_id are duplicates whatever their address says
+    shared = LookupIndex({"domain": ("domain",), "place_id": ("place_id",)})
+    for company in all_companies:
+        shared.add(company)
+    for key in shared.key_fields:
+        for value, rows in shared.duplicates(key).items():
+            logger.info(f"{len(rows)} companies share {key} {value}: {', '.join(r['file_path'] for r in rows)}")
+
     df = pd.DataFrame(all_companies)
     
     df['hash_id'] = df.apply(generate_company_hash, axis=1)
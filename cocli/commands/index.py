@@ -6,6 +6,7 @@ from pathlib import Path
 
 from datetime import datetime
 from rich.console import Console
+from rich.table import Table
 
 console = Console()
 logger = logging.getLogger(__name__)
@@ -111,12 +112,12 @@ def compact(
                 progress.update(task_iso, description=f"[green]Isolated {moved} files.")
                 
                 # 3. Ingest
-                task_ingest = progress.add_task("Downloading staging data...", total=None)
+                task_ingest = progress.add_task("Streaming staging data from S3...", total=None)
                 manager.acquire_staging()
                 progress.update(task_ingest, description="[green]Staging data acquired.")
                 
                 # 4. Merge
-                task_merge = progress.add_task("Merging checkpoint (DuckDB)...", total=None)
+                task_merge = progress.add_task("Merging checkpoint...", total=None)
                 manager.merge()
                 progress.update(task_merge, description="[green]Merge complete.")
                 
@@ -134,6 +135,15 @@ def compact(
                 manager.release_lock()
                 
         console.print("[bold green]Compaction workflow finished successfully.[/bold green]")
+        if manager.metrics:
+            table = Table(title="Compaction phases")
+            table.add_column("Phase")
+            table.add_column("Objects", justify="right")
+            table.add_column("MB", justify="right")
+            table.add_column("Seconds", justify="right")
+            for phase, m in manager.metrics.items():
+                table.add_row(phase, str(m.objects), f"{m.bytes / 1024 / 1024:.2f}", f"{m.seconds:.2f}")
+            console.print(table)
         
     except Exception as e:
         console.print(f"[bold red]Compaction failed: {e}[/bold red]")
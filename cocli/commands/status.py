@@ -15,7 +15,8 @@ logger = logging.getLogger(__name__)
 def status(
     ctx: typer.Context,
     campaign: Optional[str] = typer.Option(None, help="The campaign to check."),
-    refresh: bool = typer.Option(False, "--refresh", "-r", help="Force a fresh stats generation (slow)."),
+    refresh: bool = typer.Option(False, "--refresh", "-r", help="Force a fresh stats generation."),
+    recount: bool = typer.Option(False, "--recount", help="Recount every queue and S3 listing from scratch (slow)."),
     local: bool = typer.Option(False, "--local", "-l", help="Force local filesystem reporting (skips S3)."),
 ) -> None:
     """
@@ -45,8 +46,8 @@ def status(
 
         # 2. Get stats (either from cache or fresh)
         stats: Optional[Dict[str, Any]] = None
-        if refresh:
-            stats = services.reporting_service.get_campaign_stats(effective_campaign)
+        if refresh or recount:
+            stats = services.reporting_service.get_campaign_stats(effective_campaign, recount=recount)
         else:
             stats = services.reporting_service.load_cached_report(effective_campaign, "status")
             if not stats:
@@ -161,8 +161,8 @@ def deploy(
 
     from cocli.core.reporting import get_campaign_stats, get_exclusions_data, get_queries_data, get_locations_data
     
-    # 2a. Main Report
-    stats = get_campaign_stats(campaign_name)
+    # 2a. Main Report (published, so recount rather than serve the last snapshot)
+    stats = get_campaign_stats(campaign_name, recount=True)
     report_key = f"reports/{campaign_name}.json"
     s3.put_object(Bucket=bucket_name, Key=report_key, Body=json.dumps(stats, indent=2), ContentType="application/json")
     console.print(f"  Uploaded main report to s3://{bucket_name}/{report_key}")
@@ -248,7 +248,7 @@ def report(
         console.print("[red]No campaign specified.[/red]")
         raise typer.Exit(1)
 
-    stats = get_campaign_stats(campaign_name)
+    stats = get_campaign_stats(campaign_name, recount=True)
     
     if output:
         with open(output, "w") as f:
@@ -1,7 +1,15 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..models.companies.company import Company
 
 class BaseCompiler(ABC):
     @abstractmethod
-    def compile(self, company_dir: Path) -> None:
+    def compile(self, company_dir: Path, company: Optional["Company"] = None) -> None:
+        """
+        Compiles enrichments into the company. `company` is the already-loaded
+        company from the run's snapshot; compilers load it themselves if omitted.
+        """
         pass
@@ -7,6 +7,7 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
 from ..core.config import get_companies_dir
+from ..core.company_loader import CompanySnapshot, company_dirs
 from .base import BaseCompiler
 
 console = Console()
@@ -37,35 +38,23 @@ class EnrichmentCompiler:
         ordered_compilers.extend(compilers_map.values())
         return ordered_compilers
 
-    def run(self, campaign_name: Optional[str] = None) -> None:
+    def run(self, campaign_name: Optional[str] = None, workers: Optional[int] = None) -> None:
         companies_dir = get_companies_dir()
         if not companies_dir.exists():
             console.print("[bold red]Error:[/bold red] Companies directory not found.")
             return
 
-        company_dirs = []
+        # Load every company once; the compilers share this snapshot instead of re-reading
+        with console.status("[bold blue]Loading companies...[/bold blue]"):
+            snapshot = CompanySnapshot.load(company_dirs(companies_dir), workers=workers)
+        console.print(f"[dim]{snapshot.stats.summary()}[/dim]")
+
         if campaign_name:
             # Filter by tags in the _index.md or tags.lst
             console.print(f"[bold blue]Filtering for campaign: {campaign_name}...[/bold blue]")
-            all_dirs = [d for d in companies_dir.iterdir() if d.is_dir()]
-            
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                console=console
-            ) as progress:
-                filter_task = progress.add_task("Identifying campaign members...", total=len(all_dirs))
-                for d in all_dirs:
-                    tags_file = d / "tags.lst"
-                    if tags_file.exists():
-                        tags = tags_file.read_text().splitlines()
-                        if campaign_name in tags:
-                            company_dirs.append(d)
-                    progress.advance(filter_task)
+            companies = snapshot.tagged(campaign_name)
         else:
-            company_dirs = [d for d in companies_dir.iterdir() if d.is_dir()]
+            companies = list(snapshot)
 
         with Progress(
             SpinnerColumn(),
@@ -74,8 +63,8 @@ class EnrichmentCompiler:
             TaskProgressColumn(),
             console=console
         ) as progress:
-            task = progress.add_task(f"Compiling enrichment ({len(company_dirs)} companies)...", total=len(company_dirs))
-            for company_dir in company_dirs:
+            task = progress.add_task(f"Compiling enrichment ({len(companies)} companies)...", total=len(companies))
+            for company_dir, company in companies:
                 for compiler in self.compilers:
-                    compiler.compile(company_dir)
+                    compiler.compile(company_dir, company)
                 progress.advance(task)
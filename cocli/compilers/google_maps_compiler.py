@@ -1,17 +1,27 @@
 import csv
 import yaml
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Optional, cast
 from rich.console import Console
 from .base import BaseCompiler
 from ..models.companies.company import Company
 from ..core.config import get_cocli_base_dir
+from ..core.lookup_index import GoogleMapsLookupIndex
 
 console = Console()
 
 class GoogleMapsCompiler(BaseCompiler):
-    def compile(self, company_dir: Path) -> None:
-        company = Company.from_directory(company_dir)
+    def __init__(self) -> None:
+        self._lookup: Optional[GoogleMapsLookupIndex] = None
+
+    def lookup_index(self) -> GoogleMapsLookupIndex:
+        """The turboship CSV lookup index, loaded (or rebuilt if its CSVs changed) once per compiler."""
+        if self._lookup is None:
+            self._lookup = GoogleMapsLookupIndex.for_campaign("turboship")
+        return self._lookup
+
+    def compile(self, company_dir: Path, company: Optional[Company] = None) -> None:
+        company = company or Company.from_directory(company_dir)
         if not company:
             return
         place_id = company.place_id
@@ -22,24 +32,9 @@ class GoogleMapsCompiler(BaseCompiler):
         if place_id:
             gm_data = self._get_gm_data_by_id(place_id, company_dir)
             
-        # 2. If no data yet, try to find it in the turboship campaign index by slug
+        # 2. If no data yet, try to find it in the turboship campaign index by slug or domain
         if not gm_data:
-            campaign_gm_index = get_cocli_base_dir() / "campaigns" / "turboship" / "indexes" / "google_maps_prospects"
-            if campaign_gm_index.exists():
-                for csv_file in campaign_gm_index.glob("*.csv"):
-                    try:
-                        with open(csv_file, 'r') as f:
-                            reader = csv.DictReader(f)
-                            for row in reader:
-                                row_slug = row.get("slug") or row.get("Slug")
-                                row_domain = row.get("domain") or row.get("Domain")
-                                if row_slug == company.slug or (company.domain and row_domain == company.domain):
-                                    gm_data = row
-                                    break
-                    except Exception:
-                        continue
-                    if gm_data:
-                        break
+            gm_data = self.lookup_index().first(slug=company.slug, domain=company.domain)
 
         if not gm_data:
             return
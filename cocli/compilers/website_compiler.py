@@ -2,7 +2,7 @@ import json
 import logging
 from pathlib import Path
 from datetime import datetime, UTC
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Optional
 import yaml
 from rich.console import Console
 
@@ -52,12 +52,12 @@ class WebsiteCompiler(BaseCompiler):
         
         console.print(f"[bold blue]Audit report saved to {report_path}[/bold blue]")
 
-    def compile(self, company_dir: Path) -> None:
+    def compile(self, company_dir: Path, company: Optional[Company] = None) -> None:
         website_md_path = company_dir / "enrichments" / "website.md"
         if not website_md_path.exists():
             return
 
-        company = Company.from_directory(company_dir)
+        company = company or Company.from_directory(company_dir)
         if not company:
             console.print(f"[bold yellow]Warning:[/bold yellow] Could not load company data for {company_dir.name}")
             return
@@ -1,15 +1,22 @@
 import os
 import re
+import json
 import logging
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
-from .config import get_cocli_base_dir, get_companies_dir, get_people_dir
+from .config import get_cocli_base_dir
 from ..models.companies.cache import CompanyCacheItem
 
 logger = logging.getLogger(__name__)
 
 CACHE_FILE_NAME = "company_cache.usv"
+MANIFEST_FILE_NAME = "company_cache.manifest.json"
+# Bump when the extraction logic changes so existing caches are rebuilt
+MANIFEST_VERSION = 1
+
+_build_lock = threading.Lock()
 
 
 def get_cache_path(campaign: Optional[str] = None) -> Path:
@@ -21,20 +28,72 @@ def get_cache_path(campaign: Optional[str] = None) -> Path:
     return base / "indexes" / "company_cache"
 
 
-def _get_most_recent_mtime(directory: Path) -> Optional[float]:
-    """Fast approach to check if any source files changed."""
-    if not directory.exists():
-        return None
-    max_mtime = directory.stat().st_mtime
+def _stat_signature(path: "os.PathLike[str] | str") -> List[int]:
+    """(mtime_ns, size) of a path, or zeros if it does not exist."""
     try:
-        with os.scandir(directory) as it:
+        st = os.stat(path)
+    except OSError:
+        return [0, 0]
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _scan_sources() -> Dict[str, Tuple[str, List[int]]]:
+    """
+    Stats every cache source without reading it. Keys are `company/<slug>` and
+    `person/<stem>`; a company's signature covers its _index.md, tags.lst and the
+    enrichments dir, so in-place edits inside the company dir are seen too.
+    """
+    from .paths import paths
+
+    sources: Dict[str, Tuple[str, List[int]]] = {}
+    companies_dir = paths.companies.path
+    people_dir = paths.people.path
+
+    if companies_dir.exists():
+        with os.scandir(companies_dir) as it:
             for entry in it:
-                mtime = entry.stat().st_mtime
-                if mtime > max_mtime:
-                    max_mtime = mtime
-    except Exception:
-        pass
-    return max_mtime
+                if not entry.is_dir():
+                    continue
+                # Plain string joins: pathlib dominates the cost of this scan
+                index_sig = _stat_signature(os.path.join(entry.path, "_index.md"))
+                if index_sig == [0, 0]:
+                    continue
+                signature = (
+                    index_sig
+                    + _stat_signature(os.path.join(entry.path, "tags.lst"))
+                    + _stat_signature(os.path.join(entry.path, "enrichments"))[:1]
+                )
+                sources[f"company/{entry.name}"] = (entry.path, signature)
+
+    if people_dir.exists():
+        with os.scandir(people_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(".md"):
+                    stat = entry.stat()
+                    sources[f"person/{entry.name[:-3]}"] = (
+                        entry.path,
+                        [stat.st_mtime_ns, stat.st_size],
+                    )
+    return sources
+
+
+def _load_manifest(cache_dir: Path) -> Optional[Dict[str, Any]]:
+    """
+    The manifest of the current cache file, or None if it is missing, from an
+    older extractor, or does not describe the cache file on disk.
+    """
+    manifest_file = cache_dir / MANIFEST_FILE_NAME
+    try:
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            manifest: Dict[str, Any] = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    if manifest.get("cache") != _stat_signature(cache_dir / CACHE_FILE_NAME):
+        # The cache was written by something else since
+        return None
+    return manifest
 
 
 def is_cache_valid(campaign: Optional[str] = None) -> bool:
@@ -57,24 +116,27 @@ def is_cache_valid(campaign: Optional[str] = None) -> bool:
                     return False
 
                 cols = first_line.split(UNIT_SEP)
-                # We expect 8 columns now: slug, name, type, domain, email, phone_number, tags, display
-                if len(cols) != 8:
+                expected = len(CompanyCacheItem.model_fields)
+                if len(cols) != expected:
                     logger.info(
-                        f"Cache schema mismatch (found {len(cols)} cols, expected 8). Invalidating."
+                        f"Cache schema mismatch (found {len(cols)} cols, expected {expected}). Invalidating."
                     )
                     return False
     except Exception:
         return False
 
-    # 2. Check MTime
-    cache_mtime = cache_file.stat().st_mtime
-    companies_mtime = _get_most_recent_mtime(get_companies_dir())
-    people_mtime = _get_most_recent_mtime(get_people_dir())
-
-    if companies_mtime is not None and companies_mtime > cache_mtime:
+    # 2. Compare every source's signature with the manifest
+    manifest = _load_manifest(cache_dir)
+    if manifest is None:
         return False
-    if people_mtime is not None and people_mtime > cache_mtime:
+    entries = manifest.get("entries", {})
+    sources = _scan_sources()
+    if len(sources) != len(entries):
         return False
+    for key, (_, signature) in sources.items():
+        known = entries.get(key)
+        if known is None or known[0] != signature:
+            return False
 
     return True
 
@@ -131,90 +193,148 @@ def _fast_extract_metadata(index_path: Path) -> Dict[str, Any]:
     return data
 
 
-def build_cache(campaign: Optional[str] = None) -> None:
-    """Builds the USV search cache and its datapackage.json."""
-    from .paths import paths
+def _extract_company(slug: str, company_dir: Path) -> CompanyCacheItem:
+    meta = _fast_extract_metadata(company_dir / "_index.md")
+    tags = meta.get("tags", [])
+    # tags.lst is the source of truth; frontmatter tags are the fallback
+    try:
+        listed = [
+            t.strip()
+            for t in (company_dir / "tags.lst").read_text(encoding="utf-8").splitlines()
+            if t.strip()
+        ]
+        if listed:
+            tags = listed
+    except OSError:
+        pass
 
-    logger.info(f"Building high-performance search cache for {campaign or 'global'}...")
-    items: List[CompanyCacheItem] = []
-    companies_dir = paths.companies.path
-    people_dir = paths.people.path
+    name = meta.get("name", slug)
+    return CompanyCacheItem(
+        slug=slug,
+        name=name,
+        type="company",
+        domain=meta.get("domain"),
+        email=meta.get("email"),
+        phone_number=meta.get("phone"),
+        average_rating=float(meta["average_rating"])
+        if meta.get("average_rating")
+        else None,
+        reviews_count=int(meta["reviews_count"])
+        if meta.get("reviews_count")
+        else None,
+        tags=tags,
+        display=f"COMPANY:{name} -- {slug}",
+    )
+
+
+def _extract_person(stem: str, person_file: Path) -> CompanyCacheItem:
+    meta = _fast_extract_metadata(person_file)
+    name = meta.get("name", stem)
+    return CompanyCacheItem(
+        slug=stem,
+        name=name,
+        type="person",
+        phone_number=meta.get("phone"),
+        tags=meta.get("tags", []),
+        display=f"PERSON:{name}",
+    )
+
+
+def _read_cache_rows(cache_file: Path) -> Dict[str, str]:
+    """The raw lines of the current cache file keyed like the manifest entries."""
+    from cocli.core.constants import UNIT_SEP
+
+    rows: Dict[str, str] = {}
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            for line in f:
+                cols = line.split(UNIT_SEP, 3)
+                if len(cols) > 3:
+                    rows[f"{cols[2]}/{cols[0]}"] = line
+    except OSError:
+        pass
+    return rows
 
-    if companies_dir.exists():
-        with os.scandir(companies_dir) as it:
-            for entry in it:
-                if entry.is_dir():
-                    idx_path = Path(entry.path) / "_index.md"
-                    if not idx_path.exists():
-                        continue
-
-                    meta = _fast_extract_metadata(idx_path)
-                    tags = meta.get("tags", [])
-                    if campaign and campaign not in tags:
-                        continue
-
-                    name = meta.get("name", entry.name)
-                    items.append(
-                        CompanyCacheItem(
-                            slug=entry.name,
-                            name=name,
-                            type="company",
-                            domain=meta.get("domain"),
-                            email=meta.get("email"),
-                            phone_number=meta.get("phone"),
-                            average_rating=float(meta["average_rating"])
-                            if meta.get("average_rating")
-                            else None,
-                            reviews_count=int(meta["reviews_count"])
-                            if meta.get("reviews_count")
-                            else None,
-                            tags=tags,
-                            display=f"COMPANY:{name} -- {entry.name}",
-                        )
-                    )
 
-    if people_dir.exists():
-        with os.scandir(people_dir) as it:
-            for entry in it:
-                if entry.is_file() and entry.name.endswith(".md"):
-                    meta = _fast_extract_metadata(Path(entry.path))
-                    tags = meta.get("tags", [])
-                    if campaign and campaign not in tags:
-                        continue
-
-                    name = meta.get("name", Path(entry.name).stem)
-                    items.append(
-                        CompanyCacheItem(
-                            slug=Path(entry.name).stem,
-                            name=name,
-                            type="person",
-                            phone_number=meta.get("phone"),
-                            tags=tags,
-                            display=f"PERSON:{name}",
-                        )
-                    )
+def build_cache(campaign: Optional[str] = None, full: bool = False) -> None:
+    """
+    Builds the USV search cache and its datapackage.json.
 
+    Incremental: only sources whose signature differs from the manifest are
+    re-extracted; unchanged rows are copied over from the previous cache file.
+    `full` ignores the manifest and re-extracts everything.
+    """
+    with _build_lock:
+        _build_cache(campaign, full)
+
+
+def _build_cache(campaign: Optional[str], full: bool) -> None:
+    logger.info(f"Building high-performance search cache for {campaign or 'global'}...")
     cache_dir = get_cache_path(campaign=campaign)
     cache_dir.mkdir(parents=True, exist_ok=True)
     cache_file = cache_dir / CACHE_FILE_NAME
     tmp_cache_file = cache_file.with_suffix(".tmp")
 
-    # Tiny sleep to ensure mtime > source files in fast tests
-    import time
-
-    time.sleep(0.01)
+    # Stat before reading: an edit made while we build shows up as stale next time
+    sources = _scan_sources()
+    manifest = None if full else _load_manifest(cache_dir)
+    known: Dict[str, List[Any]] = manifest.get("entries", {}) if manifest else {}
+    rows = _read_cache_rows(cache_file) if known else {}
+
+    lines: List[str] = []
+    entries: Dict[str, List[Any]] = {}
+    extracted = 0
+    for key, (path, signature) in sources.items():
+        previous = known.get(key)
+        line = rows.get(key) if previous and previous[1] else None
+        if previous and previous[0] == signature and (line is not None or not previous[1]):
+            entries[key] = previous
+            if line is not None:
+                lines.append(line)
+            continue
+
+        extracted += 1
+        entry_type, _, name = key.partition("/")
+        if entry_type == "company":
+            item = _extract_company(name, Path(path))
+        else:
+            item = _extract_person(name, Path(path))
+        included = not campaign or campaign in item.tags
+        entries[key] = [signature, included]
+        if included:
+            lines.append(item.to_usv())
+
+    removed = len(set(known) - set(sources))
+    if manifest is not None and extracted == 0 and removed == 0:
+        logger.info(f"Cache for {campaign or 'global'} is up to date ({len(lines)} items).")
+        return
 
     try:
         with open(tmp_cache_file, "w", encoding="utf-8") as f:
-            for item in items:
-                f.write(item.to_usv())
+            f.writelines(lines)
 
         # Atomic rename to ensure search never sees a partial file
         tmp_cache_file.replace(cache_file)
 
         # Save Frictionless schema
         CompanyCacheItem.save_datapackage(cache_dir)
-        logger.info(f"Cache build complete. Saved {len(items)} items to {cache_file}")
+
+        manifest_file = cache_dir / MANIFEST_FILE_NAME
+        tmp_manifest_file = manifest_file.with_suffix(".tmp")
+        with open(tmp_manifest_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": MANIFEST_VERSION,
+                    "cache": _stat_signature(cache_file),
+                    "entries": entries,
+                },
+                f,
+            )
+        tmp_manifest_file.replace(manifest_file)
+        logger.info(
+            f"Cache build complete. Saved {len(lines)} items to {cache_file} "
+            f"({extracted} re-extracted, {removed} removed)"
+        )
     except Exception as e:
         logger.error(f"Failed to build cache: {e}")
         if tmp_cache_file.exists():
@@ -228,7 +348,7 @@ def get_cached_items(
 ) -> List[Dict[str, Any]]:
     """LEGACY ADAPTER: Still used by some CLI commands. Rebuilds USV if needed."""
     if force_rebuild or not is_cache_valid(campaign=campaign):
-        build_cache(campaign=campaign)
+        build_cache(campaign=campaign, full=force_rebuild)
 
     # Simple JSON-like list for legacy compatibility
     # In the future, we'll remove this entirely in favor of DuckDB queries.
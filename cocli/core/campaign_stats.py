@@ -0,0 +1,441 @@
+import os
+import json
+import time
+import fcntl
+import logging
+import threading
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .constants import UNIT_SEP
+from .paths import paths
+
+logger = logging.getLogger(__name__)
+
+STATS_QUEUES = ["discovery-gen", "gm-list", "gm-details", "enrichment", "to-call"]
+
+JOURNAL_NAME = "status.journal.usv"
+SNAPSHOT_NAME = "status.snapshot.json"
+LOCK_NAME = "status.recount.lock"
+# Shared by all campaigns, next to indexes/scraped-tiles/
+WITNESS_JOURNAL_NAME = "scraped-tiles.stats.usv"
+SNAPSHOT_VERSION = 1
+
+# Snapshots older than this are recounted in the background
+RECOUNT_INTERVAL = 900.0
+# Rewrite a journal after a recount once it has outgrown this
+COMPACT_BYTES = 4 * 1024 * 1024
+
+
+def _lock_path(journal_path: Path) -> Path:
+    return journal_path.with_name(journal_path.name + ".lock")
+
+
+def _append(path: Path, fields: Sequence[str]) -> None:
+    """
+    Appends one record with a single O_APPEND write, so concurrent writers never
+    interleave. Writers share the journal's lock, which `_compact_journal` holds
+    exclusively while it swaps the file.
+    """
+    data = (UNIT_SEP.join(fields) + "\n").encode("utf-8")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(_lock_path(path), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_SH)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+    except OSError as e:
+        logger.debug(f"Could not record status counters in {path}: {e}")
+
+
+def record_queue_event(
+    campaign_name: str, queue_name: str, pending: int = 0, inflight: int = 0, completed: int = 0
+) -> None:
+    """Journals a change to a local queue's counts (see CampaignStatsStore)."""
+    completed_at = datetime.now(UTC).isoformat() if completed > 0 else ""
+    _append(
+        paths.campaign(campaign_name).queues / JOURNAL_NAME,
+        [queue_name, str(pending), str(inflight), str(completed), completed_at],
+    )
+
+
+def record_witness(witness_root: Path, phrase_slug: str, total: int, empty: int) -> None:
+    """Journals a change to the witness counts of a search phrase under `witness_root`."""
+    if total or empty:
+        _append(witness_root.with_name(WITNESS_JOURNAL_NAME), [phrase_slug, str(total), str(empty)])
+
+
+def witness_items_found(witness_path: Path) -> Optional[int]:
+    """items_found of a .usv witness file (scrape_date, items_found, processed_by), or None if unreadable."""
+    from ..utils.usv_utils import USVReader
+
+    try:
+        with open(witness_path, "r", encoding="utf-8") as f:
+            rows = iter(USVReader(f))
+            row = next(rows)
+            if row and row[0] == "scrape_date":
+                header, row = row, next(rows)
+                return int(dict(zip(header, row)).get("items_found") or 0)
+            return int(row[1]) if len(row) > 1 and row[1] else 0
+    except Exception:
+        return None
+
+
+def has_witness(witness_root: Path, tile_path: Path) -> bool:
+    """
+    True if the mission tile `tile_path` (shard/lat/lon/phrase.usv) has been scraped.
+    ScrapeIndex writes witnesses without the shard folder (lat/lon/phrase.usv).
+    """
+    for rel_path in (tile_path, Path(*tile_path.parts[1:])):
+        for suffix in (".usv", ".csv"):
+            if (witness_root / rel_path.with_suffix(suffix)).exists():
+                return True
+    return False
+
+
+def _journal_position(path: Path) -> Dict[str, int]:
+    try:
+        st = os.stat(path)
+        return {"inode": st.st_ino, "offset": st.st_size}
+    except FileNotFoundError:
+        return {"inode": 0, "offset": 0}
+
+
+def _compaction_path(journal_path: Path) -> Path:
+    return journal_path.with_name(journal_path.name + ".compacted.json")
+
+
+def _compact_journal(path: Path, position: Dict[str, int]) -> Dict[str, int]:
+    """
+    Drops the records before `position` and returns the same position in the new
+    journal. Appends wait on the journal's lock meanwhile, so none is lost. The cut
+    is recorded next to the journal, so snapshots taken at a later offset of the old
+    journal (the witness journal is shared by all campaigns) can still resume.
+    """
+    tmp_path = path.with_suffix(".tmp")
+    with open(_lock_path(path), "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return {"inode": 0, "offset": 0}
+        if st.st_ino != position["inode"]:
+            return position
+        with open(path, "rb") as src, open(tmp_path, "wb") as dst:
+            src.seek(position["offset"])
+            dst.write(src.read())
+        tmp_path.replace(path)
+        new_inode = os.stat(path).st_ino
+        compaction_tmp = _compaction_path(path).with_suffix(".tmp")
+        with open(compaction_tmp, "w", encoding="utf-8") as f:
+            json.dump({"inode": st.st_ino, "offset": position["offset"], "new_inode": new_inode}, f)
+        compaction_tmp.replace(_compaction_path(path))
+    return {"inode": new_inode, "offset": 0}
+
+
+def _resume_offset(path: Path, position: Dict[str, int], st: os.stat_result) -> Optional[int]:
+    """Where `position` continues in the current journal, or None if records after it were compacted away."""
+    offset = position.get("offset", 0)
+    if st.st_ino == position.get("inode") and st.st_size >= offset:
+        return offset
+    try:
+        with open(_compaction_path(path), "r", encoding="utf-8") as f:
+            cut = json.load(f)
+    except (OSError, ValueError):
+        cut = None
+    if not position.get("inode"):
+        # No journal yet when the snapshot was taken; fine unless one was compacted since
+        return None if cut else 0
+    if cut is None:
+        return None
+    cut_offset = int(cut.get("offset", 0))
+    if cut.get("inode") == position.get("inode") and cut.get("new_inode") == st.st_ino and offset >= cut_offset:
+        return offset - cut_offset
+    return None
+
+
+def _journal_lost(path: Path, position: Dict[str, int]) -> bool:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return bool(position.get("offset"))
+    return _resume_offset(path, position, st) is None
+
+
+def _tail(path: Path, position: Dict[str, int]) -> Iterator[List[str]]:
+    """Records appended after `position`; all of them if it cannot be resumed (see is_stale)."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return
+    offset = _resume_offset(path, position, st) or 0
+    if st.st_size <= offset:
+        return
+    with open(path, "rb") as f:
+        f.seek(offset)
+        chunk = f.read()
+    # Only complete records; a writer may be mid-line
+    end = chunk.rfind(b"\n")
+    for line in chunk[: end + 1].decode("utf-8", errors="replace").splitlines():
+        yield line.split(UNIT_SEP)
+
+
+def _empty_queue() -> Dict[str, Any]:
+    return {"pending": 0, "inflight": 0, "completed": 0, "last_completed_at": None}
+
+
+class CampaignStatsStore:
+    """
+    Incrementally maintained status counts for a campaign, so `cocli status` and
+    the TUI read them without walking every queue tree:
+
+      queues/<campaign>/status.snapshot.json  last full recount (and cached S3 listing)
+      queues/<campaign>/status.journal.usv    counter deltas since, one record per
+                                              push/lease/ack/nack (queue, pending,
+                                              inflight, completed, completed_at)
+      indexes/scraped-tiles.stats.usv         witness deltas (phrase, total, empty),
+                                              shared by all campaigns
+
+    A recount drops the journal records its snapshot covers once a journal has
+    outgrown COMPACT_BYTES (see _compact_journal).
+
+    `read()` is the snapshot plus the journal records appended after the offsets
+    it recorded. Tasks that arrive outside the queue API (smart_sync, discovery
+    generation) only show up at the next `recount()`, which is also what settles
+    any drift; callers run it once the snapshot is stale (see get_campaign_stats).
+    """
+
+    def __init__(self, campaign_name: str):
+        self.campaign_name = campaign_name
+        self.queues_dir = paths.campaign(campaign_name).queues
+        self.journal_path = self.queues_dir / JOURNAL_NAME
+        self.snapshot_path = self.queues_dir / SNAPSHOT_NAME
+        self.witness_root = paths.indexes / "scraped-tiles"
+        self.witness_journal_path = self.witness_root.with_name(WITNESS_JOURNAL_NAME)
+
+    # --- Reading -----------------------------------------------------------
+
+    def load_snapshot(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot: Dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            return None
+        return snapshot
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        """Current counts, or None before the first recount."""
+        snapshot = self.load_snapshot()
+        if snapshot is None:
+            return None
+
+        local: Dict[str, Dict[str, Any]] = {q: dict(v) for q, v in snapshot["local_queues"].items()}
+        for record in _tail(self.journal_path, snapshot["journal"]):
+            if len(record) != 5:
+                continue
+            queue, pending, inflight, completed, completed_at = record
+            counts = local.setdefault(queue, _empty_queue())
+            try:
+                counts["pending"] += int(pending)
+                counts["inflight"] += int(inflight)
+                counts["completed"] += int(completed)
+            except ValueError:
+                continue
+            if completed_at and (counts["last_completed_at"] is None or completed_at > counts["last_completed_at"]):
+                counts["last_completed_at"] = completed_at
+        for counts in local.values():
+            for field in ("pending", "inflight", "completed"):
+                counts[field] = max(0, counts[field])
+
+        witness: Dict[str, List[int]] = {p: list(v) for p, v in snapshot["witness"].items()}
+        for record in _tail(self.witness_journal_path, snapshot["witness_journal"]):
+            if len(record) == 3 and record[0] in witness:
+                try:
+                    witness[record[0]][0] += int(record[1])
+                    witness[record[0]][1] += int(record[2])
+                except ValueError:
+                    continue
+
+        return {**snapshot, "local_queues": local, "witness": witness}
+
+    def is_stale(self, snapshot: Dict[str, Any], phrases: Sequence[str]) -> bool:
+        """
+        True if the snapshot is due for a recount, does not cover these phrases or
+        its journals were compacted past it (by another campaign's recount).
+        """
+        return (
+            time.time() - snapshot.get("counted_at", 0) > RECOUNT_INTERVAL
+            or not set(phrases) <= set(snapshot["witness"])
+            or _journal_lost(self.journal_path, snapshot["journal"])
+            or _journal_lost(self.witness_journal_path, snapshot["witness_journal"])
+        )
+
+    # --- Recount -----------------------------------------------------------
+
+    def recount(
+        self, phrases: Sequence[str], s3_client: Any = None, bucket_name: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Counts everything from scratch and writes a new snapshot. Returns None
+        if another process is already recounting this campaign.
+
+        Journal offsets are taken before the scan, so changes made while it runs
+        may be counted twice but are never lost; the next recount settles them.
+        """
+        self.queues_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.queues_dir / LOCK_NAME, "w") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return None
+
+            journal = _journal_position(self.journal_path)
+            witness_journal = _journal_position(self.witness_journal_path)
+            previous = self.load_snapshot() or {}
+
+            snapshot: Dict[str, Any] = {
+                "version": SNAPSHOT_VERSION,
+                "counted_at": time.time(),
+                "journal": journal,
+                "witness_journal": witness_journal,
+                "local_queues": self._count_local_queues(),
+                "witness": self._count_witness(phrases),
+                "s3_queues": previous.get("s3_queues"),
+                "s3_listed_at": previous.get("s3_listed_at"),
+            }
+            if s3_client and bucket_name:
+                snapshot["s3_queues"] = self._list_s3_queues(s3_client, bucket_name)
+                snapshot["s3_listed_at"] = datetime.now(UTC).isoformat()
+
+            self._write_snapshot(snapshot)
+            if journal["offset"] > COMPACT_BYTES or witness_journal["offset"] > COMPACT_BYTES:
+                self._compact(snapshot)
+            return snapshot
+
+    def _write_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        tmp_path.replace(self.snapshot_path)
+
+    def _compact(self, snapshot: Dict[str, Any]) -> None:
+        """Drops journal records the snapshot already covers."""
+        if snapshot["journal"]["offset"] > COMPACT_BYTES:
+            snapshot["journal"] = _compact_journal(self.journal_path, snapshot["journal"])
+        if snapshot["witness_journal"]["offset"] > COMPACT_BYTES:
+            snapshot["witness_journal"] = _compact_journal(self.witness_journal_path, snapshot["witness_journal"])
+        self._write_snapshot(snapshot)
+
+    def _count_local_queues(self) -> Dict[str, Dict[str, Any]]:
+        local_stats: Dict[str, Dict[str, Any]] = {}
+        for q_name in STATS_QUEUES:
+            queue_base = paths.queue(self.campaign_name, q_name)
+            counts = _empty_queue()
+            last_completed: Optional[datetime] = None
+
+            p_dir = queue_base / "pending"
+            if p_dir.exists():
+                for root, dirs, files in os.walk(p_dir):
+                    for f in files:
+                        if f == "task.json" or f.endswith(".usv"):
+                            counts["pending"] += 1
+                        elif f == "lease.json":
+                            counts["inflight"] += 1
+
+            c_dir = queue_base / "completed"
+            if c_dir.exists():
+                for cf in c_dir.iterdir():
+                    if cf.suffix in [".json", ".usv"]:
+                        counts["completed"] += 1
+                        mtime = datetime.fromtimestamp(cf.stat().st_mtime, tz=UTC)
+                        if last_completed is None or mtime > last_completed:
+                            last_completed = mtime
+
+            counts["last_completed_at"] = last_completed.isoformat() if last_completed else None
+            local_stats[q_name] = counts
+
+        # Mission tiles without a witness are pending gm-list work
+        dg_completed = paths.campaign(self.campaign_name).queue("discovery-gen").completed
+        if dg_completed.exists():
+            for tf in dg_completed.glob("**/*.usv"):
+                if not has_witness(self.witness_root, tf.relative_to(dg_completed)):
+                    local_stats["gm-list"]["pending"] += 1
+
+        return local_stats
+
+    def _count_witness(self, phrases: Sequence[str]) -> Dict[str, List[int]]:
+        """[scrapes, scrapes that found nothing] per phrase slug."""
+        witness: Dict[str, List[int]] = {}
+        for phrase_slug in dict.fromkeys(phrases):
+            counts = witness[phrase_slug] = [0, 0]
+            if not self.witness_root.exists():
+                continue
+            for pf in self.witness_root.glob(f"**/{phrase_slug}.usv"):
+                items_found = witness_items_found(pf)
+                if items_found is not None:
+                    counts[0] += 1
+                    counts[1] += items_found == 0
+        return witness
+
+    def _list_s3_queues(self, s3: Any, bucket_name: str) -> Dict[str, Dict[str, Any]]:
+        s3_queues = {}
+        for q in STATS_QUEUES:
+            try:
+                paginator = s3.get_paginator("list_objects_v2")
+                pending = 0
+                inflight = 0
+                prefix_pending = f"campaigns/{self.campaign_name}/queues/{q}/pending/"
+                for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix_pending):
+                    for obj in page.get("Contents", []):
+                        key = obj["Key"]
+                        if key.endswith("task.json") or (q == "discovery-gen" and key.endswith(".usv")):
+                            pending += 1
+                        elif key.endswith("lease.json"):
+                            inflight += 1
+
+                completed = 0
+                last_completed = None
+                prefix_completed = f"campaigns/{self.campaign_name}/queues/{q}/completed/"
+                for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix_completed):
+                    for obj in page.get("Contents", []):
+                        completed += 1
+                        mtime = obj["LastModified"]
+                        if last_completed is None or mtime > last_completed:
+                            last_completed = mtime
+
+                s3_queues[q] = {"pending": pending, "inflight": inflight, "completed": completed, "last_completed_at": last_completed.isoformat() if last_completed else None}
+            except Exception as e:
+                logger.warning(f"S3 stats failed for {q}: {e}")
+        return s3_queues
+
+
+# Campaigns with a background recount running in this process
+_recounting: set[str] = set()
+_recounting_lock = threading.Lock()
+
+
+def start_background_recount(
+    store: CampaignStatsStore, phrases: Sequence[str], s3: Optional[Tuple[Any, str]] = None
+) -> None:
+    """Recounts the campaign on a daemon thread unless one is already running."""
+    with _recounting_lock:
+        if store.campaign_name in _recounting:
+            return
+        _recounting.add(store.campaign_name)
+
+    def run() -> None:
+        try:
+            store.recount(phrases, *(s3 or (None, None)))
+        except Exception as e:
+            logger.warning(f"Status recount failed for {store.campaign_name}: {e}")
+        finally:
+            with _recounting_lock:
+                _recounting.discard(store.campaign_name)
+
+    threading.Thread(target=run, daemon=True, name=f"status-recount-{store.campaign_name}").start()
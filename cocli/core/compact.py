@@ -1,319 +1,585 @@
-import os
-import json
-import logging
-import time
-import subprocess
-from pathlib import Path
-from datetime import datetime, UTC
-from typing import Any, Optional
-
-import boto3
-from botocore.exceptions import ClientError
-
-from .config import get_cocli_base_dir, get_campaign_dir
-
-logger = logging.getLogger(__name__)
-
-class CompactManager:
-    """
-    Implements the Freeze-Ingest-Merge-Commit (FIMC) pattern for sharded indexes.
-    Uses S3-Native isolation to prevent race conditions with workers.
-    """
-    
-    def __init__(self, campaign_name: str, index_name: str = "google_maps_prospects", log_file: Optional[Path] = None):
-        self.campaign_name = campaign_name
-        self.index_name = index_name
-        self.run_id = f"run_{int(time.time())}"
-        self.log_file = log_file
-        
-        # Local Paths
-        self.data_root = get_cocli_base_dir() / "campaigns" / campaign_name
-        self.index_dir = self.data_root / "indexes" / index_name
-        self.checkpoint_path = self.index_dir / "prospects.checkpoint.usv"
-        self.local_proc_dir = self.index_dir / "processing" / self.run_id
-        
-        # S3 Paths
-        self.s3_index_prefix = f"campaigns/{campaign_name}/indexes/{index_name}/"
-        self.s3_wal_prefix = self.s3_index_prefix + "wal/"
-        self.s3_proc_prefix = self.s3_index_prefix + f"processing/{self.run_id}/"
-        self.s3_lock_key = self.s3_index_prefix + "compact.lock"
-        
-        # S3 Client
-        self._s3: Any = None
-        self._bucket = self._load_bucket_name()
-
-    def _load_bucket_name(self) -> str:
-        """Loads bucket name from campaign config.toml"""
-        import tomllib
-        camp_dir = get_campaign_dir(self.campaign_name)
-        if camp_dir:
-            config_path = camp_dir / "config.toml"
-            if config_path.exists():
-                with open(config_path, "rb") as f:
-                    data = tomllib.load(f)
-                    bucket = data.get("aws", {}).get("data_bucket_name") or data.get("data_bucket_name")
-                    if bucket:
-                        return str(bucket)
-        return ""
-
-    @property
-    def s3(self) -> Any:
-        if self._s3 is None:
-            self._s3 = boto3.client("s3")
-        return self._s3
-
-    def acquire_lock(self) -> bool:
-        """Creates an atomic lock on S3 using If-None-Match."""
-        logger.info(f"Attempting to acquire compaction lock: {self.s3_lock_key}")
-        lock_data = {
-            "run_id": self.run_id,
-            "created_at": datetime.now(UTC).isoformat(),
-            "host": os.uname().nodename
-        }
-        try:
-            self.s3.put_object(
-                Bucket=self._bucket,
-                Key=self.s3_lock_key,
-                Body=json.dumps(lock_data),
-                IfNoneMatch='*'
-            )
-            logger.info("Lock acquired successfully.")
-            return True
-        except ClientError as e:
-            if e.response['Error']['Code'] == 'PreconditionFailed':
-                logger.warning("Compaction lock already exists. Another process is running.")
-            else:
-                logger.error(f"Failed to acquire lock: {e}")
-            return False
-
-    def release_lock(self) -> None:
-        """Removes the compaction lock from S3."""
-        try:
-            self.s3.delete_object(Bucket=self._bucket, Key=self.s3_lock_key)
-            logger.info("Lock released.")
-        except Exception as e:
-            logger.error(f"Failed to release lock: {e}")
-
-    def isolate_wal(self) -> int:
-        """Moves files from wal/ AND out-of-place files in the root to processing/run_id/ on S3."""
-        logger.info(f"Isolating WAL files to {self.s3_proc_prefix}...")
-        
-        # 1. MOVE REMOTE WAL -> PROCESSING
-        src_wal = f"s3://{self._bucket}/{self.s3_wal_prefix}"
-        dest = f"s3://{self._bucket}/{self.s3_proc_prefix}"
-        
-        try:
-            from contextlib import nullcontext
-            with open(self.log_file, "a") if self.log_file else nullcontext() as f:
-                # Move everything from wal/ prefix
-                subprocess.run(
-                    ["aws", "s3", "mv", src_wal, dest, "--recursive", "--quiet"],
-                    stdout=f, stderr=f, text=True
-                )
-                
-                # 2. SWEEP: Move any USV/CSV files in the root that aren't the checkpoint
-                # We use a single batch move with filters for high performance
-                root_s3 = f"s3://{self._bucket}/{self.s3_index_prefix}"
-                subprocess.run(
-                    [
-                        "aws", "s3", "mv", root_s3, dest,
-                        "--recursive",
-                        "--exclude", "*",
-                        "--include", "*.usv",
-                        "--include", "*.csv",
-                        "--exclude", "prospects.checkpoint.usv",
-                        "--exclude", "validation_errors.usv",
-                        "--exclude", "_*",
-                        "--quiet"
-                    ],
-                    stdout=f, stderr=f, text=True
-                )
-
-            logger.info("Isolation complete.")
-            
-            # 2. PURGE LOCAL WAL AND ROOT NAKED FILES
-            local_wal = self.index_dir / "wal"
-            if local_wal.exists():
-                logger.info(f"Purging local WAL shards from {local_wal}...")
-                import shutil
-                shutil.rmtree(local_wal)
-                local_wal.mkdir(parents=True, exist_ok=True)
-            
-            # Purge local naked files in index root
-            for f_path in self.index_dir.glob("*.usv"):
-                if f_path.name != "prospects.checkpoint.usv" and f_path.name != "validation_errors.usv":
-                    f_path.unlink()
-            for f_path in self.index_dir.glob("*.csv"):
-                f_path.unlink()
-            
-            return 1 
-        except Exception as e:
-            logger.error(f"Failed to isolate WAL: {e}")
-            return 0
-
-    def acquire_staging(self) -> None:
-        """Syncs the processing/run_id/ folder from S3 to local disk using AWS CLI."""
-        logger.info(f"Acquiring staging data to {self.local_proc_dir}...")
-        self.local_proc_dir.mkdir(parents=True, exist_ok=True)
-        
-        src = f"s3://{self._bucket}/{self.s3_proc_prefix}"
-        try:
-            from contextlib import nullcontext
-            with open(self.log_file, "a") if self.log_file else nullcontext() as f:
-                subprocess.run(
-                    ["aws", "s3", "sync", src, str(self.local_proc_dir), "--quiet"],
-                    stdout=f, stderr=f, check=True
-                )
-            logger.info("Staging data acquired.")
-        except Exception as e:
-            logger.error(f"Failed to sync staging data: {e}")
-
-    def merge(self) -> None:
-        """Merges checkpoint and staging using DuckDB."""
-        import duckdb
-        logger.info("Starting DuckDB merge...")
-        
-        con = duckdb.connect(database=':memory:')
-        
-        # Standard schema
-        columns = {
-            "place_id": "VARCHAR",
-            "company_slug": "VARCHAR",
-            "name": "VARCHAR",
-            "phone_1": "VARCHAR",
-            "created_at": "VARCHAR",
-            "updated_at": "VARCHAR",
-            "version": "INTEGER",
-            "keyword": "VARCHAR",
-            "full_address": "VARCHAR",
-            "street_address": "VARCHAR",
-            "city": "VARCHAR",
-            "zip": "VARCHAR",
-            "municipality": "VARCHAR",
-            "state": "VARCHAR",
-            "country": "VARCHAR",
-            "timezone": "VARCHAR",
-            "phone_standard_format": "VARCHAR",
-            "website": "VARCHAR",
-            "domain": "VARCHAR",
-            "first_category": "VARCHAR",
-            "second_category": "VARCHAR",
-            "claimed_google_my_business": "VARCHAR",
-            "reviews_count": "INTEGER",
-            "average_rating": "DOUBLE",
-            "hours": "VARCHAR",
-            "saturday": "VARCHAR",
-            "sunday": "VARCHAR",
-            "monday": "VARCHAR",
-            "tuesday": "VARCHAR",
-            "wednesday": "VARCHAR",
-            "thursday": "VARCHAR",
-            "friday": "VARCHAR",
-            "latitude": "DOUBLE",
-            "longitude": "DOUBLE",
-            "coordinates": "VARCHAR",
-            "plus_code": "VARCHAR",
-            "menu_link": "VARCHAR",
-            "gmb_url": "VARCHAR",
-            "cid": "VARCHAR",
-            "google_knowledge_url": "VARCHAR",
-            "kgmid": "VARCHAR",
-            "image_url": "VARCHAR",
-            "favicon": "VARCHAR",
-            "review_url": "VARCHAR",
-            "facebook_url": "VARCHAR",
-            "linkedin_url": "VARCHAR",
-            "instagram_url": "VARCHAR",
-            "thumbnail_url": "VARCHAR",
-            "reviews": "VARCHAR",
-            "quotes": "VARCHAR",
-            "uuid": "VARCHAR",
-            "company_hash": "VARCHAR",
-            "discovery_phrase": "VARCHAR",
-            "discovery_tile_id": "VARCHAR",
-            "processed_by": "VARCHAR"
-        }
-
-        tmp_checkpoint = self.checkpoint_path.with_suffix(".tmp")
-        
-        # Gather paths
-        paths = []
-        if self.checkpoint_path.exists():
-            paths.append(str(self.checkpoint_path))
-        
-        # Add all staged USVs
-        staged_files = [str(p) for p in self.local_proc_dir.rglob("*.usv")]
-        paths.extend(staged_files)
-        
-        if not paths:
-            logger.info("No data found to merge.")
-            return
-
-        # DuckDB can handle thousands of files in one read_csv call
-        path_list = "', '".join(paths)
-        
-        # Deduplication Query
-        q = f"""
-            COPY (
-                SELECT * EXCLUDE (row_num) FROM (
-                    SELECT *, 
-                           row_number() OVER (PARTITION BY place_id ORDER BY updated_at DESC) as row_num
-                    FROM read_csv(['{path_list}'], 
-                                 delim='\x1f', 
-                                 header=False, 
-                                 columns={json.dumps(columns)}, 
-                                 ignore_errors=True)
-                ) 
-                WHERE row_num = 1
-            ) TO '{tmp_checkpoint}' (DELIMITER '\x1f', HEADER FALSE)
-        """
-        
-        con.execute(q)
-        
-        if tmp_checkpoint.exists():
-            os.replace(tmp_checkpoint, self.checkpoint_path)
-            logger.info(f"Merged checkpoint saved to {self.checkpoint_path}")
-        
-    def commit_remote(self) -> None:
-        """Uploads the new checkpoint to S3."""
-        logger.info("Uploading updated checkpoint to S3...")
-        s3_key = self.s3_index_prefix + "prospects.checkpoint.usv"
-        self.s3.upload_file(str(self.checkpoint_path), self._bucket, s3_key)
-        logger.info("S3 Checkpoint updated.")
-
-    def cleanup(self) -> None:
-        """Purges staging data from local and remote."""
-        logger.info("Cleaning up staging layers...")
-        
-        # Remote Cleanup using AWS CLI
-        src = f"s3://{self._bucket}/{self.s3_proc_prefix}"
-        try:
-            from contextlib import nullcontext
-            with open(self.log_file, "a") if self.log_file else nullcontext() as f:
-                subprocess.run(["aws", "s3", "rm", src, "--recursive", "--quiet"], stdout=f, stderr=f, check=True)
-        except Exception as e:
-            logger.error(f"Failed to cleanup S3 staging: {e}")
-        
-        # Local Cleanup
-        import shutil
-        if self.local_proc_dir.exists():
-            shutil.rmtree(self.local_proc_dir)
-            
-        logger.info("Cleanup complete.")
-
-    def run(self) -> None:
-        """Executes the full compaction lifecycle."""
-        if not self.acquire_lock():
-            return
-            
-        try:
-            moved = self.isolate_wal()
-            if moved > 0:
-                self.acquire_staging()
-                self.merge()
-                self.commit_remote()
-                self.cleanup()
-            else:
-                logger.info("Nothing to compact.")
-        finally:
-            self.release_lock()
+import os
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from datetime import datetime, UTC
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+
+from .config import get_cocli_base_dir, get_campaign_dir
+from ..utils.duckdb_utils import fresh_parquet_glob
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_NAME = "prospects.checkpoint.usv"
+
+# Root-level files the isolation sweep leaves in place
+_SWEEP_KEEP = {CHECKPOINT_NAME, "validation_errors.usv"}
+
+# S3 DeleteObjects accepts at most 1000 keys per call
+_DELETE_BATCH = 1000
+
+_UNIT_SEP = b"\x1f"
+# Column of updated_at in checkpoint rows (place_id is column 0)
+_UPDATED_AT_COLUMN = 5
+
+_NUMERIC_TYPES = {"BIGINT": int, "INTEGER": int, "DOUBLE": float}
+
+
+@dataclass
+class PhaseMetrics:
+    objects: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+
+class _RowSchema:
+    """Column count and numeric columns of the canonical prospect USV (GoogleMapsPlace)."""
+
+    def __init__(self) -> None:
+        from ..models.campaigns.indexes.google_maps_place import GoogleMapsPlace
+        from ..utils.duckdb_utils import get_duckdb_schema_from_fields
+
+        columns = get_duckdb_schema_from_fields(GoogleMapsPlace.get_datapackage_fields())
+        self.width = len(columns)
+        self.numeric = [
+            (i, _NUMERIC_TYPES[t]) for i, t in enumerate(columns.values()) if t in _NUMERIC_TYPES
+        ]
+
+    def row_key(self, line: bytes) -> Optional[Tuple[bytes, bytes]]:
+        """
+        (place_id, updated_at) of a raw checkpoint row, or None if the row does not
+        match the schema (wrong field count or unparseable numbers), like a typed read.
+        """
+        parts = line.split(_UNIT_SEP)
+        if len(parts) != self.width or not parts[0]:
+            return None
+        for i, cast in self.numeric:
+            if parts[i]:
+                try:
+                    cast(parts[i])
+                except ValueError:
+                    return None
+        return parts[0], parts[_UPDATED_AT_COLUMN]
+
+
+def _clean_line(line: bytes) -> bytes:
+    return line.rstrip(b"\r\n\x1e")
+
+
+@dataclass
+class _CheckpointScan:
+    # Row each place_id keeps: place_id -> (updated_at, line number)
+    keep: Dict[bytes, Tuple[bytes, int]] = field(default_factory=dict)
+    # Staged rows that replace the kept row of their place_id
+    replacements: Dict[bytes, bytes] = field(default_factory=dict)
+    # Duplicate rows and rows that do not match the schema
+    dropped: int = 0
+
+
+class CompactManager:
+    """
+    Implements the Freeze-Ingest-Merge-Commit (FIMC) pattern for sharded indexes.
+    Uses S3-Native isolation to prevent race conditions with workers.
+
+    All S3 work runs in-process on one boto3 client with a pool of `max_workers`
+    concurrent requests: isolation is server-side copy + bulk delete, staged
+    objects are streamed straight into the merge (no local mirror), and the merge
+    copies unchanged checkpoint rows verbatim, rewriting only the rows whose
+    place_id was updated. Objects, bytes and wall time per phase are collected in
+    `metrics`.
+    """
+    
+    def __init__(
+        self,
+        campaign_name: str,
+        index_name: str = "google_maps_prospects",
+        log_file: Optional[Path] = None,
+        s3_client: Optional[Any] = None,
+        bucket_name: Optional[str] = None,
+        max_workers: int = 16,
+    ):
+        self.campaign_name = campaign_name
+        self.index_name = index_name
+        self.run_id = f"run_{int(time.time())}"
+        self.log_file = log_file
+        self.max_workers = max_workers
+        self.metrics: Dict[str, PhaseMetrics] = {}
+        
+        # Local Paths
+        self.data_root = get_cocli_base_dir() / "campaigns" / campaign_name
+        self.index_dir = self.data_root / "indexes" / index_name
+        self.checkpoint_path = self.index_dir / CHECKPOINT_NAME
+        self.local_proc_dir = self.index_dir / "processing" / self.run_id
+        
+        # S3 Paths
+        self.s3_index_prefix = f"campaigns/{campaign_name}/indexes/{index_name}/"
+        self.s3_wal_prefix = self.s3_index_prefix + "wal/"
+        self.s3_proc_prefix = self.s3_index_prefix + f"processing/{self.run_id}/"
+        self.s3_lock_key = self.s3_index_prefix + "compact.lock"
+        
+        # S3 Client
+        self._s3: Any = s3_client
+        self._bucket = bucket_name or self._load_bucket_name()
+
+        # Newest staged row per place_id: place_id -> (updated_at, raw row)
+        self._updates: Dict[bytes, Tuple[bytes, bytes]] = {}
+        # Staged objects that could not be read; returned to wal/ instead of being deleted
+        self._failed_keys: List[str] = []
+        self._checkpoint_changed = False
+        self._schema = _RowSchema()
+
+    def _load_bucket_name(self) -> str:
+        """Loads bucket name from campaign config.toml"""
+        import tomllib
+        camp_dir = get_campaign_dir(self.campaign_name)
+        if camp_dir:
+            config_path = camp_dir / "config.toml"
+            if config_path.exists():
+                with open(config_path, "rb") as f:
+                    data = tomllib.load(f)
+                    bucket = data.get("aws", {}).get("data_bucket_name") or data.get("data_bucket_name")
+                    if bucket:
+                        return str(bucket)
+        return ""
+
+    @property
+    def s3(self) -> Any:
+        if self._s3 is None:
+            from botocore.config import Config
+            # One pooled connection per transfer worker
+            self._s3 = boto3.client("s3", config=Config(max_pool_connections=self.max_workers))
+        return self._s3
+
+    @contextmanager
+    def _phase(self, name: str) -> Iterator[PhaseMetrics]:
+        metrics = self.metrics.setdefault(name, PhaseMetrics())
+        start = time.perf_counter()
+        try:
+            yield metrics
+        finally:
+            metrics.seconds += time.perf_counter() - start
+            logger.info(
+                f"Phase {name}: {metrics.objects} objects, {metrics.bytes / 1024 / 1024:.2f} MB in {metrics.seconds:.2f}s"
+            )
+
+    def _list(self, prefix: str, delimiter: Optional[str] = None) -> List[Dict[str, Any]]:
+        paginator = self.s3.get_paginator("list_objects_v2")
+        kwargs: Dict[str, Any] = {"Bucket": self._bucket, "Prefix": prefix}
+        if delimiter:
+            kwargs["Delimiter"] = delimiter
+        objects: List[Dict[str, Any]] = []
+        for page in paginator.paginate(**kwargs):
+            objects.extend(page.get("Contents", []))
+        return objects
+
+    def _delete_keys(self, keys: List[str]) -> int:
+        """Bulk-deletes keys, 1000 per request, requests in parallel. Returns how many were deleted."""
+        batches = [keys[i:i + _DELETE_BATCH] for i in range(0, len(keys), _DELETE_BATCH)]
+
+        def _delete(batch: List[str]) -> int:
+            resp = self.s3.delete_objects(
+                Bucket=self._bucket,
+                Delete={"Objects": [{"Key": k} for k in batch], "Quiet": True},
+            )
+            errors = resp.get("Errors", [])
+            for err in errors:
+                logger.error(f"Failed to delete {err.get('Key')}: {err.get('Message')}")
+            return len(batch) - len(errors)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return sum(pool.map(_delete, batches))
+
+    def staging_keys(self) -> List[Dict[str, Any]]:
+        """Objects currently isolated under this run's processing/ prefix."""
+        return [obj for obj in self._list(self.s3_proc_prefix) if not obj["Key"].endswith("/")]
+
+    def acquire_lock(self) -> bool:
+        """Creates an atomic lock on S3 using If-None-Match."""
+        logger.info(f"Attempting to acquire compaction lock: {self.s3_lock_key}")
+        lock_data = {
+            "run_id": self.run_id,
+            "created_at": datetime.now(UTC).isoformat(),
+            "host": os.uname().nodename
+        }
+        try:
+            self.s3.put_object(
+                Bucket=self._bucket,
+                Key=self.s3_lock_key,
+                Body=json.dumps(lock_data),
+                IfNoneMatch='*'
+            )
+            logger.info("Lock acquired successfully.")
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'PreconditionFailed':
+                logger.warning("Compaction lock already exists. Another process is running.")
+            else:
+                logger.error(f"Failed to acquire lock: {e}")
+            return False
+
+    def release_lock(self) -> None:
+        """Removes the compaction lock from S3."""
+        try:
+            self.s3.delete_object(Bucket=self._bucket, Key=self.s3_lock_key)
+            logger.info("Lock released.")
+        except Exception as e:
+            logger.error(f"Failed to release lock: {e}")
+
+    def _isolation_sources(self) -> List[Tuple[str, str, int]]:
+        """(source key, destination key, size) for every WAL shard and naked root file."""
+        sources: List[Tuple[str, str, int]] = []
+        # 1. Everything under wal/, keeping its relative layout
+        for obj in self._list(self.s3_wal_prefix):
+            key = obj["Key"]
+            if key.endswith("/"):
+                continue
+            sources.append((key, self.s3_proc_prefix + key[len(self.s3_wal_prefix):], obj.get("Size", 0)))
+
+        # 2. SWEEP: USV/CSV files in the index root that aren't the checkpoint
+        for obj in self._list(self.s3_index_prefix, delimiter="/"):
+            key = obj["Key"]
+            name = key[len(self.s3_index_prefix):]
+            if name in _SWEEP_KEEP or name.startswith("_") or not name.endswith((".usv", ".csv")):
+                continue
+            sources.append((key, self.s3_proc_prefix + name, obj.get("Size", 0)))
+        return sources
+
+    def isolate_wal(self) -> int:
+        """
+        Moves files from wal/ AND out-of-place files in the root to processing/run_id/ on S3.
+        Returns the number of objects isolated.
+        """
+        logger.info(f"Isolating WAL files to {self.s3_proc_prefix}...")
+
+        with self._phase("isolate") as metrics:
+            try:
+                sources = self._isolation_sources()
+            except Exception as e:
+                logger.error(f"Failed to isolate WAL: {e}")
+                return 0
+
+            # Server-side copies in parallel; only copied sources are deleted, so a
+            # failed copy leaves the shard in wal/ for the next run.
+            copied: List[str] = []
+
+            def _copy(source: Tuple[str, str, int]) -> Tuple[str, int]:
+                src, dest, size = source
+                self.s3.copy_object(
+                    Bucket=self._bucket, Key=dest, CopySource={"Bucket": self._bucket, "Key": src}
+                )
+                return src, size
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = [pool.submit(_copy, source) for source in sources]
+                for future in as_completed(futures):
+                    try:
+                        src, size = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to isolate WAL shard: {e}")
+                        continue
+                    copied.append(src)
+                    metrics.objects += 1
+                    metrics.bytes += size
+
+            if copied:
+                self._delete_keys(copied)
+
+        logger.info(f"Isolation complete: {len(copied)} objects.")
+
+        # PURGE LOCAL WAL AND ROOT NAKED FILES
+        local_wal = self.index_dir / "wal"
+        if local_wal.exists():
+            logger.info(f"Purging local WAL shards from {local_wal}...")
+            import shutil
+            shutil.rmtree(local_wal)
+            local_wal.mkdir(parents=True, exist_ok=True)
+
+        # Purge local naked files in index root
+        for f_path in self.index_dir.glob("*.usv"):
+            if f_path.name not in _SWEEP_KEEP:
+                f_path.unlink()
+        for f_path in self.index_dir.glob("*.csv"):
+            f_path.unlink()
+
+        return len(copied)
+
+    def _ingest(self, data: bytes) -> int:
+        """Folds the rows of one staged object into the newest-row-per-place_id map."""
+        rows = 0
+        updates = self._updates
+        for line in data.splitlines():
+            line = _clean_line(line)
+            key = self._schema.row_key(line)
+            if key is None:
+                continue
+            place_id, updated_at = key
+            current = updates.get(place_id)
+            # Objects are ingested in key order; a later key wins ties
+            if current is None or updated_at >= current[0]:
+                updates[place_id] = (updated_at, line)
+            rows += 1
+        return rows
+
+    def acquire_staging(self) -> bool:
+        """
+        Streams the objects isolated under processing/run_id/ straight from S3 into
+        the merge's update map, downloading in parallel. Nothing is mirrored to disk.
+        Returns False if staging could not be listed; objects that fail to download
+        are left out of the merge and kept for the next run (see cleanup()).
+        """
+        logger.info(f"Streaming staging data from {self.s3_proc_prefix}...")
+        self._updates = {}
+        self._failed_keys = []
+
+        with self._phase("stage") as metrics:
+            try:
+                keys = [obj["Key"] for obj in self.staging_keys() if obj["Key"].endswith((".usv", ".csv"))]
+            except Exception as e:
+                logger.error(f"Failed to list staging data: {e}")
+                return False
+
+            def _fetch(key: str) -> bytes:
+                body: bytes = self.s3.get_object(Bucket=self._bucket, Key=key)["Body"].read()
+                return body
+
+            fetched: Dict[str, bytes] = {}
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = {pool.submit(_fetch, key): key for key in keys}
+                for future in as_completed(futures):
+                    key = futures[future]
+                    try:
+                        fetched[key] = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to fetch staged object {key}: {e}")
+                        self._failed_keys.append(key)
+                        continue
+                    metrics.objects += 1
+                    metrics.bytes += len(fetched[key])
+
+            # Fold in key order, so ties on updated_at resolve the same way every run
+            rows = 0
+            for key in sorted(fetched):
+                rows += self._ingest(fetched.pop(key))
+
+        logger.info(f"Staging data acquired: {rows} rows for {len(self._updates)} place_ids.")
+        return True
+
+    def merge(self) -> None:
+        """
+        Merges the staged rows into the checkpoint, keeping the newest row per place_id.
+
+        The checkpoint is scanned once to find the row each place_id keeps. If it
+        has no duplicate or malformed rows and no staged row replaces one of its
+        rows, the new place_ids are appended to the existing file. Otherwise it is
+        streamed once more into a new file: kept rows are copied byte-for-byte or
+        replaced by their newer staged row, the rest are dropped, and new place_ids
+        are appended in place_id order.
+        """
+        logger.info("Starting incremental checkpoint merge...")
+        self._checkpoint_changed = False
+
+        with self._phase("merge") as metrics:
+            pending = dict(self._updates)
+            if not pending:
+                logger.info("No data found to merge.")
+                return
+
+            replaced = 0
+            dropped = 0
+            new_rows: List[bytes] = []
+            if self.checkpoint_path.exists():
+                scan = self._scan_checkpoint(pending)
+                dropped = scan.dropped
+                new_rows = [pending[pid][1] for pid in sorted(pending)]
+                if scan.replacements or scan.dropped:
+                    replaced = self._rewrite_checkpoint(scan, new_rows, metrics)
+                elif new_rows:
+                    self._append_checkpoint(new_rows, metrics)
+            else:
+                new_rows = [pending[pid][1] for pid in sorted(pending)]
+                self._append_checkpoint(new_rows, metrics)
+
+            self._checkpoint_changed = bool(replaced or new_rows or dropped)
+            metrics.objects = replaced + len(new_rows)
+
+        if self._checkpoint_changed or fresh_parquet_glob(self.checkpoint_path) is None:
+            with self._phase("parquet") as metrics:
+                from .prospect_compactor import write_prospects_parquet
+                parquet_dir = write_prospects_parquet(self.checkpoint_path)
+                if parquet_dir:
+                    parquet_files = list(parquet_dir.rglob("*.parquet"))
+                    metrics.objects += len(parquet_files)
+                    metrics.bytes += sum(f.stat().st_size for f in parquet_files)
+
+        logger.info(
+            f"Merged checkpoint saved to {self.checkpoint_path}: {replaced} rows updated, "
+            f"{len(new_rows)} added, {dropped} duplicate or malformed rows dropped."
+        )
+
+    def _scan_checkpoint(self, pending: Dict[bytes, Tuple[bytes, bytes]]) -> "_CheckpointScan":
+        """
+        Finds the row each place_id of the checkpoint keeps (its newest, the first
+        on ties). Removes the place_ids the checkpoint already has from `pending`,
+        recording the staged rows that must replace the kept row.
+        """
+        scan = _CheckpointScan()
+        kept_rows: Dict[int, bytes] = {}
+        with open(self.checkpoint_path, "rb") as f:
+            for line_no, line in enumerate(f):
+                row = _clean_line(line)
+                if not row:
+                    continue
+                key = self._schema.row_key(row)
+                if key is None:
+                    scan.dropped += 1
+                    continue
+                place_id, updated_at = key
+                current = scan.keep.get(place_id)
+                if current is not None:
+                    scan.dropped += 1
+                    if updated_at <= current[0]:
+                        continue
+                scan.keep[place_id] = (updated_at, line_no)
+                if place_id in pending:
+                    kept_rows[line_no] = row
+
+        for place_id in [pid for pid in pending if pid in scan.keep]:
+            updated_at, staged = pending.pop(place_id)
+            kept_updated_at, line_no = scan.keep[place_id]
+            # The checkpoint keeps its row unless the staged one is at least as new
+            if updated_at >= kept_updated_at and staged != kept_rows[line_no]:
+                scan.replacements[place_id] = staged
+        return scan
+
+    def _rewrite_checkpoint(
+        self, scan: "_CheckpointScan", new_rows: List[bytes], metrics: PhaseMetrics
+    ) -> int:
+        tmp_checkpoint = self.checkpoint_path.with_suffix(".tmp")
+        replaced = 0
+        with open(self.checkpoint_path, "rb") as src, open(tmp_checkpoint, "wb", buffering=1024 * 1024) as out:
+            for line_no, line in enumerate(src):
+                row = _clean_line(line)
+                key = self._schema.row_key(row) if row else None
+                if key is None or scan.keep[key[0]][1] != line_no:
+                    continue
+                replacement = scan.replacements.get(key[0])
+                if replacement is not None:
+                    out.write(replacement + b"\n")
+                    replaced += 1
+                else:
+                    out.write(line if line.endswith(b"\n") else line + b"\n")
+            for row in new_rows:
+                out.write(row + b"\n")
+            metrics.bytes += out.tell()
+        os.replace(tmp_checkpoint, self.checkpoint_path)
+        return replaced
+
+    def _append_checkpoint(self, new_rows: List[bytes], metrics: PhaseMetrics) -> None:
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = b"".join(row + b"\n" for row in new_rows)
+        with open(self.checkpoint_path, "ab") as f:
+            if f.tell() > 0:
+                # Don't glue the first new row onto an unterminated last line
+                with open(self.checkpoint_path, "rb") as check:
+                    check.seek(-1, os.SEEK_END)
+                    if check.read(1) != b"\n":
+                        f.write(b"\n")
+            f.write(payload)
+        metrics.bytes += len(payload)
+
+    def commit_remote(self) -> None:
+        """Uploads the new checkpoint to S3 (multipart, in parallel for large checkpoints)."""
+        if not self._checkpoint_changed:
+            logger.info("Checkpoint unchanged; skipping upload.")
+            return
+        logger.info("Uploading updated checkpoint to S3...")
+        s3_key = self.s3_index_prefix + CHECKPOINT_NAME
+        with self._phase("commit") as metrics:
+            self.s3.upload_file(
+                str(self.checkpoint_path), self._bucket, s3_key,
+                Config=TransferConfig(max_concurrency=self.max_workers),
+            )
+            metrics.objects += 1
+            metrics.bytes += self.checkpoint_path.stat().st_size
+        logger.info("S3 Checkpoint updated.")
+
+    def _return_to_wal(self, keys: List[str]) -> List[str]:
+        """
+        Moves staged objects back under wal/ for the next run. Returns the keys moved.
+        They get their own prefix so a newer shard written since isolation is never overwritten.
+        """
+        retry_prefix = self.s3_wal_prefix + f"retry/{self.run_id}/"
+        moved: List[str] = []
+        for key in keys:
+            try:
+                self.s3.copy_object(
+                    Bucket=self._bucket,
+                    Key=retry_prefix + key[len(self.s3_proc_prefix):],
+                    CopySource={"Bucket": self._bucket, "Key": key},
+                )
+                moved.append(key)
+            except Exception as e:
+                logger.error(f"Failed to return {key} to the WAL; it stays in {self.s3_proc_prefix}: {e}")
+        return moved
+
+    def cleanup(self) -> None:
+        """
+        Purges staging data from local and remote. Staged objects that could not be
+        fetched were not merged, so they are moved back to wal/ instead.
+        """
+        logger.info("Cleaning up staging layers...")
+
+        with self._phase("cleanup") as metrics:
+            try:
+                failed = set(self._failed_keys)
+                staged = [obj for obj in self.staging_keys() if obj["Key"] not in failed]
+                returned = self._return_to_wal(sorted(failed))
+                metrics.objects += self._delete_keys([obj["Key"] for obj in staged] + returned)
+                metrics.bytes += sum(obj.get("Size", 0) for obj in staged)
+            except Exception as e:
+                logger.error(f"Failed to cleanup S3 staging: {e}")
+
+        # Local Cleanup (staging directories left by older versions)
+        import shutil
+        if self.local_proc_dir.exists():
+            shutil.rmtree(self.local_proc_dir)
+        self._updates = {}
+        self._failed_keys = []
+
+        logger.info("Cleanup complete.")
+
+    def report(self) -> str:
+        """One line per phase: objects, MB and seconds."""
+        return "\n".join(
+            f"{name:<8} {m.objects:>8} objects {m.bytes / 1024 / 1024:>10.2f} MB {m.seconds:>8.2f}s"
+            for name, m in self.metrics.items()
+        )
+
+    def run(self) -> None:
+        """Executes the full compaction lifecycle."""
+        if not self.acquire_lock():
+            return
+            
+        try:
+            moved = self.isolate_wal()
+            if moved > 0:
+                if not self.acquire_staging():
+                    logger.error(f"Compaction aborted; staged objects remain in {self.s3_proc_prefix}")
+                    return
+                self.merge()
+                self.commit_remote()
+                self.cleanup()
+            else:
+                logger.info("Nothing to compact.")
+        finally:
+            self.release_lock()
+        if self.metrics:
+            logger.info(f"Compaction phases:\n{self.report()}")
@@ -0,0 +1,135 @@
+import os
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..models.companies.company import Company
+from ..models.wal.record import DatagramRecord
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64
+# Below this many directories the pool's startup cost outweighs the parallelism
+MIN_PARALLEL_DIRS = 256
+
+
+@dataclass
+class LoadStats:
+    loaded: int = 0
+    skipped: int = 0
+    elapsed: float = 0.0
+    workers: int = 1
+
+    @property
+    def companies_per_sec(self) -> float:
+        return (self.loaded + self.skipped) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.loaded} companies loaded, {self.skipped} skipped in {self.elapsed:.2f}s "
+            f"({self.companies_per_sec:,.0f} companies/sec, {self.workers} workers)"
+        )
+
+
+def company_dirs(companies_dir: Optional[Path] = None) -> List[Path]:
+    """All company directories, sorted by slug."""
+    from .paths import paths
+
+    companies_dir = companies_dir or paths.companies.path
+    if not companies_dir.exists():
+        return []
+    return sorted(Path(e.path) for e in os.scandir(companies_dir) if e.is_dir())
+
+
+def _load_chunk(chunk: List[Tuple[str, List[DatagramRecord]]]) -> List[Optional[Company]]:
+    """Worker side: validates one batch of directories with their pre-read WAL updates."""
+    return [Company.from_directory(Path(d), records) for d, records in chunk]
+
+
+def load_companies(
+    dirs: Iterable[Path],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    stats: Optional[LoadStats] = None,
+) -> Iterator[Tuple[Path, Optional[Company]]]:
+    """
+    Yields (company_dir, Company or None) for every directory, in input order.
+
+    The WAL updates of all directories are read in one indexed pass here; the
+    YAML parsing and validation runs in a process pool over chunks of
+    directories. Small inputs, or `workers=1`, are loaded in-process.
+    """
+    dirs = list(dirs)
+    stats = stats if stats is not None else LoadStats()
+    start = time.perf_counter()
+
+    from .wal import read_updates_many
+
+    updates = read_updates_many(dirs)
+    chunks = [dirs[i:i + chunk_size] for i in range(0, len(dirs), chunk_size)]
+    stats.workers = min(workers or os.cpu_count() or 1, len(chunks)) or 1
+    if len(dirs) < MIN_PARALLEL_DIRS:
+        stats.workers = 1
+
+    def _count(company: Optional[Company]) -> None:
+        if company is None:
+            stats.skipped += 1
+        else:
+            stats.loaded += 1
+        stats.elapsed = time.perf_counter() - start
+
+    if stats.workers == 1:
+        for company_dir in dirs:
+            company = Company.from_directory(company_dir, updates[company_dir])
+            _count(company)
+            yield company_dir, company
+    else:
+        payloads = [[(str(d), updates[d]) for d in chunk] for chunk in chunks]
+        with ProcessPoolExecutor(max_workers=stats.workers) as pool:
+            for chunk, companies in zip(chunks, pool.map(_load_chunk, payloads)):
+                for company_dir, company in zip(chunk, companies):
+                    _count(company)
+                    yield company_dir, company
+
+    logger.debug(f"Company load: {stats.summary()}")
+
+
+class CompanySnapshot:
+    """
+    Every company loaded once for the duration of a run, so that consumers
+    (e.g. the enrichment compilers) share one copy instead of each re-reading
+    the directories. Companies that fail to load are counted, not kept.
+    """
+
+    def __init__(self, companies: Dict[str, Tuple[Path, Company]], stats: LoadStats):
+        self._companies = companies
+        self.stats = stats
+
+    @classmethod
+    def load(
+        cls, dirs: Optional[Iterable[Path]] = None, workers: Optional[int] = None
+    ) -> "CompanySnapshot":
+        stats = LoadStats()
+        companies: Dict[str, Tuple[Path, Company]] = {}
+        for company_dir, company in load_companies(
+            company_dirs() if dirs is None else dirs, workers=workers, stats=stats
+        ):
+            if company is not None:
+                companies[company_dir.name] = (company_dir, company)
+        return cls(companies, stats)
+
+    def __len__(self) -> int:
+        return len(self._companies)
+
+    def __iter__(self) -> Iterator[Tuple[Path, Company]]:
+        return iter(self._companies.values())
+
+    def get(self, slug: str) -> Optional[Company]:
+        entry = self._companies.get(slug)
+        return entry[1] if entry else None
+
+    def tagged(self, tag: str) -> List[Tuple[Path, Company]]:
+        return [(d, c) for d, c in self._companies.values() if tag in c.tags]
@@ -6,19 +6,22 @@ from playwright.async_api import Browser, BrowserContext
 from ..models.companies.company import Company
 from ..models.campaigns.campaign import Campaign
 from ..enrichment.website_scraper import WebsiteScraper
+from ..enrichment.http_fast_path import HttpFetcher
 from ..models.companies.website import Website
+from ..utils.browser_manager import BrowserContextPool
 
 logger = logging.getLogger(__name__)
 
 async def enrich_company_website(
-    browser: Browser | BrowserContext,
+    browser: Browser | BrowserContext | BrowserContextPool,
     company: Company,
     campaign: Optional[Campaign] = None,
     force: bool = False,
     ttl_days: int = 30,
     debug: bool = False,
     navigation_timeout_ms: Optional[int] = None,
-    processed_by: Optional[str] = None
+    processed_by: Optional[str] = None,
+    http_fetcher: Optional[HttpFetcher] = None,
 ) -> Optional[Website]:
     """
     Enriches a single Company object with data scraped from its website.
@@ -29,7 +32,7 @@ async def enrich_company_website(
     Uses a pre-existing browser instance.
 
     Args:
-        browser: The shared Playwright browser instance.
+        browser: The shared Playwright browser instance, a context, or a context pool.
         company: The Company object to enrich.
         campaign: The Campaign object associated with the enrichment.
         force: Force re-scraping even if fresh data is in the cache.
@@ -37,6 +40,7 @@ async def enrich_company_website(
         debug: Enable debug mode with breakpoints.
         navigation_timeout_ms: Timeout for page navigation.
         processed_by: The name of the node/worker performing the enrichment.
+        http_fetcher: Shared HTTP session; when given, static sites skip the browser.
 
     Returns:
         A Website object if enrichment is successful, otherwise None.
@@ -46,7 +50,7 @@ async def enrich_company_website(
         return None
 
     logger.info(f"Enriching website for {company.name}")
-    scraper = WebsiteScraper(processed_by=processed_by)
+    scraper = WebsiteScraper(processed_by=processed_by, http_fetcher=http_fetcher)
     website_data = await scraper.run(
         browser=browser,
         domain=company.domain,
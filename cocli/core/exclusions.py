@@ -1,5 +1,7 @@
+import os
 import json
-from typing import Optional, Dict, List
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
 from datetime import datetime
 import logging
 
@@ -8,6 +10,26 @@ from .paths import paths
 
 logger = logging.getLogger(__name__)
 
+# (name, mtime_ns, size) of every exclusion file in a directory
+_Signature = Tuple[Tuple[str, int, int], ...]
+
+# Parsed exclusions per directory, reused while none of its files changed
+_loaded: Dict[Path, Tuple[_Signature, Dict[str, Exclusion], Dict[str, Exclusion]]] = {}
+
+
+def _signature(exclude_dir: Path) -> _Signature:
+    entries = []
+    with os.scandir(exclude_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".json"):
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((entry.name, st.st_mtime_ns, st.st_size))
+    return tuple(sorted(entries))
+
+
 class ExclusionManager:
     def __init__(self, campaign: str):
         self.campaign = campaign
@@ -21,6 +43,14 @@ class ExclusionManager:
     def _load_all(self) -> None:
         self._slug_map.clear()
         self._domain_map.clear()
+        # Files rewritten in place (sync, edits) leave the directory mtime alone
+        signature = _signature(self.exclude_dir)
+        cached = _loaded.get(self.exclude_dir)
+        if cached and cached[0] == signature:
+            self._slug_map.update(cached[1])
+            self._domain_map.update(cached[2])
+            return
+
         for file in self.exclude_dir.glob("*.json"):
             try:
                 with open(file, "r") as f:
@@ -34,6 +64,7 @@ class ExclusionManager:
                         self._domain_map[exc.domain] = exc
             except Exception as e:
                 logger.error(f"Error loading exclusion file {file}: {e}")
+        _loaded[self.exclude_dir] = (signature, dict(self._slug_map), dict(self._domain_map))
 
     def is_excluded(self, domain: Optional[str] = None, slug: Optional[str] = None) -> bool:
         if slug and slug in self._slug_map:
@@ -61,7 +92,9 @@ class ExclusionManager:
             data = exc.model_dump()
             data["created_at"] = data["created_at"].isoformat()
             json.dump(data, f, indent=2)
-        
+        # A rewrite within the same mtime tick can keep the file's signature
+        _loaded.pop(self.exclude_dir, None)
+
         # Update cache
         if slug:
             self._slug_map[slug] = exc
@@ -81,6 +114,7 @@ class ExclusionManager:
         file_path = self.exclude_dir / f"{filename}.json"
         if file_path.exists():
             file_path.unlink()
+        _loaded.pop(self.exclude_dir, None)
 
     def list_exclusions(self) -> List[Exclusion]:
         # Return unique exclusions (some might have both slug and domain)
@@ -0,0 +1,250 @@
+import time
+import zlib
+import queue
+import socket
+import struct
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 0xFF never occurs in UTF-8, so nodes that only understand single-record
+# datagrams fail to decode a batch and drop it instead of misparsing it.
+BATCH_MAGIC = b"\xffCB"
+BATCH_VERSION = 2
+FLAG_ZLIB = 0x01
+
+# v1: magic, version, flags, sender epoch, sequence, record count, node id length
+_HEADER_V1 = struct.Struct("!3sBBIQHB")
+# v2 adds the byte range of the sender's journal the records were read from
+# (offset, span) and the journal file name, which follows the node id.
+_HEADER = struct.Struct("!3sBBIQHQIBB")
+
+# Conservative payload budget for a 1500-byte Ethernet MTU minus IP/UDP headers
+DEFAULT_MTU = 1400
+DEFAULT_RATE_BYTES_PER_SEC = 2 * 1024 * 1024
+
+RS_BYTE = b"\x1e"
+
+
+@dataclass
+class GossipBatch:
+    node_id: str
+    epoch: int
+    seq: int
+    records: List[str]
+    # Byte range [offset, offset + span) of the sender's `journal` these records
+    # cover; journal is None for batches from v1 senders.
+    journal: Optional[str] = None
+    offset: int = 0
+    span: int = 0
+
+
+def is_batch(data: bytes) -> bool:
+    return data.startswith(BATCH_MAGIC)
+
+
+def header_size(node_id: str, journal: str = "") -> int:
+    return _HEADER.size + len(node_id.encode("utf-8")[:255]) + len(journal.encode("utf-8")[:255])
+
+
+def frame_batch(
+    node_id: str,
+    epoch: int,
+    seq: int,
+    flags: int,
+    count: int,
+    payload: bytes,
+    journal: str = "",
+    offset: int = 0,
+    span: int = 0,
+) -> bytes:
+    node = node_id.encode("utf-8")[:255]
+    name = journal.encode("utf-8")[:255]
+    header = _HEADER.pack(
+        BATCH_MAGIC, BATCH_VERSION, flags, epoch, seq, count, offset, span, len(node), len(name)
+    )
+    return header + node + name + payload
+
+
+def decode_batch(data: bytes) -> GossipBatch:
+    """Parses a batch datagram. Raises ValueError if it is malformed."""
+    if len(data) < _HEADER_V1.size or not data.startswith(BATCH_MAGIC):
+        raise ValueError("Not a gossip batch")
+    version = data[len(BATCH_MAGIC)]
+    journal: Optional[str] = None
+    offset = span = 0
+    if version == 1:
+        _, _, flags, epoch, seq, count, node_len = _HEADER_V1.unpack_from(data)
+        start = _HEADER_V1.size + node_len
+        node_id = data[_HEADER_V1.size:start].decode("utf-8", errors="replace")
+    elif version == BATCH_VERSION:
+        if len(data) < _HEADER.size:
+            raise ValueError("Truncated gossip batch header")
+        _, _, flags, epoch, seq, count, offset, span, node_len, journal_len = _HEADER.unpack_from(data)
+        node_end = _HEADER.size + node_len
+        start = node_end + journal_len
+        node_id = data[_HEADER.size:node_end].decode("utf-8", errors="replace")
+        journal = data[node_end:start].decode("utf-8", errors="replace") or None
+    else:
+        raise ValueError(f"Unsupported gossip batch version {version}")
+
+    payload = data[start:]
+    if flags & FLAG_ZLIB:
+        try:
+            payload = zlib.decompress(payload)
+        except zlib.error as e:
+            raise ValueError(f"Corrupt gossip batch payload: {e}") from e
+
+    records = [
+        r.decode("utf-8", errors="replace") + "\x1e"
+        for r in payload.split(RS_BYTE)
+        if r.strip()
+    ]
+    if len(records) != count:
+        raise ValueError(f"Gossip batch declares {count} records, carries {len(records)}")
+    return GossipBatch(
+        node_id=node_id, epoch=epoch, seq=seq, records=records, journal=journal, offset=offset, span=span
+    )
+
+
+def pack_records(
+    records: Sequence[bytes], budget: int, compress: bool
+) -> List[Tuple[int, int, bytes, int]]:
+    """
+    Greedily packs RS-terminated records into datagram payloads of at most `budget` bytes.
+
+    Returns (flags, record count, payload, raw bytes consumed) per datagram, in order.
+    With compression, more raw bytes are packed per datagram and a batch whose
+    compressed form still exceeds the budget is split in half. A single record
+    larger than the budget is sent on its own.
+    """
+    if budget <= 0:
+        # Batching disabled: one record per datagram
+        return [(0, 1, r, len(r)) for r in records]
+
+    raw_budget = budget * 4 if compress else budget
+    groups: List[List[bytes]] = []
+    current: List[bytes] = []
+    size = 0
+    for record in records:
+        if current and size + len(record) > raw_budget:
+            groups.append(current)
+            current, size = [], 0
+        current.append(record)
+        size += len(record)
+    if current:
+        groups.append(current)
+
+    packed: List[Tuple[int, int, bytes, int]] = []
+    while groups:
+        group = groups.pop(0)
+        raw = b"".join(group)
+        if not compress:
+            packed.append((0, len(group), raw, len(raw)))
+            continue
+        payload = zlib.compress(raw, 6)
+        if len(payload) > budget and len(group) > 1:
+            half = len(group) // 2
+            groups[:0] = [group[:half], group[half:]]
+            continue
+        if len(payload) < len(raw):
+            packed.append((FLAG_ZLIB, len(group), payload, len(raw)))
+        else:
+            packed.append((0, len(group), raw, len(raw)))
+    return packed
+
+
+class TokenBucket:
+    """Byte-rate limiter: `consume` blocks until enough tokens have accumulated."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate / 4, 64 * 1024)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+
+    def consume(self, amount: int, stop: Optional[threading.Event] = None) -> bool:
+        """Returns False if `stop` was set while waiting."""
+        if self.rate <= 0:
+            return True
+        # A datagram larger than the bucket still goes out once the bucket is full
+        amount = min(amount, int(self.capacity))
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return True
+            wait = (amount - self._tokens) / self.rate
+            if stop is not None:
+                if stop.wait(wait):
+                    return False
+            else:
+                time.sleep(wait)
+
+
+class PeerSender:
+    """
+    Per-peer send queue drained by a daemon thread through a token bucket,
+    so one slow or distant peer never stalls the WAL reader or other peers.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        sock: socket.socket,
+        address: Callable[[], Optional[Tuple[str, int]]],
+        rate_bytes_per_sec: float = DEFAULT_RATE_BYTES_PER_SEC,
+        max_queue: int = 4096,
+    ):
+        self.name = name
+        self.sock = sock
+        self.address = address
+        self.bucket = TokenBucket(rate_bytes_per_sec)
+        self._queue: "queue.Queue[bytes]" = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True, name=f"GossipSender-{name}")
+        self._thread.start()
+
+        # Metrics
+        self.datagrams_sent = 0
+        self.bytes_sent = 0
+
+    def free_slots(self) -> int:
+        return self._queue.maxsize - self._queue.qsize()
+
+    def offer(self, datagram: bytes) -> bool:
+        try:
+            self._queue.put_nowait(datagram)
+            return True
+        except queue.Full:
+            return False
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                datagram = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if not self.bucket.consume(len(datagram), self._stop):
+                return
+            addr = self.address()
+            if addr is None:
+                continue
+            try:
+                self.sock.sendto(datagram, addr)
+                self.datagrams_sent += 1
+                self.bytes_sent += len(datagram)
+            except OSError as e:
+                logger.warning(f"Failed to send gossip batch to {self.name} at {addr}: {e}")
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=2)
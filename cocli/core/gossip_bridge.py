@@ -4,13 +4,25 @@ import logging
 import threading
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from zeroconf import Zeroconf, ServiceInfo, ServiceBrowser, ServiceListener
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
-from .wal import get_node_id
-from ..models.wal.record import DatagramRecord, RS, QueueDatagram, HeartbeatDatagram, ConfigDatagram
+from .wal import get_node_id, WalWriter
+from .gossip_batch import (
+    DEFAULT_MTU,
+    DEFAULT_RATE_BYTES_PER_SEC,
+    RS_BYTE,
+    PeerSender,
+    decode_batch,
+    frame_batch,
+    header_size,
+    is_batch,
+    pack_records,
+)
+from .gossip_sync import DEFAULT_HORIZON_DAYS, AntiEntropyClient, AntiEntropyServer, ReceivedRanges
+from ..models.wal.record import DatagramRecord, QueueDatagram, HeartbeatDatagram, ConfigDatagram
 from .paths import paths
 from .environment import get_environment, Environment
 
@@ -63,12 +75,46 @@ class WalEventHandler(FileSystemEventHandler):
             self.bridge.broadcast_file(Path(event.src_path))
 
 class GossipBridge:
-    def __init__(self) -> None:
+    """
+    Unicast UDP gossip of WAL records between cluster nodes.
+
+    New WAL records are packed into multi-record datagrams of at most `mtu` bytes
+    (zlib-compressed when that helps), stamped with a per-sender epoch and
+    sequence number, and queued per peer behind a token bucket of
+    `rate_bytes_per_sec`. Receivers track sequence gaps per sender and append
+    the records through a buffered WalWriter. Single-record datagrams (queue
+    markers, heartbeats, config, records from older nodes) are still accepted.
+
+    UDP delivery is best effort, so every `anti_entropy_interval` seconds (and
+    soon after a sequence gap) each peer is asked over a TCP side-channel on the
+    same port for the sizes of its recent journals. Only the byte ranges that
+    neither batches nor earlier pulls delivered are pulled and replayed.
+
+    Settings can be overridden per campaign under `[gossip]` (mtu, compress,
+    rate_bytes_per_sec, anti_entropy_interval, horizon_days).
+    """
+
+    def __init__(
+        self,
+        node_id: Optional[str] = None,
+        port: Optional[int] = None,
+        mtu: int = DEFAULT_MTU,
+        compress: bool = True,
+        rate_bytes_per_sec: float = DEFAULT_RATE_BYTES_PER_SEC,
+        anti_entropy_interval: float = 60.0,
+        horizon_days: int = DEFAULT_HORIZON_DAYS,
+    ) -> None:
         self.wal_dir = paths.wal
-        self.node_id = get_node_id()
+        self.node_id = node_id or get_node_id()
+        self.port = port or GOSSIP_PORT
+        self.mtu = mtu
+        self.compress = compress
+        self.rate_bytes_per_sec = rate_bytes_per_sec
+        self.anti_entropy_interval = anti_entropy_interval
+        self.horizon_days = horizon_days
         self.zeroconf: Optional[Zeroconf] = None
         self.browser: Optional[ServiceBrowser] = None
-        self.peers: Dict[str, str] = {} # node_id -> ip_address
+        self.peers: Dict[str, str] = {} # node_id -> ip_address (or "ip:port")
         self.running = False
         self.sock: Optional[socket.socket] = None
         self.observer = Observer()
@@ -81,6 +127,32 @@ class GossipBridge:
         # Real-time cluster status
         self.heartbeats: Dict[str, Dict[str, Any]] = {}
 
+        # Batched sending: one rate-limited queue per peer
+        self._senders: Dict[str, PeerSender] = {}
+        self._broadcast_lock = threading.Lock()
+        self._epoch = int(time.time()) & 0xFFFFFFFF
+        self._seq = 0
+
+        # Receiving: sequence tracking per sender and a buffered remote journal writer
+        self._recv_seq: Dict[str, Tuple[int, int]] = {}  # node_id -> (epoch, last seq)
+        self.remote_writer = WalWriter(max_records=512, flush_interval=0.5)
+
+        # Anti-entropy: byte ranges of peer journals already held, and the TCP side-channel
+        self.received = ReceivedRanges(self.wal_dir / ".gossip_received.json")
+        self.sync_client = AntiEntropyClient(self.received, self.node_id)
+        self.sync_server: Optional[AntiEntropyServer] = None
+        self._sync_wake = threading.Event()
+
+        self.stats: Dict[str, int] = {
+            "datagrams_sent": 0,
+            "records_sent": 0,
+            "datagrams_received": 0,
+            "records_received": 0,
+            "sequence_gaps": 0,
+            "records_missed": 0,
+            "records_pulled": 0,
+        }
+
     def _load_offsets(self) -> Dict[str, int]:
         if self.offset_file.exists():
             try:
@@ -100,8 +172,31 @@ class GossipBridge:
         except Exception:
             pass
 
+    def _peer_address(self, node_id: str) -> Optional[Tuple[str, int]]:
+        address = self.peers.get(node_id)
+        if not address:
+            return None
+        host, _, port = address.partition(":")
+        return host, int(port) if port else GOSSIP_PORT
+
+    def _peer_senders(self) -> List[PeerSender]:
+        if not self.sock:
+            return []
+        for node_id in list(self.peers):
+            if node_id not in self._senders:
+                self._senders[node_id] = PeerSender(
+                    node_id,
+                    self.sock,
+                    lambda n=node_id: self._peer_address(n),  # type: ignore[misc]
+                    rate_bytes_per_sec=self.rate_bytes_per_sec,
+                )
+        return [sender for node_id, sender in self._senders.items() if node_id in self.peers]
+
     def broadcast_file(self, wal_path: Path) -> None:
-        """Reads new records from a WAL file and sends them to all known peers via Unicast."""
+        """
+        Reads new records from a WAL file and queues them, packed into batch
+        datagrams, for every known peer.
+        """
         if not self.sock or not self.peers:
             return
         
@@ -115,41 +210,75 @@ class GossipBridge:
         if wal_path.name.startswith("remote_"):
             return
 
-        try:
-            offset = self._sent_offsets.get(str(wal_path), 0)
-            file_size = wal_path.stat().st_size
-            
-            if file_size <= offset:
-                return
+        # Watchdog events and the startup catch-up can race on the same file
+        with self._broadcast_lock:
+            try:
+                self._broadcast_new_records(wal_path)
+            except Exception as e:
+                logger.error(f"Error broadcasting {wal_path}: {e}")
 
-            with open(wal_path, "r") as f:
-                f.seek(offset)
-                new_data = f.read()
-                
-            # Split into individual records
-            records = [r + RS for r in new_data.split(RS) if r.strip()]
-            if not records:
-                # Update offset even if no records to avoid re-reading empty space
-                self._sent_offsets[str(wal_path)] = file_size
-                return
+    def _broadcast_new_records(self, wal_path: Path) -> None:
+        key = str(wal_path)
+        offset = self._sent_offsets.get(key, 0)
+        file_size = wal_path.stat().st_size
+        if file_size <= offset:
+            return
 
-            # Rate Limit: Only send up to 50 records per cycle
-            send_limit = 50
-            sent_count = 0
-            bytes_sent = 0
-            for msg in records[:send_limit]:
-                self.broadcast_msg(msg)
-                sent_count += 1
-                bytes_sent += len(msg)
-            
-            # Update offset precisely based on how many records we actually sent
-            self._sent_offsets[str(wal_path)] = offset + bytes_sent
+        with open(wal_path, "rb") as f:
+            f.seek(offset)
+            new_data = f.read()
+
+        # Only complete records; a writer may be mid-record
+        end = new_data.rfind(RS_BYTE)
+        if end == -1:
+            return
+        records: List[bytes] = []
+        record_ends: List[int] = []  # position just past each record in new_data
+        pos = 0
+        for raw in new_data[:end + 1].split(RS_BYTE)[:-1]:
+            pos += len(raw) + 1
+            if raw.strip():
+                records.append(raw + RS_BYTE)
+                record_ends.append(pos)
+        consumed_tail = end + 1
+
+        senders = self._peer_senders()
+        if not records:
+            self._sent_offsets[key] = offset + consumed_tail
             self._save_offsets()
-            
-            if len(records) > send_limit:
-                logger.debug(f"Rate limited {wal_path}: sent {send_limit}/{len(records)} records")
-        except Exception as e:
-            logger.error(f"Error broadcasting {wal_path}: {e}")
+            return
+
+        budget = self.mtu - header_size(self.node_id, wal_path.name) if self.mtu > 0 else 0
+        packed = pack_records(records, budget, self.compress)
+
+        # Advance the offset only past datagrams every peer queue accepted;
+        # the rest is picked up on the next call (backpressure, not loss).
+        # Each datagram names the journal range it covers, for anti-entropy.
+        sent_records = 0
+        for flags, count, payload, _raw_len in packed:
+            if any(sender.free_slots() < 1 for sender in senders):
+                break
+            range_start = record_ends[sent_records - 1] if sent_records else 0
+            range_end = record_ends[sent_records + count - 1]
+            self._seq += 1
+            datagram = frame_batch(
+                self.node_id, self._epoch, self._seq, flags, count, payload,
+                journal=wal_path.name, offset=offset + range_start, span=range_end - range_start,
+            )
+            for sender in senders:
+                sender.offer(datagram)
+            sent_records += count
+            self.stats["datagrams_sent"] += 1
+
+        self.stats["records_sent"] += sent_records
+        if sent_records == len(records):
+            self._sent_offsets[key] = offset + consumed_tail
+        elif sent_records:
+            self._sent_offsets[key] = offset + record_ends[sent_records - 1]
+        self._save_offsets()
+
+        if sent_records < len(records):
+            logger.debug(f"Peer queues full for {wal_path}: queued {sent_records}/{len(records)} records")
 
     def broadcast_msg(self, msg: str) -> None:
         """Sends a raw message to all known peers via Unicast UDP."""
@@ -157,12 +286,15 @@ class GossipBridge:
             return
             
         data = msg.encode('utf-8')
-        for node_id, ip in list(self.peers.items()):
+        for node_id in list(self.peers):
+            addr = self._peer_address(node_id)
+            if addr is None:
+                continue
             try:
-                self.sock.sendto(data, (ip, GOSSIP_PORT))
-                logger.info(f"Broadcasted gossip msg ({msg[0]}) to {node_id} ({ip})")
+                self.sock.sendto(data, addr)
+                logger.debug(f"Broadcasted gossip msg ({msg[0]}) to {node_id} ({addr[0]})")
             except Exception as send_err:
-                logger.warning(f"Failed to send to {node_id} at {ip}: {send_err}")
+                logger.warning(f"Failed to send to {node_id} at {addr[0]}: {send_err}")
 
     def _listen_loop(self) -> None:
         """Background thread to receive unicast gossip."""
@@ -172,8 +304,13 @@ class GossipBridge:
             try:
                 self.sock.settimeout(1.0)
                 data, addr = self.sock.recvfrom(65535)
+                self.stats["datagrams_received"] += 1
+                if is_batch(data):
+                    self.handle_batch(data, addr)
+                    continue
                 msg = data.decode('utf-8')
-                logger.info(f"RAW GOSSIP RECEIVED from {addr}: {msg[:50]}...")
+                logger.debug(f"RAW GOSSIP RECEIVED from {addr}: {msg[:50]}...")
+                self.stats["records_received"] += 1
                 self.handle_gossip(msg, addr)
 
             except socket.timeout:
@@ -182,6 +319,72 @@ class GossipBridge:
                 if self.running:
                     logger.error(f"Gossip listen error: {e}")
 
+    def handle_batch(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Unpacks a multi-record datagram, tracking sequence gaps per sender."""
+        try:
+            batch = decode_batch(data)
+        except ValueError as e:
+            logger.warning(f"Dropping malformed gossip batch from {addr}: {e}")
+            return
+
+        last = self._recv_seq.get(batch.node_id)
+        if last is not None and last[0] == batch.epoch:
+            expected = last[1] + 1
+            if batch.seq > expected:
+                missed = batch.seq - expected
+                self.stats["sequence_gaps"] += 1
+                self.stats["records_missed"] += missed
+                logger.warning(
+                    f"Gossip gap from {batch.node_id}: expected seq {expected}, got {batch.seq} ({missed} datagrams lost)"
+                )
+                # Don't wait for the next anti-entropy round
+                self._sync_wake.set()
+            elif batch.seq < expected:
+                logger.debug(f"Late gossip datagram {batch.seq} from {batch.node_id} (expected {expected})")
+        if last is None or last[0] != batch.epoch or batch.seq > last[1]:
+            self._recv_seq[batch.node_id] = (batch.epoch, batch.seq)
+
+        self.stats["records_received"] += len(batch.records)
+        for msg in batch.records:
+            self.handle_gossip(msg, addr)
+        if batch.journal:
+            self.received.add(batch.node_id, batch.journal, batch.offset, batch.offset + batch.span)
+
+    def reconcile(self, node_id: str) -> int:
+        """
+        Pulls the journal ranges a peer has that this node never received.
+        Returns the number of records replayed.
+        """
+        address = self._peer_address(node_id)
+        if address is None:
+            return 0
+        pulled = 0
+        try:
+            for peer, journal, data in self.sync_client.reconcile(address):
+                for raw in data.split(RS_BYTE):
+                    if raw.strip():
+                        self.handle_gossip(raw.decode("utf-8", errors="replace") + "\x1e", address)
+                        pulled += 1
+                logger.debug(f"Anti-entropy: pulled {len(data)} bytes of {journal} from {peer}")
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"Anti-entropy with {node_id} at {address[0]} failed: {e}")
+        self.stats["records_pulled"] += pulled
+        if pulled:
+            logger.info(f"Anti-entropy: caught up {pulled} records from {node_id}")
+        return pulled
+
+    def _anti_entropy_loop(self) -> None:
+        while self.running:
+            self._sync_wake.wait(self.anti_entropy_interval)
+            self._sync_wake.clear()
+            if not self.running:
+                break
+            for node_id in list(self.peers):
+                self.reconcile(node_id)
+            # Ranges are only persisted once their records are on disk
+            self.remote_writer.flush()
+            self.received.save()
+
     def handle_gossip(self, msg: str, addr: tuple[str, int]) -> None:
         """Processes an incoming USV datagram and writes it locally via paths authority."""
         try:
@@ -280,35 +483,69 @@ class GossipBridge:
             if record.environment != current_env:
                 return
 
-            logger.info(f"Received gossip for {record.target}.{record.field} from {record.node_id}")
+            logger.debug(f"Received gossip for {record.target}.{record.field} from {record.node_id}")
             
-            # Save received updates in a remote-node specific file via paths authority
+            # Save received updates in a remote-node specific file via paths authority.
+            # Buffered and group committed; the writer creates the WAL dir.
             remote_wal = paths.wal_remote_journal(record.node_id)
-            
-            # Ensure WAL dir exists (path authority doesn't create it automatically on path return)
-            remote_wal.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(remote_wal, "a") as f:
-                f.write(msg)
+            self.remote_writer.append_record(remote_wal, msg, record.target)
                 
         except Exception as e:
             logger.error(f"Failed to handle gossip: {e}")
 
-    def start(self) -> None:
+    def _load_settings(self) -> None:
+        """Applies the campaign's optional [gossip] overrides."""
+        try:
+            from .config import load_campaign_config, get_campaign
+            campaign_name = os.getenv("CAMPAIGN_NAME") or get_campaign()
+            if not campaign_name:
+                return
+            settings = load_campaign_config(campaign_name).get("gossip", {})
+            self.mtu = int(settings.get("mtu", self.mtu))
+            self.compress = bool(settings.get("compress", self.compress))
+            self.rate_bytes_per_sec = float(settings.get("rate_bytes_per_sec", self.rate_bytes_per_sec))
+            self.anti_entropy_interval = float(settings.get("anti_entropy_interval", self.anti_entropy_interval))
+            self.horizon_days = int(settings.get("horizon_days", self.horizon_days))
+        except Exception as e:
+            logger.debug(f"Gossip settings skipped: {e}")
+
+    def start(self, discover: bool = True) -> None:
+        """
+        Binds the gossip socket and starts listening. With `discover=False` peer
+        discovery, mDNS, the WAL observer and campaign settings are skipped and
+        peers must be added to `self.peers` directly (tests, benchmarks).
+        """
         if self.running:
             return
-            
+
+        if discover:
+            self._load_settings()
+
         try:
             # Setup Unicast UDP Socket (This is fast)
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.sock.bind(('0.0.0.0', GOSSIP_PORT))
+            # Room for bursts of batch datagrams while handle_gossip catches up
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+            self.sock.bind(('0.0.0.0', self.port))
         except Exception as e:
             logger.error(f"Gossip Bridge failed to initialize socket: {e}")
             return
 
         self.running = True
-        
+
+        # Anti-entropy side-channel: TCP on the same port number as the UDP socket
+        try:
+            self.sync_server = AntiEntropyServer(
+                ('0.0.0.0', self.port), self.wal_dir.path, self.node_id, horizon_days=self.horizon_days
+            )
+            self.sync_server.start()
+        except OSError as e:
+            logger.warning(f"Gossip anti-entropy server unavailable: {e}")
+            self.sync_server = None
+        if self.anti_entropy_interval > 0:
+            threading.Thread(target=self._anti_entropy_loop, daemon=True, name="GossipAntiEntropyLoop").start()
+
         # Start Peer Discovery, Registration, Zeroconf, and Observer in a background thread
         def _bg_init() -> None:
             try:
@@ -347,7 +584,7 @@ class GossipBridge:
                         SERVICE_TYPE,
                         f"{self.node_id}.{SERVICE_TYPE}",
                         addresses=[socket.inet_aton(local_ip)],
-                        port=GOSSIP_PORT,
+                        port=self.port,
                         properties={"node_id": self.node_id}
                     )
                     self.zeroconf.register_service(info)
@@ -374,7 +611,8 @@ class GossipBridge:
             except Exception as e:
                 logger.error(f"Gossip background init failed: {e}")
 
-        threading.Thread(target=_bg_init, daemon=True, name="GossipInit").start()
+        if discover:
+            threading.Thread(target=_bg_init, daemon=True, name="GossipInit").start()
 
         # Start Gossip Listener
         self.listener_thread = threading.Thread(target=self._listen_loop, daemon=True)
@@ -495,6 +733,13 @@ class GossipBridge:
 
     def stop(self) -> None:
         self.running = False
+        self._sync_wake.set()
+        if self.sync_server:
+            self.sync_server.stop()
+            self.sync_server = None
+        for sender in self._senders.values():
+            sender.stop()
+        self._senders.clear()
         if self.observer.is_alive():
             self.observer.stop()
             self.observer.join()
@@ -506,6 +751,8 @@ class GossipBridge:
                 pass
         if self.sock:
             self.sock.close()
+        self.remote_writer.close()
+        self.received.save()
 
 # Authoritative Global Instance
 bridge = GossipBridge()
@@ -0,0 +1,302 @@
+import re
+import json
+import socket
+import logging
+import threading
+import socketserver
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+RS_BYTE = b"\x1e"
+
+# Only dated journals are served: `<YYYYMMDD>_<node_id>.usv` directly in the WAL dir
+_JOURNAL_NAME = re.compile(r"^(\d{8})_[\w.\-]+\.usv$")
+
+# Upper bound on the bytes served for one requested range; the rest is pulled next round
+MAX_RANGE_BYTES = 8 * 1024 * 1024
+MAX_RANGES_PER_REQUEST = 256
+DEFAULT_HORIZON_DAYS = 3
+
+Range = Tuple[int, int]
+
+
+class RangeSet:
+    """Sorted, non-overlapping set of half-open byte ranges [start, end)."""
+
+    def __init__(self, ranges: Optional[List[Range]] = None):
+        self._ranges: List[Range] = []
+        for start, end in ranges or []:
+            self.add(start, end)
+
+    def __iter__(self) -> Iterator[Range]:
+        return iter(self._ranges)
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def add(self, start: int, end: int) -> None:
+        if end <= start:
+            return
+        merged: List[Range] = []
+        placed = False
+        for s, e in self._ranges:
+            if e < start:
+                merged.append((s, e))
+            elif s > end:
+                if not placed:
+                    merged.append((start, end))
+                    placed = True
+                merged.append((s, e))
+            else:
+                # Overlapping or adjacent: absorb into the new range
+                start, end = min(s, start), max(e, end)
+        if not placed:
+            merged.append((start, end))
+        self._ranges = merged
+
+    def missing(self, size: int) -> List[Range]:
+        """The gaps in [0, size) not covered by the set."""
+        gaps: List[Range] = []
+        pos = 0
+        for s, e in self._ranges:
+            if s >= size:
+                break
+            if s > pos:
+                gaps.append((pos, s))
+            pos = max(pos, e)
+        if pos < size:
+            gaps.append((pos, size))
+        return gaps
+
+    def end(self) -> int:
+        return self._ranges[-1][1] if self._ranges else 0
+
+    def to_list(self) -> List[List[int]]:
+        return [[s, e] for s, e in self._ranges]
+
+
+class ReceivedRanges:
+    """
+    Which byte ranges of each peer's journals this node already holds, keyed by
+    (peer node id, journal name). Fed by batch datagrams and by anti-entropy
+    pulls, persisted next to the gossip offsets so restarts resume the delta.
+    """
+
+    def __init__(self, state_file: Path):
+        self.state_file = state_file
+        self._ranges: Dict[str, Dict[str, RangeSet]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        if not self.state_file.exists():
+            return
+        try:
+            with open(self.state_file, "r") as f:
+                data = json.load(f)
+            for peer, journals in data.items():
+                self._ranges[peer] = {
+                    name: RangeSet([(s, e) for s, e in ranges]) for name, ranges in journals.items()
+                }
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable gossip range state {self.state_file}: {e}")
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                peer: {name: ranges.to_list() for name, ranges in journals.items()}
+                for peer, journals in self._ranges.items()
+            }
+            self._dirty = False
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.state_file, "w") as f:
+                json.dump(data, f)
+        except OSError as e:
+            logger.warning(f"Could not save gossip range state: {e}")
+
+    def add(self, peer: str, journal: str, start: int, end: int) -> None:
+        with self._lock:
+            self._ranges.setdefault(peer, {}).setdefault(journal, RangeSet()).add(start, end)
+            self._dirty = True
+
+    def missing(self, peer: str, journal: str, size: int) -> List[Range]:
+        with self._lock:
+            ranges = self._ranges.get(peer, {}).get(journal)
+            if ranges is None:
+                return [(0, size)] if size > 0 else []
+            if ranges.end() > size:
+                # The peer's journal shrank (rewritten or compacted): start over
+                logger.info(f"Journal {journal} on {peer} shrank below what we hold; re-pulling")
+                del self._ranges[peer][journal]
+                self._dirty = True
+                return [(0, size)] if size > 0 else []
+            return ranges.missing(size)
+
+    def ranges(self, peer: str, journal: str) -> List[Range]:
+        with self._lock:
+            return list(self._ranges.get(peer, {}).get(journal, RangeSet()))
+
+
+def journal_vector(wal_dir: Path, horizon_days: int = DEFAULT_HORIZON_DAYS) -> Dict[str, int]:
+    """Sizes of the dated journals in the WAL dir from the last `horizon_days` days."""
+    cutoff = (datetime.now(UTC) - timedelta(days=horizon_days)).strftime("%Y%m%d")
+    vector: Dict[str, int] = {}
+    if not wal_dir.exists():
+        return vector
+    for wal_file in wal_dir.glob("*.usv"):
+        match = _JOURNAL_NAME.match(wal_file.name)
+        if not match or match.group(1) < cutoff:
+            continue
+        try:
+            vector[wal_file.name] = wal_file.stat().st_size
+        except FileNotFoundError:
+            continue
+    return vector
+
+
+def read_range(wal_dir: Path, journal: str, start: int, end: int) -> bytes:
+    """
+    Reads [start, end) of a journal, capped at MAX_RANGE_BYTES and trimmed to
+    the last complete record. Returns b"" for unknown journals.
+    """
+    if not _JOURNAL_NAME.match(journal):
+        return b""
+    wal_file = wal_dir / journal
+    length = min(end - start, MAX_RANGE_BYTES)
+    if length <= 0:
+        return b""
+    try:
+        with open(wal_file, "rb") as f:
+            f.seek(start)
+            data = f.read(length)
+    except OSError:
+        return b""
+    cut = data.rfind(RS_BYTE)
+    return data[:cut + 1] if cut != -1 else b""
+
+
+class _SyncHandler(socketserver.StreamRequestHandler):
+    """
+    One anti-entropy exchange per connection. Requests are JSON lines:
+
+        {"op": "vector"}
+            -> {"node_id": ..., "journals": {name: size}}
+        {"op": "pull", "journal": name, "ranges": [[start, end], ...]}
+            -> per range: {"start": s, "length": n} followed by n raw bytes
+    """
+
+    server: "AntiEntropyServer"
+
+    def handle(self) -> None:
+        self.connection.settimeout(self.server.timeout_seconds)
+        try:
+            for line in self.rfile:
+                request = json.loads(line)
+                op = request.get("op")
+                if op == "vector":
+                    self._send_json({
+                        "node_id": self.server.node_id,
+                        "journals": journal_vector(self.server.wal_dir, self.server.horizon_days),
+                    })
+                elif op == "pull":
+                    journal = str(request.get("journal", ""))
+                    for start, end in request.get("ranges", [])[:MAX_RANGES_PER_REQUEST]:
+                        data = read_range(self.server.wal_dir, journal, int(start), int(end))
+                        self._send_json({"start": int(start), "length": len(data)})
+                        self.wfile.write(data)
+                    self.wfile.flush()
+                else:
+                    return
+        except (OSError, ValueError) as e:
+            logger.debug(f"Anti-entropy session with {self.client_address} ended: {e}")
+
+    def _send_json(self, obj: object) -> None:
+        self.wfile.write(json.dumps(obj).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+
+class AntiEntropyServer(socketserver.ThreadingTCPServer):
+    """TCP side-channel serving journal vectors and byte ranges to peers."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        wal_dir: Path,
+        node_id: str,
+        horizon_days: int = DEFAULT_HORIZON_DAYS,
+        timeout_seconds: float = 10.0,
+    ):
+        self.wal_dir = wal_dir
+        self.node_id = node_id
+        self.horizon_days = horizon_days
+        self.timeout_seconds = timeout_seconds
+        super().__init__(address, _SyncHandler)
+
+    def start(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, daemon=True, name="GossipAntiEntropy")
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class AntiEntropyClient:
+    """Pulls the byte ranges of a peer's journals that `received` does not cover yet."""
+
+    def __init__(self, received: ReceivedRanges, node_id: str, timeout_seconds: float = 10.0):
+        self.received = received
+        self.node_id = node_id
+        self.timeout_seconds = timeout_seconds
+
+        # Metrics
+        self.rounds = 0
+        self.bytes_pulled = 0
+
+    def reconcile(self, address: Tuple[str, int]) -> Iterator[Tuple[str, str, bytes]]:
+        """
+        Yields (peer node id, journal, raw records) for every missing range pulled
+        from the peer at `address`. A range is marked received once the caller has
+        consumed it, so an interrupted round is resumed, not skipped.
+        """
+        self.rounds += 1
+        with socket.create_connection(address, timeout=self.timeout_seconds) as conn:
+            rfile = conn.makefile("rb")
+            self._send(conn, {"op": "vector"})
+            header = json.loads(rfile.readline())
+            peer = str(header["node_id"])
+
+            for journal, size in sorted(header["journals"].items()):
+                if journal.endswith(f"_{self.node_id}.usv"):
+                    continue  # our own records
+                missing = self.received.missing(peer, journal, int(size))
+                if not missing:
+                    continue
+                missing = missing[:MAX_RANGES_PER_REQUEST]
+                self._send(conn, {"op": "pull", "journal": journal, "ranges": missing})
+                for _ in missing:
+                    reply = json.loads(rfile.readline())
+                    start, length = int(reply["start"]), int(reply["length"])
+                    data = rfile.read(length) if length else b""
+                    if len(data) != length:
+                        raise OSError(f"Short read from {peer} for {journal}@{start}")
+                    if not data:
+                        continue
+                    yield peer, journal, data
+                    self.received.add(peer, journal, start, start + length)
+                    self.bytes_pulled += length
+
+    @staticmethod
+    def _send(conn: socket.socket, obj: object) -> None:
+        conn.sendall(json.dumps(obj).encode("utf-8") + b"\n")
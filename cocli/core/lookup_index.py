@@ -0,0 +1,157 @@
+import csv
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from .config import get_cocli_base_dir
+
+logger = logging.getLogger(__name__)
+
+
+class LookupIndex:
+    """
+    In-memory hash index over rows on a fixed set of keys. Each key maps a
+    value to the positions of the rows carrying it, in source order, so a
+    lookup returns the same row a front-to-back scan would have found first.
+    """
+
+    def __init__(self, key_fields: Dict[str, Sequence[str]]):
+        # key name -> candidate column names, first non-empty one wins
+        self.key_fields = key_fields
+        self.rows: List[Dict[str, Any]] = []
+        self._keys: Dict[str, Dict[str, List[int]]] = {key: {} for key in key_fields}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _value(self, row: Dict[str, Any], key: str) -> Optional[str]:
+        for column in self.key_fields[key]:
+            value = row.get(column)
+            if value:
+                return str(value).strip()
+        return None
+
+    def add(self, row: Dict[str, Any]) -> None:
+        position = len(self.rows)
+        self.rows.append(row)
+        for key in self.key_fields:
+            value = self._value(row, key)
+            if value:
+                self._keys[key].setdefault(value, []).append(position)
+
+    def positions(self, key: str, value: Optional[str]) -> List[int]:
+        if not value:
+            return []
+        return self._keys[key].get(str(value).strip(), [])
+
+    def first(self, **criteria: Optional[str]) -> Optional[Dict[str, Any]]:
+        """The earliest row matching any of the given key=value criteria."""
+        best: Optional[int] = None
+        for key, value in criteria.items():
+            hits = self.positions(key, value)
+            if hits and (best is None or hits[0] < best):
+                best = hits[0]
+        return self.rows[best] if best is not None else None
+
+    def duplicates(self, key: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Values of `key` carried by more than one row, with those rows."""
+        return {
+            value: [self.rows[p] for p in hits]
+            for value, hits in self._keys[key].items()
+            if len(hits) > 1
+        }
+
+
+class GoogleMapsLookupIndex(LookupIndex):
+    """
+    Slug / domain / place_id index over the legacy `*.csv` files of a campaign's
+    google_maps_prospects index. Persisted under the cache dir and rebuilt when
+    any source CSV is added, removed or changed.
+    """
+
+    VERSION = 1
+    KEY_FIELDS: Dict[str, Sequence[str]] = {
+        "slug": ("slug", "Slug"),
+        "domain": ("domain", "Domain"),
+        "place_id": ("place_id", "Place ID", "Place_ID"),
+    }
+
+    def __init__(self, source_dir: Path, state_file: Optional[Path] = None):
+        super().__init__(self.KEY_FIELDS)
+        self.source_dir = source_dir
+        self.state_file = state_file
+        self.signature: Dict[str, List[int]] = {}
+
+    @classmethod
+    def for_campaign(cls, campaign_name: str = "turboship") -> "GoogleMapsLookupIndex":
+        base = get_cocli_base_dir()
+        safe_name = campaign_name.replace("/", "_").replace("\\", "_")
+        index = cls(
+            base / "campaigns" / campaign_name / "indexes" / "google_maps_prospects",
+            base / "cache" / f"google_maps_lookup_{safe_name}.json",
+        )
+        index.load()
+        return index
+
+    def source_signature(self) -> Dict[str, List[int]]:
+        signature: Dict[str, List[int]] = {}
+        if not self.source_dir.exists():
+            return signature
+        for csv_file in sorted(self.source_dir.glob("*.csv")):
+            try:
+                st = csv_file.stat()
+            except OSError:
+                continue
+            signature[csv_file.name] = [st.st_mtime_ns, st.st_size]
+        return signature
+
+    def is_stale(self) -> bool:
+        return self.source_signature() != self.signature
+
+    def load(self) -> None:
+        """Loads the persisted index if it matches the sources, else rebuilds it."""
+        signature = self.source_signature()
+        if self.state_file and self.state_file.exists():
+            try:
+                with open(self.state_file, "r", encoding="utf-8") as f:
+                    state = json.load(f)
+                if state.get("version") == self.VERSION and state.get("sources") == signature:
+                    self._reset()
+                    for row in state["rows"]:
+                        self.add(row)
+                    self.signature = signature
+                    return
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable lookup index {self.state_file}: {e}")
+        self.build(signature)
+
+    def _reset(self) -> None:
+        self.rows = []
+        self._keys = {key: {} for key in self.key_fields}
+
+    def build(self, signature: Optional[Dict[str, List[int]]] = None) -> None:
+        signature = self.source_signature() if signature is None else signature
+        self._reset()
+        for name in signature:
+            try:
+                with open(self.source_dir / name, "r", newline="") as f:
+                    for row in csv.DictReader(f):
+                        self.add(row)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable Google Maps CSV {name}: {e}")
+        self.signature = signature
+        logger.info(f"Built Google Maps lookup index: {len(self.rows)} rows from {len(signature)} CSVs")
+        self.save()
+
+    def save(self) -> None:
+        if not self.state_file:
+            return
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.state_file.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({"version": self.VERSION, "sources": self.signature, "rows": self.rows}, f)
+            tmp_file.replace(self.state_file)
+        except OSError as e:
+            logger.warning(f"Could not save lookup index {self.state_file}: {e}")
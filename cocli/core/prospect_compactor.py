@@ -2,7 +2,7 @@
 import logging
 import shutil
 from pathlib import Path
-from typing import Set
+from typing import Optional, Set
 from cocli.core.config import get_campaigns_dir
 from cocli.core.sharding import get_grid_tile_id, get_geo_shard
 from cocli.core.constants import UNIT_SEP
@@ -53,6 +53,16 @@ def consolidate_campaign_results(campaign_name: str) -> int:
     _cleanup_empty_dirs(results_dir)
     return merged_count
 
+def write_prospects_parquet(checkpoint_path: Path) -> Optional[Path]:
+    """
+    Writes the Parquet copy of a prospects checkpoint (typed with the GoogleMapsPlace
+    schema) that DuckDB readers prefer over the USV while it is up to date.
+    """
+    from cocli.models.campaigns.indexes.google_maps_place import GoogleMapsPlace
+    from cocli.utils.duckdb_utils import get_duckdb_schema_from_fields, write_parquet_checkpoint
+    columns = get_duckdb_schema_from_fields(GoogleMapsPlace.get_datapackage_fields())
+    return write_parquet_checkpoint(checkpoint_path, columns)
+
 def compact_prospects_to_checkpoint(campaign_name: str) -> int:
     """
     UNIFIED ENGINE: Merges sharded WAL prospects and/or sorts/dedupes the main checkpoint.
@@ -112,6 +122,7 @@ def compact_prospects_to_checkpoint(campaign_name: str) -> int:
         
         if temp_checkpoint.exists():
             temp_checkpoint.replace(checkpoint_path)
+            write_prospects_parquet(checkpoint_path)
             
             # 6. Cleanup WAL files only after successful swap
             if wal_dir.exists():
@@ -1,7 +1,11 @@
 import os
 import json
+import time
+import random
 import logging
-from typing import List, Type, TypeVar, Any, Optional, Union, Dict
+import threading
+from typing import List, Type, TypeVar, Any, Optional, Union, Dict, Callable, Sequence, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta, UTC
 from botocore.exceptions import ClientError
@@ -10,12 +14,15 @@ from ...models.campaigns.queues.gm_list import ScrapeTask
 from ...models.campaigns.queues.gm_details import GmItemTask
 from ...models.campaigns.queues.base import QueueMessage
 from ...core.config import get_cocli_base_dir, get_campaign_dir
+from ...core.campaign_stats import has_witness, record_queue_event
 from ...core.paths import paths
 from ...core.sharding import get_shard_id
+from .pending_catalog import PendingCatalog
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", ScrapeTask, GmItemTask, QueueMessage)
+R = TypeVar("R")
 
 
 class FilesystemQueue:
@@ -30,6 +37,7 @@ class FilesystemQueue:
               lease.json
         completed/
           <task_id>.json
+        pending.catalog.usv   (index of pending task dirs, see PendingCatalog)
     """
 
     def __init__(
@@ -40,11 +48,14 @@ class FilesystemQueue:
         stale_heartbeat_minutes: int = 10,
         s3_client: Any = None,
         bucket_name: Optional[str] = None,
+        lease_concurrency: int = 8,
     ):
         self.campaign_name = campaign_name
         self.queue_name = queue_name
         self.lease_duration = lease_duration_minutes
         self.stale_heartbeat = stale_heartbeat_minutes
+        # Max parallel S3 round trips when leasing/acking a batch
+        self.lease_concurrency = lease_concurrency
         self.s3_client = s3_client
         self.bucket_name = bucket_name
 
@@ -71,6 +82,26 @@ class FilesystemQueue:
         self.completed_dir.mkdir(parents=True, exist_ok=True)
         self.failed_dir.mkdir(parents=True, exist_ok=True)
 
+        # Loaded lazily on first use, so queues that never poll the frontier pay nothing
+        self.catalog = PendingCatalog(
+            self.pending_dir, self.queue_base / "pending.catalog.usv"
+        )
+
+        # S3 discovery state: cached shard listing and per-shard StartAfter cursors
+        self.discovery_shard_ttl = 300.0
+        self._s3_shards: List[str] = []
+        self._s3_shards_listed_at = 0.0
+        self._s3_shard_cursors: Dict[str, str] = {}
+        # Task whose lease.json ended the previous page; its task.json starts the next one
+        self._s3_shard_leased: Dict[str, str] = {}
+        self._discovery_lock = threading.Lock()
+
+        # Background discovery prefetcher (see start_discovery_prefetch)
+        self.prefetch_low_watermark = 0
+        self._prefetch_thread: Optional[threading.Thread] = None
+        self._prefetch_stop = threading.Event()
+        self._prefetch_wake = threading.Event()
+
         # We need a worker ID for the lease
         self.worker_id = (
             os.getenv("COCLI_HOSTNAME")
@@ -163,6 +194,18 @@ class FilesystemQueue:
         # 2. Fallback to Local Lease
         return self._create_local_lease(task_id, lease_data)
 
+    def _map_concurrent(self, fn: Callable[[Any], R], items: Sequence[Any]) -> List[R]:
+        """Runs fn over items, on a bounded thread pool when S3 latency is involved."""
+        if len(items) <= 1 or not (self.s3_client and self.bucket_name):
+            return [fn(item) for item in items]
+        workers = min(self.lease_concurrency, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(fn, items))
+
+    def _create_leases(self, task_ids: Sequence[str]) -> Dict[str, bool]:
+        """Attempts to lease several tasks at once (concurrent S3 conditional puts)."""
+        return dict(zip(task_ids, self._map_concurrent(self._create_lease, task_ids)))
+
     def _reclaim_stale_s3_lease(self, task_id: str) -> bool:
         """Checks if S3 lease is stale and attempts to reclaim it."""
         s3_key = self._get_s3_lease_key(task_id)
@@ -204,6 +247,7 @@ class FilesystemQueue:
             fd = os.open(lease_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
             with os.fdopen(fd, "w") as f:
                 json.dump(lease_data, f)
+            record_queue_event(self.campaign_name, self.queue_name, inflight=1)
             return True
         except FileExistsError:
             return self._reclaim_stale_local_lease(task_id)
@@ -240,6 +284,7 @@ class FilesystemQueue:
                 )
                 try:
                     lease_path.unlink()
+                    record_queue_event(self.campaign_name, self.queue_name, inflight=-1)
                     return self._create_lease(task_id)
                 except FileNotFoundError:
                     return False
@@ -251,8 +296,6 @@ class FilesystemQueue:
     def push(self, task_id: str, payload: dict[str, Any]) -> str:
         """Writes a task to the pending directory."""
         task_dir = self._get_task_dir(task_id)
-        task_dir.mkdir(parents=True, exist_ok=True)
-
         task_path = task_dir / "task.json"
 
         # Idempotent push: only write if not exists
@@ -263,13 +306,20 @@ class FilesystemQueue:
                     return obj.isoformat()
                 raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
-            with open(task_path, "w") as f:
-                json.dump(payload, f, default=datetime_handler)
+            with self.catalog.tracking(task_dir):
+                task_dir.mkdir(parents=True, exist_ok=True)
+                with open(task_path, "w") as f:
+                    json.dump(payload, f, default=datetime_handler)
+            record_queue_event(self.campaign_name, self.queue_name, pending=1)
             logger.debug(f"Pushed task {task_id} to {self.queue_name} pending")
         return task_id
 
     def poll_frontier(self, task_type: Type[T], batch_size: int = 1) -> List[T]:
-        """Generic poll for queues with S3 discovery fallback."""
+        """
+        Generic poll for queues with S3 discovery fallback.
+        Candidates come from the pending catalog, so a poll costs O(batch) rather
+        than a walk of every shard directory.
+        """
         logger.info(f"Polling {self.queue_name} for tasks...")
         if not self.pending_dir.exists():
             self.pending_dir.mkdir(parents=True, exist_ok=True)
@@ -277,55 +327,47 @@ class FilesystemQueue:
         tasks: List[T] = []
         count = 0
 
-        # 1. Get local candidates
-        candidates = []
-        if self.pending_dir.exists():
-            for entry in self.pending_dir.iterdir():
-                if entry.is_dir():
-                    # If it's a shard (1 or 2 chars), look inside
-                    if len(entry.name) in [1, 2]:
-                        for sub_entry in entry.iterdir():
-                            if sub_entry.is_dir():
-                                candidates.append(sub_entry)
-                    else:
-                        # Legacy/Flat structure
-                        candidates.append(entry)
+        # 1. Pick up tasks that arrived outside the queue API (e.g. smart_sync)
+        self.catalog.refresh()
 
         logger.debug(
-            f"Queue {self.queue_name}: Found {len(candidates)} local candidates."
+            f"Queue {self.queue_name}: Found {len(self.catalog)} local candidates."
         )
         # 2. If no local candidates and we have S3, try to discover some
-        if not candidates and self.s3_client and self.bucket_name:
+        local_count = len(self.catalog)
+        if self._prefetch_thread and local_count < self.prefetch_low_watermark:
+            # Top-up happens in the background; only block if we have nothing
+            self._prefetch_wake.set()
+        if not local_count and self.s3_client and self.bucket_name:
             # We don't log 'Local queue empty' every time to avoid spam
             # but we do need to try discovery
             self._discover_tasks_from_s3()
-            # Re-scan after discovery
-            for entry in self.pending_dir.iterdir():
-                if entry.is_dir():
-                    if len(entry.name) in [1, 2]:
-                        for sub_entry in entry.iterdir():
-                            if sub_entry.is_dir() and sub_entry not in candidates:
-                                candidates.append(sub_entry)
-                    elif entry not in candidates:
-                        candidates.append(entry)
-
-        # Shuffle to minimize collision in distributed environment (Randomized Sharding)
-        import random
-
-        random.shuffle(candidates)
-
-        for task_dir in candidates:
-            if count >= batch_size:
-                break
 
-            task_file = task_dir / "task.json"
-            if not task_file.exists():
-                # If directory exists but no task.json, it might be a partial sync or someone else's lease
-                continue
-
-            task_id = task_dir.name
+        # Catalog yields shards and offsets in random order to minimize collision
+        # in distributed environment (Randomized Sharding)
+        candidates = self.catalog.candidates()
+        exhausted = False
+        while count < batch_size and not exhausted:
+            # Collect one round of leasable candidates, then lease them together
+            round_dirs: Dict[str, Path] = {}
+            while len(round_dirs) < batch_size - count:
+                nxt = next(candidates, None)
+                if nxt is None:
+                    exhausted = True
+                    break
+                shard, task_id = nxt
+                task_dir = self.catalog.task_dir(shard, task_id)
+                if not (task_dir / "task.json").exists():
+                    # If directory exists but no task.json, it might be a partial sync or someone else's lease
+                    if not task_dir.exists():
+                        self.catalog.discard(shard, task_id)
+                    continue
+                round_dirs[task_id] = task_dir
 
-            if self._create_lease(task_id):
+            for task_id, leased in self._create_leases(list(round_dirs)).items():
+                if not leased:
+                    continue
+                task_file = round_dirs[task_id] / "task.json"
                 try:
                     with open(task_file, "r") as f:
                         data = json.load(f)
@@ -338,15 +380,17 @@ class FilesystemQueue:
                     self.nack(task_id)
         return tasks
 
-    def _discover_tasks_from_s3(self, max_discovery: int = 100) -> None:
-        """Lists S3 to find pending tasks using Sharded FIFO Discovery."""
-        if not self.s3_client or not self.bucket_name:
-            logger.warning(
-                f"S3 Discovery for {self.queue_name} skipped: Missing S3 client ({self.s3_client is not None}) or Bucket ({self.bucket_name})"
-            )
-            return
+    def rebuild_catalog(self) -> int:
+        """Reconciles the pending catalog against a full walk of the pending tree."""
+        return self.catalog.rebuild()
+
+    def _list_s3_shards(self) -> List[str]:
+        """Lists shard prefixes under pending/ on S3, cached for discovery_shard_ttl seconds."""
+        if self._s3_shards and (
+            time.monotonic() - self._s3_shards_listed_at < self.discovery_shard_ttl
+        ):
+            return self._s3_shards
 
-        # 1. Discover which shards actually exist in S3
         pending_prefix = (
             f"campaigns/{self.campaign_name}/queues/{self.queue_name}/pending/"
         )
@@ -354,108 +398,202 @@ class FilesystemQueue:
             f"S3 Discovery: Listing {self.bucket_name} with prefix {pending_prefix}"
         )
         shards = []
-        try:
-            paginator = self.s3_client.get_paginator("list_objects_v2")
-            for page in paginator.paginate(
-                Bucket=self.bucket_name, Prefix=pending_prefix, Delimiter="/"
-            ):
-                for prefix in page.get("CommonPrefixes", []):
-                    shard_prefix = prefix.get("Prefix")
-                    shard = shard_prefix.split("/")[-2]
-                    if shard:
-                        shards.append(shard)
-            logger.info(
-                f"Discovered {len(shards)} shards on S3 for {self.queue_name}: {shards}"
-            )
-        except Exception as e:
-            logger.error(f"Error listing shards from S3: {e}")
-            return
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self.bucket_name, Prefix=pending_prefix, Delimiter="/"
+        ):
+            for prefix in page.get("CommonPrefixes", []):
+                shard_prefix = prefix.get("Prefix")
+                shard = shard_prefix.split("/")[-2]
+                if shard:
+                    shards.append(shard)
+        logger.info(
+            f"Discovered {len(shards)} shards on S3 for {self.queue_name}: {shards}"
+        )
+        self._s3_shards = shards
+        self._s3_shards_listed_at = time.monotonic()
+        return shards
 
-        if not shards:
-            return
+    def _download_task(self, task_id: str) -> bool:
+        """Downloads one task.json from S3 into the local pending tree."""
+        task_dir = self._get_task_dir(task_id)
+        task_file = task_dir / "task.json"
+        if task_file.exists():
+            return False
+        try:
+            with self.catalog.tracking(task_dir):
+                task_dir.mkdir(parents=True, exist_ok=True)
+                self.s3_client.download_file(
+                    self.bucket_name, self._get_s3_task_key(task_id), str(task_file)
+                )
+            record_queue_event(self.campaign_name, self.queue_name, pending=1)
+            logger.debug(f"Discovered FIFO task {task_id}")
+            return True
+        except Exception:
+            return False
 
-        import random
+    def _discover_tasks_from_s3(self, max_discovery: int = 100) -> int:
+        """
+        Lists S3 to find pending tasks using Sharded FIFO Discovery.
+        Shard listings are cached, each shard resumes from where the previous listing
+        stopped (StartAfter), and task bodies are downloaded concurrently.
+        Returns the number of tasks downloaded.
+        """
+        if not self.s3_client or not self.bucket_name:
+            logger.warning(
+                f"S3 Discovery for {self.queue_name} skipped: Missing S3 client ({self.s3_client is not None}) or Bucket ({self.bucket_name})"
+            )
+            return 0
 
-        random.shuffle(shards)
+        with self._discovery_lock:
+            # 1. Discover which shards actually exist in S3
+            try:
+                shards = list(self._list_s3_shards())
+            except Exception as e:
+                logger.error(f"Error listing shards from S3: {e}")
+                return 0
 
-        found_total = 0
-        # Try a few active shards
-        for shard in shards[:5]:
-            if found_total >= max_discovery:
-                break
+            if not shards:
+                return 0
 
-            prefix = f"campaigns/{self.campaign_name}/queues/{self.queue_name}/pending/{shard}/"
-            try:
-                # Recursive listing to see both task.json and lease.json in one call
-                # No delimiter means we get the full keys under the prefix
-                response = self.s3_client.list_objects_v2(
-                    Bucket=self.bucket_name, Prefix=prefix, MaxKeys=500
-                )
+            random.shuffle(shards)
 
-                if "Contents" not in response:
-                    continue
+            to_download: List[str] = []
+            # Try a few active shards
+            for shard in shards[:5]:
+                if len(to_download) >= max_discovery:
+                    break
 
-                # 1. Group objects by Task ID and extract timestamps
-                # Key structure: .../pending/<shard>/<task_id>/[task.json|lease.json]
-                tasks_in_shard: Dict[str, Dict[str, Any]] = {}
+                prefix = f"campaigns/{self.campaign_name}/queues/{self.queue_name}/pending/{shard}/"
+                try:
+                    # Recursive listing to see both task.json and lease.json in one call
+                    # No delimiter means we get the full keys under the prefix
+                    list_kwargs: Dict[str, Any] = {
+                        "Bucket": self.bucket_name,
+                        "Prefix": prefix,
+                        "MaxKeys": 500,
+                    }
+                    cursor = self._s3_shard_cursors.get(shard)
+                    if cursor:
+                        list_kwargs["StartAfter"] = cursor
+                    response = self.s3_client.list_objects_v2(**list_kwargs)
+                    contents = response.get("Contents", [])
+                    leased_before = self._s3_shard_leased.pop(shard, None)
+
+                    # Resume after this page next time; wrap around at the end of the shard
+                    if response.get("IsTruncated") is True and contents:
+                        last_key = contents[-1]["Key"]
+                        self._s3_shard_cursors[shard] = last_key
+                        # lease.json sorts before task.json, so a page can end between them
+                        if last_key.endswith("/lease.json"):
+                            self._s3_shard_leased[shard] = last_key.split("/")[-2]
+                    else:
+                        self._s3_shard_cursors.pop(shard, None)
 
-                for obj in response["Contents"]:
-                    key = obj["Key"]
-                    parts = key.split("/")
-                    if len(parts) < 2:
+                    if not contents:
                         continue
 
-                    filename = parts[-1]
-                    task_id = parts[-2]
-
-                    if task_id not in tasks_in_shard:
-                        tasks_in_shard[task_id] = {
+                    # 1. Group objects by Task ID and extract timestamps
+                    # Key structure: .../pending/<shard>/<task_id>/[task.json|lease.json]
+                    tasks_in_shard: Dict[str, Dict[str, Any]] = {}
+                    if leased_before:
+                        tasks_in_shard[leased_before] = {
                             "has_task": False,
-                            "has_lease": False,
+                            "has_lease": True,
                             "mtime": None,
                         }
 
-                    if filename == "task.json":
-                        tasks_in_shard[task_id]["has_task"] = True
-                        tasks_in_shard[task_id]["mtime"] = obj["LastModified"]
-                    elif filename == "lease.json":
-                        tasks_in_shard[task_id]["has_lease"] = True
-
-                # 2. Filter for Available Tasks (Has task, No lease)
-                available_tasks = [
-                    (tid, info["mtime"])
-                    for tid, info in tasks_in_shard.items()
-                    if info["has_task"] and not info["has_lease"]
-                ]
-                logger.info(
-                    f"Shard {shard}: Found {len(tasks_in_shard)} total task dirs, {len(available_tasks)} available (unleased)."
-                )
+                    for obj in contents:
+                        key = obj["Key"]
+                        parts = key.split("/")
+                        if len(parts) < 2:
+                            continue
+
+                        filename = parts[-1]
+                        task_id = parts[-2]
+
+                        if task_id not in tasks_in_shard:
+                            tasks_in_shard[task_id] = {
+                                "has_task": False,
+                                "has_lease": False,
+                                "mtime": None,
+                            }
+
+                        if filename == "task.json":
+                            tasks_in_shard[task_id]["has_task"] = True
+                            tasks_in_shard[task_id]["mtime"] = obj["LastModified"]
+                        elif filename == "lease.json":
+                            tasks_in_shard[task_id]["has_lease"] = True
+
+                    # 2. Filter for Available Tasks (Has task, No lease)
+                    available_tasks = [
+                        (tid, info["mtime"])
+                        for tid, info in tasks_in_shard.items()
+                        if info["has_task"] and not info["has_lease"]
+                    ]
+                    logger.info(
+                        f"Shard {shard}: Found {len(tasks_in_shard)} total task dirs, {len(available_tasks)} available (unleased)."
+                    )
 
-                # 3. Sort by mtime (FIFO: Oldest First)
-                available_tasks.sort(
-                    key=lambda x: x[1] if x[1] else datetime.min.replace(tzinfo=UTC)
-                )
+                    # 3. Sort by mtime (FIFO: Oldest First)
+                    available_tasks.sort(
+                        key=lambda x: x[1] if x[1] else datetime.min.replace(tzinfo=UTC)
+                    )
 
-                # 4. Download metadata for discovery
-                for task_id, _ in available_tasks[: max_discovery - found_total]:
-                    task_dir = self._get_task_dir(task_id)
-                    task_file = task_dir / "task.json"
+                    for task_id, _ in available_tasks:
+                        if len(to_download) >= max_discovery:
+                            break
+                        if not (self._get_task_dir(task_id) / "task.json").exists():
+                            to_download.append(task_id)
+                except Exception as e:
+                    logger.error(f"Error discovering tasks from S3 shard {shard}: {e}")
 
-                    if not task_file.exists():
-                        task_dir.mkdir(parents=True, exist_ok=True)
-                        s3_key = self._get_s3_task_key(task_id)
-                        try:
-                            self.s3_client.download_file(
-                                self.bucket_name, s3_key, str(task_file)
-                            )
-                            logger.debug(
-                                f"Discovered FIFO task {task_id} from shard {shard}"
-                            )
-                            found_total += 1
-                        except Exception:
-                            pass
-            except Exception as e:
-                logger.error(f"Error discovering tasks from S3 shard {shard}: {e}")
+            # 4. Download task bodies concurrently
+            found = sum(self._map_concurrent(self._download_task, to_download))
+            if found:
+                logger.info(f"S3 Discovery: pulled {found} tasks for {self.queue_name}")
+            return found
+
+    def start_discovery_prefetch(
+        self, low_watermark: int = 50, high_watermark: int = 200, interval: float = 15.0
+    ) -> None:
+        """
+        Starts a background thread that keeps at least low_watermark local candidates
+        by topping the pending tree up from S3, so workers do not stall when it drains.
+        """
+        if not self.s3_client or not self.bucket_name or self._prefetch_thread:
+            return
+        self.prefetch_low_watermark = low_watermark
+        self._prefetch_stop.clear()
+
+        def _run() -> None:
+            while not self._prefetch_stop.is_set():
+                try:
+                    local_count = len(self.catalog)
+                    if local_count < low_watermark:
+                        self._discover_tasks_from_s3(
+                            max_discovery=high_watermark - local_count
+                        )
+                except Exception as e:
+                    logger.error(f"Discovery prefetch for {self.queue_name} failed: {e}")
+                self._prefetch_wake.wait(interval)
+                self._prefetch_wake.clear()
+
+        self._prefetch_thread = threading.Thread(
+            target=_run, name=f"discovery-prefetch-{self.queue_name}", daemon=True
+        )
+        self._prefetch_thread.start()
+        logger.info(
+            f"Started discovery prefetch for {self.queue_name} (low watermark {low_watermark})"
+        )
+
+    def stop_discovery_prefetch(self) -> None:
+        if not self._prefetch_thread:
+            return
+        self._prefetch_stop.set()
+        self._prefetch_wake.set()
+        self._prefetch_thread.join(timeout=5)
+        self._prefetch_thread = None
 
     def ack(self, task_id: Optional[str]) -> None:
         """Moves task to completed and removes pending directory (Local and S3)."""
@@ -468,13 +606,24 @@ class FilesystemQueue:
 
         try:
             # 1. Local Cleanup
-            if task_file.exists():
-                task_file.rename(completed_file)
-
             import shutil
 
-            if task_dir.exists():
-                shutil.rmtree(task_dir, ignore_errors=True)
+            with self.catalog.tracking(task_dir):
+                had_task = task_file.exists()
+                had_lease = (task_dir / "lease.json").exists()
+                if had_task:
+                    task_file.rename(completed_file)
+
+                if task_dir.exists():
+                    shutil.rmtree(task_dir, ignore_errors=True)
+            if had_task or had_lease:
+                record_queue_event(
+                    self.campaign_name,
+                    self.queue_name,
+                    pending=-int(had_task),
+                    inflight=-int(had_lease),
+                    completed=int(had_task),
+                )
 
             # 2. S3 Cleanup & Completion (Immediate)
             if self.s3_client and self.bucket_name:
@@ -579,6 +728,7 @@ class FilesystemQueue:
         try:
             if lease_path.exists():
                 lease_path.unlink()
+                record_queue_event(self.campaign_name, self.queue_name, inflight=-1)
         except Exception as e:
             logger.error(f"Error local nacking for {task_id}: {e}")
 
@@ -591,6 +741,18 @@ class FilesystemQueue:
             except Exception as e:
                 logger.error(f"Error S3 nacking for {task_id}: {e}")
 
+    def heartbeat_many(self, task_ids: Sequence[str]) -> None:
+        """Refreshes several leases at once (concurrent S3 self-copies)."""
+        self._map_concurrent(self.heartbeat, task_ids)
+
+    def ack_many(self, tasks: Sequence[Any]) -> None:
+        """Acks several tasks at once. Accepts whatever the queue's ack() accepts."""
+        self._map_concurrent(self.ack, tasks)
+
+    def nack_many(self, tasks: Sequence[Any]) -> None:
+        """Releases several leases at once."""
+        self._map_concurrent(self.nack, tasks)
+
 
 from cocli.core.geo_types import LatScale1, LonScale1
 
@@ -665,6 +827,8 @@ class FilesystemGmListQueue(FilesystemQueue):
             with open(target_path, "w") as f:
                 # Use standard model-based serialization
                 f.write(task.to_usv())
+            # A mission tile without a witness is pending gm-list work
+            record_queue_event(self.campaign_name, self.queue_name, pending=1)
             logger.debug(f"Pushed task to Discovery Gen: {task_id}")
 
             # If we have S3, also push it there
@@ -697,15 +861,32 @@ class FilesystemGmListQueue(FilesystemQueue):
             return []
 
         logger.debug(f"Polling discovery-gen pool at: {self.target_tiles_dir}")
-        count = 0
-        import os
-        import random
+        candidates = self._iter_unscraped_tiles()
+        exhausted = False
+        while len(tasks) < batch_size and not exhausted:
+            # Lease one round of candidates together (concurrent S3 conditional puts)
+            round_ids: List[str] = []
+            while len(round_ids) < batch_size - len(tasks):
+                task_id = next(candidates, None)
+                if task_id is None:
+                    exhausted = True
+                    break
+                round_ids.append(task_id)
 
+            for task_id, leased in self._create_leases(round_ids).items():
+                if not leased:
+                    continue
+                task = self._create_scrape_task(task_id)
+                if task:
+                    tasks.append(task)
+                else:
+                    self.nack(task_id)
+        return tasks
+
+    def _iter_unscraped_tiles(self) -> Iterator[str]:
+        """Yields mission tile task_ids without a witness, in randomized walk order."""
         # Optimization: Use os.walk for better performance on large mission indexes
         for root, dirs, files in os.walk(self.target_tiles_dir):
-            if count >= batch_size:
-                break
-
             # Randomize order to minimize collisions across cluster
             random.shuffle(dirs)
             random.shuffle(files)
@@ -732,18 +913,13 @@ class FilesystemGmListQueue(FilesystemQueue):
                 if witness_csv.exists() or witness_usv.exists():
                     continue
 
-                # Try to acquire lease
-                if self._create_lease(task_id):
-                    task = self._create_scrape_task(task_id)
-                    if task:
-                        tasks.append(task)
-                        count += 1
-                    else:
-                        self.nack(task_id)
+                yield task_id
 
-                if count >= batch_size:
-                    break
-        return tasks
+    def start_discovery_prefetch(
+        self, low_watermark: int = 50, high_watermark: int = 200, interval: float = 15.0
+    ) -> None:
+        """Mission discovery already runs inline on every poll; nothing to prefetch."""
+        return
 
     def _discover_mission_from_s3(self, max_discovery: int = 50) -> None:
         """Discovers unscraped tiles directly from the S3 Discovery Gen Index."""
@@ -783,6 +959,9 @@ class FilesystemGmListQueue(FilesystemQueue):
                             self.s3_client.download_file(
                                 self.bucket_name, key, str(local_path)
                             )
+                            record_queue_event(
+                                self.campaign_name, self.queue_name, pending=1
+                            )
                             found_count += 1
 
                     if found_count >= max_discovery:
@@ -796,7 +975,8 @@ class FilesystemGmListQueue(FilesystemQueue):
             # 1. Capture Lease Metadata before deletion
             lease_data = {}
             lease_path = self._get_lease_path(task.ack_token)
-            if lease_path.exists():
+            had_lease = lease_path.exists()
+            if had_lease:
                 try:
                     with open(lease_path, "r") as f:
                         lease_data = json.load(f)
@@ -809,6 +989,8 @@ class FilesystemGmListQueue(FilesystemQueue):
 
             if task_dir.exists():
                 shutil.rmtree(task_dir, ignore_errors=True)
+            if had_lease:
+                record_queue_event(self.campaign_name, self.queue_name, inflight=-1)
 
             # 3. Completion Receipt (Local & S3)
             # Use model's own sharded path resolution
@@ -850,10 +1032,20 @@ class FilesystemGmListQueue(FilesystemQueue):
             )
             receipt_dir.mkdir(parents=True, exist_ok=True)
             receipt_path = receipt_dir / f"{phrase_slug}.json"
+            first_completion = not receipt_path.exists()
 
             with open(receipt_path, "w") as f:
                 json.dump(completion_data, f, indent=2)
 
+            # The tile's witness is written by now: it is no longer pending gm-list work
+            mission_tile = Path(task.ack_token)
+            if (
+                first_completion
+                and (self.target_tiles_dir / mission_tile).exists()
+                and has_witness(self.witness_dir, mission_tile)
+            ):
+                record_queue_event(self.campaign_name, self.queue_name, pending=-1)
+
             # S3 Mirror
             if self.s3_client and self.bucket_name:
                 try:
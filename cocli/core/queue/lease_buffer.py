@@ -0,0 +1,177 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _token(task: Any) -> Optional[str]:
+    token = getattr(task, "ack_token", None)
+    return str(token) if token else None
+
+
+class LeaseBuffer:
+    """
+    In-process prefetch buffer that claims tasks from a queue in blocks.
+
+    Worker loops call `get()` instead of `queue.poll(batch_size=1)`. When the buffer
+    runs dry, one `poll(batch_size=block_size)` refills it, so the per-task S3 lease
+    latency is paid once per block (and concurrently, see FilesystemQueue._create_leases).
+    While a task sits in the buffer or is being worked on, its lease is kept alive by
+    a bulk heartbeat. Acks are grouped and flushed in bulk; nacks are immediate so
+    other nodes can pick the task up.
+
+    Works with any queue; bulk methods (`heartbeat_many`, `ack_many`, `nack_many`)
+    are used when the queue provides them. With `prefetch_low_watermark`, the queue's
+    background S3 discovery (`start_discovery_prefetch`) runs for the buffer's lifetime.
+    """
+
+    def __init__(
+        self,
+        queue: Any,
+        block_size: int = 4,
+        heartbeat_interval: float = 120.0,
+        ack_batch_size: Optional[int] = None,
+        ack_flush_interval: float = 5.0,
+        prefetch_low_watermark: int = 0,
+    ):
+        self.queue = queue
+        self.block_size = max(1, block_size)
+        self.heartbeat_interval = heartbeat_interval
+        self.ack_batch_size = ack_batch_size or self.block_size
+        self.ack_flush_interval = ack_flush_interval
+        self.prefetch_low_watermark = prefetch_low_watermark
+
+        self._buffer: Deque[Any] = deque()
+        self._in_flight: Dict[str, Any] = {}
+        self._pending_acks: List[Any] = []
+        self._refill_lock = asyncio.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._background: List[asyncio.Task[Any]] = []
+
+        # Metrics
+        self.polls = 0
+        self.claimed = 0
+
+    async def __aenter__(self) -> "LeaseBuffer":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        if self._background:
+            return
+        if self.prefetch_low_watermark and hasattr(self.queue, "start_discovery_prefetch"):
+            self.queue.start_discovery_prefetch(low_watermark=self.prefetch_low_watermark)
+        self._background = [
+            asyncio.create_task(self._heartbeat_loop()),
+            asyncio.create_task(self._flush_loop()),
+        ]
+
+    async def close(self) -> None:
+        """Flushes pending acks and releases every task that was never handed out."""
+        for bg in self._background:
+            bg.cancel()
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        self._background = []
+        if hasattr(self.queue, "stop_discovery_prefetch"):
+            await asyncio.to_thread(self.queue.stop_discovery_prefetch)
+
+        await self.flush()
+        unclaimed = list(self._buffer)
+        self._buffer.clear()
+        if unclaimed:
+            logger.info(f"LeaseBuffer: releasing {len(unclaimed)} prefetched tasks")
+            await self._call_many("nack", unclaimed)
+
+    # --- Claiming ----------------------------------------------------------
+
+    async def get(self) -> Optional[Any]:
+        """Returns the next leased task, or None if the queue is empty."""
+        async with self._refill_lock:
+            if not self._buffer:
+                tasks = await asyncio.to_thread(self.queue.poll, batch_size=self.block_size)
+                self.polls += 1
+                self.claimed += len(tasks)
+                self._buffer.extend(tasks)
+                if tasks:
+                    logger.debug(
+                        f"LeaseBuffer: claimed {len(tasks)} tasks in one poll (avg {self.claimed / self.polls:.1f})"
+                    )
+            if not self._buffer:
+                return None
+            task = self._buffer.popleft()
+
+        token = _token(task)
+        if token:
+            self._in_flight[token] = task
+        return task
+
+    # --- Completion --------------------------------------------------------
+
+    async def ack(self, task: Any) -> None:
+        """Queues an ack; flushed in bulk by size or on the flush interval."""
+        self._pending_acks.append(task)
+        if len(self._pending_acks) >= self.ack_batch_size:
+            await self.flush()
+
+    async def nack(self, task: Any) -> None:
+        token = _token(task)
+        if token:
+            self._in_flight.pop(token, None)
+        await asyncio.to_thread(self.queue.nack, task)
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self._pending_acks:
+                return
+            batch, self._pending_acks = self._pending_acks, []
+            await self._call_many("ack", batch)
+            for task in batch:
+                token = _token(task)
+                if token:
+                    self._in_flight.pop(token, None)
+
+    # --- Background --------------------------------------------------------
+
+    async def _call_many(self, op: str, tasks: List[Any]) -> None:
+        bulk = getattr(self.queue, f"{op}_many", None)
+        try:
+            if bulk:
+                await asyncio.to_thread(bulk, tasks)
+            else:
+                for task in tasks:
+                    await asyncio.to_thread(getattr(self.queue, op), task)
+        except Exception as e:
+            logger.error(f"LeaseBuffer: bulk {op} of {len(tasks)} tasks failed: {e}")
+
+    async def heartbeat(self) -> None:
+        """Refreshes leases for buffered and in-flight tasks."""
+        tokens = [t for t in (_token(task) for task in self._buffer) if t]
+        tokens += list(self._in_flight)
+        if not tokens:
+            return
+        bulk = getattr(self.queue, "heartbeat_many", None)
+        single = getattr(self.queue, "heartbeat", None)
+        try:
+            if bulk:
+                await asyncio.to_thread(bulk, tokens)
+            elif single:
+                for token in tokens:
+                    await asyncio.to_thread(single, token)
+        except Exception as e:
+            logger.error(f"LeaseBuffer: heartbeat of {len(tokens)} leases failed: {e}")
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            await self.heartbeat()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.ack_flush_interval)
+            await self.flush()
@@ -0,0 +1,390 @@
+import os
+import random
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ..constants import UNIT_SEP
+
+logger = logging.getLogger(__name__)
+
+# Pseudo-shard for legacy flat task directories directly under pending/
+ROOT_SHARD = "."
+
+OP_ADD = "+"
+OP_REMOVE = "-"
+OP_SCANNED = "@"
+
+
+class PendingCatalog:
+    """
+    Persistent, incrementally maintained catalog of pending task directories.
+
+    Lets `FilesystemQueue.poll_frontier` claim tasks in O(batch) instead of walking
+    every shard under `pending/` per poll. Stored as an append-only USV journal:
+
+      queues/<campaign>/<queue>/pending.catalog.usv
+
+    Each record is `op \\x1f shard \\x1f value`:
+      +  task directory pending/<shard>/<value> was added
+      -  task directory pending/<shard>/<value> was removed
+      @  shard directory was scanned while its mtime_ns was <value>
+
+    Tasks that land in `pending/` without going through the queue (smart_sync,
+    manual copies) are picked up by `refresh()`, which only rescans shards whose
+    directory mtime differs from the last recorded scan.
+    """
+
+    # Rewrite the journal once removals outnumber live entries by this margin
+    COMPACT_MIN_DEAD = 10000
+
+    def __init__(self, pending_dir: Path, catalog_path: Path):
+        self.pending_dir = pending_dir
+        self.catalog_path = catalog_path
+
+        self._ids: Dict[str, List[str]] = {}
+        self._positions: Dict[str, Dict[str, int]] = {}
+        self._stamps: Dict[str, int] = {}
+        self._dead = 0
+
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return sum(len(ids) for ids in self._ids.values())
+
+    def __contains__(self, task_dir: object) -> bool:
+        if not isinstance(task_dir, Path):
+            return False
+        shard, task_id = self._key(task_dir)
+        with self._lock:
+            self._ensure_loaded()
+            return task_id in self._positions.get(shard, {})
+
+    # --- Paths -------------------------------------------------------------
+
+    def _key(self, task_dir: Path) -> Tuple[str, str]:
+        if task_dir.parent == self.pending_dir:
+            return ROOT_SHARD, task_dir.name
+        return task_dir.parent.name, task_dir.name
+
+    def _shard_dir(self, shard: str) -> Path:
+        return self.pending_dir if shard == ROOT_SHARD else self.pending_dir / shard
+
+    def task_dir(self, shard: str, task_id: str) -> Path:
+        return self._shard_dir(shard) / task_id
+
+    def _mtime_ns(self, shard: str) -> Optional[int]:
+        try:
+            return os.stat(self._shard_dir(shard)).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    # --- In-memory state ---------------------------------------------------
+
+    def _apply(self, op: str, shard: str, value: str) -> bool:
+        """Applies one journal record to memory. Returns True if state changed."""
+        if op == OP_SCANNED:
+            try:
+                self._stamps[shard] = int(value)
+            except ValueError:
+                return False
+            return True
+
+        ids = self._ids.setdefault(shard, [])
+        positions = self._positions.setdefault(shard, {})
+
+        if op == OP_ADD:
+            if value in positions:
+                return False
+            positions[value] = len(ids)
+            ids.append(value)
+            return True
+
+        if op == OP_REMOVE:
+            pos = positions.pop(value, None)
+            if pos is None:
+                return False
+            # Swap-pop keeps removal O(1)
+            last = ids.pop()
+            if pos < len(ids):
+                ids[pos] = last
+                positions[last] = pos
+            self._dead += 1
+            return True
+
+        return False
+
+    def _reset(self) -> None:
+        self._ids = {}
+        self._positions = {}
+        self._stamps = {}
+        self._dead = 0
+        self._offset = 0
+        self._inode = None
+
+    # --- Journal -----------------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self._sync_journal()
+            self._loaded = True
+
+    def _sync_journal(self) -> None:
+        """Replays records appended since the last read (by this or other processes)."""
+        try:
+            st = os.stat(self.catalog_path)
+        except FileNotFoundError:
+            if self._inode is not None:
+                self._reset()
+            return
+
+        # Compacted or truncated by another process: replay from the start
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            self._reset()
+            self._inode = st.st_ino
+
+        if st.st_size == self._offset:
+            return
+
+        with open(self.catalog_path, "rb") as f:
+            f.seek(self._offset)
+            chunk = f.read()
+
+        # Only consume complete records; a concurrent writer may be mid-line
+        end = chunk.rfind(b"\n")
+        if end == -1:
+            return
+        for line in chunk[: end + 1].decode("utf-8", errors="replace").splitlines():
+            parts = line.split(UNIT_SEP)
+            if len(parts) == 3:
+                self._apply(parts[0], parts[1], parts[2])
+        self._offset += end + 1
+
+    def _append(self, records: List[Tuple[str, str, str]]) -> None:
+        if not records:
+            return
+        data = "".join(f"{UNIT_SEP.join(r)}\n" for r in records).encode("utf-8")
+        self.catalog_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            before: Optional[os.stat_result] = os.stat(self.catalog_path)
+        except FileNotFoundError:
+            before = None
+
+        with open(self.catalog_path, "ab") as f:
+            f.write(data)
+
+        # Our records are already applied. Skip past them on the next sync unless
+        # another process interleaved writes, in which case we replay (idempotently).
+        in_sync = (
+            before is None and self._offset == 0
+        ) or (
+            before is not None
+            and before.st_ino == self._inode
+            and before.st_size == self._offset
+        )
+        st = os.stat(self.catalog_path)
+        if in_sync and st.st_size == self._offset + len(data):
+            self._inode = st.st_ino
+            self._offset = st.st_size
+
+    def _record(self, records: List[Tuple[str, str, str]]) -> None:
+        """Syncs, applies and persists records."""
+        self._sync_journal()
+        applied = [r for r in records if self._apply(*r)]
+        self._append(applied)
+
+    # --- Mutations ---------------------------------------------------------
+
+    @contextmanager
+    def tracking(self, task_dir: Path) -> Iterator[None]:
+        """
+        Wraps a filesystem change to one task directory and records its outcome.
+
+        If the shard was in sync before the change, the new shard mtime is recorded
+        too, so our own pushes and acks do not force a rescan of the shard.
+        """
+        shard, task_id = self._key(task_dir)
+        with self._lock:
+            self._ensure_loaded()
+            self._sync_journal()
+            before = {s: self._mtime_ns(s) for s in {shard, ROOT_SHARD}}
+
+        try:
+            yield
+        finally:
+            self._record_outcome(shard, task_id, task_dir, before)
+
+    def _record_outcome(
+        self,
+        shard: str,
+        task_id: str,
+        task_dir: Path,
+        before: Dict[str, Optional[int]],
+    ) -> None:
+        with self._lock:
+            self._sync_journal()
+            exists = (task_dir / "task.json").exists()
+            records = [(OP_ADD if exists else OP_REMOVE, shard, task_id)]
+            for s, mtime in before.items():
+                after = self._mtime_ns(s)
+                if after is not None and mtime is not None and self._stamps.get(s) == mtime:
+                    records.append((OP_SCANNED, s, str(after)))
+            self._record(records)
+            self._maybe_compact()
+
+    def discard(self, shard: str, task_id: str) -> None:
+        """Drops an entry whose task directory has disappeared."""
+        with self._lock:
+            self._ensure_loaded()
+            self._record([(OP_REMOVE, shard, task_id)])
+
+    # --- Reconciliation ----------------------------------------------------
+
+    def _list_root(self) -> Tuple[List[str], List[str]]:
+        shards: List[str] = []
+        legacy: List[str] = []
+        try:
+            with os.scandir(self.pending_dir) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    if len(entry.name) in [1, 2]:
+                        shards.append(entry.name)
+                    else:
+                        legacy.append(entry.name)
+        except FileNotFoundError:
+            pass
+        return shards, legacy
+
+    def _scan_shard(self, shard: str, mtime: Optional[int]) -> List[Tuple[str, str, str]]:
+        """Diffs one shard directory against the catalog."""
+        if shard == ROOT_SHARD:
+            _, present_list = self._list_root()
+        else:
+            present_list = []
+            try:
+                with os.scandir(self._shard_dir(shard)) as it:
+                    present_list = [e.name for e in it if e.is_dir()]
+            except FileNotFoundError:
+                pass
+
+        present = set(present_list)
+        known = set(self._positions.get(shard, {}))
+        records = [(OP_ADD, shard, tid) for tid in present - known]
+        records += [(OP_REMOVE, shard, tid) for tid in known - present]
+        if mtime is not None:
+            records.append((OP_SCANNED, shard, str(mtime)))
+        return records
+
+    def refresh(self) -> int:
+        """
+        Reconciles shards whose directory mtime changed since their last scan.
+        Returns the number of shards rescanned.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            self._sync_journal()
+
+            records: List[Tuple[str, str, str]] = []
+            rescanned = 0
+
+            shards = set(self._ids) | set(self._stamps)
+            root_mtime = self._mtime_ns(ROOT_SHARD)
+            if root_mtime != self._stamps.get(ROOT_SHARD):
+                # New or removed shard directories only show up on the root
+                current, _ = self._list_root()
+                shards |= set(current)
+                records += self._scan_shard(ROOT_SHARD, root_mtime)
+                rescanned += 1
+            shards.discard(ROOT_SHARD)
+
+            for shard in shards:
+                mtime = self._mtime_ns(shard)
+                if mtime is None and not self._ids.get(shard):
+                    continue
+                if mtime != self._stamps.get(shard):
+                    records += self._scan_shard(shard, mtime)
+                    rescanned += 1
+
+            self._record(records)
+            if rescanned:
+                logger.debug(
+                    f"Pending catalog {self.catalog_path}: rescanned {rescanned} shard(s)"
+                )
+            return rescanned
+
+    def rebuild(self) -> int:
+        """Rebuilds the catalog from a full walk of `pending/`. Returns the task count."""
+        with self._lock:
+            self._reset()
+            records: List[Tuple[str, str, str]] = []
+            root_mtime = self._mtime_ns(ROOT_SHARD)
+            shards, _ = self._list_root()
+            records += self._scan_shard(ROOT_SHARD, root_mtime)
+            for shard in shards:
+                records += self._scan_shard(shard, self._mtime_ns(shard))
+            for r in records:
+                self._apply(*r)
+            self._dead = 0
+            self._write_snapshot()
+            self._loaded = True
+            count = sum(len(ids) for ids in self._ids.values())
+        logger.info(f"Rebuilt pending catalog {self.catalog_path}: {count} tasks")
+        return count
+
+    def _write_snapshot(self) -> None:
+        """Atomically replaces the journal with the current live state."""
+        records: List[Tuple[str, str, str]] = []
+        for shard, ids in self._ids.items():
+            records += [(OP_ADD, shard, tid) for tid in ids]
+        for shard, mtime in self._stamps.items():
+            records.append((OP_SCANNED, shard, str(mtime)))
+
+        self.catalog_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.catalog_path.with_name(f".{self.catalog_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("".join(f"{UNIT_SEP.join(r)}\n" for r in records))
+        os.replace(tmp_path, self.catalog_path)
+
+        st = os.stat(self.catalog_path)
+        self._inode = st.st_ino
+        self._offset = st.st_size
+
+    def _maybe_compact(self) -> None:
+        live = sum(len(ids) for ids in self._ids.values())
+        if self._dead >= self.COMPACT_MIN_DEAD and self._dead > live:
+            self._write_snapshot()
+            self._dead = 0
+
+    # --- Sampling ----------------------------------------------------------
+
+    def candidates(self) -> Iterator[Tuple[str, str]]:
+        """
+        Yields (shard, task_id) pairs in randomized order without materializing
+        the whole catalog: shards are shuffled and each is walked from a random
+        offset, so concurrent workers spread across the frontier.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            shards = [s for s, ids in self._ids.items() if ids]
+        random.shuffle(shards)
+
+        for shard in shards:
+            ids = self._ids.get(shard, [])
+            total = len(ids)
+            if not total:
+                continue
+            start = random.randrange(total)
+            for step in range(total):
+                # The list may shrink under us (acks in other threads)
+                size = len(ids)
+                if not size:
+                    break
+                yield shard, ids[(start + step) % size]
@@ -2,14 +2,15 @@ import os
 import json
 import boto3
 import logging
-from typing import Dict, Any, cast, Optional
+from pathlib import Path
+from typing import Dict, Any, cast, Optional, Tuple
 from rich.console import Console
-from datetime import datetime, UTC
 
-from cocli.core.config import get_cocli_base_dir, load_campaign_config
+from cocli.core.config import load_campaign_config
 from cocli.core.prospects_csv_manager import ProspectsIndexManager
 from cocli.core.exclusions import ExclusionManager
 from .paths import paths
+from ..utils.duckdb_utils import fresh_parquet_glob
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -164,86 +165,102 @@ def get_locations_data(campaign_name: str) -> Dict[str, Any]:
         "locations": stats.get("locations", [])
     }
 
-def get_campaign_stats(campaign_name: str) -> Dict[str, Any]:
-    """Collects statistics for a campaign, including local file counts and cloud status."""
-    from cocli.core.text_utils import slugify
+# Prospect counts per checkpoint, reused while its (mtime_ns, size) is unchanged
+_prospect_counts: Dict[Path, Tuple[Tuple[int, int], Tuple[int, Dict[str, int]]]] = {}
+
+
+def _count_prospects(campaign_name: str) -> Tuple[int, Dict[str, int]]:
     import duckdb
-    
+
+    source_counts = {"local-worker": 0, "fargate-worker": 0, "unknown": 0}
+    manager = ProspectsIndexManager(campaign_name)
+    checkpoint_path = manager.index_dir / "prospects.checkpoint.usv"
+    try:
+        st = checkpoint_path.stat()
+    except OSError:
+        return 0, source_counts
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _prospect_counts.get(checkpoint_path)
+    if cached and cached[0] == signature:
+        return cached[1][0], dict(cached[1][1])
+
+    total_prospects = 0
+    con = duckdb.connect(database=':memory:')
+    parquet_glob = fresh_parquet_glob(checkpoint_path)
+    if parquet_glob:
+        # Columnar copy: only processed_by is read
+        q = f"SELECT count(*), count(CASE WHEN processed_by = 'local-worker' THEN 1 END), count(CASE WHEN processed_by = 'fargate-worker' THEN 1 END) FROM read_parquet('{parquet_glob}', hive_partitioning=False)"
+    else:
+        # processed_by is column07 of the canonical prospect USV
+        q = f"SELECT count(*), count(CASE WHEN column07 = 'local-worker' THEN 1 END), count(CASE WHEN column07 = 'fargate-worker' THEN 1 END) FROM read_csv('{checkpoint_path}', delim='\x1f', header=False, auto_detect=True, all_varchar=True)"
+    res = con.execute(q).fetchone()
+    if res:
+        total_prospects, source_counts['local-worker'], source_counts['fargate-worker'] = res
+        source_counts['unknown'] = total_prospects - source_counts['local-worker'] - source_counts['fargate-worker']
+    _prospect_counts[checkpoint_path] = (signature, (total_prospects, dict(source_counts)))
+    return total_prospects, source_counts
+
+
+def get_campaign_stats(campaign_name: str, recount: bool = False, background: bool = False) -> Dict[str, Any]:
+    """
+    Collects statistics for a campaign, including local file counts and cloud status.
+
+    Queue, witness and S3 listing counts come from the campaign's CampaignStatsStore.
+    They are recounted inline on the first call, with `recount=True` and when the
+    snapshot is stale. Long-lived callers (the TUI) pass `background=True` to be
+    served the stale counts while a daemon thread recounts them; a short-lived
+    command would exit before that thread finishes.
+    """
+    from cocli.core.text_utils import slugify
+    from .campaign_stats import CampaignStatsStore, start_background_recount
+
     stats: Dict[str, Any] = {}
     config = load_campaign_config(campaign_name)
     prospecting_config = config.get("prospecting", {})
     queries = prospecting_config.get("queries", [])
     stats["queries"] = queries
-
-    witness_root = get_cocli_base_dir() / "indexes" / "scraped-tiles"
+    phrases = [slugify(q) for q in queries]
 
     stats.update(get_exclusions_data(campaign_name))
 
-    manager = ProspectsIndexManager(campaign_name)
-    total_prospects = 0
-    source_counts = {"local-worker": 0, "fargate-worker": 0, "unknown": 0}
+    stats["prospects_count"], stats["worker_stats"] = _count_prospects(campaign_name)
 
-    if manager.index_dir.exists():
-        con = duckdb.connect(database=':memory:')
-        checkpoint_path = manager.index_dir / "prospects.checkpoint.usv"
-        if checkpoint_path.exists():
-            q = f"SELECT count(*), count(CASE WHEN column24 = 'local-worker' THEN 1 END), count(CASE WHEN column24 = 'fargate-worker' THEN 1 END) FROM read_csv('{checkpoint_path}', delim='\x1f', header=False, auto_detect=True, all_varchar=True)"
-            res = con.execute(q).fetchone()
-            if res:
-                total_prospects, source_counts['local-worker'], source_counts['fargate-worker'] = res
-                source_counts['unknown'] = total_prospects - source_counts['local-worker'] - source_counts['fargate-worker']
-
-    stats["prospects_count"] = total_prospects
-    stats["worker_stats"] = source_counts
-    
     data_bucket = get_data_bucket_name(config, campaign_name)
-
+    session: Optional[boto3.Session] = None
+    s3: Optional[Tuple[Any, str]] = None
     if data_bucket:
-        stats["using_cloud_queue"] = True
         session = get_boto3_session(config)
-        s3 = get_s3_client(session=session)
-        
+        s3 = (get_s3_client(session=session), data_bucket)
+
+    store = CampaignStatsStore(campaign_name)
+    counts = None if recount else store.read()
+    if counts is not None and store.is_stale(counts, phrases):
+        if background:
+            start_background_recount(store, phrases, s3)
+        else:
+            counts = None
+    if counts is None:
+        store.recount(phrases, *(s3 or (None, None)))
+        counts = store.read() or {}
+    stats["counted_at"] = counts.get("counted_at")
+
+    if session and s3:
+        s3_client, bucket_name = s3
+        stats["using_cloud_queue"] = True
         stats["active_fargate_tasks"] = get_active_fargate_tasks(session)
 
-        # 1. S3 Queue Progress
-        s3_queues = {}
-        for q in ["discovery-gen", "gm-list", "gm-details", "enrichment", "to-call"]:
-            try:
-                paginator = s3.get_paginator("list_objects_v2")
-                pending = 0
-                inflight = 0
-                prefix_pending = f"campaigns/{campaign_name}/queues/{q}/pending/"
-                for page in paginator.paginate(Bucket=data_bucket, Prefix=prefix_pending):
-                    for obj in page.get("Contents", []):
-                        key = obj["Key"]
-                        if key.endswith("task.json") or (q == "discovery-gen" and key.endswith(".usv")):
-                            pending += 1
-                        elif key.endswith("lease.json"):
-                            inflight += 1
-                
-                completed = 0
-                last_completed = None
-                prefix_completed = f"campaigns/{campaign_name}/queues/{q}/completed/"
-                for page in paginator.paginate(Bucket=data_bucket, Prefix=prefix_completed):
-                    for obj in page.get("Contents", []):
-                        completed += 1
-                        mtime = obj["LastModified"]
-                        if last_completed is None or mtime > last_completed:
-                            last_completed = mtime
-                
-                s3_queues[q] = {"pending": pending, "inflight": inflight, "completed": completed, "last_completed_at": last_completed.isoformat() if last_completed else None}
-            except Exception as e:
-                logger.warning(f"S3 stats failed for {q}: {e}")
-        stats["s3_queues"] = s3_queues
+        # 1. S3 Queue Progress (listed by the last recount)
+        stats["s3_queues"] = counts.get("s3_queues") or {}
+        stats["s3_listed_at"] = counts.get("s3_listed_at")
 
         # 2. S3 Worker Heartbeats
         try:
             heartbeats = []
-            response = s3.list_objects_v2(Bucket=data_bucket, Prefix=paths.s3.status_root)
+            response = s3_client.list_objects_v2(Bucket=bucket_name, Prefix=paths.s3.status_root)
             for obj in response.get("Contents", []):
                 if obj["Key"].endswith(".json"):
                     try:
-                        hb_data = s3.get_object(Bucket=data_bucket, Key=obj["Key"])
+                        hb_data = s3_client.get_object(Bucket=bucket_name, Key=obj["Key"])
                         hb_json = json.loads(hb_data["Body"].read().decode("utf-8"))
                         hb_json["last_seen"] = obj["LastModified"].isoformat()
                         heartbeats.append(hb_json)
@@ -258,70 +275,19 @@ def get_campaign_stats(campaign_name: str) -> Dict[str, Any]:
     if bridge and bridge.heartbeats:
         stats["gossip_heartbeats"] = bridge.heartbeats
 
-    # 4. Local Queue Stats
-    local_stats = {}
-    for q_name in ["discovery-gen", "gm-list", "gm-details", "enrichment", "to-call"]:
-        queue_base = paths.queue(campaign_name, q_name)
-        q_pending = 0
-        q_inflight = 0
-        q_completed = 0
-        last_completed = None
-
-        p_dir = queue_base / "pending"
-        if p_dir.exists():
-            for root, dirs, files in os.walk(p_dir):
-                for f in files:
-                    if f == "task.json" or f.endswith(".usv"):
-                        q_pending += 1
-                    elif f == "lease.json":
-                        q_inflight += 1
-
-        c_dir = queue_base / "completed"
-        if c_dir.exists():
-            for cf in c_dir.iterdir():
-                if cf.suffix in [".json", ".usv"]:
-                    q_completed += 1
-                    mtime = datetime.fromtimestamp(cf.stat().st_mtime, tz=UTC)
-                    if last_completed is None or mtime > last_completed:
-                        last_completed = mtime
-        
-        local_stats[q_name] = {"pending": q_pending, "inflight": q_inflight, "completed": q_completed, "last_completed_at": last_completed.isoformat() if last_completed else None}
-
-    # 5. Mission Index Awareness for local gm-list
-    dg_completed = paths.campaign(campaign_name).queue("discovery-gen").completed
-    if dg_completed.exists():
-        mission_pending = 0
-        for tf in dg_completed.glob("**/*.usv"):
-            rel_path = tf.relative_to(dg_completed)
-            if not (witness_root / rel_path).exists() and not (witness_root / rel_path.with_suffix(".csv")).exists():
-                mission_pending += 1
-        existing = local_stats.get("gm-list", {}).get("pending", 0)
-        if isinstance(existing, (int, float)):
-            local_stats["gm-list"]["pending"] = int(existing) + mission_pending
-        else:
-            local_stats["gm-list"]["pending"] = mission_pending
-
+    # 4. Local Queue Stats (gm-list pending includes unscraped mission tiles)
+    local_stats = counts.get("local_queues") or {}
     stats["local_queues"] = local_stats
 
-    # 6. Legacy compatibility and summarization
-    stats["enrichment_pending"] = local_stats["enrichment"]["pending"]
-    stats["completed_count"] = local_stats["enrichment"]["completed"]
-
-    # 7. Anomaly and Location stats
-    total_scraped_witness = 0
-    empty_scraped_witness = 0
-    if witness_root.exists():
-        for phrase_slug in [slugify(q) for q in queries]:
-            for pf in witness_root.glob(f"**/{phrase_slug}.usv"):
-                try:
-                    with open(pf, "r", encoding="utf-8") as fh:
-                        from ..utils.usv_utils import USVDictReader
-                        row = next(USVDictReader(fh))
-                        total_scraped_witness += 1
-                        if int(row.get("items_found", 0)) == 0:
-                            empty_scraped_witness += 1
-                except Exception:
-                    continue
-    stats["anomaly_stats"] = {"total_scrapes": total_scraped_witness, "empty_scrapes": empty_scraped_witness}
+    # 5. Legacy compatibility and summarization
+    stats["enrichment_pending"] = local_stats.get("enrichment", {}).get("pending", 0)
+    stats["completed_count"] = local_stats.get("enrichment", {}).get("completed", 0)
+
+    # 6. Anomaly stats
+    witness = counts.get("witness") or {}
+    stats["anomaly_stats"] = {
+        "total_scrapes": sum(witness.get(p, [0, 0])[0] for p in phrases),
+        "empty_scrapes": sum(witness.get(p, [0, 0])[1] for p in phrases),
+    }
 
     return stats
@@ -1,14 +1,21 @@
 import math
 import logging
-from typing import List, Tuple
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
 from ..models.target_location import TargetLocation
 from ..core.scrape_index import ScrapedArea
 
 logger = logging.getLogger(__name__)
 
+EARTH_RADIUS_MILES = 3958.8
+GROUP_CELL_DEG = 1.0  # Targets are scored in groups sharing a cell of this size
+MAX_BLOCK_CELLS = 2_000_000  # Upper bound on targets x areas evaluated at once
+
 def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculates Haversine distance in miles between two points."""
-    R = 3958.8  # Radius of Earth in miles
+    R = EARTH_RADIUS_MILES
     dlat = math.radians(lat2 - lat1)
     dlon = math.radians(lon2 - lon1)
     a = math.sin(dlat / 2)**2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2)**2
@@ -42,15 +49,74 @@ def calculate_saturation_score(target: TargetLocation, areas: List[ScrapedArea],
     Score increases with more scraped areas within max_proximity.
     Weighting logic: (d_max - d_min) / (1 + d_min)
     """
-    total_score = 0.0
-    
-    for area in areas:
-        min_dist, max_dist = get_min_max_distance(target.lat, target.lon, area)
-        
-        if min_dist <= max_proximity:
-            # Avoid division by zero if min_dist is somehow negative (shouldn't be)
-            denom = 1.0 + max(0.0, min_dist)
-            weight = (max_dist - min_dist) / denom
-            total_score += weight
-            
-    return total_score
+    return float(calculate_saturation_scores([target], areas, max_proximity)[0])
+
+def _haversine_np(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """`haversine` over broadcast arrays of degrees."""
+    dlat = np.radians(lat2 - lat1)
+    dlon = np.radians(lon2 - lon1)
+    a = np.sin(dlat / 2)**2 + np.cos(np.radians(lat1)) * np.cos(np.radians(lat2)) * np.sin(dlon / 2)**2
+    distance: np.ndarray = EARTH_RADIUS_MILES * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return distance
+
+def _score_block(t_lat: np.ndarray, t_lon: np.ndarray, boxes: np.ndarray, max_proximity: float) -> np.ndarray:
+    """Exact scores of targets (column vectors) against area boxes (rows of lat_min, lat_max, lon_min, lon_max)."""
+    lat_min, lat_max, lon_min, lon_max = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+    min_dist = _haversine_np(t_lat, t_lon, np.clip(t_lat, lat_min, lat_max), np.clip(t_lon, lon_min, lon_max))
+    max_dist = np.maximum.reduce([
+        _haversine_np(t_lat, t_lon, lat_min, lon_min),
+        _haversine_np(t_lat, t_lon, lat_min, lon_max),
+        _haversine_np(t_lat, t_lon, lat_max, lon_min),
+        _haversine_np(t_lat, t_lon, lat_max, lon_max),
+    ])
+    weight = (max_dist - min_dist) / (1.0 + np.maximum(0.0, min_dist))
+    return np.where(min_dist <= max_proximity, weight, 0.0).sum(axis=1)
+
+def calculate_saturation_scores(targets: Sequence[TargetLocation], areas: Sequence[ScrapedArea], max_proximity: float = 20.0) -> np.ndarray:
+    """
+    `calculate_saturation_score` for many targets at once.
+
+    Targets are grouped by GROUP_CELL_DEG cell; each group is scored only against
+    areas whose bounding box can come within max_proximity of it (a conservative
+    lat/lon window derived from the haversine bound), in NumPy blocks.
+    """
+    scores = np.zeros(len(targets))
+    if not targets or not areas:
+        return scores
+
+    t_lat = np.array([t.lat for t in targets], dtype=float)
+    t_lon = np.array([t.lon for t in targets], dtype=float)
+    boxes = np.array([(a.lat_min, a.lat_max, a.lon_min, a.lon_max) for a in areas], dtype=float)
+
+    # Great-circle distance is at least R * |dlat|, so this lat window never drops a match
+    lat_pad = math.degrees(max_proximity / EARTH_RADIUS_MILES) + 1e-9
+    # ... and at least 2R * asin(cos(lat_max) * sin(dlon / 2)) for both points within |lat| <= lat_max
+    sin_half = math.sin(min(max_proximity / (2 * EARTH_RADIUS_MILES), math.pi / 2))
+
+    groups: Dict[Tuple[int, int], List[int]] = {}
+    for i, key in enumerate(zip(np.floor(t_lat / GROUP_CELL_DEG).astype(int).tolist(),
+                                np.floor(t_lon / GROUP_CELL_DEG).astype(int).tolist())):
+        groups.setdefault(key, []).append(i)
+
+    for members in groups.values():
+        idx = np.array(members)
+        g_lat, g_lon = t_lat[idx], t_lon[idx]
+        lat_lo, lat_hi = g_lat.min() - lat_pad, g_lat.max() + lat_pad
+        mask = (boxes[:, 1] >= lat_lo) & (boxes[:, 0] <= lat_hi)
+
+        cos_max = math.cos(math.radians(min(90.0, max(abs(lat_lo), abs(lat_hi)))))
+        if cos_max > sin_half:
+            lon_pad = math.degrees(2 * math.asin(sin_half / cos_max)) + 1e-9
+            lon_lo, lon_hi = g_lon.min() - lon_pad, g_lon.max() + lon_pad
+            if lon_lo >= -180.0 and lon_hi <= 180.0:  # No filter across the antimeridian
+                mask &= (boxes[:, 3] >= lon_lo) & (boxes[:, 2] <= lon_hi)
+
+        candidates = boxes[mask]
+        if len(candidates) == 0:
+            continue
+        step = max(1, MAX_BLOCK_CELLS // len(candidates))
+        for start in range(0, len(idx), step):
+            block = idx[start:start + step]
+            scores[block] = _score_block(t_lat[block, None], t_lon[block, None], candidates, max_proximity)
+
+    return scores
@@ -1,12 +1,19 @@
+import os
+import re
 import json
 import math
+import time
 import logging
 import csv
+import threading
 from datetime import datetime, timedelta, UTC
-from typing import List, Optional, NamedTuple, Tuple, Iterator, Any
+from typing import Callable, Dict, List, Optional, NamedTuple, Tuple, Iterator, Any, Sequence
 from pathlib import Path
 
+import numpy as np
+
 from .config import get_scraped_areas_index_dir
+from .campaign_stats import record_witness, witness_items_found
 from cocli.core.text_utils import slugify
 
 logger = logging.getLogger(__name__)
@@ -48,17 +55,121 @@ def _calculate_overlap_area(bounds1: dict[str, float], bounds2: dict[str, float]
 
     return overlap_width_degrees * overlap_height_degrees
 
+Bucket = Tuple[int, int]
+
+_GRID_KEY = re.compile(r"^lat(-?\d+)_lon(-?\d+)$")
+
+SNAPSHOT_NAME = ".scrape_index.snapshot.json"
+SNAPSHOT_VERSION = 1
+
+
+class _AreaTable:
+    """
+    Packed bounds / scrape dates / item counts of one phrase's legacy areas,
+    with a 1-degree bucket map from grid cell to row numbers. Rows are replaced
+    in place by key, so incremental updates never reshuffle the table.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.bounds = np.zeros((capacity, 4))  # lat_min, lat_max, lon_min, lon_max
+        self.dates = np.zeros(capacity)  # epoch seconds
+        self.areas: List[ScrapedArea] = []
+        self.rows: Dict[str, int] = {}
+        self.buckets: Dict[Bucket, List[int]] = {}
+        self._bucket_arrays: Dict[Bucket, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.areas)
+
+    def put(self, key: str, bucket: Bucket, bounds: Sequence[float], area: ScrapedArea) -> None:
+        row = self.rows.get(key)
+        if row is None:
+            row = len(self.areas)
+            if row == len(self.dates):
+                self.bounds = np.resize(self.bounds, (row * 2, 4))
+                self.dates = np.resize(self.dates, row * 2)
+            self.rows[key] = row
+            self.areas.append(area)
+            self.buckets.setdefault(bucket, []).append(row)
+            self._bucket_arrays.pop(bucket, None)
+        else:
+            self.areas[row] = area
+        self.bounds[row] = bounds
+        self.dates[row] = area.scrape_date.timestamp()
+
+    def remove(self, key: str) -> None:
+        """Tombstones a row: it stays allocated but never matches."""
+        row = self.rows.pop(key, None)
+        if row is not None:
+            self.bounds[row] = (math.inf, -math.inf, math.inf, -math.inf)
+            self.dates[row] = -math.inf
+
+    def candidates(self, buckets: Sequence[Bucket]) -> np.ndarray:
+        parts = []
+        for bucket in buckets:
+            if bucket not in self.buckets:
+                continue
+            arr = self._bucket_arrays.get(bucket)
+            if arr is None:
+                arr = self._bucket_arrays[bucket] = np.array(self.buckets[bucket], dtype=np.int64)
+            parts.append(arr)
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def first_match(
+        self, rows: np.ndarray, bounds: dict[str, float], min_date: float, threshold: float
+    ) -> Optional[Tuple[int, float]]:
+        """The first of `rows` covering at least `threshold` percent of `bounds` and not older than `min_date`."""
+        size = (bounds['lon_max'] - bounds['lon_min']) * (bounds['lat_max'] - bounds['lat_min'])
+        if size <= 0 or len(rows) == 0:
+            return None
+        b = self.bounds[rows]
+        height = np.minimum(b[:, 1], bounds['lat_max']) - np.maximum(b[:, 0], bounds['lat_min'])
+        width = np.minimum(b[:, 3], bounds['lon_max']) - np.maximum(b[:, 2], bounds['lon_min'])
+        percent = np.maximum(height, 0.0) * np.maximum(width, 0.0) / size * 100
+        # Tombstoned rows have inf bounds and -inf dates: never a match
+        hits = np.flatnonzero((percent >= threshold) & (self.dates[rows] >= min_date) & np.isfinite(b[:, 0]))
+        if len(hits) == 0:
+            return None
+        return int(rows[hits[0]]), float(percent[hits[0]])
+
+
 class ScrapeIndex:
     """
     Manages the index of previously scraped geographic areas.
     Uses a spatially partitioned file system structure:
     indexes/scraped_areas/{phrase}/{lat_grid}_{lon_grid}/{lat_min}_{lat_max}_{lon_min}_{lon_max}.json
+
+    Both trees are loaded once into memory (witness tiles in a dict, legacy areas
+    in packed per-phrase arrays bucketed by 1-degree cell) and kept current by
+    `add_area` and by an incremental re-scan every `refresh_interval` seconds
+    that only re-reads files whose mtime/size changed. The parsed records are
+    persisted to a snapshot next to the index so new processes start warm.
+
+    `is_tile_scraped` does not wait for that re-scan: a tile missing from memory
+    is looked up on disk, so witnesses other workers just wrote are seen at once,
+    and a single-tile check on a new index never walks the trees. Bulk and overlap
+    queries see other processes' changes within `refresh_interval`.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, refresh_interval: Optional[float] = 60.0) -> None:
         self.index_dir = get_scraped_areas_index_dir()
         from .config import get_scraped_tiles_index_dir
         self.witness_dir = get_scraped_tiles_index_dir()
+        self.snapshot_path = self.index_dir.parent / SNAPSHOT_NAME
+        self.refresh_interval = refresh_interval
+
+        self._lock = threading.RLock()
+        self._synced_at: Optional[float] = None
+        # Parsed file records keyed by path relative to their tree, with (mtime_ns, size)
+        self._witness_files: Dict[str, List[Any]] = {}
+        self._legacy_files: Dict[str, List[Any]] = {}
+        # phrase_slug -> (lat_str, lon_str) -> area (None: witness present but unreadable)
+        self._witness: Dict[str, Dict[Tuple[str, str], Optional[ScrapedArea]]] = {}
+        # phrase_slug -> relative path -> area, and the spatial tables over them
+        self._legacy_areas: Dict[str, Dict[str, ScrapedArea]] = {}
+        self._legacy_tables: Dict[str, _AreaTable] = {}
 
     def _get_grid_key(self, lat: float, lon: float) -> str:
         """Returns the grid key for spatial partitioning (1x1 degree) using floor."""
@@ -114,78 +225,252 @@ class ScrapeIndex:
             lon_f = round(float(parts[1]), 1)
             lat_str, lon_str = f"{lat_f:.1f}", f"{lon_f:.1f}"
 
-            # 1. Check Witness Index (Fast)
-
-            # Check both .usv and .csv
-            witness_path_usv = self.witness_dir / lat_str / lon_str / f"{phrase_slug}.usv"
-            witness_path_csv = self.witness_dir / lat_str / lon_str / f"{phrase_slug}.csv"
-
-            
-            witness_path = witness_path_usv if witness_path_usv.exists() else (witness_path_csv if witness_path_csv.exists() else None)
-            
-            if witness_path:
-                # Load minimal data from CSV/USV
-                try:
-                    with open(witness_path, "r", encoding="utf-8") as f:
-                        if witness_path.suffix == ".usv":
-                            from cocli.utils.usv_utils import USVReader
-                            u_reader = USVReader(f)
-                            row = next(iter(u_reader))
-                            # Schema: 0: scrape_date, 1: items_found, 2: processed_by
-                            date_val = row[0]
-                            found_val = row[1] if len(row) > 1 else "0"
-                            worker_val = row[2] if len(row) > 2 else "unknown"
-                        else:
-                            c_reader = csv.DictReader(f)
-                            row_dict = next(c_reader)
-                            date_val = row_dict['scrape_date']
-                            found_val = row_dict.get('items_found', '0')
-                            worker_val = row_dict.get('processed_by', 'unknown')
-
-                    scrape_date = datetime.fromisoformat(date_val.replace("Z", "+00:00"))
-                    if scrape_date.tzinfo is None:
-                        scrape_date = scrape_date.replace(tzinfo=UTC)
-                        
-                    if ttl_days is not None:
-                        age = datetime.now(UTC) - scrape_date
-                        if age > timedelta(days=ttl_days):
-                            return None
-                            
-                    # We return a sparse ScrapedArea object (compatible with legacy)
-                    lat, lon = float(lat_str), float(lon_str)
-                    return ScrapedArea(
-                        phrase=phrase_slug,
-                        scrape_date=scrape_date,
-                        lat_min=lat-0.05, lat_max=lat+0.05,
-                        lon_min=lon-0.05, lon_max=lon+0.05,
-                        lat_miles=8.0, lon_miles=8.0,
-                        items_found=int(found_val),
-                        tile_id=tile_id,
-                        processed_by=worker_val
-                    )
-                except Exception:
-                    pass
-
-            # 2. Check Legacy JSON Index
-            lat, lon = float(lat_str), float(lon_str)
-            grid_dir = self._get_grid_dir(phrase_slug, lat, lon)
-            
-            # Try both raw tile_id and the truncated lat_lon version
-            potential_filenames = [f"{tile_id}.json", f"{lat_str}_{lon_str}.json"]
-            for filename in potential_filenames:
-                file_path = grid_dir / filename
-                if file_path.exists():
-                    area = self._load_area_from_file(file_path)
+            def expired(area: ScrapedArea) -> bool:
+                return ttl_days is not None and datetime.now(UTC) - area.scrape_date > timedelta(days=ttl_days)
+
+            with self._lock:
+                if self._synced_at is not None:
+                    self._ensure_fresh()
+
+                # 1. Check Witness Index (Fast)
+                witness = self._witness.get(phrase_slug, {}).get((lat_str, lon_str))
+                if witness is None or expired(witness):
+                    # Possibly (re)written since the last sync by another worker
+                    for suffix in (".usv", ".csv"):
+                        self._reload_file("witness", f"{lat_str}/{lon_str}/{phrase_slug}{suffix}")
+                    witness = self._witness.get(phrase_slug, {}).get((lat_str, lon_str))
+                if witness is not None:
+                    return None if expired(witness) else witness._replace(tile_id=tile_id)
+
+                # 2. Check Legacy JSON Index
+                lat, lon = float(lat_str), float(lon_str)
+                grid_key = self._get_grid_key(lat, lon)
+
+                # Try both raw tile_id and the truncated lat_lon version
+                potential_filenames = [f"{tile_id}.json", f"{lat_str}_{lon_str}.json"]
+                for filename in potential_filenames:
+                    rel = f"{phrase_slug}/{grid_key}/{filename}"
+                    area = self._legacy_areas.get(phrase_slug, {}).get(rel)
+                    if area is None or expired(area):
+                        self._reload_file("legacy", rel)
+                        area = self._legacy_areas.get(phrase_slug, {}).get(rel)
                     if area:
-                        if ttl_days is not None:
-                            age = datetime.now(UTC) - area.scrape_date
-                            if age > timedelta(days=ttl_days):
-                                return None
-                        return area
+                        return None if expired(area) else area
         except Exception:
             pass
         return None
 
+    def witness_tile_ids(self, phrase: str, ttl_days: Optional[int] = None) -> List[str]:
+        """IDs of tiles with a readable witness for the phrase, scraped within ttl_days."""
+        self._ensure_fresh()
+        cutoff = datetime.now(UTC) - timedelta(days=ttl_days) if ttl_days is not None else None
+        return [
+            f"{lat_str}_{lon_str}"
+            for (lat_str, lon_str), area in self._witness.get(slugify(phrase), {}).items()
+            if area is not None and (cutoff is None or area.scrape_date >= cutoff)
+        ]
+
+    # --- In-memory index ---
+
+    def refresh(self) -> None:
+        """Re-scans both trees, re-reading only new or changed files."""
+        with self._lock:
+            self._sync()
+
+    def _ensure_fresh(self) -> None:
+        if self._synced_at is None or (
+            self.refresh_interval is not None
+            and time.monotonic() - self._synced_at > self.refresh_interval
+        ):
+            self.refresh()
+
+    def _reload_file(self, kind: str, rel: str) -> None:
+        """Re-reads one file of the witness or legacy tree if it changed on disk, without a re-scan."""
+        reader: Callable[[Path], List[Any]]
+        if kind == "witness":
+            root, files, reader, apply = self.witness_dir, self._witness_files, self._read_witness_record, self._apply_witness
+        else:
+            root, files, reader, apply = self.index_dir, self._legacy_files, self._read_legacy_record, self._apply_legacy
+        try:
+            st = os.stat(root / rel)
+        except OSError:
+            if files.pop(rel, None) is not None:
+                apply(rel)
+            return
+        record = files.get(rel)
+        if record is not None and record[:2] == [st.st_mtime_ns, st.st_size]:
+            return
+        files[rel] = [st.st_mtime_ns, st.st_size] + reader(root / rel)
+        apply(rel)
+
+    @staticmethod
+    def _scan_tree(root: Path, depth: int, suffixes: Tuple[str, ...]) -> Dict[str, List[int]]:
+        """(mtime_ns, size) of the files exactly `depth` directories below `root`."""
+        found: Dict[str, List[int]] = {}
+        if not root.exists():
+            return found
+
+        def walk(path: str, prefix: str, level: int) -> None:
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if level < depth:
+                            if entry.is_dir():
+                                walk(entry.path, f"{prefix}{entry.name}/", level + 1)
+                        elif entry.name.endswith(suffixes) and entry.is_file():
+                            st = entry.stat()
+                            found[f"{prefix}{entry.name}"] = [st.st_mtime_ns, st.st_size]
+            except OSError:
+                pass
+
+        walk(str(root), "", 0)
+        return found
+
+    def _sync(self) -> None:
+        first = self._synced_at is None
+        if first:
+            # Drop the tiles looked up one by one before the first sync
+            self._witness_files, self._legacy_files = {}, {}
+            self._witness, self._legacy_areas, self._legacy_tables = {}, {}, {}
+            self._load_snapshot()
+
+        read = 0
+        changed: Dict[str, List[str]] = {"witness": [], "legacy": []}
+        for kind, root, files, reader, suffixes in (
+            ("witness", self.witness_dir, self._witness_files, self._read_witness_record, (".usv", ".csv")),
+            ("legacy", self.index_dir, self._legacy_files, self._read_legacy_record, (".json",)),
+        ):
+            current = self._scan_tree(root, 2, suffixes)
+            for rel, sig in current.items():
+                record = files.get(rel)
+                if record is None or record[:2] != sig:
+                    files[rel] = sig + reader(root / rel)
+                    changed[kind].append(rel)
+                    read += 1
+            for rel in set(files) - set(current):
+                del files[rel]
+                changed[kind].append(rel)
+
+        for rel in (self._witness_files if first else changed["witness"]):
+            self._apply_witness(rel)
+        for rel in (sorted(self._legacy_files) if first else changed["legacy"]):
+            self._apply_legacy(rel)
+
+        self._synced_at = time.monotonic()
+        if read or changed["witness"] or changed["legacy"]:
+            logger.debug(f"Scrape index synced: {read} files read, {len(self._witness_files)} witness, {len(self._legacy_files)} legacy")
+            self._save_snapshot()
+
+    def _read_witness_record(self, witness_path: Path) -> List[Any]:
+        """[scrape_date iso, items_found, processed_by], or [None] if unreadable."""
+        try:
+            with open(witness_path, "r", encoding="utf-8") as f:
+                if witness_path.suffix == ".usv":
+                    from cocli.utils.usv_utils import USVReader
+                    row = next(iter(USVReader(f)))
+                    # Schema: 0: scrape_date, 1: items_found, 2: processed_by
+                    date_val = row[0]
+                    found_val = row[1] if len(row) > 1 else "0"
+                    worker_val = row[2] if len(row) > 2 else "unknown"
+                else:
+                    row_dict = next(csv.DictReader(f))
+                    date_val = row_dict['scrape_date']
+                    found_val = row_dict.get('items_found', '0')
+                    worker_val = row_dict.get('processed_by', 'unknown')
+            scrape_date = datetime.fromisoformat(date_val.replace("Z", "+00:00"))
+            if scrape_date.tzinfo is None:
+                scrape_date = scrape_date.replace(tzinfo=UTC)
+            return [scrape_date.isoformat(), int(found_val), worker_val]
+        except Exception:
+            return [None]
+
+    def _read_legacy_record(self, file_path: Path) -> List[Any]:
+        area = self._load_area_from_file(file_path)
+        if area is None:
+            return [None]
+        return [{**area._asdict(), "scrape_date": area.scrape_date.isoformat()}]
+
+    def _apply_witness(self, rel: str) -> None:
+        lat_str, lon_str, name = rel.split("/")
+        phrase_slug = name.rsplit(".", 1)[0]
+        # A .usv witness takes precedence over a .csv one for the same tile
+        record = self._witness_files.get(f"{lat_str}/{lon_str}/{phrase_slug}.usv") or \
+            self._witness_files.get(f"{lat_str}/{lon_str}/{phrase_slug}.csv")
+        tiles = self._witness.setdefault(phrase_slug, {})
+        if record is None:
+            tiles.pop((lat_str, lon_str), None)
+            return
+        area: Optional[ScrapedArea] = None
+        if record[2] is not None:
+            try:
+                lat, lon = float(lat_str), float(lon_str)
+                area = ScrapedArea(
+                    phrase=phrase_slug,
+                    scrape_date=datetime.fromisoformat(record[2]),
+                    lat_min=lat - 0.05, lat_max=lat + 0.05,
+                    lon_min=lon - 0.05, lon_max=lon + 0.05,
+                    lat_miles=8.0, lon_miles=8.0,
+                    items_found=record[3],
+                    tile_id=f"{lat_str}_{lon_str}",
+                    processed_by=record[4],
+                )
+            except ValueError:
+                area = None
+        tiles[(lat_str, lon_str)] = area
+
+    def _apply_legacy(self, rel: str) -> None:
+        phrase_slug, grid_key, name = rel.split("/")
+        areas = self._legacy_areas.setdefault(phrase_slug, {})
+        table = self._legacy_tables.setdefault(phrase_slug, _AreaTable())
+        record = self._legacy_files.get(rel)
+        if record is None or record[2] is None:
+            areas.pop(rel, None)
+            table.remove(rel)
+            return
+        data = dict(record[2])
+        data["scrape_date"] = datetime.fromisoformat(data["scrape_date"])
+        area = ScrapedArea(**data)
+        areas[rel] = area
+
+        # Overlap uses the filename bounds, like the directory scan did
+        bounds = self._parse_filename_bounds(name)
+        match = _GRID_KEY.match(grid_key)
+        if not bounds or not match:
+            table.remove(rel)
+            return
+        bucket = (int(match.group(1)), int(match.group(2)))
+        table.put(rel, bucket, (bounds['lat_min'], bounds['lat_max'], bounds['lon_min'], bounds['lon_max']), area)
+
+    def _load_snapshot(self) -> None:
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (
+            snapshot.get("version") != SNAPSHOT_VERSION
+            or snapshot.get("witness_dir") != str(self.witness_dir)
+            or snapshot.get("index_dir") != str(self.index_dir)
+        ):
+            return
+        self._witness_files = snapshot.get("witness", {})
+        self._legacy_files = snapshot.get("legacy", {})
+
+    def _save_snapshot(self) -> None:
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": SNAPSHOT_VERSION,
+                    "witness_dir": str(self.witness_dir),
+                    "index_dir": str(self.index_dir),
+                    "witness": self._witness_files,
+                    "legacy": self._legacy_files,
+                }, f)
+            tmp_path.replace(self.snapshot_path)
+        except OSError as e:
+            logger.warning(f"Could not save scrape index snapshot: {e}")
+
     def _iter_areas_in_grid(self, phrase: str, grid_key: str) -> Iterator[dict[str, Any]]:
         """
         Fast scan: Yields bounds dicts for all files in a grid bucket based ONLY on filenames.
@@ -256,12 +541,20 @@ class ScrapeIndex:
                     witness_dir = self.index_dir.parent / "scraped-tiles" / lat_str / lon_str
                     witness_dir.mkdir(parents=True, exist_ok=True)
                     witness_path = witness_dir / f"{phrase_slug}.usv"
+                    previous = witness_items_found(witness_path) if witness_path.exists() else None
                     
                     from cocli.utils.usv_utils import USVWriter
                     with open(witness_path, 'w', encoding='utf-8') as wf:
                         writer = USVWriter(wf)
                         writer.writerow([(scrape_date or datetime.now(UTC)).isoformat(), str(items_found), processed_by or ""])
                     logger.debug(f"Saved witness file (USV): {witness_path}")
+                    record_witness(
+                        witness_dir.parent.parent,
+                        phrase_slug,
+                        total=int(previous is None),
+                        empty=int(items_found == 0) - int(previous == 0),
+                    )
+                    self._index_witness(witness_path)
                     return witness_path
                 except Exception as we:
                     logger.error(f"Failed to save witness file for {tile_id}: {we}")
@@ -272,64 +565,50 @@ class ScrapeIndex:
             logger.error(f"Failed to save witness index for {tile_id}: {e}")
             return None
 
+    def _index_witness(self, witness_path: Path) -> None:
+        """Applies a just-written witness file to the index."""
+        with self._lock:
+            try:
+                rel = witness_path.relative_to(self.witness_dir).as_posix()
+                st = witness_path.stat()
+            except (ValueError, OSError):
+                return
+            self._witness_files[rel] = [st.st_mtime_ns, st.st_size] + self._read_witness_record(witness_path)
+            self._apply_witness(rel)
+
     def is_area_scraped(self, phrase: str, bounds: dict[str, float], ttl_days: Optional[int] = None, overlap_threshold_percent: float = 0.0) -> Optional[Tuple[ScrapedArea, float]]:
         """
         Checks if a given bounding box overlaps with existing scraped areas.
         """
-        phrase_slug = slugify(phrase)
-        
-        # Determine relevant grid buckets.
-        center_lat = (bounds['lat_min'] + bounds['lat_max']) / 2
-        center_lon = (bounds['lon_min'] + bounds['lon_max']) / 2
-        
-        center_lat_floor = math.floor(center_lat)
-        center_lon_floor = math.floor(center_lon)
-        
-        checked_grids = set()
-        
-        # Check 3x3 grid around center
-        for dlat in [-1, 0, 1]:
-            for dlon in [-1, 0, 1]:
-                lat_key = center_lat_floor + dlat
-                lon_key = center_lon_floor + dlon
-                grid_key = f"lat{lat_key}_lon{lon_key}"
-                
-                if grid_key in checked_grids:
-                    continue
-                checked_grids.add(grid_key)
-                
-                # Scan this grid bucket
-                for area_bounds in self._iter_areas_in_grid(phrase_slug, grid_key):
-                    # Quick overlap check using bounds from filename
-                    
-                    # Ensure float typing for overlap calculation
-                    calc_bounds = {k: float(v) for k, v in area_bounds.items() if k in ['lat_min', 'lat_max', 'lon_min', 'lon_max']}
-                    overlap_area = _calculate_overlap_area(bounds, calc_bounds)
-                    
-                    current_area_size = (bounds['lon_max'] - bounds['lon_min']) * (bounds['lat_max'] - bounds['lat_min'])
-                    if current_area_size <= 0:
-                        continue
-                        
-                    percent = (overlap_area / current_area_size) * 100
-                    
-                    if percent >= overlap_threshold_percent:
-                        # Potential match! Now we need to read the file to check date/TTL
-                        file_path_str = area_bounds.get('_file_path')
-                        if not file_path_str:
-                             continue
-                        full_area = self._load_area_from_file(Path(str(file_path_str)))
-                        if not full_area:
-                            continue
-                            
-                        if ttl_days is not None:
-                            age = datetime.now(UTC) - full_area.scrape_date
-                            if age > timedelta(days=ttl_days):
-                                continue # Stale
-                        
-                        logger.debug(f"Overlap found ({percent:.1f}%) with {full_area.lat_min},{full_area.lon_min}")
-                        return full_area, percent
+        return self.query_many(phrase, [bounds], ttl_days, overlap_threshold_percent)[0]
 
-        return None
+    def query_many(self, phrase: str, bounds_list: Sequence[dict[str, float]], ttl_days: Optional[int] = None, overlap_threshold_percent: float = 0.0) -> List[Optional[Tuple[ScrapedArea, float]]]:
+        """
+        `is_area_scraped` for many bounding boxes at once. Candidates are the legacy
+        areas bucketed in the 3x3 one-degree cells around each box's center.
+        """
+        self._ensure_fresh()
+        table = self._legacy_tables.get(slugify(phrase))
+        if not table:
+            return [None] * len(bounds_list)
+
+        min_date = (datetime.now(UTC) - timedelta(days=ttl_days)).timestamp() if ttl_days is not None else -math.inf
+        results: List[Optional[Tuple[ScrapedArea, float]]] = []
+        for bounds in bounds_list:
+            center_lat_floor = math.floor((bounds['lat_min'] + bounds['lat_max']) / 2)
+            center_lon_floor = math.floor((bounds['lon_min'] + bounds['lon_max']) / 2)
+            buckets = [
+                (center_lat_floor + dlat, center_lon_floor + dlon)
+                for dlat in (-1, 0, 1) for dlon in (-1, 0, 1)
+            ]
+            hit = table.first_match(table.candidates(buckets), bounds, min_date, overlap_threshold_percent)
+            if hit is None:
+                results.append(None)
+                continue
+            area = table.areas[hit[0]]
+            logger.debug(f"Overlap found ({hit[1]:.1f}%) with {area.lat_min},{area.lon_min}")
+            results.append((area, hit[1]))
+        return results
 
     def add_wilderness_area(self, bounds: dict[str, float], lat_miles: float, lon_miles: float, items_found: int) -> None:
         """Adds a new wilderness area to the index."""
@@ -345,72 +624,35 @@ class ScrapeIndex:
 
     def get_all_areas_for_phrases(self, phrases: List[str]) -> List[ScrapedArea]:
         """
-        Recursively loads ALL areas for the given phrases.
+        Loads ALL areas for the given phrases.
         Usage: KML generation (infrequent).
         Includes both legacy JSON and Phase 10 Witness (CSV) indexes.
         """
+        self._ensure_fresh()
         all_areas: List[ScrapedArea] = []
-        seen_tiles: set[str] = set() # (phrase, tile_id)
 
         for phrase in phrases:
             phrase_slug = slugify(phrase)
+            seen_tiles: set[str] = set()
 
-            # 1. Scan Witness Index (New Format)
-            # Structure: indexes/scraped-tiles/{lat}/{lon}/{phrase}.csv
-            if self.witness_dir.exists():
-                for lat_dir in self.witness_dir.iterdir():
-                    if not lat_dir.is_dir():
-                        continue
-                    for lon_dir in lat_dir.iterdir():
-                        if not lon_dir.is_dir():
-                            continue
-                        
-                        # Check for both .usv and .csv
-                        witness_usv = lon_dir / f"{phrase_slug}.usv"
-                        witness_csv = lon_dir / f"{phrase_slug}.csv"
-                        if witness_usv.exists() or witness_csv.exists():
-                            tile_id = f"{lat_dir.name}_{lon_dir.name}"
-                            area = self.is_tile_scraped(phrase, tile_id)
-                            if area:
-                                all_areas.append(area)
-                                seen_tiles.add(f"{phrase_slug}:{tile_id}")
-
-            # 2. Scan Legacy JSON Index
-            phrase_dir = self.index_dir / phrase_slug
-            if not phrase_dir.exists():
-                continue
-                
-            for grid_dir in phrase_dir.iterdir():
-                if grid_dir.is_dir():
-                    for file_path in grid_dir.glob("*.json"):
-                         area = self._load_area_from_file(file_path)
-                         if area:
-                             # Deduplicate if we already saw it in the witness index
-                             unique_key = f"{phrase_slug}:{area.tile_id}" if area.tile_id else None
-                             if unique_key and unique_key in seen_tiles:
-                                 continue
-                             all_areas.append(area)
+            # 1. Witness Index (New Format)
+            for _, area in sorted(self._witness.get(phrase_slug, {}).items()):
+                if area:
+                    all_areas.append(area)
+                    seen_tiles.add(str(area.tile_id))
+
+            # 2. Legacy JSON Index, deduplicated against the witness index
+            for _, area in sorted(self._legacy_areas.get(phrase_slug, {}).items()):
+                if area.tile_id and area.tile_id in seen_tiles:
+                    continue
+                all_areas.append(area)
         return all_areas
 
     def get_all_scraped_areas(self) -> List[ScrapedArea]:
-        """Loads ALL scraped areas (all phrases). Expensive."""
-        # Collect all unique phrases from both indexes
-        phrases = set()
-        if self.index_dir.exists():
-            phrases.update([d.name for d in self.index_dir.iterdir() if d.is_dir()])
-        
-        if self.witness_dir.exists():
-            for lat_dir in self.witness_dir.iterdir():
-                if not lat_dir.is_dir():
-                    continue
-                for lon_dir in lat_dir.iterdir():
-                    if not lon_dir.is_dir():
-                        continue
-                    # Collect phrases from both .csv and .usv
-                    phrases.update([f.stem for f in lon_dir.glob("*.csv")])
-                    phrases.update([f.stem for f in lon_dir.glob("*.usv")])
-
-        return self.get_all_areas_for_phrases(list(phrases))
+        """Loads ALL scraped areas (all phrases)."""
+        self._ensure_fresh()
+        phrases = set(self._witness) | set(self._legacy_areas)
+        return self.get_all_areas_for_phrases(sorted(phrases))
 
     def generate_diagnostic_manifest(self, output_path: Path) -> int:
         """
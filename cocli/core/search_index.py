@@ -0,0 +1,584 @@
+# POLICY: frictionless-data-policy-enforcement (See docs/FRICTIONLESS_DATA_POLICY_ENFORCEMENT.md)
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, cast
+
+import duckdb
+
+from ..models.campaigns.indexes.google_maps_place import GoogleMapsPlace
+from ..utils.duckdb_utils import load_usv_to_duckdb
+from .cache import CACHE_FILE_NAME, get_cache_path
+from .text_index import TextIndex, TextRow
+
+logger = logging.getLogger(__name__)
+
+SEARCH_DB_NAME = "search.duckdb"
+# Bump when the table layout or the items query changes; older databases are discarded
+SCHEMA_VERSION = 1
+# Bytes hashed at the end of an append-only source to recognise a pure append
+TAIL_BYTES = 4096
+# Past this many changed slugs the items table is rebuilt rather than patched
+MAX_PATCH_SLUGS = 50_000
+
+_META = "__meta__"
+
+# Searchable fields and filter attributes of items, as TextRow
+TEXT_ROWS_SQL = """
+    SELECT slug, name, domain, city, array_to_string(tags, ','), type,
+        COALESCE(email IS NOT NULL AND email != '' AND email != 'null', FALSE),
+        COALESCE(phone_number IS NOT NULL AND phone_number != '' AND phone_number != 'null', FALSE),
+        is_to_call
+    FROM items WHERE slug IS NOT NULL
+"""
+
+
+def compacted_fallback_columns() -> Dict[str, str]:
+    """Columns of items_compacted when the campaign has no compacted results yet."""
+    return {
+        "place_id": "VARCHAR",
+        "slug": "VARCHAR",
+        "phone": "VARCHAR",
+        "average_rating": "VARCHAR",
+        "reviews_count": "VARCHAR",
+        "street_address": "VARCHAR",
+        "city": "VARCHAR",
+        "state": "VARCHAR",
+        "zip": "VARCHAR",
+    }
+
+
+@dataclass
+class SearchSource:
+    """One input of the items table, kept in its own DuckDB table."""
+    table: str
+    path: Optional[Path]
+    datapackage: Optional[Path] = None
+    # Column identifying the rows a change touches: slug, or place_id (mapped to slugs)
+    key: str = "slug"
+    # Checkpoints only grow between compactions, so growth is loaded as a delta
+    append_only: bool = False
+    # Schema used when `path` is missing
+    fallback_columns: Optional[Dict[str, str]] = None
+    # Uses the GoogleMapsPlace schema instead of `datapackage`
+    place_schema: bool = False
+
+
+@dataclass
+class RefreshStats:
+    reloaded: List[str] = field(default_factory=list)
+    deltas: Dict[str, int] = field(default_factory=dict)  # table -> rows appended
+    patched_slugs: int = 0
+    rebuilt: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.reloaded or self.deltas or self.patched_slugs or self.rebuilt)
+
+
+def _signature(path: Optional[Path]) -> Optional[List[int]]:
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _tail_hash(path: Path, end: int) -> Optional[str]:
+    """Hash of the TAIL_BYTES ending at `end`, or None if `end` is not a record boundary."""
+    start = max(0, end - TAIL_BYTES)
+    try:
+        with open(path, "rb") as f:
+            f.seek(start)
+            tail = f.read(end - start)
+    except OSError:
+        return None
+    if len(tail) != end - start or (tail and not tail.endswith(b"\n")):
+        return None
+    return hashlib.sha1(tail).hexdigest()
+
+
+class SearchIndex:
+    """
+    The DuckDB database behind fuzzy search. Each source (company cache,
+    prospect and venue checkpoints, compacted results, lifecycle, to-call queue)
+    lives in its own table and is versioned by its file signature, so a refresh
+    only reloads what changed: checkpoint growth is appended as a delta, other
+    sources are reloaded and diffed on their key. The joined `items` table is
+    materialized and patched for the slugs those changes touch, and so is the
+    in-memory text index built from it on the first text search.
+
+    The database is persisted next to the company cache so a restart reuses it.
+    """
+
+    def __init__(self, db_path: Optional[Path], sources: List[SearchSource]):
+        self.db_path = db_path
+        self.sources = sources
+        self.con: duckdb.DuckDBPyConnection = self._connect()
+        self._state: Dict[str, Dict[str, Any]] = self._load_state()
+        self._text: Optional[TextIndex] = None
+        self._exclusions: Optional[Tuple[FrozenSet[str], FrozenSet[str]]] = None
+
+    @classmethod
+    def for_campaign(cls, campaign: Optional[str], persist: bool = True) -> "SearchIndex":
+        from .paths import paths
+
+        cache_dir = get_cache_path(campaign=campaign)
+        sources = [
+            SearchSource("items_cache", cache_dir / CACHE_FILE_NAME, cache_dir / "datapackage.json"),
+        ]
+        if campaign:
+            campaign_node = paths.campaign(campaign)
+            compacted_path = campaign_node.queue("gm-list").completed / "results" / "compacted.usv"
+            sources += [
+                SearchSource(
+                    "items_prospects",
+                    campaign_node.index("google_maps_prospects").checkpoint,
+                    append_only=True,
+                    place_schema=True,
+                ),
+                SearchSource(
+                    "items_venues",
+                    campaign_node.index("google_maps_venues").path / "venues.checkpoint.usv",
+                    append_only=True,
+                    place_schema=True,
+                ),
+                SearchSource(
+                    "items_compacted",
+                    compacted_path,
+                    compacted_path.parent / "datapackage.json",
+                    key="place_id",
+                    fallback_columns=compacted_fallback_columns(),
+                ),
+                SearchSource(
+                    "items_lifecycle",
+                    campaign_node.lifecycle,
+                    campaign_node.path / "indexes" / "lifecycle" / "datapackage.json",
+                    key="place_id",
+                ),
+                SearchSource("items_to_call", paths.queue(campaign, "to-call") / "pending"),
+            ]
+        else:
+            sources += [
+                SearchSource("items_prospects", None, place_schema=True),
+                SearchSource("items_venues", None, place_schema=True),
+                SearchSource("items_compacted", None, key="place_id", fallback_columns=compacted_fallback_columns()),
+                SearchSource("items_lifecycle", None, key="place_id"),
+                SearchSource("items_to_call", None),
+            ]
+        return cls(cache_dir / SEARCH_DB_NAME if persist else None, sources)
+
+    # --- Connection and persisted state ---------------------------------------
+
+    def _connect(self) -> duckdb.DuckDBPyConnection:
+        if self.db_path is None:
+            return duckdb.connect(database=":memory:")
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            con = duckdb.connect(database=str(self.db_path))
+        except (duckdb.Error, OSError) as e:
+            # Typically another process holds the write lock
+            logger.warning(f"Search index {self.db_path} unavailable ({e}); using an in-memory index")
+            self.db_path = None
+            return duckdb.connect(database=":memory:")
+
+        con.execute("CREATE TABLE IF NOT EXISTS search_state (name VARCHAR PRIMARY KEY, state VARCHAR)")
+        row = con.execute("SELECT state FROM search_state WHERE name = ?", [_META]).fetchone()
+        if row is None or json.loads(row[0]).get("version") != SCHEMA_VERSION:
+            con.close()
+            for stale in (self.db_path, self.db_path.with_name(self.db_path.name + ".wal")):
+                stale.unlink(missing_ok=True)
+            con = duckdb.connect(database=str(self.db_path))
+        return con
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        self.con.execute("CREATE TABLE IF NOT EXISTS search_state (name VARCHAR PRIMARY KEY, state VARCHAR)")
+        return {
+            name: json.loads(state)
+            for name, state in self.con.execute("SELECT name, state FROM search_state").fetchall()
+            if name != _META
+        }
+
+    def _save_state(self) -> None:
+        rows = [[_META, json.dumps({"version": SCHEMA_VERSION})]]
+        rows += [[name, json.dumps(state)] for name, state in self._state.items()]
+        self.con.executemany("INSERT OR REPLACE INTO search_state VALUES (?, ?)", rows)
+
+    def close(self) -> None:
+        try:
+            self.con.close()
+        except duckdb.Error:
+            pass
+
+    def has_table(self, name: str) -> bool:
+        row = self.con.execute(
+            "SELECT 1 FROM information_schema.tables WHERE table_name = ? AND table_type = 'BASE TABLE'",
+            [name],
+        ).fetchone()
+        return row is not None
+
+    def _columns(self, table: str) -> List[str]:
+        return [cast(str, c[1]) for c in self.con.execute(f"PRAGMA table_info('{table}')").fetchall()]
+
+    # --- Refresh --------------------------------------------------------------
+
+    def refresh(self) -> RefreshStats:
+        """Brings every source table and the items table up to date."""
+        stats = RefreshStats()
+        start = time.perf_counter()
+        if self._sources_current():
+            stats.elapsed = time.perf_counter() - start
+            return stats
+        previous_state = json.loads(json.dumps(self._state))
+        rebuild = not self.has_table("items")
+        changed: List[SearchSource] = []
+
+        self.con.execute("BEGIN TRANSACTION")
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                place_dp = Path(tmp_dir) / "place_datapackage.json"
+                with open(place_dp, "w") as f:
+                    json.dump({"resources": [{"schema": {"fields": GoogleMapsPlace.get_datapackage_fields()}}]}, f)
+
+                for source in self.sources:
+                    outcome = self._refresh_source(source, place_dp, Path(tmp_dir), stats)
+                    if outcome is None:
+                        rebuild = True
+                    elif outcome:
+                        changed.append(source)
+
+            self.con.execute("""
+                CREATE OR REPLACE VIEW items_checkpoint AS
+                SELECT *, CAST('company' AS VARCHAR) as type FROM items_prospects
+                UNION ALL
+                SELECT *, CAST('company' AS VARCHAR) as type FROM items_venues
+            """)
+
+            if not rebuild and changed:
+                rebuild = not self._patch_items(changed, stats)
+            if rebuild:
+                self._build_items()
+                self._text = None
+                stats.rebuilt = True
+
+            for source in self.sources:
+                self.con.execute(f"DROP TABLE IF EXISTS _changed_{source.table}")
+            self._save_state()
+            self.con.execute("COMMIT")
+        except Exception:
+            self.con.execute("ROLLBACK")
+            self._state = previous_state
+            self._text = None
+            raise
+
+        stats.elapsed = time.perf_counter() - start
+        if stats.changed:
+            logger.debug(
+                f"Search index refreshed in {stats.elapsed:.3f}s: reloaded={stats.reloaded} "
+                f"deltas={stats.deltas} patched_slugs={stats.patched_slugs} rebuilt={stats.rebuilt}"
+            )
+        return stats
+
+    def _sources_current(self) -> bool:
+        """True if no source moved since the last refresh: one stat per source, as searches call this per keystroke."""
+        return all(
+            source.table in self._state and self._state[source.table].get("signature") == _signature(source.path)
+            for source in self.sources
+        ) and self.has_table("items")
+
+    def _refresh_source(
+        self, source: SearchSource, place_dp: Path, tmp_dir: Path, stats: RefreshStats
+    ) -> Optional[bool]:
+        """
+        Updates one source table. Returns False if it was already current, True
+        if it changed and `_changed_<table>` holds the changed key values, or
+        None if its schema changed and the items table must be rebuilt.
+        """
+        if source.table == "items_to_call":
+            return self._refresh_to_call(source, stats)
+
+        signature = _signature(source.path)
+        state = self._state.get(source.table)
+        exists = self.has_table(source.table)
+        if exists and state is not None and state.get("signature") == signature:
+            return False
+
+        datapackage = place_dp if source.place_schema else source.datapackage
+        if (
+            exists
+            and state is not None
+            and source.append_only
+            and source.path is not None
+            and signature is not None
+            and state.get("tail")
+            and signature[0] > state["loaded"]
+            and _tail_hash(source.path, state["loaded"]) == state["tail"]
+        ):
+            appended = self._append_delta(source, datapackage, state["loaded"], signature[0], tmp_dir)
+            if appended is not None:
+                loaded, rows = appended
+                stats.deltas[source.table] = rows
+                self._state[source.table] = {
+                    "signature": signature,
+                    "loaded": loaded,
+                    "tail": _tail_hash(source.path, loaded),
+                }
+                return True
+
+        # Full reload, diffed against the previous copy when the schema is unchanged
+        old_table = f"_old_{source.table}"
+        if exists:
+            self.con.execute(f"DROP TABLE IF EXISTS {old_table}")
+            self.con.execute(f"ALTER TABLE {source.table} RENAME TO {old_table}")
+        self._load(source, datapackage)
+        stats.reloaded.append(source.table)
+        loaded = signature[0] if signature else 0
+        self._state[source.table] = {
+            "signature": signature,
+            "loaded": loaded,
+            "tail": _tail_hash(source.path, loaded) if source.append_only and source.path and signature else None,
+        }
+        if not exists:
+            return None
+        try:
+            if self._columns(old_table) != self._columns(source.table):
+                return None
+            key = f'"{source.key}"'
+            self.con.execute(f"""
+                CREATE TEMP TABLE _changed_{source.table} AS
+                SELECT DISTINCT {key} AS key FROM (
+                    (SELECT * FROM {source.table} EXCEPT SELECT * FROM {old_table})
+                    UNION ALL
+                    (SELECT * FROM {old_table} EXCEPT SELECT * FROM {source.table})
+                )
+            """)
+            return True
+        finally:
+            self.con.execute(f"DROP TABLE IF EXISTS {old_table}")
+
+    def _load(self, source: SearchSource, datapackage: Optional[Path]) -> None:
+        path = source.path
+        if (path is None or not path.exists()) and source.fallback_columns:
+            cols_sql = ", ".join([f'"{name}" {dtype}' for name, dtype in source.fallback_columns.items()])
+            self.con.execute(f"CREATE TABLE {source.table} ({cols_sql})")
+            return
+        load_usv_to_duckdb(self.con, source.table, path or Path("/dev/null"), datapackage)
+
+    def _append_delta(
+        self, source: SearchSource, datapackage: Optional[Path], start: int, end: int, tmp_dir: Path
+    ) -> Optional[tuple[int, int]]:
+        """Loads the complete records appended after byte `start`. Returns (new loaded offset, rows)."""
+        assert source.path is not None
+        with open(source.path, "rb") as f:
+            f.seek(start)
+            appended = f.read(end - start)
+        # A record still being written is picked up by a later refresh
+        cut = appended.rfind(b"\n") + 1
+        if cut == 0:
+            return None
+        delta_path = tmp_dir / f"{source.table}.delta.usv"
+        delta_path.write_bytes(appended[:cut])
+        delta_table = f"_delta_{source.table}"
+        load_usv_to_duckdb(self.con, delta_table, delta_path, datapackage, prefer_parquet=False)
+        if self._columns(delta_table) != self._columns(source.table):
+            self.con.execute(f"DROP TABLE {delta_table}")
+            return None
+        self.con.execute(f"INSERT INTO {source.table} SELECT * FROM {delta_table}")
+        self.con.execute(
+            f'CREATE TEMP TABLE _changed_{source.table} AS SELECT DISTINCT "{source.key}" AS key FROM {delta_table}'
+        )
+        row = self.con.execute(f"SELECT COUNT(*) FROM {delta_table}").fetchone()
+        self.con.execute(f"DROP TABLE {delta_table}")
+        return start + cut, row[0] if row else 0
+
+    def _refresh_to_call(self, source: SearchSource, stats: RefreshStats) -> Optional[bool]:
+        signature = _signature(source.path)
+        state = self._state.get(source.table)
+        exists = self.has_table(source.table)
+        if exists and state is not None and state.get("signature") == signature:
+            return False
+
+        slugs: List[str] = []
+        if source.path is not None and source.path.is_dir():
+            slugs = [f[:-4] for f in os.listdir(source.path) if f.endswith(".usv")]
+        self._state[source.table] = {"signature": signature}
+        self.con.execute("CREATE OR REPLACE TEMP TABLE _to_call_now AS SELECT unnest(?::VARCHAR[]) AS slug", [slugs])
+        try:
+            if not exists:
+                self.con.execute(f"CREATE TABLE {source.table} AS SELECT slug FROM _to_call_now")
+                stats.reloaded.append(source.table)
+                return None
+            self.con.execute(f"""
+                CREATE TEMP TABLE _changed_{source.table} AS
+                (SELECT slug AS key FROM _to_call_now EXCEPT SELECT slug FROM {source.table})
+                UNION
+                (SELECT slug AS key FROM {source.table} EXCEPT SELECT slug FROM _to_call_now)
+            """)
+            self.con.execute(f"DELETE FROM {source.table} WHERE slug NOT IN (SELECT slug FROM _to_call_now)")
+            self.con.execute(f"""
+                INSERT INTO {source.table}
+                SELECT DISTINCT slug FROM _to_call_now WHERE slug NOT IN (SELECT slug FROM {source.table})
+            """)
+            stats.deltas[source.table] = len(slugs)
+            return True
+        finally:
+            self.con.execute("DROP TABLE IF EXISTS _to_call_now")
+
+    # --- Items ----------------------------------------------------------------
+
+    def _patch_items(self, changed: List[SearchSource], stats: RefreshStats) -> bool:
+        """Recomputes the items rows of the slugs the changed sources touch. False if a rebuild is cheaper."""
+        selects = []
+        for source in changed:
+            if source.key == "slug":
+                selects.append(f"SELECT CAST(key AS VARCHAR) AS slug FROM _changed_{source.table}")
+            else:
+                selects.append(
+                    f"SELECT slug FROM items_checkpoint WHERE {source.key} IN (SELECT key FROM _changed_{source.table})"
+                )
+        self.con.execute(
+            "CREATE OR REPLACE TEMP TABLE _affected AS SELECT DISTINCT slug FROM (" + " UNION ALL ".join(selects) + ")"
+        )
+        try:
+            row = self.con.execute("SELECT COUNT(*), COUNT(*) - COUNT(slug) FROM _affected").fetchone()
+            affected, null_slugs = (row[0], row[1]) if row else (0, 0)
+            # Rows without a slug collapse into one item, which a slug filter can't target
+            if null_slugs or affected > MAX_PATCH_SLUGS:
+                return False
+            if affected:
+                self.con.execute("DELETE FROM items WHERE slug IN (SELECT slug FROM _affected)")
+                self.con.execute("INSERT INTO items " + self._items_select(only_affected=True))
+                if self._text is not None:
+                    self._patch_text()
+            stats.patched_slugs = affected
+            return True
+        finally:
+            self.con.execute("DROP TABLE IF EXISTS _affected")
+
+    def _patch_text(self) -> None:
+        assert self._text is not None
+        slugs = [r[0] for r in self.con.execute("SELECT slug FROM _affected").fetchall()]
+        rows = self.con.execute(TEXT_ROWS_SQL + " AND slug IN (SELECT slug FROM _affected)").fetchall()
+        self._text.update(slugs, [TextRow(*r) for r in rows])
+        if self._text.needs_rebuild:
+            self._text = None
+
+    def text_index(self) -> TextIndex:
+        """The text index over items, built on first use."""
+        if self._text is None:
+            rows = self.con.execute(TEXT_ROWS_SQL + " ORDER BY slug").fetchall()
+            self._text = TextIndex([TextRow(*r) for r in rows])
+            if self._exclusions:
+                self._text.exclude(*self._exclusions)
+        return self._text
+
+    def set_exclusions(self, slugs: Iterable[str], domains: Iterable[str]) -> None:
+        """
+        Loads the campaign's excluded slugs and domains into the excluded_slugs
+        and excluded_domains tables that searches anti-join against.
+        """
+        exclusions = (frozenset(slugs), frozenset(domains))
+        if exclusions == self._exclusions:
+            return
+        self.con.execute(
+            "CREATE OR REPLACE TEMP TABLE excluded_slugs AS SELECT unnest(?::VARCHAR[]) AS slug",
+            [sorted(exclusions[0])],
+        )
+        self.con.execute(
+            "CREATE OR REPLACE TEMP TABLE excluded_domains AS SELECT unnest(?::VARCHAR[]) AS domain",
+            [sorted(exclusions[1])],
+        )
+        self._exclusions = exclusions
+        if self._text is not None:
+            self._text.exclude(*exclusions)
+
+    def _build_items(self) -> None:
+        self.con.execute("CREATE OR REPLACE TABLE items AS " + self._items_select())
+        self.con.execute("CREATE INDEX items_slug_idx ON items (slug)")
+
+    def _items_select(self, only_affected: bool = False) -> str:
+        """
+        The unified search row per slug. Column expressions adapt to the sources'
+        schemas. With `only_affected`, both sides of the slug join are narrowed to
+        the `_affected` slugs before joining.
+        """
+        columns = {
+            table: {c.lower() for c in self._columns(table)}
+            for table in ("items_checkpoint", "items_compacted", "items_cache", "items_lifecycle")
+        }
+
+        def has(table: str, col: str) -> bool:
+            return col in columns[table]
+
+        # Rating and reviews: compacted > checkpoint, then the cache (human-edited company data)
+        rating_from_checkpoint = (
+            "COALESCE(TRY_CAST(compacted.average_rating AS DOUBLE), TRY_CAST(t1.average_rating AS DOUBLE))"
+            if has("items_checkpoint", "average_rating") or has("items_compacted", "average_rating")
+            else "CAST(NULL AS DOUBLE)"
+        )
+        reviews_from_checkpoint = (
+            "COALESCE(TRY_CAST(compacted.reviews_count AS BIGINT), TRY_CAST(t1.reviews_count AS BIGINT))"
+            if has("items_checkpoint", "reviews_count") or has("items_compacted", "reviews_count")
+            else "CAST(NULL AS BIGINT)"
+        )
+        rating_from_cache = (
+            "TRY_CAST(t2.average_rating AS DOUBLE)" if has("items_cache", "average_rating") else "CAST(NULL AS DOUBLE)"
+        )
+        reviews_from_cache = (
+            "TRY_CAST(t2.reviews_count AS BIGINT)" if has("items_cache", "reviews_count") else "CAST(NULL AS BIGINT)"
+        )
+        lc_enqueued = "lc.enqueued_at" if has("items_lifecycle", "enqueued_at") else "CAST(NULL AS VARCHAR)"
+        lc_enriched = "lc.enriched_at" if has("items_lifecycle", "enriched_at") else "CAST(NULL AS VARCHAR)"
+        lc_scraped = (
+            "lc.scraped_at" if has("items_lifecycle", "scraped_at")
+            else "lc.created_at" if has("items_lifecycle", "created_at")
+            else "CAST(NULL AS VARCHAR)"
+        )
+        lc_details = (
+            "lc.details_at" if has("items_lifecycle", "details_at")
+            else "lc.updated_at" if has("items_lifecycle", "updated_at")
+            else "CAST(NULL AS VARCHAR)"
+        )
+
+        checkpoint, cache = "items_checkpoint", "items_cache"
+        if only_affected:
+            checkpoint = "(SELECT * FROM items_checkpoint WHERE slug IN (SELECT slug FROM _affected))"
+            cache = "(SELECT * FROM items_cache WHERE slug IN (SELECT slug FROM _affected))"
+
+        return f"""
+            SELECT DISTINCT ON (slug)
+                COALESCE(t1.slug, t2.slug) as slug,
+                COALESCE(t1.name, t2.name) as name,
+                COALESCE(t1.type, t2.type, CAST('company' AS VARCHAR)) as type,
+                COALESCE(t1.domain, t2.domain) as domain,
+                COALESCE(t2.email, t1.email) as email,
+                COALESCE(compacted.phone, t1.phone, t2.phone_number) as phone_number,
+                COALESCE(string_to_array(t2.tags, ';'), string_to_array(t1.keyword, ';'), CAST([] AS VARCHAR[])) as tags,
+                COALESCE(t2.display, 'COMPANY:' || COALESCE(t1.name, t2.name)) as display,
+                COALESCE(t1.updated_at, CAST(NULL AS VARCHAR)) as last_modified,
+                COALESCE({rating_from_checkpoint}, {rating_from_cache}) as average_rating,
+                COALESCE({reviews_from_checkpoint}, {reviews_from_cache}) as reviews_count,
+                COALESCE(t1.street_address, CAST(NULL AS VARCHAR)) as street_address,
+                COALESCE(t1.city, CAST(NULL AS VARCHAR)) as city,
+                COALESCE(t1.state, CAST(NULL AS VARCHAR)) as state,
+                COALESCE(t1.zip, CAST(NULL AS VARCHAR)) as zip,
+                COALESCE({lc_scraped}, t1.created_at) as list_found_at,
+                COALESCE({lc_details}, t1.updated_at) as details_found_at,
+                COALESCE({lc_enqueued}, CAST(NULL AS VARCHAR)) as enqueued_at,
+                COALESCE({lc_enriched}, CAST(NULL AS VARCHAR)) as last_enriched,
+                CASE WHEN tc.slug IS NOT NULL THEN TRUE ELSE FALSE END as is_to_call
+            FROM {checkpoint} t1
+            LEFT JOIN items_compacted compacted ON t1.place_id = compacted.place_id
+            FULL OUTER JOIN {cache} t2 ON t1.slug = t2.slug
+            LEFT JOIN items_lifecycle lc ON t1.place_id = lc.place_id
+            LEFT JOIN items_to_call tc ON COALESCE(t1.slug, t2.slug) = tc.slug
+            ORDER BY slug, last_modified DESC NULLS LAST
+        """
@@ -0,0 +1,392 @@
+import bisect
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import AbstractSet, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Trigrams hash into this many posting lists; collisions only add candidates
+HASH_BITS = 16
+# Leading bytes of the name kept in the sorted array that answers prefix matches
+NAME_KEY_BYTES = 24
+# Rows per chunk when building postings and when verifying candidates
+BUILD_CHUNK_ROWS = 50_000
+VERIFY_CHUNK = 2048
+# Minimum share of query trigrams a name needs for the fuzzy fallback
+FUZZY_MIN_SHARE = 0.4
+# ...counting only trigrams present in at most this share of names
+COMMON_TRIGRAM_SHARE = 0.25
+# The delta overlay is folded into a rebuild past max(MIN_DELTA_ROWS, DELTA_SHARE * rows)
+MIN_DELTA_ROWS = 2000
+DELTA_SHARE = 0.02
+
+FIELD_SEP = "\x00"
+ROW_SEP = "\x01"
+
+# Ranking tiers: name starts with the query, name contains it, another field contains it
+TIER_PREFIX, TIER_NAME, TIER_OTHER = 0, 1, 2
+
+
+class TextRow(NamedTuple):
+    """The searchable fields and filter attributes of one items row."""
+    slug: str
+    name: Optional[str]
+    domain: Optional[str]
+    city: Optional[str]
+    tags: Optional[str]
+    type: Optional[str]
+    has_email: bool
+    has_phone: bool
+    is_to_call: bool
+
+
+@dataclass(frozen=True)
+class TextFilter:
+    item_type: Optional[str] = None
+    # "any": email or phone, "both": email and phone
+    contact: Optional[str] = None
+    to_call: bool = False
+
+    def accepts(self, row: TextRow) -> bool:
+        if self.item_type and row.type != self.item_type:
+            return False
+        if self.contact == "any" and not (row.has_email or row.has_phone):
+            return False
+        if self.contact == "both" and not (row.has_email and row.has_phone):
+            return False
+        return not self.to_call or row.is_to_call
+
+
+def _clean(value: Optional[str]) -> str:
+    return (value or "").lower().replace(FIELD_SEP, " ").replace(ROW_SEP, " ")
+
+
+def _name_text(row: TextRow) -> str:
+    return _clean(row.name)
+
+
+def _other_text(row: TextRow) -> str:
+    return FIELD_SEP.join(_clean(v) for v in (row.slug, row.domain, row.city, row.tags))
+
+
+def _hash_codes(data: np.ndarray) -> np.ndarray:
+    """Hash of the trigram starting at each position but the last two of a uint8 array."""
+    codes = (data[:-2].astype(np.uint32) << 16) | (data[1:-1].astype(np.uint32) << 8) | data[2:]
+    hashed: np.ndarray = (codes * np.uint32(2654435761)) >> np.uint32(32 - HASH_BITS)
+    return hashed.astype(np.uint16)
+
+
+def query_hashes(text: str) -> List[int]:
+    data = np.frombuffer(text.encode(), dtype=np.uint8)
+    if len(data) < 3:
+        return []
+    return sorted(set(_hash_codes(data).tolist()))
+
+
+class _Postings:
+    """Row ids per trigram hash, ascending, stored as one CSR array."""
+
+    def __init__(self, offsets: np.ndarray, rows: np.ndarray):
+        self.offsets = offsets
+        self.rows = rows
+
+    def get(self, h: int) -> np.ndarray:
+        return self.rows[self.offsets[h] : self.offsets[h + 1]]
+
+    def candidates(self, hashes: Sequence[int], chunk: int) -> Iterator[np.ndarray]:
+        """
+        Rows holding every hash in `hashes`, ascending, in batches. The shortest
+        posting list is walked `chunk` rows at a time so callers that stop early
+        don't pay for the whole intersection.
+        """
+        lists = sorted((self.get(h) for h in hashes), key=len)
+        if not len(lists[0]) or any(not len(posting) for posting in lists[1:]):
+            return
+        for first in range(0, len(lists[0]), chunk):
+            found = lists[0][first : first + chunk]
+            for posting in lists[1:]:
+                at = np.minimum(np.searchsorted(posting, found), len(posting) - 1)
+                found = found[posting[at] == found]
+                if not len(found):
+                    break
+            if len(found):
+                yield found
+
+    @classmethod
+    def build(cls, chunks: List[Tuple[np.ndarray, np.ndarray]]) -> "_Postings":
+        """Merges per-chunk (hashes, rows) pairs whose rows ascend across chunks."""
+        buckets = 1 << HASH_BITS
+        sorted_chunks = []
+        counts = np.zeros(buckets, dtype=np.int64)
+        for hashes, rows in chunks:
+            order = np.argsort(hashes, kind="stable")
+            hashes, rows = hashes[order], rows[order]
+            # A trigram repeated within a row is posted once
+            keep = np.ones(len(rows), dtype=bool)
+            keep[1:] = (hashes[1:] != hashes[:-1]) | (rows[1:] != rows[:-1])
+            hashes, rows = hashes[keep], rows[keep]
+            chunk_counts = np.bincount(hashes, minlength=buckets)
+            sorted_chunks.append((hashes, rows, chunk_counts))
+            counts += chunk_counts
+
+        offsets = np.zeros(buckets + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        out = np.empty(int(offsets[-1]), dtype=np.int32)
+        cursor = offsets[:-1].copy()
+        for hashes, rows, chunk_counts in sorted_chunks:
+            group_start = np.zeros(buckets, dtype=np.int64)
+            np.cumsum(chunk_counts[:-1], out=group_start[1:])
+            within = np.arange(len(rows), dtype=np.int64) - group_start[hashes]
+            out[cursor[hashes] + within] = rows
+            cursor += chunk_counts
+        return cls(offsets, out)
+
+
+class _TextField:
+    """
+    One lowercased text per row, joined into a single byte buffer, with the
+    trigram postings of each row.
+    """
+
+    def __init__(self, texts: List[str]):
+        self.buffer = "".join(text + ROW_SEP for text in texts).encode()
+        data = np.frombuffer(self.buffer, dtype=np.uint8)
+        self.ends = np.flatnonzero(data == 1)
+        self.starts = np.zeros(len(texts), dtype=np.int64)
+        self.starts[1:] = self.ends[:-1] + 1
+
+        chunks: List[Tuple[np.ndarray, np.ndarray]] = []
+        for first in range(0, len(texts), BUILD_CHUNK_ROWS):
+            last = min(first + BUILD_CHUNK_ROWS, len(texts))
+            lo, hi = int(self.starts[first]), int(self.ends[last - 1]) + 1
+            chunk = data[lo:hi]
+            if len(chunk) < 3:
+                continue
+            hashes = _hash_codes(chunk)
+            # Trigrams spanning a field or row separator match nothing
+            valid = (chunk[:-2] > 1) & (chunk[1:-1] > 1) & (chunk[2:] > 1)
+            row_of = np.repeat(
+                np.arange(first, last, dtype=np.int32), self.ends[first:last] - self.starts[first:last] + 1
+            )[: len(hashes)]
+            chunks.append((hashes[valid], row_of[valid]))
+        self.postings = _Postings.build(chunks)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def contains(self, i: int, needle: bytes) -> bool:
+        return self.buffer.find(needle, int(self.starts[i]), int(self.ends[i])) != -1
+
+    def startswith(self, i: int, needle: bytes) -> bool:
+        return self.buffer.startswith(needle, int(self.starts[i]), int(self.ends[i]))
+
+    def candidates(self, needle: bytes, hashes: List[int]) -> Iterator[np.ndarray]:
+        """Ascending batches of rows that may contain `needle` (every row that does is included)."""
+        if hashes:
+            yield from self.postings.candidates(hashes, VERIFY_CHUNK)
+            return
+        # Shorter than a trigram: scan the buffer for occurrences
+        batch: List[int] = []
+        at = self.buffer.find(needle)
+        while at != -1:
+            row = int(np.searchsorted(self.ends, at))
+            batch.append(row)
+            if len(batch) == VERIFY_CHUNK:
+                yield np.array(batch, dtype=np.int32)
+                batch = []
+            at = self.buffer.find(needle, int(self.ends[row]) + 1)
+        if batch:
+            yield np.array(batch, dtype=np.int32)
+
+
+class TextIndex:
+    """
+    In-memory trigram index over the searchable fields of the items table
+    (name, slug, domain, city, tags).
+
+    Names and the other fields are kept lowercased in two byte buffers, rows
+    in slug order. Candidate rows for a query come from intersecting trigram
+    posting lists and are confirmed with a substring check, so results match a
+    case-insensitive substring search. Name prefixes are answered from a
+    sorted array of leading name bytes.
+
+    Updates go to a small overlay of replaced rows; once it grows past a
+    share of the index the owner rebuilds it (see `needs_rebuild`).
+    """
+
+    def __init__(self, rows: Sequence[TextRow]):
+        start = time.perf_counter()
+        self.slugs: List[str] = [row.slug for row in rows]
+        self.types = np.array([row.type or "" for row in rows], dtype=object)
+        self.has_email = np.array([row.has_email for row in rows], dtype=bool)
+        self.has_phone = np.array([row.has_phone for row in rows], dtype=bool)
+        self.is_to_call = np.array([row.is_to_call for row in rows], dtype=bool)
+        self.domains: List[Optional[str]] = [row.domain for row in rows]
+        self.dead = np.zeros(len(rows), dtype=bool)
+        # Rows of excluded slugs or domains (see `exclude`)
+        self.excluded = np.zeros(len(rows), dtype=bool)
+        self.excluded_slugs: AbstractSet[str] = frozenset()
+        self.excluded_domains: AbstractSet[str] = frozenset()
+        # Replaced and new rows with their lowercased name and other fields
+        self.delta: Dict[str, Tuple[TextRow, str, str]] = {}
+
+        self.names = _TextField([_name_text(row) for row in rows])
+        self.others = _TextField([_other_text(row) for row in rows])
+
+        # Leading name bytes (zero padded), sorted for prefix lookups
+        data = np.frombuffer(self.names.buffer, dtype=np.uint8)
+        at = self.names.starts[:, None] + np.arange(NAME_KEY_BYTES)
+        key_bytes = np.where(at < self.names.ends[:, None], data[np.minimum(at, len(data) - 1)], 0)
+        name_keys = np.ascontiguousarray(key_bytes.astype(np.uint8)).view(f"S{NAME_KEY_BYTES}").ravel()
+        self.name_order = np.argsort(name_keys, kind="stable").astype(np.int32)
+        self.sorted_name_keys = name_keys[self.name_order]
+
+        logger.debug(f"Text index built over {len(rows)} rows in {time.perf_counter() - start:.2f}s")
+
+    def __len__(self) -> int:
+        return len(self.slugs) - int(self.dead.sum()) + len(self.delta)
+
+    @property
+    def needs_rebuild(self) -> bool:
+        return len(self.delta) > max(MIN_DELTA_ROWS, DELTA_SHARE * len(self.slugs))
+
+    def update(self, slugs: Iterable[str], rows: Iterable[TextRow]) -> None:
+        """Replaces the rows of `slugs` with `rows` (slugs without a row are removed)."""
+        for slug in slugs:
+            self.delta.pop(slug, None)
+            at = bisect.bisect_left(self.slugs, slug)
+            if at < len(self.slugs) and self.slugs[at] == slug:
+                self.dead[at] = True
+        for row in rows:
+            self.delta[row.slug] = (row, _name_text(row), _other_text(row))
+
+    def exclude(self, slugs: AbstractSet[str], domains: AbstractSet[str]) -> None:
+        """Leaves rows with these slugs or domains out of every search."""
+        self.excluded_slugs, self.excluded_domains = slugs, domains
+        self.excluded = np.fromiter(
+            (slug in slugs or domain in domains for slug, domain in zip(self.slugs, self.domains)),
+            dtype=bool,
+            count=len(self.slugs),
+        )
+
+    def _is_excluded(self, row: TextRow) -> bool:
+        return row.slug in self.excluded_slugs or row.domain in self.excluded_domains
+
+    # --- Search -----------------------------------------------------------------
+
+    def search(self, query: str, text_filter: TextFilter = TextFilter(), limit: int = 500, offset: int = 0) -> List[str]:
+        """Slugs matching `query`, best first: name prefix, name, other fields; then slug order."""
+        q = query.lower()
+        needle = q.encode()
+        need = offset + limit
+        if not needle or need <= 0:
+            return []
+        hashes = query_hashes(q)
+
+        delta_tiers: Dict[int, List[str]] = {TIER_PREFIX: [], TIER_NAME: [], TIER_OTHER: []}
+        for row, name, other in self.delta.values():
+            if text_filter.accepts(row) and not self._is_excluded(row):
+                if name.startswith(q):
+                    delta_tiers[TIER_PREFIX].append(row.slug)
+                elif q in name:
+                    delta_tiers[TIER_NAME].append(row.slug)
+                elif q in other:
+                    delta_tiers[TIER_OTHER].append(row.slug)
+
+        ranked: List[str] = []
+        for tier in (TIER_PREFIX, TIER_NAME, TIER_OTHER):
+            base = self._base_tier(tier, needle, hashes, text_filter, need - len(ranked))
+            merged = list(_merge(base, sorted(delta_tiers[tier])))
+            ranked.extend(merged[: need - len(ranked)])
+            if len(ranked) >= need:
+                break
+
+        if not ranked and len(hashes) >= 2:
+            ranked = self._fuzzy(hashes, text_filter, need)
+        return ranked[offset:need]
+
+    def _keep(self, ids: np.ndarray, text_filter: TextFilter) -> np.ndarray:
+        mask: np.ndarray = ~(self.dead[ids] | self.excluded[ids])
+        if text_filter.item_type:
+            mask &= self.types[ids] == text_filter.item_type
+        if text_filter.contact == "any":
+            mask &= self.has_email[ids] | self.has_phone[ids]
+        elif text_filter.contact == "both":
+            mask &= self.has_email[ids] & self.has_phone[ids]
+        if text_filter.to_call:
+            mask &= self.is_to_call[ids]
+        kept: np.ndarray = ids[mask]
+        return kept
+
+    def _base_tier(
+        self, tier: int, needle: bytes, hashes: List[int], text_filter: TextFilter, need: int
+    ) -> List[str]:
+        """Up to `need` slugs of the base rows in `tier`, in slug order."""
+        if tier == TIER_PREFIX:
+            key = needle[:NAME_KEY_BYTES]
+            lo = np.searchsorted(self.sorted_name_keys, np.bytes_(key), "left")
+            if len(key) < NAME_KEY_BYTES:
+                hi = np.searchsorted(self.sorted_name_keys, np.bytes_(key + b"\xff"), "left")
+            else:
+                hi = np.searchsorted(self.sorted_name_keys, np.bytes_(key), "right")
+            ids = self._keep(self.name_order[lo:hi], text_filter)
+            if len(needle) > NAME_KEY_BYTES:
+                ids = np.array([i for i in ids.tolist() if self.names.startswith(i, needle)], dtype=np.int32)
+            if len(ids) > need:
+                ids = np.partition(ids, need - 1)[:need]
+            return [self.slugs[i] for i in np.sort(ids).tolist()]
+
+        field = self.names if tier == TIER_NAME else self.others
+        names = self.names
+        found: List[str] = []
+        for batch in field.candidates(needle, hashes):
+            ids = self._keep(batch, text_filter)
+            for i, start, end in zip(ids.tolist(), names.starts[ids].tolist(), names.ends[ids].tolist()):
+                if names.buffer.startswith(needle, start, end):
+                    continue
+                in_name = names.buffer.find(needle, start, end) != -1
+                if in_name if tier == TIER_NAME else not in_name and self.others.contains(i, needle):
+                    found.append(self.slugs[i])
+                    if len(found) >= need:
+                        return found
+        return found
+
+    def _fuzzy(self, hashes: List[int], text_filter: TextFilter, need: int) -> List[str]:
+        """Names sharing the most query trigrams, for queries with no substring match (typos)."""
+        postings = sorted(((h, self.names.postings.get(h)) for h in hashes), key=lambda hp: len(hp[1]))
+        # Trigrams found in most names say little about which one was meant
+        informative = [
+            (h, p) for h, p in postings if len(p) <= COMMON_TRIGRAM_SHARE * len(self.slugs)
+        ] or postings[:1]
+        threshold = max(1, math.ceil(FUZZY_MIN_SHARE * len(informative)))
+        shared = np.bincount(np.concatenate([p for _, p in informative]), minlength=len(self.slugs))
+        ids = self._keep(np.flatnonzero(shared >= threshold).astype(np.int32), text_filter)
+        best = ids[np.lexsort((ids, -shared[ids]))[:need]]
+        scored: List[Tuple[int, str]] = [(-int(shared[i]), self.slugs[i]) for i in best.tolist()]
+
+        query_set = {h for h, _ in informative}
+        for row, name, _ in self.delta.values():
+            if text_filter.accepts(row) and not self._is_excluded(row):
+                overlap = len(query_set & set(query_hashes(name)))
+                if overlap >= threshold:
+                    scored.append((-overlap, row.slug))
+        return [slug for _, slug in sorted(scored)[:need]]
+
+
+def _merge(first: List[str], second: List[str]) -> Iterable[str]:
+    """Merges two ascending slug lists."""
+    i = j = 0
+    while i < len(first) and j < len(second):
+        if first[i] <= second[j]:
+            yield first[i]
+            i += 1
+        else:
+            yield second[j]
+            j += 1
+    yield from first[i:]
+    yield from second[j:]
+
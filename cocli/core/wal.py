@@ -1,11 +1,18 @@
+import os
+import json
+import time
+import atexit
 import socket
+import weakref
 import logging
+import threading
 from datetime import datetime, UTC
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from .paths import paths
-from ..models.wal.record import DatagramRecord, RS
+from .wal_index import WalIndex, get_wal_index
+from ..models.wal.record import DatagramRecord
 
 logger = logging.getLogger(__name__)
 
@@ -15,66 +22,274 @@ def get_node_id() -> str:
 def append_update(target_dir: Path, field: str, value: Any, campaign_name: Optional[str] = None) -> None:
     """
     Appends a field update to the centralized WAL journal via the paths authority.
+
+    Goes through the process-wide WalWriter: committed immediately, or group
+    committed when called inside a `with get_wal_writer():` batch.
+    """
+    get_wal_writer().append(target_dir, field, value, campaign_name=campaign_name)
+
+def wal_index() -> WalIndex:
+    """Returns the process-wide index of the centralized WAL."""
+    return get_wal_index(paths.wal.path)
+
+def _write_records(wal_file: Path, records: List[Tuple[bytes, str]], fsync: bool = False) -> None:
+    """Appends (data, target) records in one write and registers them in the WAL index."""
+    payload = b"".join(data for data, _ in records)
+    with open(wal_file, "ab") as f:
+        f.write(payload)
+        f.flush()
+        if fsync:
+            os.fsync(f.fileno())
+        # O_APPEND: the records end wherever the file position is now
+        offset = f.tell() - len(payload)
+
+    index = wal_index()
+    for data, target in records:
+        index.record_append(wal_file, offset, len(data), target)
+        offset += len(data)
+
+def append_record(wal_file: Path, usv_record: str, target: str) -> None:
+    """
+    Appends one raw USV record to a WAL journal and registers it in the WAL index.
     """
-    from .config import get_campaign
-    
-    node_id = get_node_id()
-    wal_file = paths.wal_journal(node_id)
-    target_id = paths.wal_target_id(target_dir)
-
-    # Infer campaign if not provided
-    effective_campaign = campaign_name or get_campaign() or "unknown"
-
-    # Convert value to string representation (JSON if complex)
-    if isinstance(value, (list, dict)):
-        import json
-        value_str = json.dumps(value)
-    else:
-        value_str = str(value)
-    
-    from .environment import get_environment
-    record = DatagramRecord(
-        timestamp=datetime.now(UTC).isoformat(),
-        node_id=node_id,
-        campaign_name=effective_campaign,
-        environment=get_environment().value,
-        target=target_id,
-        field=field,
-        value=value_str
-    )
-
-    
     # Ensure WAL directory exists
     wal_file.parent.mkdir(parents=True, exist_ok=True)
+    _write_records(wal_file, [(usv_record.encode("utf-8"), target)])
+
+# Writers with buffered records are flushed at interpreter exit
+_open_writers: "weakref.WeakSet[WalWriter]" = weakref.WeakSet()
+
+@atexit.register
+def _flush_writers_at_exit() -> None:
+    for writer in list(_open_writers):
+        try:
+            writer.close()
+        except Exception as e:
+            logger.error(f"WAL flush at exit failed: {e}")
+
+class WalWriter:
+    """
+    Buffered, group-committing writer for WAL records.
+
+    Records are encoded and buffered in memory, then written with one open/write
+    per journal when the buffer reaches `max_records` or `max_bytes`, when the
+    oldest buffered record is `flush_interval` seconds old (checked by a
+    background thread), on `flush()`, and at interpreter exit. With `fsync=True`
+    every group commit is fsynced before it is acknowledged in the WAL index.
+
+    With `autocommit=True` (the process-wide writer behind append_update), each
+    record is committed as it is appended unless the appending thread has a
+    batch open. A batch is the context manager; it is tracked per thread and
+    always commits what is left when the block exits, even on error:
+
+        with get_wal_writer() as wal:
+            for field, value in updates.items():
+                wal.append(company_dir, field, value)
+    """
+
+    def __init__(
+        self,
+        max_records: int = 256,
+        max_bytes: int = 1024 * 1024,
+        flush_interval: Optional[float] = 1.0,
+        fsync: bool = False,
+        autocommit: bool = False,
+    ):
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.autocommit = autocommit
+
+        self._buffer: Dict[Path, List[Tuple[bytes, str]]] = {}
+        self._buffered_records = 0
+        self._buffered_bytes = 0
+        self._oldest: Optional[float] = None
+        # Batch nesting depth of each thread (see __enter__)
+        self._batches = threading.local()
+        self._ensured_dirs: Set[Path] = set()
+        self._lock = threading.RLock()
+
+        # Process constants, resolved once instead of per record
+        self._node_id: Optional[str] = None
+        self._environment: Optional[str] = None
+        self._config_campaign: Optional[str] = None
+
+        self._flusher: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._closed = False
+        _open_writers.add(self)
+
+        # Metrics
+        self.commits = 0
+        self.records_written = 0
+
+    def __enter__(self) -> "WalWriter":
+        self._batches.depth = self._batch_depth + 1
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._batches.depth = self._batch_depth - 1
+        if self._batch_depth == 0:
+            self.flush()
 
-    with open(wal_file, "a") as f:
-        f.write(record.to_usv())
-    
-    logger.info(f"WAL append: {field}={value_str} in {wal_file}")
+    @property
+    def _batch_depth(self) -> int:
+        """Batch nesting depth of the calling thread."""
+        depth: int = getattr(self._batches, "depth", 0)
+        return depth
+
+    def __len__(self) -> int:
+        return self._buffered_records
+
+    # --- Appending ---------------------------------------------------------
+
+    def _campaign(self) -> str:
+        # set_campaign() updates the env var in-process; the config file is read once
+        env_campaign = os.environ.get("COCLI_CAMPAIGN")
+        if env_campaign:
+            return env_campaign
+        if self._config_campaign is None:
+            from .config import get_campaign
+            self._config_campaign = get_campaign() or "unknown"
+        return self._config_campaign
+
+    def append(self, target_dir: Path, field: str, value: Any, campaign_name: Optional[str] = None) -> None:
+        """Buffers a field update for an entity directory."""
+        if self._node_id is None or self._environment is None:
+            from .environment import get_environment
+            self._node_id = get_node_id()
+            self._environment = get_environment().value
+
+        # Convert value to string representation (JSON if complex)
+        if isinstance(value, (list, dict)):
+            value_str = json.dumps(value)
+        else:
+            value_str = str(value)
+
+        target_id = paths.wal_target_id(target_dir)
+        record = DatagramRecord(
+            timestamp=datetime.now(UTC).isoformat(),
+            node_id=self._node_id,
+            campaign_name=campaign_name or self._campaign(),
+            environment=self._environment,
+            target=target_id,
+            field=field,
+            value=value_str
+        )
+        logger.debug(f"WAL append: {target_id}.{field}={value_str}")
+        self.append_record(paths.wal_journal(self._node_id), record.to_usv(), target_id)
+
+    def append_record(self, wal_file: Path, usv_record: str, target: str) -> None:
+        """Buffers one raw USV record for a journal."""
+        data = usv_record.encode("utf-8")
+        with self._lock:
+            if self._closed:
+                # Too late for buffering (interpreter exit): write through
+                append_record(wal_file, usv_record, target)
+                return
+            self._buffer.setdefault(wal_file, []).append((data, target))
+            self._buffered_records += 1
+            self._buffered_bytes += len(data)
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+
+            if (
+                (self.autocommit and self._batch_depth == 0)
+                or self._buffered_records >= self.max_records
+                or self._buffered_bytes >= self.max_bytes
+            ):
+                self.flush()
+            elif self.flush_interval is not None:
+                self._ensure_flusher()
+
+    # --- Committing --------------------------------------------------------
+
+    def flush(self) -> int:
+        """Group-commits every buffered record. Returns the number of records written."""
+        with self._lock:
+            if not self._buffer:
+                return 0
+            buffer, self._buffer = self._buffer, {}
+            count = self._buffered_records
+            self._buffered_records = 0
+            self._buffered_bytes = 0
+            self._oldest = None
+
+            for wal_file, records in buffer.items():
+                try:
+                    if wal_file.parent not in self._ensured_dirs:
+                        wal_file.parent.mkdir(parents=True, exist_ok=True)
+                        self._ensured_dirs.add(wal_file.parent)
+                    _write_records(wal_file, records, fsync=self.fsync)
+                except OSError as e:
+                    # Keep the records for the next commit rather than dropping updates
+                    logger.error(f"WAL commit to {wal_file} failed: {e}")
+                    self._requeue(wal_file, records)
+                    count -= len(records)
+
+            self.commits += 1
+            self.records_written += count
+            logger.debug(f"WAL commit: {count} records to {len(buffer)} journal(s)")
+            return count
+
+    def _requeue(self, wal_file: Path, records: List[Tuple[bytes, str]]) -> None:
+        self._buffer.setdefault(wal_file, [])[:0] = records
+        self._buffered_records += len(records)
+        self._buffered_bytes += sum(len(data) for data, _ in records)
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True, name="WalWriterFlush")
+        self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        interval = self.flush_interval or 1.0
+        while not self._wake.wait(interval / 2):
+            with self._lock:
+                if self._oldest is not None and time.monotonic() - self._oldest >= interval:
+                    self.flush()
+
+    def close(self) -> None:
+        """Flushes outstanding records and stops the background flusher."""
+        self._wake.set()
+        with self._lock:
+            self.flush()
+            self._closed = True
+
+_writer: Optional[WalWriter] = None
+_writer_lock = threading.Lock()
+
+def get_wal_writer() -> WalWriter:
+    """Returns the process-wide WAL writer used by append_update."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = WalWriter(autocommit=True)
+        return _writer
 
 def read_updates(target_dir: Path) -> List[DatagramRecord]:
     """
     Reads all datagram records for a specific entity from the centralized WAL.
     """
-    wal_dir = paths.wal
-    records: List[DatagramRecord] = []
-    if not wal_dir.exists():
-        return records
-    
-    target_id = paths.wal_target_id(target_dir)
-
-    for wal_file in sorted(wal_dir.glob("*.usv")):
-        try:
-            content = wal_file.read_text()
-            for raw_record in content.split(RS):
-                if raw_record.strip():
-                    record = DatagramRecord.from_usv(raw_record)
-                    if record.target == target_id:
-                        records.append(record)
-        except Exception as e:
-            logger.error(f"Error reading WAL file {wal_file}: {e}")
+    return read_updates_many([target_dir])[target_dir]
+
+def read_updates_many(target_dirs: Iterable[Path]) -> Dict[Path, List[DatagramRecord]]:
+    """
+    Reads the datagram records of many entities, each list sorted by timestamp.
+    Only the indexed records of the requested targets are read and parsed.
+    """
+    # Read-your-writes: commit anything this process still has buffered
+    if _writer is not None:
+        _writer.flush()
+
+    target_dirs = list(target_dirs)
+    if not paths.wal.exists():
+        return {target_dir: [] for target_dir in target_dirs}
 
-            
-    # Sort by timestamp (naive 'latest wins' for now)
-    records.sort(key=lambda x: x.timestamp)
-    return records
+    target_ids = {target_dir: paths.wal_target_id(target_dir) for target_dir in target_dirs}
+    by_target = wal_index().read(target_ids.values())
+    return {target_dir: list(by_target[target_id]) for target_dir, target_id in target_ids.items()}
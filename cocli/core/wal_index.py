@@ -0,0 +1,254 @@
+import os
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..models.wal.record import DatagramRecord, RS, US
+
+logger = logging.getLogger(__name__)
+
+_RS_BYTE = RS.encode("utf-8")
+_US_BYTE = US.encode("utf-8")
+
+# Where the target column sits for each DatagramRecord layout (see DatagramRecord.from_usv)
+_TARGET_COLUMN = {6: 2, 7: 3}
+_V3_TARGET_COLUMN = 4
+
+
+def record_target(raw: bytes) -> Optional[str]:
+    """Extracts the target of a raw WAL record without building a DatagramRecord."""
+    parts = raw.split(_US_BYTE)
+    if len(parts) < 6:
+        return None
+    column = _TARGET_COLUMN.get(len(parts), _V3_TARGET_COLUMN)
+    return parts[column].decode("utf-8", errors="replace")
+
+
+# (journal file name, byte offset, byte length)
+WalLocation = Tuple[str, int, int]
+
+
+@dataclass
+class _JournalState:
+    inode: int
+    offset: int = 0
+
+
+@dataclass
+class WalChunk:
+    """One complete record read by WalTail, with its position in the journal."""
+    file_name: str
+    offset: int
+    raw: bytes = field(repr=False)
+
+    @property
+    def length(self) -> int:
+        return len(self.raw)
+
+    def parse(self) -> DatagramRecord:
+        return DatagramRecord.from_usv(self.raw.decode("utf-8", errors="replace"))
+
+
+class WalTail:
+    """
+    Offset-based incremental reader over the `*.usv` journals in the WAL directory.
+
+    Each `poll()` only reads the bytes appended since the previous call. Journals
+    that were replaced or truncated (rotation, compaction) are reported through
+    `poll()`'s `reset` set and re-read from the start.
+    """
+
+    def __init__(self, wal_dir: Path):
+        self.wal_dir = wal_dir
+        self._journals: Dict[str, _JournalState] = {}
+
+    def offset(self, file_name: str) -> Optional[int]:
+        state = self._journals.get(file_name)
+        return state.offset if state else None
+
+    def advance(self, file_name: str, offset: int, length: int) -> bool:
+        """
+        Moves past a record this process appended itself.
+        Returns False if the journal was not read up to `offset` (another writer got in between).
+        """
+        state = self._journals.get(file_name)
+        if state is None or state.offset != offset:
+            return False
+        state.offset += length
+        return True
+
+    def poll(self) -> Tuple[List[WalChunk], List[str]]:
+        """Returns (new records, journals that must be forgotten and were re-read)."""
+        chunks: List[WalChunk] = []
+        reset: List[str] = []
+        if not self.wal_dir.exists():
+            return chunks, reset
+
+        seen = set()
+        for wal_file in sorted(self.wal_dir.glob("*.usv")):
+            name = wal_file.name
+            seen.add(name)
+            try:
+                st = os.stat(wal_file)
+            except FileNotFoundError:
+                continue
+
+            state = self._journals.get(name)
+            if state is not None and (state.inode != st.st_ino or st.st_size < state.offset):
+                reset.append(name)
+                state = None
+            if state is None:
+                state = self._journals[name] = _JournalState(inode=st.st_ino)
+            if st.st_size == state.offset:
+                continue
+
+            try:
+                chunks.extend(self._read_from(wal_file, state))
+            except OSError as e:
+                logger.error(f"Error reading WAL file {wal_file}: {e}")
+
+        for name in set(self._journals) - seen:
+            del self._journals[name]
+            reset.append(name)
+        return chunks, reset
+
+    def _read_from(self, wal_file: Path, state: _JournalState) -> Iterator[WalChunk]:
+        with open(wal_file, "rb") as f:
+            f.seek(state.offset)
+            data = f.read()
+
+        # Only consume complete records; a writer may be mid-record
+        end = data.rfind(_RS_BYTE)
+        if end == -1:
+            return
+        base = state.offset
+        pos = 0
+        while pos <= end:
+            stop = data.index(_RS_BYTE, pos)
+            raw = data[pos:stop]
+            if raw.strip():
+                yield WalChunk(wal_file.name, base + pos, raw)
+            pos = stop + 1
+        state.offset = base + end + 1
+
+    def read_new(self) -> List[DatagramRecord]:
+        """Parses the records appended since the last call."""
+        chunks, _ = self.poll()
+        records = []
+        for chunk in chunks:
+            try:
+                records.append(chunk.parse())
+            except Exception as e:
+                logger.warning(f"Skipping malformed WAL record in {chunk.file_name}@{chunk.offset}: {e}")
+        return records
+
+
+class WalIndex:
+    """
+    In-memory index of the WAL: target -> [(journal, offset, length), ...].
+
+    Built lazily with a single pass over the journals, then kept current by
+    `record_append()` (called by local writers) and by tailing only the bytes
+    other processes appended since the last lookup. Lookups read and parse just
+    the records of the requested targets.
+    """
+
+    def __init__(self, wal_dir: Path):
+        self.wal_dir = wal_dir
+        self._tail = WalTail(wal_dir)
+        self._locations: Dict[str, List[WalLocation]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(locs) for locs in self._locations.values())
+
+    def refresh(self) -> int:
+        """Indexes records appended since the last refresh. Returns how many were added."""
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self) -> int:
+        chunks, reset = self._tail.poll()
+        if reset:
+            self._forget(set(reset))
+        added = 0
+        for chunk in chunks:
+            target = record_target(chunk.raw)
+            if target is None:
+                continue
+            self._locations.setdefault(target, []).append((chunk.file_name, chunk.offset, chunk.length))
+            added += 1
+        return added
+
+    def _forget(self, file_names: set[str]) -> None:
+        for target in list(self._locations):
+            kept = [loc for loc in self._locations[target] if loc[0] not in file_names]
+            if kept:
+                self._locations[target] = kept
+            else:
+                del self._locations[target]
+
+    def record_append(self, wal_file: Path, offset: int, length: int, target: str) -> None:
+        """
+        Registers a record this process just appended at `offset`.
+        If the journal has unread bytes before it, the next refresh picks it up instead.
+        """
+        if wal_file.parent != self.wal_dir:
+            return
+        with self._lock:
+            if self._tail.advance(wal_file.name, offset, length):
+                self._locations.setdefault(target, []).append((wal_file.name, offset, length))
+
+    def locations(self, target: str) -> List[WalLocation]:
+        with self._lock:
+            self._refresh()
+            return list(self._locations.get(target, []))
+
+    def read(self, targets: Iterable[str]) -> Dict[str, List[DatagramRecord]]:
+        """Reads the records of several targets, opening each journal once."""
+        wanted = list(dict.fromkeys(targets))
+        with self._lock:
+            self._refresh()
+            by_file: Dict[str, List[Tuple[int, int, str]]] = {}
+            for target in wanted:
+                for name, offset, length in self._locations.get(target, []):
+                    by_file.setdefault(name, []).append((offset, length, target))
+
+        results: Dict[str, List[DatagramRecord]] = {t: [] for t in wanted}
+        for name in sorted(by_file):
+            wal_file = self.wal_dir / name
+            try:
+                with open(wal_file, "rb") as f:
+                    for offset, length, target in sorted(by_file[name]):
+                        f.seek(offset)
+                        raw = f.read(length)
+                        try:
+                            record = DatagramRecord.from_usv(raw.decode("utf-8", errors="replace"))
+                        except Exception as e:
+                            logger.warning(f"Skipping malformed WAL record in {name}@{offset}: {e}")
+                            continue
+                        if record.target == target:
+                            results[target].append(record)
+            except OSError as e:
+                logger.error(f"Error reading WAL file {wal_file}: {e}")
+
+        # Sort by timestamp (naive 'latest wins' for now)
+        for records in results.values():
+            records.sort(key=lambda x: x.timestamp)
+        return results
+
+
+_indexes: Dict[Path, WalIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_wal_index(wal_dir: Path) -> WalIndex:
+    """Returns the process-wide index for a WAL directory."""
+    with _indexes_lock:
+        index = _indexes.get(wal_dir)
+        if index is None:
+            index = _indexes[wal_dir] = WalIndex(wal_dir)
+        return index
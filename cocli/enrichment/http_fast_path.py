@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import re
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import urljoin, urlparse
+
+import aiohttp
+from selectolax.lexbor import LexborHTMLParser
+
+from ..utils.headers import ANTI_BOT_HEADERS, USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+# Below this much visible body text a page that ships scripts is assumed to render client-side
+MIN_STATIC_TEXT_CHARS = 200
+
+SPA_ROOT_SELECTORS = "#root, #app, #__next, #__nuxt, #___gatsby, [ng-app], [ng-version], [data-reactroot]"
+CHALLENGE_MARKERS = ("cf-browser-verification", "challenge-platform", "cf_chl_opt", "/_incapsula_resource")
+NOSCRIPT_GATE = re.compile(r"(enable|requires?|turn on)\s+javascript|javascript\s+(is\s+)?(required|disabled)", re.I)
+
+
+def detect_js_rendering(html: str) -> Optional[str]:
+    """
+    Returns why `html` needs a real browser to render, or None when the
+    static markup already carries the page's content.
+    """
+    lowered = html[:20000].lower()
+    if any(marker in lowered for marker in CHALLENGE_MARKERS) or "<title>just a moment" in lowered:
+        return "bot_challenge"
+
+    parser = LexborHTMLParser(html)
+    if parser.body is None:
+        return "no_body"
+
+    scripts = len(parser.css("script"))
+    noscript_text = " ".join(node.text() for node in parser.css("noscript"))
+    has_spa_root = parser.css_first(SPA_ROOT_SELECTORS) is not None
+    parser.strip_tags(["script", "style", "noscript", "template", "svg"])
+    text_chars = len(parser.body.text(separator=" ", strip=True))
+
+    if text_chars >= MIN_STATIC_TEXT_CHARS:
+        return None
+    if has_spa_root:
+        return "spa_shell"
+    if NOSCRIPT_GATE.search(noscript_text):
+        return "noscript_gate"
+    if scripts:
+        return "thin_content"
+    return None
+
+
+@dataclass
+class FetchedPage:
+    url: str
+    status: int
+    content_type: str
+    body: bytes
+    encoding: str = "utf-8"
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    @property
+    def is_html(self) -> bool:
+        return not self.content_type or "html" in self.content_type
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding, errors="replace")
+
+
+@dataclass
+class FastPathStats:
+    domains: int = 0
+    served: int = 0
+    fallbacks: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def fast_path_rate(self) -> float:
+        return self.served / self.domains if self.domains else 0.0
+
+    def fallback(self, reason: str) -> None:
+        self.fallbacks[reason] = self.fallbacks.get(reason, 0) + 1
+
+    def summary(self) -> str:
+        fallbacks = ", ".join(f"{reason}={count}" for reason, count in sorted(self.fallbacks.items())) or "none"
+        return (
+            f"{self.served}/{self.domains} domains served over HTTP ({self.fast_path_rate:.0%}); "
+            f"browser fallbacks: {fallbacks}"
+        )
+
+
+class HttpFetcher:
+    """
+    Shared aiohttp session for browserless enrichment. One connection pool
+    serves every domain while `per_host` caps concurrent requests to any one
+    site, and bodies are cut off at `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        per_host: int = 4,
+        timeout_seconds: float = 15.0,
+        max_bytes: int = 2_000_000,
+        verify_ssl: bool = False,
+    ):
+        self.max_connections = max_connections
+        self.per_host = max(1, per_host)
+        self.timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+        self.max_bytes = max_bytes
+        self.verify_ssl = verify_ssl
+        self.stats = FastPathStats()
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._host_users: Dict[str, int] = {}
+
+    async def __aenter__(self) -> "HttpFetcher":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections, limit_per_host=self.per_host, ssl=self.verify_ssl
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers={**ANTI_BOT_HEADERS, "User-Agent": USER_AGENT},
+            )
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            if self.stats.domains:
+                logger.info(f"HTTP fast path: {self.stats.summary()}")
+
+    @asynccontextmanager
+    async def _host_slot(self, host: str) -> AsyncIterator[None]:
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self.per_host)
+        self._host_users[host] = self._host_users.get(host, 0) + 1
+        try:
+            async with limit:
+                yield
+        finally:
+            self._host_users[host] -= 1
+            if not self._host_users[host]:
+                del self._host_users[host]
+                del self._host_limits[host]
+
+    async def fetch(self, url: str) -> Optional[FetchedPage]:
+        """GETs `url`, following redirects. Returns None on network errors."""
+        await self.start()
+        assert self._session is not None
+        host = (urlparse(url).hostname or url).lower()
+        try:
+            async with self._host_slot(host):
+                async with self._session.get(url, allow_redirects=True) as response:
+                    chunks: List[bytes] = []
+                    size = 0
+                    async for chunk in response.content.iter_chunked(65536):
+                        chunks.append(chunk)
+                        size += len(chunk)
+                        if size >= self.max_bytes:
+                            break
+                    try:
+                        encoding = response.get_encoding()
+                    except RuntimeError:
+                        encoding = "utf-8"
+                    return FetchedPage(
+                        url=str(response.url),
+                        status=response.status,
+                        content_type=response.content_type or "",
+                        body=b"".join(chunks),
+                        encoding=encoding,
+                    )
+        except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeError, ValueError) as e:
+            logger.debug(f"HTTP fetch failed for {url}: {e}")
+            return None
+
+
+class StaticPage:
+    """
+    The slice of Playwright's Page the WebsiteScraper extractors use, backed by
+    fetched markup so they run unchanged on the HTTP fast path.
+    """
+
+    def __init__(self, fetcher: HttpFetcher, fetched: Optional[FetchedPage] = None):
+        self.fetcher = fetcher
+        self.url = fetched.url if fetched else "about:blank"
+        self.html = fetched.text if fetched else ""
+        self._closed = False
+
+    async def goto(self, url: str, **kwargs: Any) -> FetchedPage:
+        fetched = await self.fetcher.fetch(url)
+        if fetched is None or not fetched.ok or not fetched.is_html:
+            status = fetched.status if fetched else "No Response"
+            raise RuntimeError(f"HTTP fetch of {url} failed with status {status}")
+        self.url = fetched.url
+        self.html = fetched.text
+        return fetched
+
+    async def content(self) -> str:
+        return self.html
+
+    def find_link(self, link_texts: List[str]) -> Optional[str]:
+        """First anchor whose text matches any of `link_texts` (case-insensitive), as an absolute URL."""
+        pattern = re.compile("|".join(re.escape(t) for t in link_texts), re.I)
+        for anchor in LexborHTMLParser(self.html).css("a[href]"):
+            href = anchor.attributes.get("href")
+            if href and pattern.search(anchor.text(strip=True)):
+                return urljoin(self.url, href)
+        return None
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    async def close(self) -> None:
+        self._closed = True
+
+
+class HttpBrowsingContext:
+    """Stands in for a BrowserContext on the fast path; its pages fetch over HTTP."""
+
+    def __init__(self, fetcher: HttpFetcher):
+        self.fetcher = fetcher
+
+    async def new_page(self) -> StaticPage:
+        return StaticPage(self.fetcher)
@@ -0,0 +1,187 @@
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+import string
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set
+
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+EMAIL_PATTERN = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+EMAIL_RE = re.compile(f"({EMAIL_PATTERN})")
+BOUNDED_EMAIL_RE = re.compile(rf"\b{EMAIL_PATTERN}\b")
+EMAIL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-@")
+MAILTO_RE = re.compile(rf"mailto:({EMAIL_PATTERN})", re.I)
+# "Sales: sales@..." -> "Sales"
+EMAIL_LABEL_RE = re.compile(r"([a-zA-Z]{3,20}(?:\s+[a-zA-Z]{3,20})?)\s*[:\-]\s*$")
+PHONE_RE = re.compile(r"\b(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})\b")
+# "Owner: jane@..." on contact pages
+LABELED_EMAIL_RE = re.compile(rf"(\w+\s*:\s*{EMAIL_PATTERN})")
+# Staff pages sometimes write "jane @ acme.com"
+SPACED_EMAIL_RE = re.compile(r"\b[a-zA-Z0-9._%+-]+ ?@ ?[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b")
+LINKEDIN_PROFILE_RE = re.compile(r"linkedin\.com/in/", re.I)
+ABOUT_RE = re.compile("about", re.I)
+
+SOCIAL_PLATFORMS = ("facebook", "linkedin", "instagram", "twitter", "youtube")
+SOCIAL_RE = {platform: re.compile(f"{platform}\\.com", re.I) for platform in SOCIAL_PLATFORMS}
+
+# Markup substring -> technology
+TECH_SIGNATURES = {
+    "wp-content": "WordPress",
+    "shopify": "Shopify",
+    "wix.com": "Wix",
+    "squarespace": "Squarespace",
+    "wsimg.com": "GoDaddy Website Builder",
+}
+
+# Not part of the visible text
+NON_TEXT_TAGS = ["script", "style", "template"]
+
+
+class KeywordMatcher:
+    """
+    Reports which of a fixed set of keywords occur in a text. The text is
+    lowercased once and each keyword is a C-level substring search, which in
+    CPython beats both a regex alternation and a pure-Python Aho-Corasick
+    automaton over the same text.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: FrozenSet[str] = frozenset(k.lower() for k in keywords if k)
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def find(self, text: str) -> Set[str]:
+        """The lowercased keywords occurring in `text`."""
+        if not self.keywords:
+            return set()
+        lowered = text.lower()
+        return {k for k in self.keywords if k in lowered}
+
+
+TECH_MATCHER = KeywordMatcher(TECH_SIGNATURES)
+
+
+@lru_cache(maxsize=32)
+def keyword_matcher(keywords: Sequence[str]) -> KeywordMatcher:
+    """Matchers are reused across pages of a campaign."""
+    return KeywordMatcher(keywords)
+
+
+@dataclass
+class PageAnalysis:
+    """Everything extracted from one parse of a page."""
+    parser: LexborHTMLParser
+    # Visible text, text nodes joined by spaces
+    text: str
+    emails: Dict[str, str] = field(default_factory=dict)  # email -> label
+    tech: List[str] = field(default_factory=list)
+    keywords: List[str] = field(default_factory=list)
+    social_links: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def title(self) -> Optional[str]:
+        node = self.parser.css_first("title")
+        return node.text() if node is not None else None
+
+
+def detect_tech(html: str, parser: Optional[LexborHTMLParser] = None) -> List[str]:
+    parser = parser or LexborHTMLParser(html)
+    tech = {TECH_SIGNATURES[signature] for signature in TECH_MATCHER.find(html)}
+    generator = parser.css_first('meta[name="generator"]')
+    if generator is not None and (content := generator.attributes.get("content")):
+        tech.add(content.strip())
+    return sorted(tech)
+
+
+def find_emails(text: str) -> List[str]:
+    """
+    `BOUNDED_EMAIL_RE.findall(text)`, but the pattern only runs over the
+    stretch of email characters around each "@" instead of from every
+    position of the text.
+    """
+    found: List[str] = []
+    at = text.find("@")
+    while at != -1:
+        start = at
+        while start and text[start - 1] in EMAIL_CHARS:
+            start -= 1
+        stop = at + 1
+        while stop < len(text) and text[stop] in EMAIL_CHARS:
+            stop += 1
+        # One character past the run so the closing \b sees what follows it
+        found.extend(BOUNDED_EMAIL_RE.findall(text, start, stop + 1))
+        at = text.find("@", stop)
+    return found
+
+
+def single_string(node: Optional[LexborNode]) -> Optional[str]:
+    """BeautifulSoup's `.string`: the text of a node with exactly one descendant string."""
+    while node is not None:
+        child = node.child
+        if child is None or child.next is not None:
+            return None
+        if child.tag == "-text":
+            return child.text_content
+        node = child
+    return None
+
+
+def analyze_page(
+    html: str, keywords: Sequence[str] = (), parser: Optional[LexborHTMLParser] = None
+) -> PageAnalysis:
+    """
+    Parses `html` once and extracts emails with their labels, technology
+    signatures, campaign keywords and social profile links. Script, style and
+    template elements are stripped from `parser` along the way.
+    """
+    parser = parser or LexborHTMLParser(html)
+    tech = detect_tech(html, parser)
+
+    emails: Dict[str, str] = {}
+    social_links: Dict[str, str] = {}
+    for anchor in parser.css("a[href]"):
+        href = anchor.attributes.get("href") or ""
+        if href[:7].lower() == "mailto:":
+            m = MAILTO_RE.search(href)
+            if m:
+                email = m.group(1).lower()
+                label = anchor.text(strip=True)
+                if label and email not in label.lower() and len(label) < 60:
+                    emails[email] = label
+                elif email not in emails:
+                    emails[email] = ""
+        for platform, pattern in SOCIAL_RE.items():
+            if platform not in social_links and pattern.search(href):
+                social_links[platform] = href
+
+    parser.strip_tags(NON_TEXT_TAGS)
+    text = parser.root.text(separator=" ") if parser.root is not None else ""
+
+    for match in EMAIL_RE.finditer(text):
+        email = match.group(1).lower()
+        if not emails.get(email):
+            prefix = text[max(0, match.start() - 40) : match.start()].strip()
+            label_match = EMAIL_LABEL_RE.search(prefix)
+            if label_match:
+                emails[email] = label_match.group(1).strip()
+            elif email not in emails:
+                emails[email] = ""
+
+    # Emails only present in attributes or scripts
+    for email in find_emails(html):
+        emails.setdefault(email.lower(), "")
+
+    found_keywords: List[str] = []
+    if keywords:
+        found = keyword_matcher(tuple(keywords)).find(" ".join(text.split()))
+        found_keywords = [k for k in keywords if k.lower() in found]
+
+    return PageAnalysis(
+        parser=parser,
+        text=text,
+        emails=emails,
+        tech=tech,
+        keywords=found_keywords,
+        social_links=social_links,
+    )
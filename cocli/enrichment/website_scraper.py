@@ -1,4 +1,3 @@
-import re
 import httpx
 import asyncio
 import socket
@@ -7,6 +6,7 @@ import xml.etree.ElementTree as ET
 from typing import Optional, List, Callable, Coroutine, Any, Dict, Union, Tuple
 from playwright.async_api import Page, Browser, BrowserContext
 from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import logging
 from urllib.parse import urljoin
 from datetime import datetime, timedelta, UTC
@@ -25,19 +25,38 @@ from ..core.email_index_manager import EmailIndexManager
 from ..models.campaigns.indexes.email import EmailEntry
 from ..models.email_address import EmailAddress
 from ..utils.playwright_utils import setup_stealth_context
+from ..utils.browser_manager import BrowserContextPool
 from ..models.campaigns.raw_witness import RawWebsiteWitness
 from ..core.text_utils import is_valid_email
 from ..utils.headers import ANTI_BOT_HEADERS, USER_AGENT
+from .http_fast_path import HttpBrowsingContext, HttpFetcher, StaticPage, detect_js_rendering
+from .page_analyzer import (
+    ABOUT_RE,
+    LABELED_EMAIL_RE,
+    LINKEDIN_PROFILE_RE,
+    PHONE_RE,
+    SPACED_EMAIL_RE,
+    PageAnalysis,
+    analyze_page,
+    detect_tech,
+    single_string,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Extractors run on Playwright pages and, on the HTTP fast path, on fetched markup
+AnyPage = Union[Page, StaticPage]
+AnyContext = Union[BrowserContext, HttpBrowsingContext]
+
 
 class WebsiteScraper:
-    def __init__(self, processed_by: Optional[str] = None) -> None:
+    def __init__(self, processed_by: Optional[str] = None, http_fetcher: Optional[HttpFetcher] = None) -> None:
         self.headers = ANTI_BOT_HEADERS
         self.user_agent = USER_AGENT
         self.processed_by = processed_by or socket.gethostname().split(".")[0]
+        # When set, static sites are scraped over HTTP and only JS-rendered ones open a browser
+        self.http_fetcher = http_fetcher
 
     def _index_emails(self, website_data: Website, campaign_name: str) -> None:
         """Helper to record all found emails in the centralized email index."""
@@ -107,7 +126,7 @@ class WebsiteScraper:
 
     async def run(
         self,
-        browser: Union[Browser, BrowserContext],
+        browser: Union[Browser, BrowserContext, BrowserContextPool],
         domain: str,
         company_slug: Optional[str] = None,
         force_refresh: bool = False,
@@ -248,7 +267,7 @@ class WebsiteScraper:
 
     async def scrape_website_internal(
         self,
-        browser: Union[Browser, BrowserContext],
+        browser: Union[Browser, BrowserContext, BrowserContextPool],
         domain: str,
         website_data: Website,
         force_refresh: bool = False,
@@ -291,6 +310,11 @@ class WebsiteScraper:
         logger.info(f"Starting website scraping for {domain}")
         # website_data is already initialized by run()
 
+        if self.http_fetcher and await self._scrape_over_http(
+            self.http_fetcher, domain, website_data, debug, campaign, navigation_timeout_ms, company_slug
+        ):
+            return website_data
+
         # --- High Speed Head Extraction ---
         try:
             from ..scrapers.head_scraper import HeadScraper
@@ -302,15 +326,19 @@ class WebsiteScraper:
                     website_data.title = head_title
                 
                 # Pre-detect tech from head
-                head_soup = BeautifulSoup(head_html, "html.parser")
-                detected = self._detect_tech(head_soup)
-                for t in detected:
+                for t in detect_tech(head_html):
                     if t not in website_data.tech_stack:
                         website_data.tech_stack.append(t)
         except Exception as e:
             logger.debug(f"Pre-scrape head extraction failed: {e}")
         # ----------------------------------
 
+        if isinstance(browser, BrowserContextPool):
+            async with browser.context() as pooled_context:
+                return await self._scrape_with_context(
+                    pooled_context, domain, website_data, debug, campaign, navigation_timeout_ms, company_slug
+                )
+
         context: BrowserContext
         if isinstance(browser, Browser):
             context = await browser.new_context(
@@ -322,6 +350,24 @@ class WebsiteScraper:
         else:
             context = browser
 
+        try:
+            return await self._scrape_with_context(
+                context, domain, website_data, debug, campaign, navigation_timeout_ms, company_slug
+            )
+        finally:
+            if isinstance(browser, Browser):
+                await context.close()
+
+    async def _scrape_with_context(
+        self,
+        context: BrowserContext,
+        domain: str,
+        website_data: Website,
+        debug: bool,
+        campaign: Optional[Campaign],
+        navigation_timeout_ms: int,
+        company_slug: Optional[str],
+    ) -> Website:
         page = await context.new_page()
         try:
             canonical_url = await self._resolve_canonical_url(domain)
@@ -345,180 +391,278 @@ class WebsiteScraper:
 
             await self._scrape_page(page, website_data, context, target_keywords)
 
-            # --- Capture Raw Witness ---
-            try:
-                html_content = await page.content()
-                witness = RawWebsiteWitness(
-                    domain=domain,
-                    company_slug=company_slug or "unknown",
-                    processed_by=self.processed_by,
-                    campaign_name=campaign.name if campaign else "default",
-                    url=page.url,
-                    html=html_content,
-                    metadata={
-                        "user_agent": self.user_agent,
-                        "headers": self.headers,
-                        "navigation_timeout": navigation_timeout_ms,
-                        "viewport": str(page.viewport_size),
-                        "captured_at": datetime.now(UTC).isoformat()
-                    }
-                )
-                # Sync to S3 if campaign has AWS config
-                s3_client = None
-                bucket = os.getenv("COCLI_S3_BUCKET_NAME")
-                if campaign and campaign.aws:
-                    from ..core.reporting import get_boto3_session
-                    try:
-                        session = get_boto3_session(campaign.model_dump())
-                        s3_client = session.client("s3")
-                        if not bucket:
-                             bucket = campaign.model_dump().get("aws", {}).get("data_bucket_name") or f"cocli-data-{campaign.name}"
-                    except Exception:
-                        pass
-                
-                witness.save(s3_client=s3_client, bucket_name=bucket)
-                logger.info(f"Saved Raw Witness for {domain}")
-            except Exception as witness_err:
-                logger.debug(f"Failed to capture raw witness for {domain}: {witness_err}")
-            # ---------------------------
-
-            if not (website_data.email and not target_keywords):
-                sitemap_pages, sitemap_xml = await self._get_sitemap_urls(
-                    f"http://{domain}"
-                )
-                website_data.sitemap_xml = sitemap_xml
-                if sitemap_pages:
-                    # 1. Identify high-priority URLs
-                    page_map = {
-                        "About Us": ["about"],
-                        "Contact Us": ["contact"],
-                        "Services": ["service"],
-                        "Products": ["product"],
-                    }
-                    
-                    urls_to_scrape: Dict[str, Tuple[str, Callable[..., Coroutine[Any, Any, Website]]]] = {} # url -> (type, func)
-                    
-                    # Search for standard pages
-                    for page_type, keywords in page_map.items():
-                        for keyword in keywords:
-                            for url in sitemap_pages:
-                                if url not in urls_to_scrape and keyword in url.lower():
-                                    scrape_func: Callable[..., Coroutine[Any, Any, Website]] = self._scrape_page
-                                    if page_type == "Contact Us":
-                                        scrape_func = self._scrape_contact_page
-                                    elif page_type == "Services":
-                                        scrape_func = self._scrape_services_page
-                                    elif page_type == "Products":
-                                        scrape_func = self._scrape_products_page
-                                    
-                                    urls_to_scrape[url] = (page_type, scrape_func)
-                                    break # Found one for this type
-
-                    # Search for keyword-specific pages
-                    if target_keywords:
-                        for url in sitemap_pages:
-                            if len(urls_to_scrape) >= 10:
-                                break
-                            if url not in urls_to_scrape and any(k.lower() in url.lower() for k in target_keywords):
-                                urls_to_scrape[url] = ("Keyword Search", self._scrape_page)
-
-                    # Fill remaining slots with generic pages if we haven't hit 10
-                    if len(urls_to_scrape) < 10:
-                        for url in sitemap_pages:
-                            if len(urls_to_scrape) >= 10:
-                                break
-                            if url not in urls_to_scrape:
-                                urls_to_scrape[url] = ("Generic", self._scrape_page)
-
-                    # 2. Execute scraping with concurrency limit
-                    semaphore = asyncio.Semaphore(3)
-
-                    async def sem_scrape(url: str, p_type: str, s_func: Callable[..., Coroutine[Any, Any, Website]]) -> None:
-                        async with semaphore:
-                            page = None
-                            try:
-                                page = await context.new_page()
-                                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                                await s_func(page, website_data, context, target_keywords)
-                            except Exception:
-                                pass
-                            finally:
-                                if page:
-                                    await page.close()
-
-                    scrape_tasks = [
-                        sem_scrape(url, p_type, s_func) 
-                        for url, (p_type, s_func) in urls_to_scrape.items()
-                    ]
-                    
-                    if scrape_tasks:
-                        await asyncio.gather(*scrape_tasks)
-
-                if not website_data.about_us_url:
-                    await self._navigate_and_scrape(
-                        page,
-                        website_data,
-                        ["About", "About Us", "Our Story", "Company"],
-                        "About Us",
-                        self._scrape_page,
-                        context,
-                        debug,
-                        navigation_timeout_ms,
-                        target_keywords,
-                    )
-                if not website_data.contact_url:
-                    await self._navigate_and_scrape(
-                        page,
-                        website_data,
-                        [
-                            "Contact",
-                            "Contacts",
-                            "Contact Us",
-                            "Get in Touch",
-                            "Reach Us",
-                        ],
-                        "Contact Us",
-                        self._scrape_contact_page,
-                        context,
-                        debug,
-                        navigation_timeout_ms,
-                        target_keywords,
-                    )
-                if not website_data.services:
-                    await self._navigate_and_scrape(
-                        page,
-                        website_data,
-                        ["Services"],
-                        "Services",
-                        self._scrape_services_page,
-                        context,
-                        debug,
-                        navigation_timeout_ms,
-                        target_keywords,
-                    )
-                if not website_data.products:
-                    await self._navigate_and_scrape(
-                        page,
-                        website_data,
-                        ["Products"],
-                        "Products",
-                        self._scrape_products_page,
-                        context,
-                        debug,
-                        navigation_timeout_ms,
-                        target_keywords,
-                    )
+            self._save_witness(
+                domain,
+                company_slug,
+                campaign,
+                page.url,
+                await page.content(),
+                {
+                    "user_agent": self.user_agent,
+                    "headers": self.headers,
+                    "navigation_timeout": navigation_timeout_ms,
+                    "viewport": str(page.viewport_size),
+                },
+            )
+
+            await self._scrape_linked_pages(
+                page, context, domain, website_data, debug, navigation_timeout_ms, target_keywords
+            )
 
         except Exception as e:
             logger.error(f"Error scraping {domain}: {e}")
             raise EnrichmentError(str(e)) from e
         finally:
             await page.close()
-            if isinstance(browser, Browser):
-                await context.close()
 
         return website_data
 
+    async def _scrape_over_http(
+        self,
+        fetcher: HttpFetcher,
+        domain: str,
+        website_data: Website,
+        debug: bool,
+        campaign: Optional[Campaign],
+        navigation_timeout_ms: int,
+        company_slug: Optional[str],
+    ) -> bool:
+        """
+        Scrapes `domain` without a browser. Returns False, leaving `website_data`
+        untouched, when the homepage can't be fetched or needs JS to render.
+        """
+        fetcher.stats.domains += 1
+        homepage = None
+        for protocol in ["http://", "https://"]:
+            homepage = await fetcher.fetch(f"{protocol}{domain}")
+            if homepage is not None and homepage.ok:
+                break
+        if homepage is None or not homepage.ok:
+            fetcher.stats.fallback("fetch_failed")
+            return False
+        if not homepage.is_html:
+            fetcher.stats.fallback("not_html")
+            return False
+        html = homepage.text
+        reason = detect_js_rendering(html)
+        if reason:
+            logger.info(f"{domain} needs a browser ({reason})")
+            fetcher.stats.fallback(reason)
+            return False
+
+        fetcher.stats.served += 1
+        logger.info(f"Scraping {domain} over HTTP")
+        website_data.url = homepage.url
+        target_keywords: List[str] = []
+        if campaign:
+            target_keywords = campaign.prospecting.queries + campaign.prospecting.keywords
+
+        # The head is read before the analysis strips scripts from the shared parse
+        parser = LexborHTMLParser(html)
+        if parser.head is not None:
+            website_data.head_html = parser.head.html
+            title_node = parser.css_first("title")
+            if title_node is not None and not website_data.title:
+                website_data.title = title_node.text().strip()
+        analysis = analyze_page(html, target_keywords, parser)
+
+        page = StaticPage(fetcher, homepage)
+        context = HttpBrowsingContext(fetcher)
+        try:
+            await self._scrape_page(page, website_data, context, target_keywords, analysis)
+            self._save_witness(
+                domain,
+                company_slug,
+                campaign,
+                page.url,
+                html,
+                {"user_agent": self.user_agent, "headers": self.headers, "fetched_via": "http"},
+            )
+            await self._scrape_linked_pages(
+                page, context, domain, website_data, debug, navigation_timeout_ms, target_keywords
+            )
+        except Exception as e:
+            logger.error(f"Error scraping {domain} over HTTP: {e}")
+            raise EnrichmentError(str(e)) from e
+        return True
+
+    def _save_witness(
+        self,
+        domain: str,
+        company_slug: Optional[str],
+        campaign: Optional[Campaign],
+        url: str,
+        html_content: str,
+        metadata: Dict[str, Any],
+    ) -> None:
+        """Captures the homepage HTML as a RawWebsiteWitness."""
+        try:
+            witness = RawWebsiteWitness(
+                domain=domain,
+                company_slug=company_slug or "unknown",
+                processed_by=self.processed_by,
+                campaign_name=campaign.name if campaign else "default",
+                url=url,
+                html=html_content,
+                metadata={**metadata, "captured_at": datetime.now(UTC).isoformat()},
+            )
+            # Sync to S3 if campaign has AWS config
+            s3_client = None
+            bucket = os.getenv("COCLI_S3_BUCKET_NAME")
+            if campaign and campaign.aws:
+                from ..core.reporting import get_boto3_session
+                try:
+                    session = get_boto3_session(campaign.model_dump())
+                    s3_client = session.client("s3")
+                    if not bucket:
+                         bucket = campaign.model_dump().get("aws", {}).get("data_bucket_name") or f"cocli-data-{campaign.name}"
+                except Exception:
+                    pass
+
+            witness.save(s3_client=s3_client, bucket_name=bucket)
+            logger.info(f"Saved Raw Witness for {domain}")
+        except Exception as witness_err:
+            logger.debug(f"Failed to capture raw witness for {domain}: {witness_err}")
+
+    async def _scrape_linked_pages(
+        self,
+        page: AnyPage,
+        context: AnyContext,
+        domain: str,
+        website_data: Website,
+        debug: bool,
+        navigation_timeout_ms: int,
+        target_keywords: List[str],
+    ) -> None:
+        """Follows the sitemap and the about/contact/services/products links from the homepage."""
+        if website_data.email and not target_keywords:
+            return
+
+        fetcher = context.fetcher if isinstance(context, HttpBrowsingContext) else None
+        sitemap_pages, sitemap_xml = await self._get_sitemap_urls(f"http://{domain}", fetcher)
+        website_data.sitemap_xml = sitemap_xml
+        if sitemap_pages:
+            # 1. Identify high-priority URLs
+            page_map = {
+                "About Us": ["about"],
+                "Contact Us": ["contact"],
+                "Services": ["service"],
+                "Products": ["product"],
+            }
+
+            urls_to_scrape: Dict[str, Tuple[str, Callable[..., Coroutine[Any, Any, Website]]]] = {} # url -> (type, func)
+
+            # Search for standard pages
+            for page_type, keywords in page_map.items():
+                for keyword in keywords:
+                    for url in sitemap_pages:
+                        if url not in urls_to_scrape and keyword in url.lower():
+                            scrape_func: Callable[..., Coroutine[Any, Any, Website]] = self._scrape_page
+                            if page_type == "Contact Us":
+                                scrape_func = self._scrape_contact_page
+                            elif page_type == "Services":
+                                scrape_func = self._scrape_services_page
+                            elif page_type == "Products":
+                                scrape_func = self._scrape_products_page
+
+                            urls_to_scrape[url] = (page_type, scrape_func)
+                            break # Found one for this type
+
+            # Search for keyword-specific pages
+            if target_keywords:
+                for url in sitemap_pages:
+                    if len(urls_to_scrape) >= 10:
+                        break
+                    if url not in urls_to_scrape and any(k.lower() in url.lower() for k in target_keywords):
+                        urls_to_scrape[url] = ("Keyword Search", self._scrape_page)
+
+            # Fill remaining slots with generic pages if we haven't hit 10
+            if len(urls_to_scrape) < 10:
+                for url in sitemap_pages:
+                    if len(urls_to_scrape) >= 10:
+                        break
+                    if url not in urls_to_scrape:
+                        urls_to_scrape[url] = ("Generic", self._scrape_page)
+
+            # 2. Execute scraping with concurrency limit (the fetcher caps requests per host)
+            semaphore = asyncio.Semaphore(max(1, len(urls_to_scrape)) if fetcher else 3)
+
+            async def sem_scrape(url: str, p_type: str, s_func: Callable[..., Coroutine[Any, Any, Website]]) -> None:
+                async with semaphore:
+                    sub_page: Optional[AnyPage] = None
+                    try:
+                        sub_page = await context.new_page()
+                        await sub_page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                        await s_func(sub_page, website_data, context, target_keywords)
+                    except Exception:
+                        pass
+                    finally:
+                        if sub_page:
+                            await sub_page.close()
+
+            scrape_tasks = [
+                sem_scrape(url, p_type, s_func)
+                for url, (p_type, s_func) in urls_to_scrape.items()
+            ]
+
+            if scrape_tasks:
+                await asyncio.gather(*scrape_tasks)
+
+        if not website_data.about_us_url:
+            await self._navigate_and_scrape(
+                page,
+                website_data,
+                ["About", "About Us", "Our Story", "Company"],
+                "About Us",
+                self._scrape_page,
+                context,
+                debug,
+                navigation_timeout_ms,
+                target_keywords,
+            )
+        if not website_data.contact_url:
+            await self._navigate_and_scrape(
+                page,
+                website_data,
+                [
+                    "Contact",
+                    "Contacts",
+                    "Contact Us",
+                    "Get in Touch",
+                    "Reach Us",
+                ],
+                "Contact Us",
+                self._scrape_contact_page,
+                context,
+                debug,
+                navigation_timeout_ms,
+                target_keywords,
+            )
+        if not website_data.services:
+            await self._navigate_and_scrape(
+                page,
+                website_data,
+                ["Services"],
+                "Services",
+                self._scrape_services_page,
+                context,
+                debug,
+                navigation_timeout_ms,
+                target_keywords,
+            )
+        if not website_data.products:
+            await self._navigate_and_scrape(
+                page,
+                website_data,
+                ["Products"],
+                "Products",
+                self._scrape_products_page,
+                context,
+                debug,
+                navigation_timeout_ms,
+                target_keywords,
+            )
+
     async def _scrape_sitemap_page(
         self,
         url: str,
@@ -537,27 +681,38 @@ class WebsiteScraper:
         except Exception:
             pass
 
-    async def _get_sitemap_urls(self, domain: str) -> Tuple[List[str], Optional[str]]:
+    async def _get_sitemap_urls(
+        self, domain: str, fetcher: Optional[HttpFetcher] = None
+    ) -> Tuple[List[str], Optional[str]]:
         all_urls = set()
         raw_xml = None
         async with httpx.AsyncClient(
             follow_redirects=True,
             headers={**self.headers, "User-Agent": self.user_agent}
         ) as client:
+
+            async def get(url: str) -> Optional[bytes]:
+                # Over the shared fetcher on the HTTP fast path
+                if fetcher:
+                    fetched = await fetcher.fetch(url)
+                    return fetched.body if fetched and fetched.status == 200 else None
+                resp = await client.get(url, timeout=5)
+                return resp.content if resp.status_code == 200 else None
+
             for loc in ["/sitemap.xml", "/sitemap_index.xml", "/sitemap.desktop.xml"]:
                 try:
-                    resp = await client.get(urljoin(domain, loc), timeout=5)
-                    if resp.status_code == 200:
+                    content = await get(urljoin(domain, loc))
+                    if content is not None:
                         if not raw_xml:
-                            raw_xml = resp.text
-                        root = ET.fromstring(resp.content)
+                            raw_xml = content.decode("utf-8", errors="replace")
+                        root = ET.fromstring(content)
                         if "sitemapindex" in root.tag:
                             for sm in root.iter():
                                 if "loc" in sm.tag and sm.text:
                                     try:
-                                        sub_resp = await client.get(sm.text, timeout=5)
-                                        if sub_resp.status_code == 200:
-                                            sub_root = ET.fromstring(sub_resp.content)
+                                        sub_content = await get(sm.text)
+                                        if sub_content is not None:
+                                            sub_root = ET.fromstring(sub_content)
                                             for elem in sub_root.iter():
                                                 if "loc" in elem.tag and elem.text:
                                                     all_urls.add(elem.text)
@@ -573,62 +728,57 @@ class WebsiteScraper:
 
     async def _scrape_services_page(
         self,
-        page: Page,
+        page: AnyPage,
         website_data: Website,
-        browser: BrowserContext,
+        browser: AnyContext,
         target_keywords: List[str] = [],
     ) -> Website:
-        html = await page.content()
-        soup = BeautifulSoup(html, "html.parser")
-        if target_keywords:
-            self._search_keywords(soup, website_data, target_keywords)
-
-        found_services = [
-            el.get_text(strip=True)
-            for el in soup.select("li, h2, h3")
-            if 3 < len(el.get_text(strip=True)) < 100
-        ]
-        website_data.services = list(set(website_data.services + found_services))
+        analysis = analyze_page(await page.content(), target_keywords)
+        self._record_keywords(website_data, analysis.keywords)
+        website_data.services = list(set(website_data.services + self._list_items(analysis)))
         return website_data
 
     async def _scrape_products_page(
         self,
-        page: Page,
+        page: AnyPage,
         website_data: Website,
-        browser: BrowserContext,
+        browser: AnyContext,
         target_keywords: List[str] = [],
     ) -> Website:
-        html = await page.content()
-        soup = BeautifulSoup(html, "html.parser")
-        if target_keywords:
-            self._search_keywords(soup, website_data, target_keywords)
-
-        found_products = [
-            el.get_text(strip=True)
-            for el in soup.select("li, h2, h3")
-            if 3 < len(el.get_text(strip=True)) < 100
-        ]
-        website_data.products = list(set(website_data.products + found_products))
+        analysis = analyze_page(await page.content(), target_keywords)
+        self._record_keywords(website_data, analysis.keywords)
+        website_data.products = list(set(website_data.products + self._list_items(analysis)))
         return website_data
 
+    def _list_items(self, analysis: PageAnalysis) -> List[str]:
+        return [
+            text
+            for text in (el.text(strip=True) for el in analysis.parser.css("li, h2, h3"))
+            if 3 < len(text) < 100
+        ]
+
     async def _navigate_and_scrape(
         self,
-        page: Page,
+        page: AnyPage,
         website_data: Website,
         link_texts: List[str],
         page_type: str,
         scrape_func: Callable[..., Coroutine[Any, Any, Website]],
-        browser: BrowserContext,
+        browser: AnyContext,
         debug: bool,
         timeout: int,
         target_keywords: List[str] = [],
     ) -> Website:
-        link = page.locator(
-            ", ".join([f'a:text-matches("{t}", "i")' for t in link_texts])
-        ).first
         try:
-            await link.wait_for(state="attached", timeout=3000)
-            url = await link.get_attribute("href")
+            url: Optional[str]
+            if isinstance(page, StaticPage):
+                url = page.find_link(link_texts)
+            else:
+                link = page.locator(
+                    ", ".join([f'a:text-matches("{t}", "i")' for t in link_texts])
+                ).first
+                await link.wait_for(state="attached", timeout=3000)
+                url = await link.get_attribute("href")
             if url:
                 if any(
                     url.lower().endswith(ext)
@@ -655,33 +805,33 @@ class WebsiteScraper:
 
     async def _scrape_page(
         self,
-        page: Page,
+        page: AnyPage,
         website_data: Website,
-        browser: BrowserContext,
+        browser: AnyContext,
         target_keywords: List[str] = [],
+        analysis: Optional[PageAnalysis] = None,
     ) -> Website:
-        html = await page.content()
-        soup = BeautifulSoup(html, "html.parser")
-        if target_keywords:
-            self._search_keywords(soup, website_data, target_keywords)
+        if analysis is None:
+            analysis = analyze_page(await page.content(), target_keywords)
+        parser = analysis.parser
+        self._record_keywords(website_data, analysis.keywords)
 
         # 1. Detect technology
-        detected_tech = self._detect_tech(soup)
-        for t in detected_tech:
+        for t in analysis.tech:
             if t not in website_data.tech_stack:
                 website_data.tech_stack.append(t)
 
         # Populate title
-        if soup.title and soup.title.string:
-            website_data.title = soup.title.string.strip()
+        title = analysis.title
+        if title:
+            website_data.title = title.strip()
 
         if not website_data.navbar_html:
-            nav = soup.find("nav") or soup.select_one("[class*=nav], [id*=nav], header")
-            if nav:
-                website_data.navbar_html = str(nav)
+            nav = parser.css_first("nav") or parser.css_first("[class*=nav], [id*=nav], header")
+            if nav is not None:
+                website_data.navbar_html = nav.html
 
-        email_map = self._extract_all_emails(soup, html)
-        for e_str, label in email_map.items():
+        for e_str, label in analysis.emails.items():
             try:
                 addr = EmailAddress(e_str)
                 if addr not in website_data.all_emails:
@@ -697,23 +847,21 @@ class WebsiteScraper:
         # Extract Company Name
         if not website_data.company_name:
             company_name = None
-            if soup.title and soup.title.string:
-                company_name = soup.title.string.split("|")[0].split("-")[0].strip()
+            if title:
+                company_name = title.split("|")[0].split("-")[0].strip()
             if not company_name or len(company_name) < 3:
-                h1 = soup.find("h1")
-                if h1 and h1.string:
-                    company_name = h1.string.strip()
+                h1_string = single_string(parser.css_first("h1"))
+                if h1_string:
+                    company_name = h1_string.strip()
             if not company_name or len(company_name) < 3:
-                logo = soup.select_one("[class*=logo], [id*=logo]")
-                if logo and logo.text:
-                    company_name = logo.text.strip()
+                logo = parser.css_first("[class*=logo], [id*=logo]")
+                if logo is not None and logo.text():
+                    company_name = logo.text().strip()
             if company_name and len(company_name) > 2:
                 website_data.company_name = company_name
 
         if not website_data.phone:
-            match = re.search(
-                r"\b(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})\b", soup.get_text()
-            )
+            match = PHONE_RE.search(analysis.text)
             if match:
                 try:
                     from cocli.models.phone import PhoneNumber
@@ -722,55 +870,46 @@ class WebsiteScraper:
                 except Exception:
                     pass
 
-        for platform in ["facebook", "linkedin", "instagram", "twitter", "youtube"]:
+        for platform, url in analysis.social_links.items():
             if not getattr(website_data, f"{platform}_url"):
-                link = soup.find("a", href=re.compile(f"{platform}\\.com", re.I))
-                if link:
-                    setattr(website_data, f"{platform}_url", str(link["href"]))
+                setattr(website_data, f"{platform}_url", url)
 
         # Extract Description
         if page.url == website_data.about_us_url:
-            main_content = soup.select_one(
+            main_content = parser.css_first(
                 "main, article, #main, #content, .main, .content"
             )
-            if main_content:
-                for tag in main_content.select("nav, footer"):
+            if main_content is not None:
+                for tag in main_content.css("nav, footer"):
                     tag.decompose()
-                website_data.description = str(
-                    main_content.get_text(separator="\n", strip=True)
-                )
-            else:
-                if soup.body:
-                    for tag in soup.body.select("nav, footer, header"):
-                        tag.decompose()
-                    website_data.description = str(
-                        soup.body.get_text(separator="\n", strip=True)
-                    )
+                website_data.description = main_content.text(separator="\n", strip=True)
+            elif parser.body is not None:
+                for tag in parser.body.css("nav, footer, header"):
+                    tag.decompose()
+                website_data.description = parser.body.text(separator="\n", strip=True)
         elif not website_data.description:
-            about_section = soup.find(
-                id=re.compile("about", re.IGNORECASE)
-            ) or soup.find(class_=re.compile("about", re.IGNORECASE))
-            if about_section:
-                website_data.description = str(
-                    about_section.get_text(separator="\n", strip=True)
-                )
+            about_section = next(
+                (el for el in parser.css("[id]") if ABOUT_RE.search(el.attributes.get("id") or "")),
+                None,
+            ) or next(
+                (el for el in parser.css("[class]") if ABOUT_RE.search(el.attributes.get("class") or "")),
+                None,
+            )
+            if about_section is not None:
+                website_data.description = about_section.text(separator="\n", strip=True)
 
         return website_data
 
     async def _scrape_contact_page(
         self,
-        page: Page,
+        page: AnyPage,
         website_data: Website,
-        browser: BrowserContext,
+        browser: AnyContext,
         target_keywords: List[str] = [],
     ) -> Website:
-        await self._scrape_page(page, website_data, browser, target_keywords)
-        html = await page.content()
-        soup = BeautifulSoup(html, "html.parser")
-        for match in re.findall(
-            r"(\w+\s*:\s*[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
-            soup.get_text(),
-        ):
+        analysis = analyze_page(await page.content(), target_keywords)
+        await self._scrape_page(page, website_data, browser, target_keywords, analysis)
+        for match in LABELED_EMAIL_RE.findall(analysis.text):
             website_data.personnel.append({"email": match.replace(" ", "")})
 
         # Look for personnel links
@@ -780,11 +919,12 @@ class WebsiteScraper:
             ".team__member",
             ".staff__item",
         ]
-        personnel_elements = soup.select(", ".join(personnel_selectors))
+        personnel_elements = analysis.parser.css(", ".join(personnel_selectors))
         for element in personnel_elements:
-            link = element.find("a", href=True)
-            if link and link["href"]:
-                person_url = urljoin(str(page.url), str(link["href"]))
+            link = element.css_first("a[href]")
+            href = link.attributes.get("href") if link is not None else None
+            if href:
+                person_url = urljoin(str(page.url), href)
                 if person_url and person_url != page.url:
                     person_page = await browser.new_page()
                     try:
@@ -803,22 +943,20 @@ class WebsiteScraper:
         return website_data
 
     async def _scrape_personnel_details(
-        self, page: Page, website_data: Website
+        self, page: AnyPage, website_data: Website
     ) -> Optional[Dict[str, Any]]:
-        html = await page.content()
-        soup = BeautifulSoup(html, "html.parser")
+        analysis = analyze_page(await page.content())
+        parser = analysis.parser
         person_data: Dict[str, Any] = {}
-        name_element = soup.select_one("h1, .member__name, .person__name")
-        if name_element:
-            person_data["name"] = name_element.get_text(strip=True)
-        title_element = soup.select_one(
+        name_element = parser.css_first("h1, .member__name, .person__name")
+        if name_element is not None:
+            person_data["name"] = name_element.text(strip=True)
+        title_element = parser.css_first(
             ".member__position, .person__position, .person__title"
         )
-        if title_element:
-            person_data["title"] = title_element.get_text(strip=True)
-        email_match = re.search(
-            r"\b[a-zA-Z0-9._%+-]+ ?@ ?[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b", soup.get_text()
-        )
+        if title_element is not None:
+            person_data["title"] = title_element.text(strip=True)
+        email_match = SPACED_EMAIL_RE.search(analysis.text)
         if email_match:
             try:
                 person_data["email"] = EmailAddress(
@@ -826,86 +964,27 @@ class WebsiteScraper:
                 )
             except Exception:
                 pass
-        linkedin_link = soup.find("a", href=re.compile(r"linkedin\.com/in/", re.I))
-        if linkedin_link:
-            person_data["linkedin_url"] = str(linkedin_link["href"])
-        phone_match = re.search(
-            r"\b(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})\b", soup.get_text()
+        linkedin_link = next(
+            (a for a in parser.css("a[href]") if LINKEDIN_PROFILE_RE.search(a.attributes.get("href") or "")),
+            None,
         )
+        if linkedin_link is not None:
+            person_data["linkedin_url"] = linkedin_link.attributes.get("href")
+        phone_match = PHONE_RE.search(analysis.text)
         if phone_match:
             person_data["phone"] = str(phone_match.group(0))
         return person_data if person_data else None
 
-    def _search_keywords(
-        self, soup: BeautifulSoup, website_data: Website, target_keywords: List[str]
-    ) -> None:
-        text = soup.get_text(separator=" ", strip=True).lower()
-        for k in target_keywords:
-            if k.lower() in text and k not in website_data.found_keywords:
+    def _record_keywords(self, website_data: Website, keywords: List[str]) -> None:
+        for k in keywords:
+            if k not in website_data.found_keywords:
                 website_data.found_keywords.append(k)
                 logger.info(f"Found keyword '{k}' on {website_data.url}")
 
     def _extract_all_emails(
         self, soup: BeautifulSoup, html: str = ""
     ) -> Dict[str, str]:
-        email_to_label = {}
-        for link in soup.find_all("a", href=re.compile(r"^mailto:", re.I)):
-            href_attr = link.get("href")
-            if not href_attr or not isinstance(href_attr, str):
-                continue
-            m = re.search(
-                r"mailto:([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
-                href_attr,
-                re.I,
-            )
-            if m:
-                email = m.group(1).lower()
-                label = link.get_text(strip=True)
-                if label and email not in label.lower() and len(label) < 60:
-                    email_to_label[email] = label
-                elif email not in email_to_label:
-                    email_to_label[email] = ""
-
-        text_content = soup.get_text(separator=" ")
-        for match in re.finditer(
-            r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})", text_content
-        ):
-            email = match.group(1).lower()
-            if email not in email_to_label or not email_to_label[email]:
-                prefix = text_content[
-                    max(0, match.start() - 40) : match.start()
-                ].strip()
-                label_match = re.search(
-                    r"([a-zA-Z]{3,20}(?:\s+[a-zA-Z]{3,20})?)\s*[:\-]\s*$", prefix
-                )
-                if label_match:
-                    email_to_label[email] = label_match.group(1).strip()
-                elif email not in email_to_label:
-                    email_to_label[email] = ""
-
-        if html:
-            for email in re.findall(
-                r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b", html
-            ):
-                email = email.lower()
-                if email not in email_to_label:
-                    email_to_label[email] = ""
-        return email_to_label
+        return analyze_page(html or str(soup)).emails
 
     def _detect_tech(self, soup: BeautifulSoup) -> List[str]:
-        tech = set()
-        generator = soup.find("meta", attrs={"name": "generator"})
-        if generator and (content := generator.get("content")):
-            tech.add(str(content).strip())
-        html_str = str(soup).lower()
-        if "wp-content" in html_str:
-            tech.add("WordPress")
-        if "shopify" in html_str:
-            tech.add("Shopify")
-        if "wix.com" in html_str:
-            tech.add("Wix")
-        if "squarespace" in html_str:
-            tech.add("Squarespace")
-        if "wsimg.com" in html_str:
-            tech.add("GoDaddy Website Builder")
-        return sorted(list(tech))
+        return detect_tech(str(soup))
@@ -2,7 +2,6 @@
 import json
 import logging
 from enum import Enum
-from datetime import datetime
 from pathlib import Path
 from typing import (
     List,
@@ -12,6 +11,9 @@ from typing import (
     TypeVar,
     Optional,
     Tuple,
+    Iterable,
+    Iterator,
+    cast,
     Protocol,
     runtime_checkable,
     ClassVar,
@@ -20,6 +22,7 @@ from typing import (
 from pydantic import BaseModel, ValidationError
 
 from ..core.constants import UNIT_SEP, RECORD_SEP
+from .usv_codec import UsvCodec, get_usv_codec
 
 logger = logging.getLogger(__name__)
 
@@ -94,49 +97,27 @@ class BaseUsvModel(BaseModel):
         field_names = list(cls.model_fields.keys())
         return UNIT_SEP.join(field_names) + UNIT_SEP + "\n"
 
+    @classmethod
+    def _usv_codec(cls) -> UsvCodec:
+        """Cached field order, list mask and converters for this class."""
+        return get_usv_codec(cls)
+
     def to_usv(self) -> str:
         """
         Serializes the model into a Unit-Separated Value string.
         Follows field definition order strictly.
         Handles datetimes, lists, and special character sanitization.
         """
-        field_names = list(self.__class__.model_fields.keys())
-        # Use by_alias=False to ensure we use internal field names
-        dump = self.model_dump(by_alias=False)
-
-        values = []
-        for field in field_names:
-            val = dump.get(field)
-            if val is None:
-                values.append("")
-            elif isinstance(val, Enum):
-                values.append(str(val.value))
-            elif isinstance(val, (list, tuple)):
-                # Lists are semicolon-separated within the field
-                # Replace newlines and UNIT_SEP to prevent record breakage
-                sanitized_list = [
-                    str(v)
-                    .replace("\r\n", "<br>")
-                    .replace("\n", "<br>")
-                    .replace("\r", "<br>")
-                    .replace(UNIT_SEP, " ")
-                    for v in val
-                ]
-                values.append(";".join(sanitized_list))
-            elif isinstance(val, datetime):
-                values.append(val.isoformat())
-            else:
-                # Sanitize all other fields for newlines and separators
-                s_val = (
-                    str(val)
-                    .replace("\r\n", "<br>")
-                    .replace("\n", "<br>")
-                    .replace("\r", "<br>")
-                    .replace(UNIT_SEP, " ")
-                )
-                values.append(s_val)
+        return self._usv_codec().encode_model(self) + RECORD_SEP + "\n"
 
-        return UNIT_SEP.join(values) + RECORD_SEP + "\n"
+    @classmethod
+    def to_usv_many(cls: Type[T], items: Iterable[T]) -> Iterator[str]:
+        """
+        Serializes many models, one record per item (for `f.writelines`).
+        Items whose class overrides `to_usv` are serialized by that override.
+        """
+        for item in items:
+            yield item.to_usv()
 
     @classmethod
     def validate_record(cls: Type[T], usv_line: str) -> Tuple[bool, Optional[T], str]:
@@ -234,32 +215,48 @@ class BaseUsvModel(BaseModel):
                 f_invalid.close()
 
     @classmethod
-    def from_usv(cls: Type[T], usv_str: str) -> T:
-        """Parses a Unit-Separated Value string into a model instance."""
+    def from_usv(cls: Type[T], usv_str: str, trusted: bool = False) -> T:
+        """
+        Parses a Unit-Separated Value string into a model instance.
+
+        With trusted=True (rows written by our own `to_usv`, e.g. checkpoints),
+        cells are converted by the cached codec and the model is built like
+        `model_construct`, skipping validators. Rows the codec cannot convert
+        fall back to full validation.
+        """
         # Strip both Record Separator and Newline
         line = usv_str.strip("\x1e\n")
         if not line:
             raise ValueError(f"Empty or invalid USV line for {cls.__name__}")
 
-        parts = line.split(UNIT_SEP)
-        field_names = list(cls.model_fields.keys())
-
-        data: Dict[str, Any] = {}
-        for i, field_name in enumerate(field_names):
-            if i < len(parts):
-                val: Any = parts[i]
-                if val == "":
-                    # Skip empty strings, letting Pydantic handle defaults
-                    continue
+        codec = cls._usv_codec()
+        if trusted:
+            converted = codec.convert(line)
+            if converted is not None:
+                return cast(T, codec.construct(converted))
 
-                # Check for list fields (semicolon separated)
-                field_info = cls.model_fields[field_name]
-                if "List" in str(field_info.annotation):
-                    data[field_name] = [t.strip() for t in val.split(";") if t.strip()]
-                else:
-                    data[field_name] = val
+        return cls.model_validate(codec.split(line))
 
-        return cls.model_validate(data)
+    @classmethod
+    def from_usv_many(
+        cls: Type[T],
+        lines: Iterable[str],
+        trusted: bool = False,
+        skip_invalid: bool = False,
+    ) -> Iterator[T]:
+        """
+        Parses many USV lines, skipping blank ones.
+        With skip_invalid=True, rows that fail to parse are logged and dropped.
+        """
+        for line in lines:
+            if not line.strip("\x1e\n"):
+                continue
+            try:
+                yield cls.from_usv(line, trusted=trusted)
+            except (ValidationError, ValueError) as e:
+                if not skip_invalid:
+                    raise
+                logger.debug(f"Skipping invalid {cls.__name__} record: {e}")
 
     @classmethod
     def get_schema_hash(cls) -> str:
@@ -237,23 +237,8 @@ class GoogleMapsPlace(GoogleMapsIdx):
         """
         STRICT CANONICAL SERIALIZATION: Ensures field order matches datapackage.json.
         """
-        from cocli.core.constants import UNIT_SEP
-        field_names = list(self.__class__.model_fields.keys())
-        dump = self.model_dump(by_alias=False)
-        
-        values = []
-        for field in field_names:
-            val = dump.get(field)
-            if val is None:
-                values.append("")
-            elif isinstance(val, datetime):
-                values.append(val.isoformat())
-            else:
-                # Sanitize newlines and separators
-                s_val = str(val).replace("\r\n", "<br>").replace("\n", "<br>").replace("\r", "<br>").replace(UNIT_SEP, " ")
-                values.append(s_val)
-        
-        return UNIT_SEP.join(values) + "\n"
+        # Unlike BaseUsvModel, index rows carry no record separator
+        return self._usv_codec().encode_model(self) + "\n"
 
     @classmethod
     def get_datapackage_fields(cls) -> List[Dict[str, Any]]:
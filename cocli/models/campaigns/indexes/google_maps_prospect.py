@@ -58,6 +58,26 @@ class GoogleMapsProspect(GoogleMapsPlace):
         if not checkpoint.exists():
             return None
 
+        from cocli.utils.duckdb_utils import fresh_parquet_glob
+
+        parquet_glob = fresh_parquet_glob(checkpoint)
+        if parquet_glob:
+            # Sorted by place_id: row group min/max stats skip almost every group
+            try:
+                cursor = con.execute(
+                    f"SELECT * FROM read_parquet('{parquet_glob}', hive_partitioning=False) WHERE place_id = ? LIMIT 1",
+                    [place_id],
+                )
+                row = cursor.fetchone()
+                if row is None:
+                    return None
+                names = [d[0] for d in cursor.description]
+                return cls.model_validate(
+                    {k: v for k, v in zip(names, row) if v is not None}
+                )
+            except Exception:
+                pass
+
         try:
             # We only need to check the checkpoint for now as a baseline
             q = f"SELECT * FROM read_csv('{checkpoint}', delim='\x1f', header=False, auto_detect=True, all_varchar=True) WHERE column1 = '{place_id}' LIMIT 1"
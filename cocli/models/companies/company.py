@@ -1,6 +1,6 @@
 import re
 from pathlib import Path
-from typing import Optional, List, Any, Iterator, Dict
+from typing import Optional, List, Any, Iterator, Dict, TYPE_CHECKING
 import logging
 from datetime import datetime, UTC
 
@@ -23,8 +23,14 @@ from .slug import CompanySlug
 from ...core.ordinant import CollectionName
 from ...core.config import get_campaign
 
+if TYPE_CHECKING:
+    from ..wal.record import DatagramRecord
+
 logger = logging.getLogger(__name__)
 
+# libyaml's loader when available: frontmatter parsing dominates directory loads
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def split_categories(v: Any) -> List[str]:
     if isinstance(v, str):
@@ -165,25 +171,17 @@ class Company(BaseModel):
         return self
 
     @classmethod
-    def get_all(cls) -> Iterator["Company"]:
-        """Iterates through all company directories and yields Company objects."""
-        from ...core.paths import paths
-
-        companies_dir = paths.companies.path
-        if not companies_dir.exists():
-            return
-
-        # We can store state on the class for the duration of the scan if needed
-        # but for now we just yield and let the caller count.
-        for company_dir in sorted(companies_dir.iterdir()):
-            if company_dir.is_dir():
-                company = cls.from_directory(company_dir)
-                if company:
-                    yield company
-                else:
-                    # We can't easily pass the count back via iterator without changing API
-                    # so we'll just yield None for skipped items to allow counting.
-                    yield None  # type: ignore
+    def get_all(cls, workers: Optional[int] = None) -> Iterator["Company"]:
+        """
+        Iterates through all company directories and yields Company objects.
+        Directories are loaded in parallel (see `company_loader`), in sorted order.
+        """
+        from ...core.company_loader import company_dirs, load_companies
+
+        # We can't easily pass the count back via iterator without changing API
+        # so we'll just yield None for skipped items to allow counting.
+        for _, company in load_companies(company_dirs(), workers=workers):
+            yield company  # type: ignore[misc]
 
     @classmethod
     def get(cls, slug: str) -> Optional["Company"]:
@@ -196,7 +194,13 @@ class Company(BaseModel):
         return None
 
     @classmethod
-    def from_directory(cls, company_dir: Path) -> Optional["Company"]:
+    def from_directory(
+        cls, company_dir: Path, wal_records: Optional[List["DatagramRecord"]] = None
+    ) -> Optional["Company"]:
+        """
+        Loads a company from its directory. `wal_records` are the entity's WAL
+        updates when the caller already read them in bulk (see `read_updates_many`).
+        """
         from ...core.paths import paths
 
         logger = logging.getLogger(__name__)
@@ -222,7 +226,7 @@ class Company(BaseModel):
                     frontmatter_str = parts[1]
                     markdown_content = parts[2]
                     try:
-                        frontmatter_data = yaml.safe_load(frontmatter_str) or {}
+                        frontmatter_data = yaml.load(frontmatter_str, Loader=_YamlLoader) or {}
                     except yaml.YAMLError as e:  # Catch YAML errors specifically
                         logger.warning(
                             f"Skipping {company_dir.name}: YAML error in _index.md: {e}"
@@ -230,9 +234,10 @@ class Company(BaseModel):
                         return None
 
             # Apply WAL Updates on top of frontmatter
-            from cocli.core.wal import read_updates
+            if wal_records is None:
+                from cocli.core.wal import read_updates
 
-            wal_records = read_updates(company_dir)
+                wal_records = read_updates(company_dir)
             for record in wal_records:
                 # Naive merge: latest field value wins
                 try:
@@ -45,8 +45,8 @@ class MissionTask(BaseUsvModel):
         self._status = value
 
     @classmethod
-    def from_usv(cls, usv_str: str) -> "MissionTask":
-        return super().from_usv(usv_str)
+    def from_usv(cls, usv_str: str, trusted: bool = False) -> "MissionTask":
+        return super().from_usv(usv_str, trusted=trusted)
 
 class MigrationTask(BaseUsvModel):
     """
@@ -0,0 +1,319 @@
+import types
+from datetime import datetime, UTC
+from enum import Enum
+from operator import itemgetter
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, PlainSerializer, TypeAdapter, WrapSerializer
+
+from ..core.constants import UNIT_SEP
+
+# Values of these types are stored as-is and need no copy when used as defaults
+_IMMUTABLE = (str, int, float, bool, type(None), tuple, frozenset, Enum, datetime)
+
+# Stored values of these types serialize the same with or without model_dump
+_PLAIN_TYPES = (str, int, float, bool, datetime)
+
+_DYNAMIC_DEFAULT = object()
+
+
+def _sanitize_newlines(value: str) -> str:
+    # str.replace beats a str.translate table here: the table maps to
+    # multi-character strings, which takes translate's slow path.
+    return value.replace("\r\n", "<br>").replace("\n", "<br>").replace("\r", "<br>")
+
+
+def sanitize_usv_value(value: str) -> str:
+    """Replaces newlines with <br> and unit separators with spaces."""
+    if "\n" not in value and "\r" not in value and UNIT_SEP not in value:
+        return value
+    return _sanitize_newlines(value).replace(UNIT_SEP, " ")
+
+
+def _encode_list(val: Any) -> str:
+    # Lists are semicolon-separated within the field
+    return ";".join(sanitize_usv_value(str(v)) for v in val)
+
+
+# Exact-type dispatch for the common cell types; subclasses take the isinstance path
+_ENCODERS: Dict[type, Callable[[Any], str]] = {
+    int: str,
+    float: str,
+    bool: str,
+    datetime: datetime.isoformat,
+    list: _encode_list,
+    tuple: _encode_list,
+}
+
+
+def encode_usv_value(val: Any) -> str:
+    """Converts one field value into its USV cell."""
+    if val is None:
+        return ""
+    encoder = _ENCODERS.get(type(val))
+    if encoder is not None:
+        return encoder(val)
+    if isinstance(val, Enum):
+        return str(val.value)
+    if isinstance(val, (list, tuple)):
+        return _encode_list(val)
+    if isinstance(val, datetime):
+        return val.isoformat()
+    return sanitize_usv_value(str(val))
+
+
+def _split_list(val: str) -> List[str]:
+    return [t.strip() for t in val.split(";") if t.strip()]
+
+
+def _parse_bool(val: str) -> bool:
+    return val.strip().lower() in ("true", "1", "yes", "y")
+
+
+def _parse_int(val: str) -> int:
+    return int(float(val)) if "." in val else int(val)
+
+
+def _parse_datetime(val: str) -> datetime:
+    dt = datetime.fromisoformat(val)
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=UTC)
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _is_plain(annotation: Any, metadata: List[Any]) -> bool:
+    """True if a stored value of this field serializes to itself in model_dump."""
+    if any(isinstance(m, (PlainSerializer, WrapSerializer)) for m in metadata):
+        return False
+    target = _unwrap_optional(annotation)
+    if get_origin(target) in (list, List):
+        return all(arg in _PLAIN_TYPES for arg in get_args(target))
+    if target in _PLAIN_TYPES:
+        return True
+    return isinstance(target, type) and issubclass(target, Enum)
+
+
+class UsvCodec:
+    """
+    Per-model USV encoder/decoder, built once per class and cached.
+
+    Precomputes the positional field order, which fields hold ';'-joined lists,
+    which fields can be read straight from the instance (everything else still
+    goes through pydantic's serializer) and, for trusted parsing, a converter
+    per field so rows written by `to_usv` can be rebuilt without validation.
+    """
+
+    def __init__(self, model: Type[BaseModel]):
+        fields = model.model_fields
+        self.model = model
+        self.field_names: Tuple[str, ...] = tuple(fields)
+        # Same rule the validated path has always used for list fields
+        self.list_mask: Tuple[bool, ...] = tuple(
+            "List" in str(info.annotation) for info in fields.values()
+        )
+        self.required: FrozenSet[str] = frozenset(
+            name for name, info in fields.items() if info.is_required()
+        )
+
+        decorators = model.__pydantic_decorators__
+        serialized_by_hook = {
+            f for d in decorators.field_serializers.values() for f in d.info.fields
+        }
+        # Excluded fields are absent from model_dump and always written empty
+        self._excluded = tuple(i for i, info in enumerate(fields.values()) if info.exclude)
+        self._dumped: Dict[int, str] = {
+            i: name
+            for i, (name, info) in enumerate(fields.items())
+            if not info.exclude
+            and (name in serialized_by_hook or not _is_plain(info.annotation, info.metadata))
+        }
+        self._direct = len(self.field_names) > 1 and not decorators.model_serializers
+        self._getter = itemgetter(*self.field_names) if self._direct else None
+
+        self._converters: Optional[Tuple[Callable[[str], Any], ...]] = None
+        self._defaults: Optional[Tuple[Tuple[str, Any], ...]] = None
+
+    # --- Encoding ----------------------------------------------------------
+
+    def encode_model(self, instance: BaseModel) -> str:
+        """
+        Encodes a model into one unterminated record.
+
+        Plain fields are read straight from the instance; only fields with custom
+        serialization (phone numbers, serializer annotations) go through model_dump.
+        """
+        if self._getter is None:
+            return self.encode(instance.model_dump(by_alias=False))
+        try:
+            values = list(self._getter(instance.__dict__))
+        except KeyError:
+            return self.encode(instance.model_dump(by_alias=False))
+
+        if self._dumped:
+            dump = instance.model_dump(by_alias=False, include=set(self._dumped.values()))
+            for i, name in self._dumped.items():
+                values[i] = dump.get(name)
+        for i in self._excluded:
+            values[i] = None
+        return self._join(values)
+
+    def encode(self, dump: Dict[str, Any]) -> str:
+        """Joins a `model_dump(by_alias=False)` dict into one unterminated record."""
+        # model_dump keeps field order; excluded or extra fields force the keyed path
+        if len(dump) == len(self.field_names):
+            return self._join(dump.values())
+        return self._join([dump.get(name) for name in self.field_names])
+
+    @staticmethod
+    def _join(values: Any) -> str:
+        cells = [
+            "" if val is None else val if type(val) is str else encode_usv_value(val)
+            for val in values
+        ]
+        record = UNIT_SEP.join(cells)
+        # Sanitize the joined record once; a separator inside a value shows up as
+        # an extra separator, and only then are the cells sanitized one by one.
+        if record.count(UNIT_SEP) != len(cells) - 1:
+            record = UNIT_SEP.join([sanitize_usv_value(c) for c in cells])
+        elif "\n" in record or "\r" in record:
+            record = _sanitize_newlines(record)
+        return record
+
+    # --- Decoding ----------------------------------------------------------
+
+    def split(self, line: str) -> Dict[str, Any]:
+        """
+        Splits a USV line into a field dict for `model_validate`.
+        Empty cells are skipped so pydantic applies the field defaults.
+        """
+        data: Dict[str, Any] = {}
+        for name, is_list, val in zip(self.field_names, self.list_mask, line.split(UNIT_SEP)):
+            if val == "":
+                continue
+            data[name] = _split_list(val) if is_list else val
+        return data
+
+    def convert(self, line: str) -> Optional[Dict[str, Any]]:
+        """
+        Splits and type-converts a USV line without validation.
+        Returns None if the row cannot be converted (the caller should validate instead).
+        """
+        converters = self._converters
+        if converters is None:
+            converters = self._converters = self._build_converters()
+
+        data: Dict[str, Any] = {}
+        try:
+            for name, conv, val in zip(self.field_names, converters, line.split(UNIT_SEP)):
+                if val != "":
+                    data[name] = conv(val)
+        except (ValueError, TypeError):
+            return None
+        if not self.required.issubset(data):
+            return None
+        return data
+
+    def construct(self, data: Dict[str, Any]) -> Any:
+        """
+        Equivalent of `model_construct(**data)` for already converted field data.
+
+        model_construct resolves aliases and validation aliases for every field on
+        every call, which costs as much as validating a wide row; here the defaults
+        are resolved once per class.
+        """
+        model = self.model
+        if model.model_config.get("extra") == "allow" or model.__pydantic_root_model__:
+            return model.model_construct(**data)
+
+        defaults = self._defaults
+        if defaults is None:
+            defaults = self._defaults = self._build_defaults()
+
+        values: Dict[str, Any] = {}
+        fields = model.model_fields
+        for name, default in defaults:
+            if name in data:
+                values[name] = data[name]
+            elif default is _DYNAMIC_DEFAULT:
+                values[name] = fields[name].get_default(call_default_factory=True, validated_data=values)
+            else:
+                values[name] = default
+
+        instance = model.__new__(model)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__pydantic_fields_set__", set(data))
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        if model.__pydantic_post_init__:
+            instance.model_post_init(None)
+        return instance
+
+    def _build_defaults(self) -> Tuple[Tuple[str, Any], ...]:
+        defaults: List[Tuple[str, Any]] = []
+        for name, info in self.model.model_fields.items():
+            if info.default_factory is None and isinstance(info.default, _IMMUTABLE):
+                defaults.append((name, info.default))
+            else:
+                # Factories and mutable defaults are resolved per instance
+                defaults.append((name, _DYNAMIC_DEFAULT))
+        return tuple(defaults)
+
+    def _build_converters(self) -> Tuple[Callable[[str], Any], ...]:
+        return tuple(
+            self._converter_for(info.annotation, info.metadata, is_list)
+            for info, is_list in zip(self.model.model_fields.values(), self.list_mask)
+        )
+
+    @staticmethod
+    def _converter_for(annotation: Any, metadata: List[Any], is_list: bool) -> Callable[[str], Any]:
+        if is_list:
+            return _split_list
+        target = _unwrap_optional(annotation)
+        if target is str:
+            return str
+        if target is bool:
+            return _parse_bool
+        if target is int:
+            return _parse_int
+        if target is float:
+            return float
+        if target is datetime:
+            return _parse_datetime
+        if isinstance(target, type) and issubclass(target, Enum):
+            return target
+
+        # Custom types (phone numbers, nested models): let pydantic convert just this cell
+        adapter: TypeAdapter[Any] = TypeAdapter(
+            Annotated[(annotation, *metadata)] if metadata else annotation
+        )
+        return adapter.validate_python
+
+
+_CODECS: Dict[Type[BaseModel], UsvCodec] = {}
+
+
+def get_usv_codec(model: Type[BaseModel]) -> UsvCodec:
+    """Returns the cached codec for a model class."""
+    codec = _CODECS.get(model)
+    if codec is None:
+        codec = _CODECS[model] = UsvCodec(model)
+    return codec
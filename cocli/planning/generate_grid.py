@@ -1,8 +1,11 @@
 import math
 import os
 import json
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterable, Iterator, Sequence, Tuple
+
+import numpy as np
 from rich.console import Console
 
 # Optional dependency for high-quality KML generation
@@ -12,13 +15,91 @@ try:
 except ImportError:
     SIMPLEKML_AVAILABLE = False
 
-from ..core.sharding import get_grid_tile_id
-
 console = Console()
 
 # 0.1 degrees is the standardized grid step for discovery.
 DEFAULT_GRID_STEP_DEG = 0.1
 
+# Tiles are addressed by integer coordinates at 0.1-degree scale (the southwest
+# corner times TILE_SCALE), packed into one int64 key per tile.
+TILE_SCALE = 10
+_KEY_OFFSET = 1 << 20
+_KEY_SHIFT = 21
+
+def pack_tile_keys(lat_k: np.ndarray, lon_k: np.ndarray) -> np.ndarray:
+    """Packs integer tile coordinates into sortable int64 keys (lat-major)."""
+    keys: np.ndarray = ((lat_k.astype(np.int64) + _KEY_OFFSET) << _KEY_SHIFT) | (lon_k.astype(np.int64) + _KEY_OFFSET)
+    return keys
+
+def unpack_tile_keys(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    keys = np.asarray(keys, dtype=np.int64)
+    return (keys >> _KEY_SHIFT) - _KEY_OFFSET, (keys & ((1 << _KEY_SHIFT) - 1)) - _KEY_OFFSET
+
+def tile_ids_to_keys(tile_ids: Iterable[str]) -> np.ndarray:
+    """Keys of canonical "{lat:.1f}_{lon:.1f}" tile IDs; other IDs are skipped."""
+    lat_k: List[int] = []
+    lon_k: List[int] = []
+    for tile_id in tile_ids:
+        parts = tile_id.split("_")
+        if len(parts) < 2:
+            continue
+        try:
+            lat, lon = float(parts[0]), float(parts[1])
+        except ValueError:
+            continue
+        if f"{lat:.1f}" != parts[0] or f"{lon:.1f}" != parts[1]:
+            continue
+        lat_k.append(round(lat * TILE_SCALE))
+        lon_k.append(round(lon * TILE_SCALE))
+    return pack_tile_keys(np.array(lat_k, dtype=np.int64), np.array(lon_k, dtype=np.int64))
+
+def grid_tile_keys(center_lat: float, center_lon: float, radius_miles: float) -> np.ndarray:
+    """
+    Keys of the 0.1-degree tiles covering a circle, in row-major (south to
+    north, west to east) order. Same selection as `generate_global_grid`.
+    """
+    lat_buffer_deg = radius_miles / 69.0
+    lon_buffer_deg = radius_miles / (69.0 * math.cos(math.radians(center_lat)))
+    max_lat = center_lat + lat_buffer_deg
+    max_lon = center_lon + lon_buffer_deg
+
+    # Align grid to standardized 0.1-degree steps
+    # We round to 6 decimals first to handle floating point noise (e.g. -79.7999999999999)
+    start_lat_k = math.floor(round(center_lat - lat_buffer_deg, 6) * 10)
+    start_lon_k = math.floor(round(center_lon - lon_buffer_deg, 6) * 10)
+
+    lat_k = np.arange(start_lat_k, math.floor(max_lat * 10) + 2, dtype=np.int64)
+    lon_k = np.arange(start_lon_k, math.floor(max_lon * 10) + 2, dtype=np.int64)
+    lat_k = lat_k[lat_k / 10 <= max_lat]
+    lon_k = lon_k[lon_k / 10 <= max_lon]
+
+    # Simple Euclidean distance in miles from each tile center (approximation)
+    d_lat = ((2 * lat_k + 1) / 20 - center_lat) * 69.0
+    d_lon = ((2 * lon_k + 1) / 20 - center_lon) * 69.0 * math.cos(math.radians(center_lat))
+    dist = np.sqrt(d_lat[:, None] ** 2 + d_lon[None, :] ** 2)
+
+    # Buffer for partial tiles (~7 miles is diag of 0.1 deg tile)
+    rows, cols = np.nonzero(dist <= radius_miles + 7.0)
+    return pack_tile_keys(lat_k[rows], lon_k[cols])
+
+def tile_from_key(key: int, ref_lat: float, step_deg: float = DEFAULT_GRID_STEP_DEG) -> Dict[str, Any]:
+    """The tile dictionary for a key; `ref_lat` is the latitude of the circle that produced it."""
+    lat_k = (key >> _KEY_SHIFT) - _KEY_OFFSET
+    lon_k = (key & ((1 << _KEY_SHIFT) - 1)) - _KEY_OFFSET
+    return {
+        # tile_id MUST be the Southwest Corner
+        "id": f"{lat_k / 10:.1f}_{lon_k / 10:.1f}",
+        "south_west_lat": lat_k / 10,
+        "south_west_lon": lon_k / 10,
+        "north_east_lat": (lat_k + 1) / 10,
+        "north_east_lon": (lon_k + 1) / 10,
+        "center_lat": (2 * lat_k + 1) / 20,
+        "center_lon": (2 * lon_k + 1) / 20,
+        "step_deg": step_deg,
+        "est_width_miles": round(0.1 * 69.0 * math.cos(math.radians(ref_lat)), 2),
+        "est_height_miles": 6.9
+    }
+
 def generate_global_grid(center_lat: float, center_lon: float, radius_miles: float, step_deg: float = DEFAULT_GRID_STEP_DEG) -> List[Dict[str, Any]]:
     """
     Generates a grid of tiles covering a circular area defined by a center and radius.
@@ -32,140 +113,140 @@ def generate_global_grid(center_lat: float, center_lon: float, radius_miles: flo
     Returns:
         A list of tile dictionaries, each containing its bounds and center.
     """
-    # Calculate search bounds in degrees
-    lat_buffer_deg = radius_miles / 69.0
-    lon_buffer_deg = radius_miles / (69.0 * math.cos(math.radians(center_lat)))
-    
-    min_lat = center_lat - lat_buffer_deg
-    max_lat = center_lat + lat_buffer_deg
-    min_lon = center_lon - lon_buffer_deg
-    max_lon = center_lon + lon_buffer_deg
-    
-    # Align grid to standardized 0.1-degree steps
-    # We round to 6 decimals first to handle floating point noise (e.g. -79.7999999999999)
-    start_lat = math.floor(round(min_lat, 6) * 10) / 10.0
-    start_lon = math.floor(round(min_lon, 6) * 10) / 10.0
-    
-    grid_tiles = []
-    
-    current_lat = start_lat
-    while current_lat <= max_lat:
-        current_lon = start_lon
-        while current_lon <= max_lon:
-            # Check if tile center is within radius (using Haversine or simple approximation)
-            # Use 0.05 (half of 0.1) for exact center
-            tile_center_lat = round(current_lat + 0.05, 6)
-            tile_center_lon = round(current_lon + 0.05, 6)
-            
-            # Simple Euclidean distance in miles (approximation)
-            d_lat = (tile_center_lat - center_lat) * 69.0
-            d_lon = (tile_center_lon - center_lon) * 69.0 * math.cos(math.radians(center_lat))
-            dist = math.sqrt(d_lat**2 + d_lon**2)
-            
-            if dist <= radius_miles + 7.0: # Buffer for partial tiles (~7 miles is diag of 0.1 deg tile)
-                # tile_id MUST be the Southwest Corner
-                tile_id = get_grid_tile_id(current_lat, current_lon)
-                grid_tiles.append({
-                    "id": tile_id,
-                    "south_west_lat": round(current_lat, 6),
-                    "south_west_lon": round(current_lon, 6),
-                    "north_east_lat": round(current_lat + 0.1, 6),
-                    "north_east_lon": round(current_lon + 0.1, 6),
-                    "center_lat": tile_center_lat,
-                    "center_lon": tile_center_lon,
-                    "step_deg": step_deg,
-                    "est_width_miles": round(0.1 * 69.0 * math.cos(math.radians(center_lat)), 2),
-                    "est_height_miles": 6.9
-                })
-            
-            current_lon = round(current_lon + 0.1, 6)
-        current_lat = round(current_lat + 0.1, 6)
-        
-    return grid_tiles
+    return [tile_from_key(key, center_lat, step_deg) for key in grid_tile_keys(center_lat, center_lon, radius_miles).tolist()]
 
-def get_campaign_grid_tiles(campaign_name: str, target_locations: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
-    """Helper to load grid tiles for a campaign from its config or provided locations."""
+@dataclass
+class TilePlan:
+    """
+    The unique tiles of a campaign as packed keys, in first-seen order across
+    target locations, with the latitude of the location that produced each one.
+    Tile dictionaries are only built while iterating.
+    """
+    keys: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    ref_lats: np.ndarray = field(default_factory=lambda: np.empty(0))
+    step_deg: float = DEFAULT_GRID_STEP_DEG
+
+    @classmethod
+    def for_locations(cls, locations: Sequence[Dict[str, Any]], radius_miles: float) -> "TilePlan":
+        parts: List[np.ndarray] = []
+        lats: List[np.ndarray] = []
+        for loc in locations:
+            try:
+                lat = float(loc["lat"])
+                keys = grid_tile_keys(lat, float(loc["lon"]), radius_miles)
+            except Exception as e:
+                console.print(f"[red]Error processing location {loc.get('name')}: {e}[/red]")
+                continue
+            parts.append(keys)
+            lats.append(np.full(len(keys), lat))
+        if not parts:
+            return cls()
+        all_keys = np.concatenate(parts)
+        # Deduplicate, keeping each tile's first occurrence in location order
+        _, first = np.unique(all_keys, return_index=True)
+        first.sort()
+        return cls(all_keys[first], np.concatenate(lats)[first])
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for key, ref_lat in zip(self.keys.tolist(), self.ref_lats.tolist()):
+            yield tile_from_key(key, ref_lat, self.step_deg)
+
+    def tile_ids(self) -> List[str]:
+        lat_k, lon_k = unpack_tile_keys(self.keys)
+        return [f"{a / 10:.1f}_{b / 10:.1f}" for a, b in zip(lat_k.tolist(), lon_k.tolist())]
+
+    def centers(self) -> Tuple[np.ndarray, np.ndarray]:
+        lat_k, lon_k = unpack_tile_keys(self.keys)
+        return (2 * lat_k + 1) / 20, (2 * lon_k + 1) / 20
+
+    def uncovered(self, covered_keys: np.ndarray) -> np.ndarray:
+        """Mask of planned tiles not in `covered_keys`."""
+        return np.isin(self.keys, covered_keys, invert=True)
+
+def load_target_locations(campaign_name: str) -> List[Dict[str, Any]]:
+    """Target locations from the campaign's CSV, else geocoded from its config."""
     from cocli.core.config import load_campaign_config, get_campaign_dir
     config = load_campaign_config(campaign_name)
     campaign_dir = get_campaign_dir(campaign_name)
-    
-    proximity = config.get("prospecting", {}).get("proximity-miles", 10)
-    
-    if target_locations is None:
-        target_locations = []
-        prospecting_config = config.get("prospecting", {})
-        target_locations_csv = prospecting_config.get("target-locations-csv")
-
-        # 1. Try to load from CSV first
-        if target_locations_csv and campaign_dir:
-            import csv
-            csv_path = Path(target_locations_csv)
-            if not csv_path.is_absolute():
-                csv_path = campaign_dir / csv_path
-            
-            if csv_path.exists():
+
+    target_locations: List[Dict[str, Any]] = []
+    prospecting_config = config.get("prospecting", {})
+    target_locations_csv = prospecting_config.get("target-locations-csv")
+
+    # 1. Try to load from CSV first
+    if target_locations_csv and campaign_dir:
+        import csv
+        csv_path = Path(target_locations_csv)
+        if not csv_path.is_absolute():
+            csv_path = campaign_dir / csv_path
+        
+        if csv_path.exists():
+            try:
+                with open(csv_path, 'r', encoding='utf-8') as f:
+                    reader = csv.DictReader(f)
+                    for row in reader:
+                        name = row.get("name") or row.get("city")
+                        lat = row.get("lat")
+                        lon = row.get("lon")
+                        if name and lat and lon and lat.strip() and lon.strip():
+                            target_locations.append({
+                                "name": str(name),
+                                "lat": float(lat),
+                                "lon": float(lon)
+                            })
+                if target_locations:
+                    console.print(f"[dim]Loaded {len(target_locations)} target locations from {csv_path.name}[/dim]")
+            except Exception as e:
+                console.print(f"[red]Error reading target locations CSV: {e}[/red]")
+
+    # 2. Fallback to geocoding 'target-locations' list if still empty
+    if not target_locations:
+        locations = prospecting_config.get("target-locations", [])
+        if not locations:
+            # Legacy check for 'locations'
+            locations = prospecting_config.get("locations", [])
+        
+        if locations:
+            from geopy.geocoders import Nominatim # type: ignore
+            geolocator = Nominatim(user_agent="cocli_planner")
+
+            for loc in locations:
                 try:
-                    with open(csv_path, 'r', encoding='utf-8') as f:
-                        reader = csv.DictReader(f)
-                        for row in reader:
-                            name = row.get("name") or row.get("city")
-                            lat = row.get("lat")
-                            lon = row.get("lon")
-                            if name and lat and lon and lat.strip() and lon.strip():
-                                target_locations.append({
-                                    "name": str(name),
-                                    "lat": float(lat),
-                                    "lon": float(lon)
-                                })
-                    if target_locations:
-                        console.print(f"[dim]Loaded {len(target_locations)} target locations from {csv_path.name}[/dim]")
+                    if isinstance(loc, str):
+                        console.print(f"[dim]Geocoding {loc}...[/dim]")
+                        location = geolocator.geocode(loc)
+                        if not location:
+                            continue
+                        lat, lon = location.latitude, location.longitude
+                    else:
+                        lat, lon = loc[0], loc[1]
+                    
+                    target_locations.append({
+                        "name": str(loc),
+                        "lat": lat,
+                        "lon": lon
+                    })
                 except Exception as e:
-                    console.print(f"[red]Error reading target locations CSV: {e}[/red]")
-
-        # 2. Fallback to geocoding 'target-locations' list if still empty
-        if not target_locations:
-            locations = prospecting_config.get("target-locations", [])
-            if not locations:
-                # Legacy check for 'locations'
-                locations = prospecting_config.get("locations", [])
-            
-            if locations:
-                from geopy.geocoders import Nominatim # type: ignore
-                geolocator = Nominatim(user_agent="cocli_planner")
-
-                for loc in locations:
-                    try:
-                        if isinstance(loc, str):
-                            console.print(f"[dim]Geocoding {loc}...[/dim]")
-                            location = geolocator.geocode(loc)
-                            if not location:
-                                continue
-                            lat, lon = location.latitude, location.longitude
-                        else:
-                            lat, lon = loc[0], loc[1]
-                        
-                        target_locations.append({
-                            "name": str(loc),
-                            "lat": lat,
-                            "lon": lon
-                        })
-                    except Exception as e:
-                        console.print(f"[red]Error geocoding {loc}: {e}[/red]")
-    
-    all_tiles = []
-    seen_ids = set()
+                    console.print(f"[red]Error geocoding {loc}: {e}[/red]")
 
-    for loc in target_locations:
-        try:
-            tiles = generate_global_grid(loc["lat"], loc["lon"], proximity)
-            for t in tiles:
-                if t["id"] not in seen_ids:
-                    all_tiles.append(t)
-                    seen_ids.add(t["id"])
-        except Exception as e:
-            console.print(f"[red]Error processing location {loc.get('name')}: {e}[/red]")
-            
-    return all_tiles
+    return target_locations
+
+def get_campaign_tile_plan(campaign_name: str, target_locations: Optional[List[Dict[str, Any]]] = None) -> TilePlan:
+    """The deduplicated tile plan for a campaign's (or the provided) target locations."""
+    from cocli.core.config import load_campaign_config
+    config = load_campaign_config(campaign_name)
+    proximity = config.get("prospecting", {}).get("proximity-miles", 10)
+
+    if target_locations is None:
+        target_locations = load_target_locations(campaign_name)
+    return TilePlan.for_locations(target_locations, proximity)
+
+def get_campaign_grid_tiles(campaign_name: str, target_locations: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    """Helper to load grid tiles for a campaign from its config or provided locations."""
+    return list(get_campaign_tile_plan(campaign_name, target_locations))
 
 def export_to_kml(tiles: List[Dict[str, Any]], filename: str, campaign_name: str, color: Optional[str] = None) -> None:
     """
@@ -1,6 +1,6 @@
 import logging
 from typing import List, AsyncIterator, Optional, Dict, Any, Union
-from playwright.async_api import Browser
+from playwright.async_api import Browser, BrowserContext, Page
 from geopy.distance import geodesic # type: ignore
 
 from ....models.campaigns.indexes.google_maps_list_item import GoogleMapsListItem
@@ -10,9 +10,24 @@ from .wilderness import WildernessManager
 from .scanner import SidebarScraper
 from .utils import get_viewport_bounds
 from ....utils.playwright_utils import setup_optimized_context
+from ....utils.browser_manager import BrowserContextPool
 
 logger = logging.getLogger(__name__)
 
+async def new_maps_context(browser: Browser, viewport_width: int, viewport_height: int) -> BrowserContext:
+    """A Google Maps scraping context: fixed viewport, project user agent and stealth."""
+    from ....utils.headers import USER_AGENT
+    from ....utils.playwright_utils import setup_stealth_context
+
+    context = await browser.new_context(
+        viewport={'width': viewport_width, 'height': viewport_height},
+        user_agent=USER_AGENT
+    )
+    # Apply Stealth (No resource blocking)
+    await setup_stealth_context(context)
+    await setup_optimized_context(context)
+    return context
+
 class ScrapeCoordinator:
     def __init__(
         self,
@@ -24,9 +39,11 @@ class ScrapeCoordinator:
         viewport_height: int = 2000,
         debug: bool = False,
         s3_client: Any = None,
-        s3_bucket: Optional[str] = None
+        s3_bucket: Optional[str] = None,
+        context_pool: Optional[BrowserContextPool] = None
     ):
         self.browser = browser
+        self.context_pool = context_pool
         self.campaign_name = campaign_name
         self.base_width_miles = base_width_miles
         self.base_height_miles = base_height_miles
@@ -48,24 +65,38 @@ class ScrapeCoordinator:
         processed_by: Optional[str] = None
     ) -> AsyncIterator[GoogleMapsListItem]:
         
-        # Create a new context explicitly for this session
-        from ....utils.headers import USER_AGENT
-        
+        if self.context_pool:
+            # Warm pooled context/page shared with the worker's other tasks
+            async with self.context_pool.page() as page:
+                async for item in self._scrape(page, start_lat, start_lon, search_phrases, max_proximity_miles, panning_distance_miles, force_refresh, ttl_days, grid_tiles, processed_by):
+                    yield item
+            return
+
         # We launch a fresh context but the browser instance was already launched by the caller.
-        # However, to support channel selection, we ensure the coordinator's browser is 
-        # launched with 'msedge' if possible.
-        context = await self.browser.new_context(
-            viewport={'width': self.viewport_width, 'height': self.viewport_height},
-            user_agent=USER_AGENT
-        )
-        
-        # Apply Stealth (No resource blocking)
-        from ....utils.playwright_utils import setup_stealth_context
-        await setup_stealth_context(context)
-        await setup_optimized_context(context)
-        
+        context = await new_maps_context(self.browser, self.viewport_width, self.viewport_height)
         page = await context.new_page()
-        
+        try:
+            async for item in self._scrape(page, start_lat, start_lon, search_phrases, max_proximity_miles, panning_distance_miles, force_refresh, ttl_days, grid_tiles, processed_by):
+                yield item
+        finally:
+            try:
+                await context.close()
+            except Exception:
+                pass
+
+    async def _scrape(
+        self,
+        page: Page,
+        start_lat: float,
+        start_lon: float,
+        search_phrases: List[str],
+        max_proximity_miles: float,
+        panning_distance_miles: int,
+        force_refresh: bool,
+        ttl_days: int,
+        grid_tiles: Optional[List[Dict[str, Any]]],
+        processed_by: Optional[str],
+    ) -> AsyncIterator[GoogleMapsListItem]:
         navigator = Navigator(page)
         scanner = SidebarScraper(page, debug=self.debug)
         
@@ -79,66 +110,59 @@ class ScrapeCoordinator:
         
         processed_ids: set[str] = set()
         
-        try:
-            for target in strategy:
-                # Unpack target based on length to support both Spiral (2) and Grid (3) strategies
-                tile_id = None
-                if len(target) == 3:
-                    lat, lon, tile_id = target
-                else:
-                    lat, lon = target
+        for target in strategy:
+            # Unpack target based on length to support both Spiral (2) and Grid (3) strategies
+            tile_id = None
+            if len(target) == 3:
+                lat, lon, tile_id = target
+            else:
+                lat, lon = target
 
-                # 1. Proximity Check (Skip for GridStrategy)
-                dist = 0.0
-                if not grid_tiles:
-                    dist = geodesic((start_lat, start_lon), (lat, lon)).miles
-                    if max_proximity_miles > 0 and dist > max_proximity_miles:
-                        logger.info(f"Reached max proximity ({dist:.2f} > {max_proximity_miles} miles). Stopping.")
-                        break
-                
-                logger.info(f"Processing location: {lat:.4f}, {lon:.4f} (Dist: {dist:.1f} mi)")
-                
-                # 2. Determine Scope (Expand-Out)
-                # We attempt to define the largest effective box for this center point
-                # For now, simplistic approach: Use base size. 
-                
-                current_width = self.base_width_miles
-                current_height = self.base_height_miles
-                
-                # Check if this area is already covered
-                bounds = get_viewport_bounds(lat, lon, current_width, current_height)
+            # 1. Proximity Check (Skip for GridStrategy)
+            dist = 0.0
+            if not grid_tiles:
+                dist = geodesic((start_lat, start_lon), (lat, lon)).miles
+                if max_proximity_miles > 0 and dist > max_proximity_miles:
+                    logger.info(f"Reached max proximity ({dist:.2f} > {max_proximity_miles} miles). Stopping.")
+                    break
+            
+            logger.info(f"Processing location: {lat:.4f}, {lon:.4f} (Dist: {dist:.1f} mi)")
+            
+            # 2. Determine Scope (Expand-Out)
+            # We attempt to define the largest effective box for this center point
+            # For now, simplistic approach: Use base size. 
+            
+            current_width = self.base_width_miles
+            current_height = self.base_height_miles
+            
+            # Check if this area is already covered
+            bounds = get_viewport_bounds(lat, lon, current_width, current_height)
+            
+            # Scrape each query
+            for query in search_phrases:
+                # In Grid Mode (tile_id present), we bypass the wilderness/overlap check
+                # to strictly follow the grid plan.
+                if not tile_id and not self.wilderness.should_scrape(bounds, query):
+                    logger.info(f"Skipping '{query}' at {lat},{lon} (Already covered/wilderness).")
+                    continue
+                    
+                # Navigate with CORRECT ZOOM
+                success = await navigator.goto(lat, lon, current_width, current_height, query)
+                if not success:
+                    continue
+                    
+                # Calculate ACTUAL dimensions from map scale
+                actual_width, actual_height = await navigator.get_current_map_dimensions()
                 
-                # Scrape each query
-                for query in search_phrases:
-                    # In Grid Mode (tile_id present), we bypass the wilderness/overlap check
-                    # to strictly follow the grid plan.
-                    if not tile_id and not self.wilderness.should_scrape(bounds, query):
-                        logger.info(f"Skipping '{query}' at {lat},{lon} (Already covered/wilderness).")
-                        continue
-                        
-                    # Navigate with CORRECT ZOOM
-                    success = await navigator.goto(lat, lon, current_width, current_height, query)
-                    if not success:
-                        continue
-                        
-                    # Calculate ACTUAL dimensions from map scale
-                    actual_width, actual_height = await navigator.get_current_map_dimensions()
+                # Use actuals if available, otherwise fallback to planned
+                record_width = actual_width if actual_width > 0 else current_width
+                record_height = actual_height if actual_height > 0 else current_height
                     
-                    # Use actuals if available, otherwise fallback to planned
-                    record_width = actual_width if actual_width > 0 else current_width
-                    record_height = actual_height if actual_height > 0 else current_height
-                        
-                    # Scrape
-                    items_found = 0
-                    async for item in scanner.scrape(query, processed_ids, force_refresh, ttl_days, tile_id=tile_id):
-                        yield item
-                        items_found += 1
-                        
-                    # Mark Index
-                    self.wilderness.mark_scraped(bounds, query, items_found, record_width, record_height, tile_id=tile_id, processed_by=processed_by)
+                # Scrape
+                items_found = 0
+                async for item in scanner.scrape(query, processed_ids, force_refresh, ttl_days, tile_id=tile_id):
+                    yield item
+                    items_found += 1
                     
-        finally:
-            try:
-                await context.close()
-            except Exception:
-                pass
+                # Mark Index
+                self.wilderness.mark_scraped(bounds, query, items_found, record_width, record_height, tile_id=tile_id, processed_by=processed_by)
@@ -5,6 +5,7 @@ from playwright.async_api import Browser
 from .gm_scraper.coordinator import ScrapeCoordinator
 from ...models.campaigns.indexes.google_maps_list_item import GoogleMapsListItem
 from ...core.config import load_scraper_settings
+from ...utils.browser_manager import BrowserContextPool
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +31,8 @@ async def scrape_google_maps(
     grid_tiles: Optional[List[Dict[str, Any]]] = None,
     s3_client: Any = None,
     s3_bucket: Optional[str] = None,
-    processed_by: Optional[str] = None
+    processed_by: Optional[str] = None,
+    context_pool: Optional[BrowserContextPool] = None
 ) -> AsyncIterator[GoogleMapsListItem]:
     """
     Scrapes business information from Google Maps using the modular ScrapeCoordinator.
@@ -86,7 +88,8 @@ async def scrape_google_maps(
         viewport_height=launch_height,
         debug=debug,
         s3_client=s3_client,
-        s3_bucket=s3_bucket
+        s3_bucket=s3_bucket,
+        context_pool=context_pool
     )
     
     # Run
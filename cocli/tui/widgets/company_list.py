@@ -50,6 +50,8 @@ class CompanyList(Container):
         self.current_sort: Optional[str] = "recent"
         self.search_offset: int = 0
         self.search_limit: int = 50
+        # Last slug before each page of the unranked listing (keyset paging)
+        self._page_after: List[Optional[str]] = [None]
         self._ignoring_input_change: bool = False
 
     def compose(self) -> ComposeResult:
@@ -224,17 +226,11 @@ class CompanyList(Container):
                 event.prevent_default()
         elif event.key == "]":  # Next Page
             if list_view.has_focus:
-                self.search_offset += self.search_limit
-                self.run_search(
-                    self.query_one("#company_search_input", CocliSearchInput).value
-                )
+                self.action_next_page()
                 event.prevent_default()
         elif event.key == "[":  # Prev Page
             if list_view.has_focus and self.search_offset >= self.search_limit:
-                self.search_offset -= self.search_limit
-                self.run_search(
-                    self.query_one("#company_search_input", CocliSearchInput).value
-                )
+                self.action_prev_page()
                 event.prevent_default()
         elif event.key == "escape":
             # If search is focused, return focus to list
@@ -242,6 +238,21 @@ class CompanyList(Container):
                 list_view.focus()
                 event.prevent_default()
 
+    def action_next_page(self) -> None:
+        """Show the next page, remembering the slug it starts after."""
+        page = self.search_offset // self.search_limit + 1
+        last = self.filtered_fz_items[-1].slug if self.filtered_fz_items else None
+        self._page_after = self._page_after[:page] + [last]
+        self.search_offset += self.search_limit
+        self.run_search(self.query_one("#company_search_input", CocliSearchInput).value)
+
+    def action_prev_page(self) -> None:
+        """Show the previous page."""
+        if self.search_offset < self.search_limit:
+            return
+        self.search_offset -= self.search_limit
+        self.run_search(self.query_one("#company_search_input", CocliSearchInput).value)
+
     async def on_input_changed(self, event: Input.Changed) -> None:
         """Called when the search input changes."""
         if self._ignoring_input_change:
@@ -250,6 +261,19 @@ class CompanyList(Container):
         # but for search we rely on on_search_debounced
         pass
 
+    def _after_cursor(self, query: str) -> Optional[str]:
+        """
+        The slug the current page starts after, so unranked listings seek past
+        it rather than skipping `search_offset` rows. Ranked searches have no
+        cursor and page by offset.
+        """
+        if self.search_offset == 0:
+            self._page_after = [None]
+        page = self.search_offset // self.search_limit
+        if query or page >= len(self._page_after):
+            return None
+        return self._page_after[page]
+
     def run_search(self, query: str) -> None:
         app = cast("CocliApp", self.app)
         sort_by = self.current_sort or ("recent" if self.sort_recent else None)
@@ -279,6 +303,7 @@ class CompanyList(Container):
                 sort_by=sort_by,
                 limit=self.search_limit,
                 offset=self.search_offset,
+                after=self._after_cursor(query),
             )
             self.filtered_fz_items = results
             # For synchronous tests, we need immediate update
@@ -309,6 +334,7 @@ class CompanyList(Container):
             sort_by=sort_by,
             limit=self.search_limit,
             offset=self.search_offset,
+            after=self._after_cursor(query),
         )
         self.filtered_fz_items = results
 
@@ -363,6 +389,7 @@ class CompanyList(Container):
                     sort_by=sort_by,
                     limit=self.search_limit,
                     offset=self.search_offset,
+                    after=self._after_cursor(query),
                 )
 
             if not self.is_running:
@@ -278,7 +278,8 @@ class QueueDetail(VerticalScroll):
             indicator.update(f"[bold green] {branch.title()} Synced[/bold green]")
             self.app.notify(f"Sync Complete: {queue_name} ({branch})")
 
-            await asyncio.to_thread(app.services.reporting_service.get_campaign_stats)
+            # Synced tasks bypass the queue journal, so count them again
+            await asyncio.to_thread(app.services.reporting_service.get_campaign_stats, recount=True)
             self.call_after_refresh(self.refresh_counts)
 
         except Exception as e:
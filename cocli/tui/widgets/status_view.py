@@ -122,7 +122,9 @@ class StatusView(VerticalScroll):
             
             # Fetch both stats and health in parallel
             # These are the heavy blocking calls
-            stats_task = asyncio.to_thread(app.services.reporting_service.get_campaign_stats, campaign)
+            stats_task = asyncio.to_thread(
+                app.services.reporting_service.get_campaign_stats, campaign, background=True
+            )
             health_task = app.services.reporting_service.get_cluster_health()
             
             stats, health = await asyncio.gather(stats_task, health_task)
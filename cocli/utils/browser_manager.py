@@ -1,6 +1,12 @@
 import asyncio
-from typing import Optional, Any
-from playwright.async_api import async_playwright, Browser, Page
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Optional, Any, AsyncIterator, Awaitable, Callable, Dict
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+
+logger = logging.getLogger(__name__)
 
 
 class BrowserManager:
@@ -41,3 +47,231 @@ class BrowserManager:
             self.browser = None
             self.playwright = None
             self.page = None
+
+
+ContextFactory = Callable[[Browser], Awaitable[BrowserContext]]
+
+
+async def _default_context(browser: Browser) -> BrowserContext:
+    return await browser.new_context()
+
+
+def chromium_max_rss_mb() -> float:
+    """Resident memory (MB) of the largest Chromium process started by this process."""
+    import psutil
+    largest = 0.0
+    try:
+        children = psutil.Process().children(recursive=True)
+    except psutil.Error:
+        return largest
+    for proc in children:
+        try:
+            name = proc.name().lower()
+            if "chrom" in name or "headless_shell" in name:
+                largest = max(largest, proc.memory_info().rss / (1024 * 1024))
+        except psutil.Error:
+            continue
+    return largest
+
+
+@dataclass
+class PoolMetrics:
+    leases: int = 0
+    reuses: int = 0
+    created: int = 0
+    health_failures: int = 0
+    recycled: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def reuse_rate(self) -> float:
+        return self.reuses / self.leases if self.leases else 0.0
+
+    def summary(self) -> str:
+        recycled = ", ".join(f"{k}={v}" for k, v in sorted(self.recycled.items())) or "none"
+        return (
+            f"{self.leases} leases, {self.reuse_rate:.0%} reused, {self.created} contexts created, "
+            f"recycled: {recycled}, {self.health_failures} failed health checks"
+        )
+
+
+@dataclass
+class _Slot:
+    context: BrowserContext
+    page: Optional[Page] = None
+    uses: int = 0
+
+
+class BrowserContextPool:
+    """
+    Warm, reusable browser contexts shared by the worker loops of one browser.
+
+    Each lease hands a context (or the context's long-lived page) to one task at a
+    time. A context is recycled after `max_uses` leases, when it fails the health
+    check run before every reuse, or when the largest Chromium process grows past
+    `max_process_rss_mb` (checked at most every `memory_check_interval` seconds).
+    Replacements are created on release so the next lease starts warm.
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        context_factory: Optional[ContextFactory] = None,
+        size: int = 1,
+        max_uses: int = 50,
+        max_process_rss_mb: Optional[float] = None,
+        memory_check_interval: float = 30.0,
+        health_check_timeout: float = 5.0,
+    ):
+        self.browser = browser
+        self.context_factory = context_factory or _default_context
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self.max_process_rss_mb = max_process_rss_mb
+        self.memory_check_interval = memory_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.metrics = PoolMetrics()
+
+        self._idle: asyncio.Queue[_Slot] = asyncio.Queue()
+        self._slots = 0
+        self._create_lock = asyncio.Lock()
+        self._last_memory_check = 0.0
+        self._closed = False
+
+    async def __aenter__(self) -> "BrowserContextPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Creates the warm contexts up front."""
+        while self._slots < self.size:
+            await self._idle.put(await self._new_slot())
+
+    async def close(self) -> None:
+        self._closed = True
+        while not self._idle.empty():
+            await self._discard(self._idle.get_nowait())
+        logger.info(f"BrowserContextPool: {self.metrics.summary()}")
+
+    # --- Leasing -----------------------------------------------------------
+
+    @asynccontextmanager
+    async def context(self) -> AsyncIterator[BrowserContext]:
+        """Leases a context; pages the task leaves open are closed on release."""
+        slot = await self._acquire()
+        failed = True
+        try:
+            yield slot.context
+            failed = False
+        finally:
+            await self._release(slot, failed)
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Leases a context's long-lived page."""
+        slot = await self._acquire()
+        failed = True
+        try:
+            if slot.page is None or slot.page.is_closed():
+                slot.page = await slot.context.new_page()
+            yield slot.page
+            failed = False
+        finally:
+            await self._release(slot, failed)
+
+    async def _acquire(self) -> _Slot:
+        if self._closed:
+            raise RuntimeError("BrowserContextPool is closed")
+        async with self._create_lock:
+            if self._idle.empty() and self._slots < self.size:
+                await self._idle.put(await self._new_slot())
+        slot = await self._idle.get()
+        if slot.uses and not await self._healthy(slot):
+            self.metrics.health_failures += 1
+            await self._recycle(slot, "unhealthy")
+            slot = await self._new_slot()
+        self.metrics.leases += 1
+        if slot.uses:
+            self.metrics.reuses += 1
+        return slot
+
+    async def _release(self, slot: _Slot, failed: bool) -> None:
+        slot.uses += 1
+        reason: Optional[str] = None
+        if slot.uses >= self.max_uses:
+            reason = "max_uses"
+        elif failed and not await self._healthy(slot):
+            self.metrics.health_failures += 1
+            reason = "unhealthy"
+        elif self._over_memory_ceiling():
+            reason = "memory"
+
+        if reason is None:
+            await self._close_stray_pages(slot)
+            await self._idle.put(slot)
+            return
+
+        await self._recycle(slot, reason)
+        if self._closed:
+            return
+        try:
+            await self._idle.put(await self._new_slot())
+        except Exception as e:
+            # The next lease retries the creation
+            logger.warning(f"BrowserContextPool: could not replace recycled context: {e}")
+
+    # --- Slot lifecycle ----------------------------------------------------
+
+    async def _new_slot(self) -> _Slot:
+        context = await self.context_factory(self.browser)
+        self._slots += 1
+        self.metrics.created += 1
+        return _Slot(context)
+
+    async def _recycle(self, slot: _Slot, reason: str) -> None:
+        self.metrics.recycled[reason] = self.metrics.recycled.get(reason, 0) + 1
+        logger.debug(f"BrowserContextPool: recycling context after {slot.uses} uses ({reason})")
+        await self._discard(slot)
+
+    async def _discard(self, slot: _Slot) -> None:
+        self._slots -= 1
+        try:
+            await slot.context.close()
+        except Exception:
+            pass
+
+    async def _close_stray_pages(self, slot: _Slot) -> None:
+        for page in list(slot.context.pages):
+            if page is not slot.page:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+
+    async def _healthy(self, slot: _Slot) -> bool:
+        try:
+            if not self.browser.is_connected():
+                return False
+            if slot.page is not None:
+                if slot.page.is_closed():
+                    slot.page = None
+                else:
+                    await asyncio.wait_for(slot.page.evaluate("1"), self.health_check_timeout)
+            return True
+        except Exception:
+            return False
+
+    def _over_memory_ceiling(self) -> bool:
+        if not self.max_process_rss_mb:
+            return False
+        now = time.monotonic()
+        if now - self._last_memory_check < self.memory_check_interval:
+            return False
+        self._last_memory_check = now
+        rss_mb = chromium_max_rss_mb()
+        if rss_mb > self.max_process_rss_mb:
+            logger.info(f"BrowserContextPool: Chromium process at {rss_mb:.0f}MB (ceiling {self.max_process_rss_mb:.0f}MB)")
+            return True
+        return False
@@ -2,13 +2,33 @@
 import fnmatch
 import json
 import logging
+import os
 import re
+import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 import duckdb
 
 logger = logging.getLogger(__name__)
 
+# Written next to a Parquet checkpoint; records the USV it was built from
+PARQUET_SOURCE_STAMP = "_source.json"
+
+# Parquet files are partitioned by the place_id shard (see sharding.get_place_id_shard),
+# lower-cased so partitions don't collide on case-insensitive filesystems
+_PLACE_ID_SHARD_SQL = (
+    "CASE WHEN regexp_matches(substr(place_id, 6, 1), '^[A-Za-z0-9]$') "
+    "THEN lower(substr(place_id, 6, 1)) ELSE '_' END"
+)
+
+_FRICTIONLESS_TO_DUCKDB = {
+    "string": "VARCHAR",
+    "integer": "BIGINT",
+    "number": "DOUBLE",
+    "datetime": "VARCHAR",
+    "boolean": "BOOLEAN",
+}
+
 
 def get_schema_field_names(
     datapackage_path: Path, resource_name: Optional[str] = None
@@ -188,23 +208,115 @@ def get_duckdb_schema_from_datapackage(
     if not resource:
         resource = data["resources"][0]
 
-    fields = resource["schema"]["fields"]
+    return get_duckdb_schema_from_fields(resource["schema"]["fields"])
+
 
-    type_map = {
-        "string": "VARCHAR",
-        "integer": "BIGINT",
-        "number": "DOUBLE",
-        "datetime": "VARCHAR",
-        "boolean": "BOOLEAN",
+def get_duckdb_schema_from_fields(fields: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Maps Frictionless field definitions to DuckDB column types."""
+    return {
+        field["name"]: _FRICTIONLESS_TO_DUCKDB.get(field.get("type", "string"), "VARCHAR")
+        for field in fields
     }
 
-    duck_cols = {}
-    for field in fields:
-        name = field["name"]
-        f_type = field.get("type", "string")
-        duck_cols[name] = type_map.get(f_type, "VARCHAR")
 
-    return duck_cols
+def parquet_path_for(usv_path: Path) -> Path:
+    """The Parquet checkpoint directory kept next to a USV checkpoint."""
+    return usv_path.with_suffix(".parquet")
+
+
+def _usv_stamp(usv_path: Path) -> Dict[str, int]:
+    st = usv_path.stat()
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def fresh_parquet_glob(usv_path: Path) -> Optional[str]:
+    """
+    Returns the read_parquet glob for the Parquet copy of a USV checkpoint, or
+    None if there is none or the USV changed since it was written (e.g. a
+    direct append), in which case readers must use the USV.
+    """
+    parquet_dir = parquet_path_for(usv_path)
+    stamp_path = parquet_dir / PARQUET_SOURCE_STAMP
+    try:
+        with open(stamp_path, "r") as f:
+            stamp = json.load(f)
+        if stamp != _usv_stamp(usv_path):
+            return None
+    except (OSError, ValueError):
+        return None
+    return str(parquet_dir / "**" / "*.parquet")
+
+
+def write_parquet_checkpoint(
+    usv_path: Path,
+    columns: Dict[str, str],
+    row_group_size: int = 100_000,
+    con: Optional[duckdb.DuckDBPyConnection] = None,
+) -> Optional[Path]:
+    """
+    Writes a typed, zstd-compressed Parquet copy of a headerless USV checkpoint.
+
+    Files are partitioned by place_id shard and sorted by place_id, so row group
+    min/max statistics (kept for every column, including place_id, state and
+    first_category) let DuckDB skip row groups on selective filters. The copy is
+    built in a temporary directory and swapped in, then stamped with the USV's
+    size and mtime; see fresh_parquet_glob.
+    """
+    if not usv_path.exists() or "place_id" not in columns:
+        return None
+
+    parquet_dir = parquet_path_for(usv_path)
+    tmp_dir = parquet_dir.with_name(parquet_dir.name + ".tmp")
+    old_dir = parquet_dir.with_name(parquet_dir.name + ".old")
+    for stale in (tmp_dir, old_dir):
+        if stale.exists():
+            shutil.rmtree(stale)
+
+    stamp = _usv_stamp(usv_path)
+    columns_def = ", ".join([f"\"{name}\": 'VARCHAR'" for name in columns])
+    cast_sql = ", ".join(
+        [f'TRY_CAST("{name}" AS {dtype}) as "{name}"' for name, dtype in columns.items()]
+    )
+    own_con = con is None
+    con = con or duckdb.connect(database=":memory:")
+    try:
+        con.execute(f"""
+            COPY (
+                SELECT *, {_PLACE_ID_SHARD_SQL} AS shard FROM (
+                    SELECT {cast_sql}
+                    FROM read_csv('{usv_path}', delim='\x1f', header=False, auto_detect=False,
+                                  columns={{{columns_def}}}, quote='', escape='',
+                                  null_padding=True)
+                )
+                WHERE place_id IS NOT NULL
+                ORDER BY place_id
+            ) TO '{tmp_dir}' (
+                FORMAT PARQUET, COMPRESSION ZSTD, PARTITION_BY (shard),
+                ROW_GROUP_SIZE {int(row_group_size)}
+            )
+        """)
+    except Exception as e:
+        logger.error(f"Parquet checkpoint for {usv_path} failed: {e}")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return None
+    finally:
+        if own_con:
+            con.close()
+
+    # The USV may have been appended to while it was being read
+    if _usv_stamp(usv_path) != stamp:
+        logger.warning(f"{usv_path} changed during the Parquet export; keeping the USV authoritative")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return None
+
+    with open(tmp_dir / PARQUET_SOURCE_STAMP, "w") as f:
+        json.dump(stamp, f)
+    if parquet_dir.exists():
+        os.replace(parquet_dir, old_dir)
+    os.replace(tmp_dir, parquet_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    logger.info(f"Parquet checkpoint written to {parquet_dir}")
+    return parquet_dir
 
 
 def load_usv_to_duckdb(
@@ -212,10 +324,14 @@ def load_usv_to_duckdb(
     table_name: str,
     usv_path: Path,
     datapackage_path: Optional[Path] = None,
+    prefer_parquet: bool = True,
 ) -> None:
     """
     FDPE ENFORCEMENT: Loads a headerless USV file into DuckDB using a
     datapackage.json (discovered or provided) as the authority.
+
+    If an up-to-date Parquet copy of the file exists (write_parquet_checkpoint),
+    the schema's columns are read from it instead of parsing the USV.
     """
     # 1. Discover datapackage if not provided
     dp_path = datapackage_path or find_datapackage(usv_path)
@@ -263,6 +379,9 @@ def load_usv_to_duckdb(
                 """)
             return
 
+        if columns and prefer_parquet and _load_parquet_copy(con, table_name, usv_path, columns):
+            return
+
         if columns:
             columns_def = ", ".join(
                 [f"\"{name}\": '{dtype}'" for name, dtype in columns.items()]
@@ -297,6 +416,29 @@ def load_usv_to_duckdb(
         raise
 
 
+def _load_parquet_copy(
+    con: duckdb.DuckDBPyConnection, table_name: str, usv_path: Path, columns: Dict[str, str]
+) -> bool:
+    parquet_glob = fresh_parquet_glob(usv_path)
+    if parquet_glob is None:
+        return False
+    cast_sql = ", ".join(
+        [f'TRY_CAST("{name}" AS {dtype}) as "{name}"' for name, dtype in columns.items()]
+    )
+    try:
+        con.execute(f"""
+            CREATE TABLE {table_name} AS
+            SELECT {cast_sql} FROM read_parquet('{parquet_glob}', hive_partitioning=False)
+        """)
+    except duckdb.Error as e:
+        # Schema drift between the Parquet copy and this datapackage: use the USV
+        logger.debug(f"Parquet copy of {usv_path} not usable for {table_name}: {e}")
+        con.execute(f"DROP TABLE IF EXISTS {table_name}")
+        return False
+    logger.debug(f"FDPE: Loaded {table_name} from Parquet copy of {usv_path}")
+    return True
+
+
 def load_from_datapackage(
     con: duckdb.DuckDBPyConnection, table_name: str, datapackage_path: Path
 ) -> None:
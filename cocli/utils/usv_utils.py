@@ -1,46 +1,175 @@
 import csv
-from typing import List, Iterable, Iterator, Any, Dict, Optional
+import io
+import os
+import re
+import mmap
+from typing import List, Iterable, Iterator, Any, Dict, Optional, Union
 
 from cocli.core.constants import UNIT_SEP
 
 # Use standard newline for compatibility with grep, sed, awk, wc
 RECORD_SEPARATOR = "\n"
 
+# Both LF and legacy RS (\x1e) terminate a record; runs of them are one boundary
+_RECORD_SPLIT = re.compile("[\n\x1e]")
+_RECORD_BYTES = re.compile(rb"[^\n\x1e]+")
+
+READ_CHUNK_SIZE = 1 << 20
+# Files at least this large are memory-mapped when read from a binary handle
+MMAP_THRESHOLD = 64 << 20
+
 
 class USVReader:
     """
-    A reader for Unit Separated Values (USV).
+    A streaming reader for Unit Separated Values (USV).
     Uses \x1f for fields and \n or \x1e for records.
+
+    Reads incrementally in chunks (or through `mmap` for large binary files), so
+    memory stays constant regardless of file size. For binary sources, `tell()`
+    returns the byte offset just past the last record yielded and `seek()` resumes
+    from a byte offset.
     """
 
-    def __init__(self, f: Any):
+    def __init__(
+        self,
+        f: Any,
+        offset: Optional[int] = None,
+        use_mmap: Optional[bool] = None,
+        chunk_size: int = READ_CHUNK_SIZE,
+    ):
         self.f = f
-        self.content = f.read()
-        if isinstance(self.content, str):
-            content_bytes = self.content.encode("utf-8", errors="replace")
+        self.chunk_size = chunk_size
+        self._mmap: Optional[mmap.mmap] = None
+        self._owns_file = False
+        self._binary = isinstance(f, (io.RawIOBase, io.BufferedIOBase)) or (
+            "b" in getattr(f, "mode", "")
+        )
+
+        if self._binary:
+            start = offset if offset is not None else f.tell()
+            if use_mmap is not False:
+                self._mmap = self._try_mmap(f, force=bool(use_mmap))
         else:
-            content_bytes = self.content
-        normalized = normalize_usv_record_separators(content_bytes)
-        self.records = [r for r in normalized.split("\n") if r.strip()]
-        self._iterator = iter(self.records)
+            if offset is not None:
+                raise ValueError("Byte offsets require a binary file handle")
+            start = 0
 
-    def __iter__(self) -> Iterator[List[str]]:
-        for line in self._iterator:
-            clean_line = line.strip()
+        self._offset: Optional[int] = start if self._binary else None
+        self._rows = self._iter_rows(start)
+
+    @classmethod
+    def open(
+        cls, path: Union[str, "os.PathLike[str]"], offset: int = 0, use_mmap: Optional[bool] = None
+    ) -> "USVReader":
+        """Opens a file in binary mode for streaming; use as a context manager."""
+        reader = cls(open(path, "rb"), offset=offset, use_mmap=use_mmap)
+        reader._owns_file = True
+        return reader
+
+    @staticmethod
+    def _try_mmap(f: Any, force: bool) -> Optional[mmap.mmap]:
+        try:
+            size = os.fstat(f.fileno()).st_size
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return None
+        if size == 0 or (not force and size < MMAP_THRESHOLD):
+            return None
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+    def _iter_records(self, start: int) -> Iterator[str]:
+        if self._mmap is not None:
+            size = len(self._mmap)
+            for m in _RECORD_BYTES.finditer(self._mmap, start):
+                self._offset = min(m.end() + 1, size)
+                yield m.group().decode("utf-8", errors="replace")
+            return
+
+        if self._binary:
+            if start != self.f.tell():
+                self.f.seek(start)
+            base = start
+            tail = b""
+            while True:
+                chunk = self.f.read(self.chunk_size)
+                if not chunk:
+                    break
+                buf = tail + chunk
+                end = max(buf.rfind(b"\n"), buf.rfind(b"\x1e"))
+                if end == -1:
+                    tail = buf
+                    continue
+                for m in _RECORD_BYTES.finditer(buf, 0, end):
+                    self._offset = base + m.end() + 1
+                    yield m.group().decode("utf-8", errors="replace")
+                base += end + 1
+                tail = buf[end + 1 :]
+            if tail:
+                self._offset = base + len(tail)
+                yield tail.decode("utf-8", errors="replace")
+            return
+
+        tail_str = ""
+        while True:
+            text_chunk = self.f.read(self.chunk_size)
+            if not text_chunk:
+                break
+            if isinstance(text_chunk, bytes):
+                text_chunk = text_chunk.decode("utf-8", errors="replace")
+            parts = _RECORD_SPLIT.split(tail_str + text_chunk)
+            tail_str = parts.pop()
+            for part in parts:
+                if part:
+                    yield part
+        if tail_str:
+            yield tail_str
+
+    def _iter_rows(self, start: int) -> Iterator[List[str]]:
+        for record in self._iter_records(start):
+            clean_line = record.strip()
             if clean_line:
                 yield clean_line.split(UNIT_SEP)
 
+    def __iter__(self) -> Iterator[List[str]]:
+        return self
+
     def __next__(self) -> List[str]:
-        return next(iter(self))
+        return next(self._rows)
+
+    def tell(self) -> Optional[int]:
+        """Byte offset just past the last record yielded (binary sources only)."""
+        return self._offset
+
+    def seek(self, offset: int) -> None:
+        """Restarts iteration at a byte offset (binary sources only)."""
+        if not self._binary:
+            raise ValueError("Byte offsets require a binary file handle")
+        self._offset = offset
+        self._rows = self._iter_rows(offset)
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._owns_file:
+            self.f.close()
+
+    def __enter__(self) -> "USVReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
 
 class USVDictReader:
     """
-    A DictReader for USV.
+    A DictReader for USV, streaming on top of USVReader.
     """
 
-    def __init__(self, f: Iterable[str], fieldnames: Optional[List[str]] = None):
-        self.reader = USVReader(f)
+    def __init__(self, f: Any, fieldnames: Optional[List[str]] = None, **reader_kwargs: Any):
+        self.reader = f if isinstance(f, USVReader) else USVReader(f, **reader_kwargs)
         self.fieldnames = fieldnames
         self._first_row_read = False
         self._gen = self._get_gen()
@@ -0,0 +1,89 @@
+import asyncio
+import time
+
+import typer
+from playwright.async_api import async_playwright
+from rich.console import Console
+from rich.table import Table
+
+from cocli.utils.browser_manager import BrowserContextPool, chromium_max_rss_mb
+
+console = Console()
+app = typer.Typer()
+
+PAGE_HTML = "<html><body>" + "<p>benchmark</p>" * 200 + "</body></html>"
+
+
+async def _task(page) -> None:  # type: ignore[no-untyped-def]
+    await page.set_content(PAGE_HTML)
+    await page.evaluate("document.querySelectorAll('p').length")
+
+
+async def _run(tasks: int, workers: int, max_uses: int) -> Table:
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            queue: asyncio.Queue[int] = asyncio.Queue()
+
+            async def fresh_worker() -> None:
+                while not queue.empty():
+                    queue.get_nowait()
+                    context = await browser.new_context()
+                    try:
+                        await _task(await context.new_page())
+                    finally:
+                        await context.close()
+
+            for i in range(tasks):
+                queue.put_nowait(i)
+            start = time.perf_counter()
+            await asyncio.gather(*(fresh_worker() for _ in range(workers)))
+            fresh_elapsed = time.perf_counter() - start
+            fresh_rss = chromium_max_rss_mb()
+
+            pool = BrowserContextPool(browser, size=workers, max_uses=max_uses)
+            await pool.start()
+
+            async def pooled_worker() -> None:
+                while not queue.empty():
+                    queue.get_nowait()
+                    async with pool.page() as page:
+                        await _task(page)
+
+            for i in range(tasks):
+                queue.put_nowait(i)
+            start = time.perf_counter()
+            await asyncio.gather(*(pooled_worker() for _ in range(workers)))
+            pooled_elapsed = time.perf_counter() - start
+            pooled_rss = chromium_max_rss_mb()
+            await pool.close()
+        finally:
+            await browser.close()
+
+    table = Table(title=f"Browser contexts ({tasks} tasks, {workers} workers, max_uses={max_uses})")
+    table.add_column("Strategy")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Tasks/s", justify="right")
+    table.add_column("Max Chromium RSS (MB)", justify="right")
+    table.add_column("Contexts created", justify="right")
+    table.add_row("New context per task", f"{fresh_elapsed:.2f}", f"{tasks / fresh_elapsed:,.1f}",
+                  f"{fresh_rss:.0f}", str(tasks))
+    table.add_row("BrowserContextPool", f"{pooled_elapsed:.2f}", f"{tasks / pooled_elapsed:,.1f}",
+                  f"{pooled_rss:.0f}", str(pool.metrics.created))
+    return table
+
+
+@app.command()
+def main(
+    tasks: int = typer.Option(200, "--tasks", help="Page tasks to run per strategy."),
+    workers: int = typer.Option(4, "--workers", help="Concurrent worker loops."),
+    max_uses: int = typer.Option(50, "--max-uses", help="Leases before a pooled context is recycled."),
+) -> None:
+    """
+    Compares a fresh browser context per task against leases from a BrowserContextPool.
+    """
+    console.print(asyncio.run(_run(tasks, workers, max_uses)))
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,68 @@
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from cocli.core.campaign_stats import CampaignStatsStore, record_queue_event
+from cocli.core.paths import paths
+
+console = Console()
+app = typer.Typer()
+
+CAMPAIGN = "benchmark"
+
+
+def _write_tasks(tasks: int, completed: int) -> None:
+    pending = paths.queue(CAMPAIGN, "enrichment").pending
+    for n in range(tasks):
+        task_dir = pending / f"{n % 256:02x}" / f"task-{n}"
+        task_dir.mkdir(parents=True, exist_ok=True)
+        (task_dir / "task.json").write_text("{}")
+        if n % 10 == 0:
+            (task_dir / "lease.json").write_text("{}")
+    done = paths.queue(CAMPAIGN, "enrichment").completed
+    done.mkdir(parents=True, exist_ok=True)
+    for n in range(completed):
+        (done / f"task-{n}.json").write_text("{}")
+
+
+@app.command()
+def main(
+    tasks: int = typer.Option(50_000, "--tasks", help="Pending enrichment tasks on disk."),
+    completed: int = typer.Option(50_000, "--completed", help="Completed enrichment tasks on disk."),
+    events: int = typer.Option(5_000, "--events", help="Queue events journaled since the last recount."),
+) -> None:
+    """
+    Reading campaign status from the stats store (snapshot plus journal tail)
+    vs recounting every queue tree the way each status call used to.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir, patch.object(type(paths), "root", Path(tmp_dir)):
+        _write_tasks(tasks, completed)
+        store = CampaignStatsStore(CAMPAIGN)
+
+        start = time.perf_counter()
+        store.recount([])
+        recount = time.perf_counter() - start
+
+        for _ in range(events):
+            record_queue_event(CAMPAIGN, "enrichment", pending=-1, completed=1)
+
+        start = time.perf_counter()
+        counts = store.read()
+        read = time.perf_counter() - start
+        assert counts is not None
+
+    table = Table(title=f"Campaign status ({tasks:,} pending, {completed:,} completed, {events:,} journaled events)")
+    table.add_column("Step")
+    table.add_column("Time (s)", justify="right")
+    table.add_row("Full recount (os.walk + stat per completed file)", f"{recount:.3f}")
+    table.add_row("Read: snapshot + journal tail", f"{read:.4f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,73 @@
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+from unittest.mock import patch
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from cocli.core import cache
+from cocli.core.paths import paths
+
+console = Console()
+app = typer.Typer()
+
+
+def _populate(companies: int) -> None:
+    for i in range(companies):
+        company_dir = paths.companies / f"company-{i}"
+        company_dir.mkdir(parents=True, exist_ok=True)
+        (company_dir / "_index.md").write_text(
+            f"---\nname: Company {i}\ndomain: company{i}.example.com\n"
+            f"email: info@company{i}.example.com\nphone: '+15551234567'\n"
+            f"tags:\n  - roofing\n  - benchmark\n---\n\nNotes for company {i}.\n"
+        )
+        (company_dir / "tags.lst").write_text("roofing\nbenchmark\n")
+
+
+def _time(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+@app.command()
+def main(
+    companies: int = typer.Option(10000, "--companies", help="Number of company directories to generate."),
+    edits: int = typer.Option(10, "--edits", help="Companies edited in place before the incremental build."),
+) -> None:
+    """
+    Times a full company_cache build against the manifest-driven incremental
+    build after a handful of in-place edits, plus the validity check itself.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        paths.root = Path(tmp)
+        try:
+            with patch("cocli.core.cache.get_cocli_base_dir", return_value=Path(tmp)):
+                _populate(companies)
+                full = _time(lambda: cache.build_cache(campaign="benchmark", full=True))
+                check = _time(lambda: cache.is_cache_valid(campaign="benchmark"))
+                noop = _time(lambda: cache.build_cache(campaign="benchmark"))
+
+                for i in range(edits):
+                    index = paths.companies / f"company-{i}" / "_index.md"
+                    index.write_text(index.read_text().replace("Notes", "Edited notes"))
+                stale = not cache.is_cache_valid(campaign="benchmark")
+                incremental = _time(lambda: cache.build_cache(campaign="benchmark"))
+        finally:
+            del paths.root
+
+    table = Table(title=f"company_cache build ({companies:,} companies, {edits} edited)")
+    table.add_column("Operation")
+    table.add_column("Time (s)", justify="right")
+    table.add_row("Full build", f"{full:.3f}")
+    table.add_row("is_cache_valid (signature scan)", f"{check:.3f}")
+    table.add_row("No-op build", f"{noop:.3f}")
+    table.add_row(f"Incremental build (stale detected: {stale})", f"{incremental:.3f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from cocli.core.company_loader import LoadStats, company_dirs, load_companies
+from cocli.core.paths import paths
+from cocli.core.wal import append_update
+from cocli.models.companies.company import Company
+
+console = Console()
+app = typer.Typer()
+
+
+def _populate(companies: int, updates: int) -> None:
+    for i in range(companies):
+        company_dir = paths.companies / f"company-{i:06d}"
+        company_dir.mkdir(parents=True, exist_ok=True)
+        (company_dir / "_index.md").write_text(
+            f"---\nname: Company {i}\ndomain: company{i}.example.com\nwebsite_url: https://company{i}.example.com/\n"
+            f"email: info@company{i}.example.com\nfull_address: {i} Main St, Austin, TX 78701\n"
+            f"categories:\n  - Roofing contractor\n  - Gutter service\nreviews_count: {i % 400}\n"
+            f"average_rating: 4.6\n---\n\nNotes for company {i}.\n"
+        )
+        (company_dir / "tags.lst").write_text("roofing\nbenchmark\n")
+    for i in range(updates):
+        append_update(paths.companies / f"company-{i % companies:06d}", "phone_number", "+15125550100", "benchmark")
+
+
+@app.command()
+def main(
+    companies: int = typer.Option(5000, "--companies", help="Number of company directories to generate."),
+    updates: int = typer.Option(2000, "--updates", help="WAL updates spread over the companies."),
+    workers: int = typer.Option(os.cpu_count() or 1, "--workers", help="Processes for the parallel run."),
+) -> None:
+    """
+    Reports companies/sec for the previous serial Company.from_directory loop
+    against load_companies in-process and with a process pool.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        paths.root = Path(tmp)
+        try:
+            _populate(companies, updates)
+            dirs = company_dirs()
+
+            start = time.perf_counter()
+            legacy: List[Company] = [c for c in (Company.from_directory(d) for d in dirs) if c]
+            legacy_elapsed = time.perf_counter() - start
+
+            serial = LoadStats()
+            list(load_companies(dirs, workers=1, stats=serial))
+            parallel = LoadStats()
+            list(load_companies(dirs, workers=workers, stats=parallel))
+        finally:
+            del paths.root
+
+    table = Table(title=f"Company loading ({companies:,} companies, {updates:,} WAL updates)")
+    table.add_column("Loader")
+    table.add_column("Workers", justify="right")
+    table.add_column("Loaded", justify="right")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Companies/s", justify="right")
+    table.add_row("from_directory per dir", "1", f"{len(legacy):,}", f"{legacy_elapsed:.3f}",
+                  f"{len(dirs) / legacy_elapsed:,.0f}")
+    for label, stats in (("load_companies (in-process)", serial), ("load_companies (pool)", parallel)):
+        table.add_row(label, str(stats.workers), f"{stats.loaded:,}", f"{stats.elapsed:.3f}",
+                      f"{stats.companies_per_sec:,.0f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
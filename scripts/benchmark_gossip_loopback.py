@@ -0,0 +1,153 @@
+import socket
+import tempfile
+import time
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from cocli.core.environment import get_environment
+from cocli.core.gossip_batch import DEFAULT_MTU
+from cocli.core.gossip_bridge import GossipBridge
+from cocli.core.paths import paths
+from cocli.models.wal.record import DatagramRecord
+
+console = Console()
+app = typer.Typer()
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(("127.0.0.1", 0))
+        port: int = s.getsockname()[1]
+        return port
+
+
+def _write_journal(node_id: str, count: int) -> Path:
+    journal = paths.wal_journal(node_id)
+    journal.parent.mkdir(parents=True, exist_ok=True)
+    environment = get_environment().value
+    now = datetime.now(UTC).isoformat()
+    with open(journal, "w") as f:
+        for i in range(count):
+            f.write(DatagramRecord(
+                timestamp=now,
+                node_id=node_id,
+                campaign_name="benchmark",
+                environment=environment,
+                target=f"companies/company-{i}",
+                field="website_url",
+                value=f"https://company-{i}.example.com/",
+            ).to_usv())
+    return journal
+
+
+def _run(records: int, mtu: int, compress: bool, rate: float, timeout: float) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        paths.root = Path(tmp)
+        try:
+            port_a, port_b = _free_port(), _free_port()
+            sender = GossipBridge(node_id="bench-a", port=port_a, mtu=mtu, compress=compress, rate_bytes_per_sec=rate)
+            receiver = GossipBridge(node_id="bench-b", port=port_b)
+            receiver.start(discover=False)
+            sender.start(discover=False)
+            sender.peers["bench-b"] = f"127.0.0.1:{port_b}"
+
+            journal = _write_journal("bench-a", records)
+            size = journal.stat().st_size
+
+            start = time.perf_counter()
+            while sender._sent_offsets.get(str(journal), 0) < size:
+                sender.broadcast_file(journal)
+                time.sleep(0.001)
+
+            # Wait for delivery; stop once nothing has arrived for a while
+            last_count, last_progress = -1, time.perf_counter()
+            while receiver.stats["records_received"] < records:
+                count = receiver.stats["records_received"]
+                if count != last_count:
+                    last_count, last_progress = count, time.perf_counter()
+                elif time.perf_counter() - last_progress > timeout:
+                    break
+                time.sleep(0.001)
+            # Stalled runs are timed up to the last delivered record
+            done = time.perf_counter() if receiver.stats["records_received"] >= records else last_progress
+            elapsed = done - start
+
+            # Anti-entropy: pull whatever UDP dropped over the TCP side-channel
+            receiver.peers["bench-a"] = f"127.0.0.1:{port_a}"
+            sync_start = time.perf_counter()
+            pulled = receiver.reconcile("bench-a")
+            sync_elapsed = time.perf_counter() - sync_start
+
+            receiver.remote_writer.flush()
+            sender.stop()
+            receiver.stop()
+
+            stored = paths.wal_remote_journal("bench-a")
+            written = stored.read_bytes().count(b"\x1e") if stored.exists() else 0
+            return {
+                "elapsed": elapsed,
+                "datagrams": sender.stats["datagrams_sent"],
+                "received": receiver.stats["records_received"],
+                "written": written,
+                "gaps": receiver.stats["sequence_gaps"],
+                "pulled": pulled,
+                "sync_elapsed": sync_elapsed,
+                "bytes": size,
+            }
+        finally:
+            del paths.root
+
+
+@app.command()
+def main(
+    records: int = typer.Option(20000, "--records", help="Number of WAL records to gossip."),
+    mtu: int = typer.Option(DEFAULT_MTU, "--mtu", help="Datagram budget in bytes for the batched runs."),
+    rate: float = typer.Option(0, "--rate", help="Per-peer rate limit in bytes/sec (0 = unlimited)."),
+    no_compress: bool = typer.Option(False, "--no-compress", help="Skip the compressed run."),
+    timeout: float = typer.Option(2.0, "--timeout", help="Seconds without progress before a run is called done."),
+) -> None:
+    """
+    Gossips a journal between two GossipBridges on 127.0.0.1 and reports records/sec
+    for one-record-per-datagram framing versus MTU-packed batches, then how many
+    dropped records one anti-entropy round pulls back.
+    """
+    runs: List[Tuple[str, int, bool]] = [
+        ("one record per datagram", 0, False),
+        (f"batched (mtu {mtu})", mtu, False),
+    ]
+    if not no_compress:
+        runs.append((f"batched + zlib (mtu {mtu})", mtu, True))
+
+    table = Table(title=f"Gossip loopback benchmark ({records} records)")
+    table.add_column("Framing")
+    table.add_column("Datagrams", justify="right")
+    table.add_column("Received", justify="right")
+    table.add_column("Gaps", justify="right")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Records/s", justify="right")
+    table.add_column("Pulled", justify="right")
+    table.add_column("Pull (s)", justify="right")
+    table.add_column("Written", justify="right")
+    for label, run_mtu, compress in runs:
+        result = _run(records, run_mtu, compress, rate, timeout)
+        table.add_row(
+            label,
+            f"{result['datagrams']:,.0f}",
+            f"{result['received']:,.0f}",
+            f"{result['gaps']:,.0f}",
+            f"{result['elapsed']:.3f}",
+            f"{result['received'] / result['elapsed']:,.0f}",
+            f"{result['pulled']:,.0f}",
+            f"{result['sync_elapsed']:.3f}",
+            f"{result['written']:,.0f}",
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
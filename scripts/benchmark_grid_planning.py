@@ -0,0 +1,105 @@
+import math
+import random
+import time
+from typing import Any, Dict, List
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from cocli.core.sharding import get_grid_tile_id
+from cocli.planning.generate_grid import TilePlan, tile_ids_to_keys
+
+console = Console()
+app = typer.Typer()
+
+
+def _legacy_grid(center_lat: float, center_lon: float, radius_miles: float) -> List[Dict[str, Any]]:
+    """The nested while-loop generator generate_global_grid used before integer tile keys."""
+    lat_buffer_deg = radius_miles / 69.0
+    lon_buffer_deg = radius_miles / (69.0 * math.cos(math.radians(center_lat)))
+    max_lat, max_lon = center_lat + lat_buffer_deg, center_lon + lon_buffer_deg
+    start_lon = math.floor(round(center_lon - lon_buffer_deg, 6) * 10) / 10.0
+    current_lat = math.floor(round(center_lat - lat_buffer_deg, 6) * 10) / 10.0
+    tiles = []
+    while current_lat <= max_lat:
+        current_lon = start_lon
+        while current_lon <= max_lon:
+            tile_center_lat = round(current_lat + 0.05, 6)
+            tile_center_lon = round(current_lon + 0.05, 6)
+            d_lat = (tile_center_lat - center_lat) * 69.0
+            d_lon = (tile_center_lon - center_lon) * 69.0 * math.cos(math.radians(center_lat))
+            if math.sqrt(d_lat**2 + d_lon**2) <= radius_miles + 7.0:
+                tiles.append({
+                    "id": get_grid_tile_id(current_lat, current_lon),
+                    "south_west_lat": round(current_lat, 6),
+                    "south_west_lon": round(current_lon, 6),
+                    "north_east_lat": round(current_lat + 0.1, 6),
+                    "north_east_lon": round(current_lon + 0.1, 6),
+                    "center_lat": tile_center_lat,
+                    "center_lon": tile_center_lon,
+                    "step_deg": 0.1,
+                    "est_width_miles": round(0.1 * 69.0 * math.cos(math.radians(center_lat)), 2),
+                    "est_height_miles": 6.9,
+                })
+            current_lon = round(current_lon + 0.1, 6)
+        current_lat = round(current_lat + 0.1, 6)
+    return tiles
+
+
+@app.command()
+def main(
+    locations: int = typer.Option(2000, "--locations", help="Target locations (spread over several states)."),
+    radius: float = typer.Option(25.0, "--radius", help="Proximity radius in miles."),
+    covered: float = typer.Option(0.6, "--covered", help="Fraction of tiles with a witness."),
+) -> None:
+    """
+    Compares the per-location dict generator + seen-set dedup and per-tile
+    coverage lookups against integer tile keys and set-difference diffing.
+    """
+    rng = random.Random(42)
+    targets: List[Dict[str, Any]] = [{"name": f"t{i}", "lat": rng.uniform(29.0, 36.0), "lon": rng.uniform(-106.0, -90.0)}
+               for i in range(locations)]
+
+    start = time.perf_counter()
+    legacy_tiles: List[Dict[str, Any]] = []
+    seen = set()
+    for loc in targets:
+        for tile in _legacy_grid(loc["lat"], loc["lon"], radius):
+            if tile["id"] not in seen:
+                legacy_tiles.append(tile)
+                seen.add(tile["id"])
+    legacy_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    plan = TilePlan.for_locations(targets, radius)
+    plan_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    streamed = sum(1 for _ in plan)
+    stream_elapsed = time.perf_counter() - start
+    assert streamed == len(legacy_tiles)
+
+    witness_ids = [t["id"] for t in legacy_tiles if rng.random() < covered]
+    start = time.perf_counter()
+    witness_set = set(witness_ids)
+    legacy_pending = [t for t in legacy_tiles if t["id"] not in witness_set]
+    legacy_diff_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pending = plan.uncovered(tile_ids_to_keys(witness_ids))
+    diff_elapsed = time.perf_counter() - start
+    assert int(pending.sum()) == len(legacy_pending)
+
+    table = Table(title=f"Grid planning ({locations:,} locations, {radius} mi, {len(plan):,} unique tiles)")
+    table.add_column("Step")
+    table.add_column("Legacy (s)", justify="right")
+    table.add_column("Tile keys (s)", justify="right")
+    table.add_row("Generate + dedup", f"{legacy_elapsed:.3f}", f"{plan_elapsed:.3f}")
+    table.add_row("Build tile dicts (streamed)", "", f"{stream_elapsed:.3f}")
+    table.add_row(f"Diff against {len(witness_ids):,} witnesses", f"{legacy_diff_elapsed:.3f}", f"{diff_elapsed:.3f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
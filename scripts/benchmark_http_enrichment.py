@@ -0,0 +1,122 @@
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+import typer
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from rich.console import Console
+from rich.table import Table
+
+from cocli.core.paths import paths
+from cocli.enrichment.http_fast_path import HttpFetcher
+from cocli.models.companies.website import Website
+from cocli.enrichment.website_scraper import WebsiteScraper
+
+console = Console()
+app = typer.Typer()
+
+NAV = '<nav><a href="/about-us">About Us</a> <a href="/contact">Contact</a> <a href="/services">Services</a></nav>'
+BODY = "<p>Family owned contractor serving the area since 1987. Licensed, bonded and insured.</p>" * 5
+SPA = '<html><head><script src="/app.js"></script></head><body><div id="root"></div></body></html>'
+
+
+def _site_app(static_ratio: float, sites: int, latency_ms: int) -> web.Application:
+    """Synthetic small-business sites keyed by Host; a share of them are JS-rendered shells."""
+    static_sites = int(sites * static_ratio)
+
+    async def handler(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency_ms / 1000)
+        site = int(request.host.split(":")[0].rsplit(".", 1)[1]) - 1
+        if site >= static_sites:
+            return web.Response(text=SPA, content_type="text/html")
+        if request.path == "/sitemap.xml":
+            raise web.HTTPNotFound()
+        email = f"<p>Office: info@site{site}.test</p>" if request.path == "/contact" else ""
+        html = f"<html><head><title>Site {site} | Roofing</title></head><body>{NAV}<main>{BODY}{email}</main></body></html>"
+        return web.Response(text=html, content_type="text/html")
+
+    application = web.Application()
+    application.router.add_get("/{tail:.*}", handler)
+    return application
+
+
+async def _run(sites: int, static_ratio: float, latency_ms: int, concurrency: int, per_host: int, browser: bool) -> Table:
+    server = TestServer(_site_app(static_ratio, sites, latency_ms), host="0.0.0.0")
+    await server.start_server()
+    domains = [f"127.0.0.{i + 1}:{server.port}" for i in range(sites)]
+    table = Table(title=f"Website enrichment ({sites} sites, {static_ratio:.0%} static, {latency_ms}ms latency)")
+    table.add_column("Mode")
+    table.add_column("Served over HTTP", justify="right")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Domains/s", justify="right")
+
+    async def enrich_all(worker: "asyncio.Queue[str]", run_one) -> float:  # type: ignore[no-untyped-def]
+        for domain in domains:
+            worker.put_nowait(domain)
+
+        async def loop() -> None:
+            while not worker.empty():
+                await run_one(worker.get_nowait())
+
+        start = time.perf_counter()
+        await asyncio.gather(*(loop() for _ in range(concurrency)))
+        return time.perf_counter() - start
+
+    try:
+        async with HttpFetcher(per_host=per_host) as fetcher:
+            scraper = WebsiteScraper(processed_by="benchmark", http_fetcher=fetcher)
+
+            async def http_first(domain: str) -> None:
+                await scraper._scrape_over_http(fetcher, domain, Website(url=domain), False, None, 30000, None)
+
+            elapsed = await enrich_all(asyncio.Queue(), http_first)
+            table.add_row("HTTP fast path", f"{fetcher.stats.fast_path_rate:.0%}", f"{elapsed:.2f}", f"{sites / elapsed:,.1f}")
+
+        if browser:
+            from playwright.async_api import async_playwright
+            from cocli.utils.browser_manager import BrowserContextPool
+
+            async with async_playwright() as p:
+                chromium = await p.chromium.launch(headless=True)
+                async with BrowserContextPool(chromium, size=concurrency) as pool:
+                    browser_scraper = WebsiteScraper(processed_by="benchmark")
+
+                    async def browser_only(domain: str) -> None:
+                        async with pool.context() as context:
+                            await browser_scraper._scrape_with_context(context, domain, Website(url=domain), False, None, 30000, None)
+
+                    elapsed = await enrich_all(asyncio.Queue(), browser_only)
+                await chromium.close()
+            table.add_row("Browser only", "0%", f"{elapsed:.2f}", f"{sites / elapsed:,.1f}")
+    finally:
+        await server.close()
+    return table
+
+
+@app.command()
+def main(
+    sites: int = typer.Option(200, "--sites", help="Synthetic sites (each on its own 127.0.0.x host)."),
+    static_ratio: float = typer.Option(0.8, "--static-ratio", help="Share of sites that render without JS."),
+    latency_ms: int = typer.Option(50, "--latency-ms", help="Simulated server latency per request."),
+    concurrency: int = typer.Option(8, "--concurrency", help="Concurrent enrichment loops."),
+    per_host: int = typer.Option(4, "--per-host", help="Concurrent requests per host."),
+    browser: bool = typer.Option(False, "--browser", help="Also time the browser-only path (needs Chromium)."),
+    root: Optional[Path] = typer.Option(None, "--root", help="Data root for witnesses (default: a temp dir)."),
+) -> None:
+    """
+    Reports domains/s and the fast-path share for HTTP-first enrichment against synthetic sites.
+    """
+    sites = min(sites, 254)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths.root = root or Path(tmp)
+        try:
+            console.print(asyncio.run(_run(sites, static_ratio, latency_ms, concurrency, per_host, browser)))
+        finally:
+            del paths.root
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,82 @@
+import csv
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from cocli.core.lookup_index import GoogleMapsLookupIndex
+
+console = Console()
+app = typer.Typer()
+
+
+def _scan(source_dir: Path, slug: str, domain: Optional[str]) -> Optional[Dict[str, Any]]:
+    """The per-company CSV scan GoogleMapsCompiler used before the index."""
+    for csv_file in source_dir.glob("*.csv"):
+        with open(csv_file, "r") as f:
+            for row in csv.DictReader(f):
+                row_slug = row.get("slug") or row.get("Slug")
+                row_domain = row.get("domain") or row.get("Domain")
+                if row_slug == slug or (domain and row_domain == domain):
+                    return row
+    return None
+
+
+@app.command()
+def main(
+    rows: int = typer.Option(20000, "--rows", help="Rows across the google_maps_prospects CSVs."),
+    files: int = typer.Option(10, "--files", help="Number of CSV files."),
+    lookups: int = typer.Option(200, "--lookups", help="Companies looked up (half of them miss)."),
+) -> None:
+    """
+    Compares per-company CSV scans against the persisted slug/domain lookup index.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "google_maps_prospects"
+        source.mkdir()
+        per_file = rows // files
+        for n in range(files):
+            with open(source / f"prospects_{n:02d}.csv", "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=["Name", "slug", "Domain", "Place ID"])
+                writer.writeheader()
+                for i in range(n * per_file, (n + 1) * per_file):
+                    writer.writerow({"Name": f"Company {i}", "slug": f"company-{i}",
+                                     "Domain": f"company{i}.test", "Place ID": f"ChIJ{i:020d}"})
+        queries = [(f"company-{(i * 7919) % (rows * 2)}", None) for i in range(lookups)]
+
+        start = time.perf_counter()
+        scanned = [_scan(source, slug, domain) for slug, domain in queries]
+        scan_elapsed = time.perf_counter() - start
+
+        state = Path(tmp) / "lookup.json"
+        start = time.perf_counter()
+        index = GoogleMapsLookupIndex(source, state)
+        index.load()
+        build_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reloaded = GoogleMapsLookupIndex(source, state)
+        reloaded.load()
+        load_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed = [reloaded.first(slug=slug, domain=domain) for slug, domain in queries]
+        lookup_elapsed = time.perf_counter() - start
+        assert indexed == scanned
+
+    table = Table(title=f"Google Maps fallback lookups ({rows:,} rows in {files} CSVs, {lookups} companies)")
+    table.add_column("Step")
+    table.add_column("Time (s)", justify="right")
+    table.add_row("CSV scan per company", f"{scan_elapsed:.3f}")
+    table.add_row("Index build (first run)", f"{build_elapsed:.3f}")
+    table.add_row("Index load (persisted)", f"{load_elapsed:.3f}")
+    table.add_row("Index lookups", f"{lookup_elapsed:.5f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
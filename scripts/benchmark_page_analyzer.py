@@ -0,0 +1,120 @@
+import re
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import typer
+from bs4 import BeautifulSoup
+from rich.console import Console
+from rich.table import Table
+
+from cocli.core.paths import paths
+from cocli.enrichment.page_analyzer import analyze_page
+
+console = Console()
+app = typer.Typer()
+
+KEYWORDS = [
+    "roofing", "roof repair", "gutters", "siding", "insulation", "flooring", "hardwood", "tile",
+    "carpet", "installation", "commercial", "residential", "free estimate", "financing", "warranty",
+    "licensed", "insured", "emergency", "storm damage", "inspection",
+]
+
+
+def _legacy(html: str, keywords: List[str]) -> Tuple[Dict[str, str], List[str], List[str]]:
+    """The per-page BeautifulSoup extraction WebsiteScraper ran before the analyzer."""
+    soup = BeautifulSoup(html, "html.parser")
+    text = soup.get_text(separator=" ", strip=True).lower()
+    found = [k for k in keywords if k.lower() in text]
+
+    tech = set()
+    generator = soup.find("meta", attrs={"name": "generator"})
+    if generator and (content := generator.get("content")):
+        tech.add(str(content).strip())
+    html_str = str(soup).lower()
+    for signature, name in (("wp-content", "WordPress"), ("shopify", "Shopify"), ("wix.com", "Wix"),
+                            ("squarespace", "Squarespace"), ("wsimg.com", "GoDaddy Website Builder")):
+        if signature in html_str:
+            tech.add(name)
+
+    emails: Dict[str, str] = {}
+    for link in soup.find_all("a", href=re.compile(r"^mailto:", re.I)):
+        href = link.get("href")
+        if not isinstance(href, str):
+            continue
+        m = re.search(r"mailto:([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})", href, re.I)
+        if m:
+            email = m.group(1).lower()
+            label = link.get_text(strip=True)
+            if label and email not in label.lower() and len(label) < 60:
+                emails[email] = label
+            elif email not in emails:
+                emails[email] = ""
+    text_content = soup.get_text(separator=" ")
+    for match in re.finditer(r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})", text_content):
+        email = match.group(1).lower()
+        if email not in emails or not emails[email]:
+            prefix = text_content[max(0, match.start() - 40) : match.start()].strip()
+            label_match = re.search(r"([a-zA-Z]{3,20}(?:\s+[a-zA-Z]{3,20})?)\s*[:\-]\s*$", prefix)
+            if label_match:
+                emails[email] = label_match.group(1).strip()
+            elif email not in emails:
+                emails[email] = ""
+    for email in re.findall(r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b", html):
+        emails.setdefault(email.lower(), "")
+    return emails, sorted(tech), found
+
+
+def _witness_files(html_dir: Optional[Path]) -> List[Path]:
+    if html_dir:
+        return sorted(html_dir.rglob("*.html"))
+    files = sorted(paths.campaigns.glob("*/raw/enrichment/**/witness.html")) if paths.campaigns.exists() else []
+    return files or sorted(Path("tests/data/websites").rglob("*.html"))
+
+
+@app.command()
+def main(
+    html_dir: Optional[Path] = typer.Option(None, "--html-dir", help="HTML to analyze (default: saved RawWebsiteWitness captures)."),
+    repeat: int = typer.Option(20, "--repeat", help="Passes over the pages."),
+) -> None:
+    """
+    Times the single-pass page analyzer against the previous BeautifulSoup
+    extraction on saved website HTML and reports where their results differ.
+    """
+    pages = [f.read_text(encoding="utf-8", errors="replace") for f in _witness_files(html_dir)]
+    if not pages:
+        console.print("[red]No HTML found.[/red]")
+        raise typer.Exit(1)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        legacy = [_legacy(html, KEYWORDS) for html in pages]
+    legacy_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        analyses = [analyze_page(html, KEYWORDS) for html in pages]
+    analyzer_elapsed = time.perf_counter() - start
+
+    differing = {"emails": 0, "labels": 0, "tech": 0, "keywords": 0}
+    for (emails, tech, keywords), analysis in zip(legacy, analyses):
+        differing["emails"] += set(emails) != set(analysis.emails)
+        differing["labels"] += emails != analysis.emails
+        differing["tech"] += tech != analysis.tech
+        # The analyzer also matches keywords split across elements by whitespace
+        differing["keywords"] += not set(keywords) <= set(analysis.keywords)
+
+    total_mb = sum(len(html) for html in pages) * repeat / 1e6
+    table = Table(title=f"Page extraction ({len(pages)} pages x {repeat}, {len(KEYWORDS)} keywords)")
+    table.add_column("Extractor")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Pages/s", justify="right")
+    table.add_column("MB/s", justify="right")
+    for label, elapsed in (("BeautifulSoup, multi-pass", legacy_elapsed), ("analyze_page (lexbor)", analyzer_elapsed)):
+        table.add_row(label, f"{elapsed:.3f}", f"{len(pages) * repeat / elapsed:,.0f}", f"{total_mb / elapsed:,.1f}")
+    console.print(table)
+    console.print("Pages with differing results: " + ", ".join(f"{k}={v}" for k, v in differing.items()))
+
+
+if __name__ == "__main__":
+    app()
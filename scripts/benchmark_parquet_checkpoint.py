@@ -0,0 +1,105 @@
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import duckdb
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from cocli.core.prospect_compactor import write_prospects_parquet
+from cocli.models.campaigns.indexes.google_maps_place import GoogleMapsPlace
+from cocli.models.campaigns.indexes.google_maps_prospect import GoogleMapsProspect
+from cocli.utils.duckdb_utils import load_usv_to_duckdb, parquet_path_for
+
+console = Console()
+app = typer.Typer()
+
+STATES = ["TX", "CA", "FL", "NY", "WA", "CO"]
+
+
+def _write_checkpoint(path: Path, n: int) -> None:
+    alphabet = "abcdefghijklmnopqrstuvwxyz0123456789"
+    with open(path, "w") as f:
+        for i in range(n):
+            f.write(GoogleMapsProspect.model_validate({
+                "place_id": f"ChIJ{alphabet[i % 36]}{alphabet[(i * 7) % 36]}bench{i:010d}",
+                "company_slug": f"company-{i}",
+                "name": f"Company {i}, LLC",
+                "phone": "+1 (555) 123-4567",
+                "website": f"https://company{i}.example.com/",
+                "full_address": f"{i} Main St, Austin, TX 78701",
+                "state": STATES[i % len(STATES)],
+                "first_category": ["Roofer", "Plumber", "Electrician"][i % 3],
+                "reviews_count": i % 500,
+                "average_rating": 4.5,
+                "latitude": 30.2672,
+                "longitude": -97.7431,
+                "processed_by": f"node-{i % 4}",
+            }).to_usv())
+
+
+def _dir_size(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+def _time(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+@app.command()
+def main(
+    rows: int = typer.Option(200000, "--rows", help="Number of prospects in the checkpoint."),
+) -> None:
+    """
+    Compares loading prospects.checkpoint.usv through read_csv against the sorted,
+    ZSTD-compressed Parquet copy written by the compactor.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        checkpoint = Path(tmp) / "prospects.checkpoint.usv"
+        _write_checkpoint(checkpoint, rows)
+        datapackage = Path(tmp) / "datapackage.json"
+        datapackage.write_text(json.dumps(
+            {"resources": [{"schema": {"fields": GoogleMapsPlace.get_datapackage_fields()}}]}
+        ))
+
+        write_time = _time(lambda: write_prospects_parquet(checkpoint))
+
+        con = duckdb.connect()
+        usv_load = _time(lambda: load_usv_to_duckdb(con, "usv", checkpoint, datapackage, prefer_parquet=False))
+        pq_load = _time(lambda: load_usv_to_duckdb(con, "pq", checkpoint, datapackage))
+
+        glob = str(parquet_path_for(checkpoint) / "**" / "*.parquet")
+        names = [f["name"] for f in GoogleMapsPlace.get_datapackage_fields()]
+        usv_query = _time(lambda: con.execute(
+            "SELECT state, count(*) FROM read_csv(?, delim='\x1f', header=False, all_varchar=True, quote='', names=?) "
+            "GROUP BY 1", [str(checkpoint), names]
+        ).fetchall())
+        pq_query = _time(lambda: con.execute(
+            f"SELECT state, count(*) FROM read_parquet('{glob}', hive_partitioning=false) GROUP BY 1"
+        ).fetchall())
+        place_id = con.execute("SELECT place_id FROM usv ORDER BY random() LIMIT 1").fetchone()
+        pq_point = _time(lambda: con.execute(
+            f"SELECT * FROM read_parquet('{glob}', hive_partitioning=false) WHERE place_id = ?",
+            [place_id[0] if place_id else ""],
+        ).fetchall())
+
+        table = Table(title=f"Prospects checkpoint: USV vs Parquet ({rows:,} rows)")
+        table.add_column("Measure")
+        table.add_column("USV", justify="right")
+        table.add_column("Parquet", justify="right")
+        table.add_row("On-disk size (MB)", f"{checkpoint.stat().st_size / 1e6:.2f}",
+                      f"{_dir_size(parquet_path_for(checkpoint)) / 1e6:.2f}")
+        table.add_row("Write (s)", "-", f"{write_time:.3f}")
+        table.add_row("Full typed load (s)", f"{usv_load:.3f}", f"{pq_load:.3f}")
+        table.add_row("Projected GROUP BY state (s)", f"{usv_query:.3f}", f"{pq_query:.3f}")
+        table.add_row("Point lookup by place_id (s)", "-", f"{pq_point:.3f}")
+        console.print(table)
+
+
+if __name__ == "__main__":
+    app()
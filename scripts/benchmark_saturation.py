@@ -0,0 +1,64 @@
+import random
+import time
+from datetime import datetime, UTC
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from cocli.core.saturation_calculator import calculate_saturation_scores, get_min_max_distance
+from cocli.core.scrape_index import ScrapedArea
+from cocli.models.target_location import TargetLocation
+
+console = Console()
+app = typer.Typer()
+
+
+@app.command()
+def main(
+    targets: int = typer.Option(10000, "--targets", help="Target locations to score."),
+    areas: int = typer.Option(100000, "--areas", help="Scraped areas (0.1 degree tiles)."),
+    sample: int = typer.Option(20, "--sample", help="Targets timed with the per-area loop, extrapolated to all."),
+    proximity: float = typer.Option(20.0, "--proximity", help="Max proximity in miles."),
+) -> None:
+    """
+    Compares the per-target, per-area haversine loop against the vectorized
+    targets x areas scorer on a synthetic US-sized campaign.
+    """
+    rng = random.Random(42)
+    now = datetime.now(UTC)
+    scraped = []
+    for _ in range(areas):
+        lat, lon = round(rng.uniform(25.0, 49.0), 1), round(rng.uniform(-124.0, -67.0), 1)
+        scraped.append(ScrapedArea("roofing", now, lat, lat + 0.1, lon, lon + 0.1, 7.0, 6.0, 0))
+    locations = [TargetLocation(name=f"t{i}", lat=rng.uniform(25.0, 49.0), lon=rng.uniform(-124.0, -67.0))
+                 for i in range(targets)]
+
+    start = time.perf_counter()
+    looped = []
+    for target in locations[:sample]:
+        total = 0.0
+        for area in scraped:
+            min_dist, max_dist = get_min_max_distance(target.lat, target.lon, area)
+            if min_dist <= proximity:
+                total += (max_dist - min_dist) / (1.0 + max(0.0, min_dist))
+        looped.append(total)
+    loop_elapsed = (time.perf_counter() - start) / sample * targets
+
+    start = time.perf_counter()
+    scores = calculate_saturation_scores(locations, scraped, max_proximity=proximity)
+    vector_elapsed = time.perf_counter() - start
+    drift = max(abs(a - b) for a, b in zip(looped, scores[:sample]))
+
+    table = Table(title=f"Saturation scoring ({targets:,} targets x {areas:,} areas)")
+    table.add_column("Scorer")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Targets/s", justify="right")
+    table.add_row(f"Per-area loop (extrapolated from {sample})", f"{loop_elapsed:,.1f}", f"{targets / loop_elapsed:,.1f}")
+    table.add_row("Vectorized", f"{vector_elapsed:.2f}", f"{targets / vector_elapsed:,.0f}")
+    console.print(table)
+    console.print(f"Max score difference on sampled targets: {drift:.2e}")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,120 @@
+import json
+import math
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from cocli.core.scrape_index import ScrapeIndex, ScrapedArea, _calculate_overlap_area
+
+console = Console()
+app = typer.Typer()
+
+
+def _scan(index: ScrapeIndex, phrase: str, bounds: Dict[str, float], ttl_days: Optional[int], threshold: float) -> Optional[Tuple[ScrapedArea, float]]:
+    """The directory scan is_area_scraped ran on every call before the in-memory index."""
+    center_lat_floor = math.floor((bounds['lat_min'] + bounds['lat_max']) / 2)
+    center_lon_floor = math.floor((bounds['lon_min'] + bounds['lon_max']) / 2)
+    size = (bounds['lon_max'] - bounds['lon_min']) * (bounds['lat_max'] - bounds['lat_min'])
+    for dlat in (-1, 0, 1):
+        for dlon in (-1, 0, 1):
+            grid_key = f"lat{center_lat_floor + dlat}_lon{center_lon_floor + dlon}"
+            for area_bounds in index._iter_areas_in_grid(phrase, grid_key):
+                calc_bounds = {k: float(v) for k, v in area_bounds.items() if k != '_file_path'}
+                percent = _calculate_overlap_area(bounds, calc_bounds) / size * 100
+                if percent < threshold:
+                    continue
+                area = index._load_area_from_file(Path(str(area_bounds['_file_path'])))
+                if not area:
+                    continue
+                if ttl_days is not None and datetime.now(UTC) - area.scrape_date > timedelta(days=ttl_days):
+                    continue
+                return area, percent
+    return None
+
+
+def _populate(index_dir: Path, phrase: str, areas: int, rng: random.Random) -> None:
+    now = datetime.now(UTC)
+    for _ in range(areas):
+        lat = round(rng.uniform(29.0, 33.0), 2)
+        lon = round(rng.uniform(-99.0, -95.0), 2)
+        bounds = (lat, round(lat + 0.1, 2), lon, round(lon + 0.1, 2))
+        grid_dir = index_dir / phrase / f"lat{math.floor(lat)}_lon{math.floor(lon)}"
+        grid_dir.mkdir(parents=True, exist_ok=True)
+        (grid_dir / ("_".join(str(b) for b in bounds) + ".json")).write_text(json.dumps({
+            "phrase": phrase, "scrape_date": (now - timedelta(days=rng.randint(0, 60))).isoformat(),
+            "lat_min": bounds[0], "lat_max": bounds[1], "lon_min": bounds[2], "lon_max": bounds[3],
+            "lat_miles": 7.0, "lon_miles": 6.0, "items_found": rng.randint(0, 40),
+        }))
+
+
+@app.command()
+def main(
+    areas: int = typer.Option(5000, "--areas", help="Legacy scraped-area files to generate."),
+    queries: int = typer.Option(500, "--queries", help="Bounding boxes to check."),
+    threshold: float = typer.Option(50.0, "--threshold", help="Overlap threshold percent."),
+) -> None:
+    """
+    Compares per-call directory scans in is_area_scraped against the in-memory
+    scrape index (cold build, warm start from the snapshot, and batched queries).
+    """
+    rng = random.Random(42)
+    phrase = "roofing"
+    boxes: List[Dict[str, Any]] = []
+    for _ in range(queries):
+        lat, lon = rng.uniform(29.2, 32.8), rng.uniform(-98.8, -95.2)
+        boxes.append({'lat_min': lat, 'lat_max': lat + 0.1, 'lon_min': lon, 'lon_max': lon + 0.1})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index_dir = Path(tmp) / "indexes" / "scraped_areas"
+        _populate(index_dir, phrase, areas, rng)
+        with patch("cocli.core.scrape_index.get_scraped_areas_index_dir", return_value=index_dir), \
+                patch("cocli.core.config.get_scraped_tiles_index_dir", return_value=Path(tmp) / "indexes" / "scraped-tiles"):
+            index = ScrapeIndex()
+
+            start = time.perf_counter()
+            scanned = [_scan(index, phrase, b, 30, threshold) for b in boxes]
+            scan_elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            index.refresh()
+            build_elapsed = time.perf_counter() - start
+
+            warm = ScrapeIndex()
+            start = time.perf_counter()
+            warm.refresh()
+            warm_elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            single = [warm.is_area_scraped(phrase, b, 30, threshold) for b in boxes]
+            single_elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            batched = warm.query_many(phrase, boxes, 30, threshold)
+            batched_elapsed = time.perf_counter() - start
+
+    # The legacy scan visits grid files in directory order, so compare hit/miss per box
+    assert [m is None for m in scanned] == [m is None for m in single] == [m is None for m in batched]
+    hits = sum(m is not None for m in single)
+
+    table = Table(title=f"Scrape index overlap queries ({areas:,} areas, {queries} boxes, {hits} hits)")
+    table.add_column("Step")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Queries/s", justify="right")
+    table.add_row("Directory scan per query", f"{scan_elapsed:.3f}", f"{queries / scan_elapsed:,.0f}")
+    table.add_row("Index build (cold)", f"{build_elapsed:.3f}", "")
+    table.add_row("Index load (snapshot)", f"{warm_elapsed:.3f}", "")
+    table.add_row("is_area_scraped (indexed)", f"{single_elapsed:.4f}", f"{queries / single_elapsed:,.0f}")
+    table.add_row("query_many (indexed)", f"{batched_elapsed:.4f}", f"{queries / batched_elapsed:,.0f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,115 @@
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from cocli.core.search_index import SearchIndex, SearchSource, compacted_fallback_columns
+from cocli.models.campaigns.indexes.google_maps_place import GoogleMapsPlace
+
+console = Console()
+app = typer.Typer()
+
+PLACE_FIELDS = [f["name"] for f in GoogleMapsPlace.get_datapackage_fields()]
+CACHE_FIELDS = ["slug", "name", "type", "domain", "email", "phone_number", "tags", "display"]
+LIFECYCLE_FIELDS = ["place_id", "scraped_at", "details_at", "enqueued_at", "enriched_at"]
+QUERY = "SELECT slug FROM items WHERE name ILIKE '%company 12%' ORDER BY slug LIMIT 500"
+
+
+def _write_usv(path: Path, fields: List[str], rows: List[Dict[str, str]], mode: str = "w") -> None:
+    with open(path, mode) as f:
+        for row in rows:
+            f.write("\x1f".join(row.get(field, "") for field in fields) + "\n")
+
+
+def _datapackage(path: Path, fields: List[str]) -> Path:
+    path.write_text(json.dumps({"resources": [{"schema": {"fields": [{"name": f, "type": "string"} for f in fields]}}]}))
+    return path
+
+
+def _place(n: int) -> Dict[str, str]:
+    return {"place_id": f"ChIJ{n:08d}", "slug": f"company-{n}", "name": f"Company {n}", "keyword": "roofing",
+            "city": "Austin", "updated_at": "2026-01-01", "average_rating": "4.5", "reviews_count": "10"}
+
+
+def _timed(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+@app.command()
+def main(
+    rows: int = typer.Option(200000, "--rows", help="Rows in the prospects checkpoint."),
+    appended: int = typer.Option(50, "--appended", help="Rows appended to the checkpoint between searches."),
+    queries: int = typer.Option(20, "--queries", help="Search queries timed against the items view/table."),
+) -> None:
+    """
+    Compares rebuilding the search tables from scratch (what every change cost
+    before) with incremental refreshes of the persisted search index.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        prospects = tmp / "prospects.checkpoint.usv"
+        to_call = tmp / "to-call"
+        to_call.mkdir()
+        _write_usv(prospects, PLACE_FIELDS, [_place(n) for n in range(rows)])
+        _write_usv(tmp / "cache.usv", CACHE_FIELDS,
+                   [{"slug": f"company-{n}", "email": f"info@company{n}.test", "tags": "roofing"}
+                    for n in range(0, rows, 10)])
+        _write_usv(tmp / "lifecycle.usv", LIFECYCLE_FIELDS,
+                   [{"place_id": f"ChIJ{n:08d}", "scraped_at": "2026-01-01"} for n in range(0, rows, 2)])
+        sources = [
+            SearchSource("items_cache", tmp / "cache.usv", _datapackage(tmp / "cache_dp.json", CACHE_FIELDS)),
+            SearchSource("items_prospects", prospects, append_only=True, place_schema=True),
+            SearchSource("items_venues", None, place_schema=True),
+            SearchSource("items_compacted", None, key="place_id", fallback_columns=compacted_fallback_columns()),
+            SearchSource("items_lifecycle", tmp / "lifecycle.usv",
+                         _datapackage(tmp / "lifecycle_dp.json", LIFECYCLE_FIELDS), key="place_id"),
+            SearchSource("items_to_call", to_call),
+        ]
+        db_path = tmp / "search.duckdb"
+
+        index = SearchIndex(db_path, sources)
+        cold = _timed(index.refresh)
+        index.close()
+
+        index = SearchIndex(db_path, sources)
+        warm = _timed(index.refresh)
+
+        def append() -> None:
+            _write_usv(prospects, PLACE_FIELDS, [_place(rows + n) for n in range(appended)], mode="a")
+        append()
+        delta = _timed(index.refresh)
+        append()
+        rebuild = _timed(lambda: SearchIndex(None, sources).refresh())
+
+        (to_call / "company-7.usv").write_text("")
+        enqueue = _timed(index.refresh)
+
+        # The previous layout: a DISTINCT ON view recomputed by every query
+        index.con.execute("CREATE TEMP VIEW legacy_items AS " + index._items_select())
+        view_query = _timed(lambda: [index.con.execute(QUERY.replace("items", "legacy_items")).fetchall()
+                                     for _ in range(queries)]) / queries
+        table_query = _timed(lambda: [index.con.execute(QUERY).fetchall() for _ in range(queries)]) / queries
+        index.close()
+
+    table = Table(title=f"Search index refresh ({rows:,} checkpoint rows)")
+    table.add_column("Step")
+    table.add_column("Time (s)", justify="right")
+    table.add_row("Cold build (persisted)", f"{cold:.3f}")
+    table.add_row("Restart, nothing changed", f"{warm:.4f}")
+    table.add_row(f"Full rebuild after {appended} appended rows", f"{rebuild:.3f}")
+    table.add_row(f"Delta refresh after {appended} appended rows", f"{delta:.4f}")
+    table.add_row("Refresh after one to-call enqueue", f"{enqueue:.4f}")
+    table.add_row("Search query on the DISTINCT ON view", f"{view_query:.4f}")
+    table.add_row("Search query on the materialized table", f"{table_query:.4f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
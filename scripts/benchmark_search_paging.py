@@ -0,0 +1,66 @@
+import time
+from typing import Callable
+
+import duckdb
+import typer
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+app = typer.Typer()
+
+COLUMNS = ("type, name, slug, domain, email, phone_number, tags, display, average_rating, reviews_count, "
+           "street_address, city, state, zip, list_found_at, details_found_at, enqueued_at, last_enriched")
+
+
+def _items(con: duckdb.DuckDBPyConnection, rows: int) -> None:
+    con.execute(f"""
+        CREATE TABLE items AS
+        SELECT 'company' AS type, 'Company ' || i AS name, 'company-' || lpad(i::VARCHAR, 8, '0') AS slug,
+            'site' || i || '.test' AS domain, 'info@site' || i || '.test' AS email, '555-0100' AS phone_number,
+            ['roofing'] AS tags, 'Company ' || i AS display, 4.5 AS average_rating, 10 AS reviews_count,
+            '1 Main St' AS street_address, 'Austin' AS city, 'TX' AS state, '78701' AS zip,
+            '2026-01-01' AS list_found_at, NULL AS details_found_at, NULL AS enqueued_at, NULL AS last_enriched
+        FROM range({rows}) t(i)
+    """)
+    con.execute("CREATE INDEX items_slug_idx ON items (slug)")
+
+
+def _ms(fn: Callable[[], object], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+@app.command()
+def main(
+    rows: int = typer.Option(1_000_000, "--rows", help="Rows in the items table."),
+    limit: int = typer.Option(50, "--limit", help="Rows per page (the TUI page size)."),
+    repeat: int = typer.Option(20, "--repeat", help="Timed repetitions per measurement."),
+) -> None:
+    """
+    Cost of fetching a listing page near the start and near the end of the items
+    table with LIMIT/OFFSET vs seeking after the previous page's last slug.
+    """
+    con = duckdb.connect()
+    _items(con, rows)
+
+    table = Table(title=f"Listing page of {limit} ({rows:,} rows)")
+    table.add_column("Page")
+    table.add_column("OFFSET (ms)", justify="right")
+    table.add_column("Keyset (ms)", justify="right")
+    for page in (1, rows // limit // 2, rows // limit - 1):
+        offset = page * limit
+        after = con.execute(f"SELECT slug FROM items ORDER BY slug LIMIT 1 OFFSET {offset - 1}").fetchone()
+        by_offset = _ms(lambda: con.execute(
+            f"SELECT {COLUMNS} FROM items ORDER BY slug LIMIT {limit} OFFSET {offset}").fetchall(), repeat)
+        by_key = _ms(lambda: con.execute(
+            f"SELECT {COLUMNS} FROM items WHERE slug > ? ORDER BY slug LIMIT {limit}", [after[0] if after else ""]
+        ).fetchall(), repeat)
+        table.add_row(f"{page:,}", f"{by_offset:.2f}", f"{by_key:.2f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
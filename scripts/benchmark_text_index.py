@@ -0,0 +1,140 @@
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import patch
+
+import duckdb
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from cocli.application.search_service import get_fuzzy_search_results
+from cocli.core.cache import build_cache
+from cocli.core.paths import paths
+from cocli.core.search_index import TEXT_ROWS_SQL
+from cocli.core.text_index import TextFilter, TextIndex, TextRow
+
+console = Console()
+app = typer.Typer()
+
+WORDS = ["roofing", "plumbing", "solar", "electric", "dental", "auto", "repair", "pros", "group", "services",
+         "home", "garden", "hvac", "bros", "co"]
+CITIES = ["Austin", "Dallas", "Houston", "El Paso"]
+ILIKE_SQL = (
+    "SELECT slug FROM items WHERE type = 'company' "
+    "AND (name ILIKE ? OR slug ILIKE ? OR array_to_string(tags, ',') ILIKE ?) ORDER BY slug LIMIT ?"
+)
+
+
+def _items(con: duckdb.DuckDBPyConnection, rows: int) -> None:
+    def pick(values: List[str], seed: int) -> str:
+        choices = "[" + ", ".join(f"'{v}'" for v in values) + "]"
+        return f"{choices}[1 + CAST(hash(i * {seed}) % {len(values)} AS BIGINT)]"
+
+    con.execute(f"""
+        CREATE TABLE items AS
+        SELECT lower(replace(name, ' ', '-')) AS slug, * EXCLUDE (i) FROM (
+            SELECT i,
+                upper({pick(WORDS, 1)}) || ' ' || {pick(WORDS, 7)} || ' ' || i AS name,
+                'site' || i || '.test' AS domain,
+                {pick(CITIES, 13)} AS city,
+                [{pick(WORDS, 17)}] AS tags,
+                'company' AS type,
+                CASE WHEN i % 3 = 0 THEN NULL ELSE 'info@site' || i || '.test' END AS email,
+                CASE WHEN i % 4 = 0 THEN NULL ELSE '555-0100' END AS phone_number,
+                i % 97 = 0 AS is_to_call
+            FROM range({rows}) t(i)
+        ) ORDER BY slug
+    """)
+
+
+def _end_to_end(companies: int, queries: List[str], limit: int) -> List[float]:
+    """
+    get_fuzzy_search_results per keystroke over generated company directories:
+    the text index search plus the cache, source and exclusion checks around it.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        paths.root = Path(tmp)
+        try:
+            with patch("cocli.core.cache.get_cocli_base_dir", return_value=Path(tmp)):
+                for i in range(companies):
+                    company_dir = paths.companies / f"company-{i}"
+                    company_dir.mkdir(parents=True)
+                    name = f"{WORDS[i % len(WORDS)].upper()} {WORDS[i * 7 % len(WORDS)]} {i}"
+                    (company_dir / "_index.md").write_text(f"---\nname: {name}\ndomain: site{i}.test\n---\n")
+                    (company_dir / "tags.lst").write_text(f"benchmark\n{WORDS[i * 17 % len(WORDS)]}\n")
+                build_cache(campaign="benchmark")
+                # Opens the search index and builds the text index
+                get_fuzzy_search_results("warm", campaign_name="benchmark", limit=limit)
+
+                timings: List[float] = []
+                for query in queries:
+                    start = time.perf_counter()
+                    get_fuzzy_search_results(query, campaign_name="benchmark", limit=limit)
+                    timings.append((time.perf_counter() - start) * 1000)
+                return timings
+        finally:
+            del paths.root
+
+
+def _keystrokes(words: List[str]) -> List[str]:
+    """Every prefix of each query, as typed."""
+    return [word[:n] for word in words for n in range(1, len(word) + 1)]
+
+
+@app.command()
+def main(
+    rows: int = typer.Option(1_000_000, "--rows", help="Rows in the items table."),
+    limit: int = typer.Option(100, "--limit", help="Results per search (the TUI page size)."),
+    companies: int = typer.Option(
+        10_000, "--companies", help="Companies searched end to end through get_fuzzy_search_results (0 skips)."
+    ),
+) -> None:
+    """
+    Per-keystroke search latency: ILIKE over the items table vs the trigram text
+    index, and the whole get_fuzzy_search_results call over company directories.
+    """
+    con = duckdb.connect()
+    _items(con, rows)
+    queries = _keystrokes(["roofing 12", "houston", "site4242", "hvac bros", "plumbnig"])
+
+    start = time.perf_counter()
+    index = TextIndex([TextRow(*r) for r in con.execute(TEXT_ROWS_SQL + " ORDER BY slug").fetchall()])
+    build = time.perf_counter() - start
+
+    ilike_ms: List[float] = []
+    index_ms: List[float] = []
+    text_filter = TextFilter(item_type="company")
+    for query in queries:
+        pattern = f"%{query}%"
+        start = time.perf_counter()
+        con.execute(ILIKE_SQL, [pattern, pattern, pattern, limit]).fetchall()
+        ilike_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        index.search(query, text_filter, limit=limit)
+        index_ms.append((time.perf_counter() - start) * 1000)
+
+    results: Dict[str, List[float]] = {
+        f"DuckDB ILIKE ({rows:,} rows)": ilike_ms,
+        f"Trigram text index ({rows:,} rows)": index_ms,
+    }
+    if companies:
+        results[f"get_fuzzy_search_results ({companies:,} companies)"] = _end_to_end(companies, queries, limit)
+
+    table = Table(title=f"Search per keystroke ({len(queries)} keystrokes)")
+    table.add_column("Engine")
+    table.add_column("Median (ms)", justify="right")
+    table.add_column("p95 (ms)", justify="right")
+    table.add_column("Max (ms)", justify="right")
+    for label, timings in results.items():
+        p95 = statistics.quantiles(timings, n=20)[-1]
+        table.add_row(label, f"{statistics.median(timings):.2f}", f"{p95:.2f}", f"{max(timings):.2f}")
+    console.print(table)
+    console.print(f"Text index build: {build:.2f}s")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,108 @@
+import time
+from datetime import datetime, UTC
+from typing import Any, Callable, Dict, List
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from cocli.core.constants import UNIT_SEP
+from cocli.models.campaigns.indexes.google_maps_prospect import GoogleMapsProspect
+
+console = Console()
+app = typer.Typer()
+
+
+def legacy_to_usv(prospect: GoogleMapsProspect) -> str:
+    """The per-field str.replace chain used before the cached codec."""
+    dump = prospect.model_dump(by_alias=False)
+    values = []
+    for field in GoogleMapsProspect.model_fields:
+        val = dump.get(field)
+        if val is None:
+            values.append("")
+        elif isinstance(val, datetime):
+            values.append(val.isoformat())
+        else:
+            values.append(
+                str(val).replace("\r\n", "<br>").replace("\n", "<br>").replace("\r", "<br>").replace(UNIT_SEP, " ")
+            )
+    return UNIT_SEP.join(values) + "\n"
+
+
+def legacy_from_usv(line: str) -> GoogleMapsProspect:
+    """The per-row annotation inspection used before the cached codec."""
+    parts = line.strip("\x1e\n").split(UNIT_SEP)
+    data: Dict[str, Any] = {}
+    for i, (name, info) in enumerate(GoogleMapsProspect.model_fields.items()):
+        if i < len(parts) and parts[i] != "":
+            if "List" in str(info.annotation):
+                data[name] = [t.strip() for t in parts[i].split(";") if t.strip()]
+            else:
+                data[name] = parts[i]
+    return GoogleMapsProspect.model_validate(data)
+
+
+def _sample(n: int) -> List[GoogleMapsProspect]:
+    now = datetime.now(UTC)
+    return [
+        GoogleMapsProspect.model_validate({
+            "place_id": f"ChIJbenchmark{i:010d}",
+            "company_slug": f"company-{i}",
+            "name": f"Company {i}, LLC",
+            "phone": "+1 (555) 123-4567",
+            "website": f"https://company{i}.example.com/",
+            "full_address": f"{i} Main St, Austin, TX 78701",
+            "reviews_count": i % 500,
+            "average_rating": 4.5,
+            "latitude": 30.2672,
+            "longitude": -97.7431,
+            "hours": "Mon 9-5\nTue 9-5",
+            "keyword": "roofing",
+            "created_at": now,
+            "updated_at": now,
+        })
+        for i in range(n)
+    ]
+
+
+def _time(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+@app.command()
+def main(
+    rows: int = typer.Option(20000, "--rows", help="Number of GoogleMapsProspect rows to serialize and parse."),
+) -> None:
+    """
+    Compares the cached USV codec against the previous to_usv/from_usv implementation.
+    """
+    prospects = _sample(rows)
+    lines = [p.to_usv() for p in prospects]
+    if lines != [legacy_to_usv(p) for p in prospects]:
+        console.print("[bold red]Codec output differs from the legacy serializer![/bold red]")
+        raise typer.Exit(code=1)
+
+    results = [
+        ("to_usv (legacy)", _time(lambda: [legacy_to_usv(p) for p in prospects])),
+        ("to_usv (codec)", _time(lambda: [p.to_usv() for p in prospects])),
+        ("to_usv_many", _time(lambda: list(GoogleMapsProspect.to_usv_many(prospects)))),
+        ("from_usv (legacy)", _time(lambda: [legacy_from_usv(line) for line in lines])),
+        ("from_usv (codec)", _time(lambda: [GoogleMapsProspect.from_usv(line) for line in lines])),
+        ("from_usv_many (trusted)", _time(lambda: list(GoogleMapsProspect.from_usv_many(lines, trusted=True)))),
+    ]
+
+    table = Table(title=f"USV codec benchmark ({rows} GoogleMapsProspect rows)")
+    table.add_column("Path")
+    table.add_column("Total (s)", justify="right")
+    table.add_column("Per row (µs)", justify="right")
+    table.add_column("Rows/s", justify="right")
+    for label, elapsed in results:
+        table.add_row(label, f"{elapsed:.3f}", f"{elapsed / rows * 1e6:.1f}", f"{rows / elapsed:,.0f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
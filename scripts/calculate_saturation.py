@@ -1,13 +1,13 @@
 import typer
 import csv
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from rich.console import Console
 from rich.progress import track
 
 from cocli.models.target_location import TargetLocation
 from cocli.core.scrape_index import ScrapeIndex
-from cocli.core.saturation_calculator import calculate_saturation_score
+from cocli.core.saturation_calculator import calculate_saturation_scores
 from cocli.core.config import get_campaign, get_campaigns_dir
 
 logger = logging.getLogger(__name__)
@@ -44,7 +44,6 @@ def main(
 
     console.print(f"[bold blue]Processing target locations from {csv_path.name}...[/bold blue]")
     
-    updated_rows = []
     headers = []
     
     with open(csv_path, 'r', encoding='utf-8') as f:
@@ -60,42 +59,28 @@ def main(
             headers.append("company_slug")
 
         rows = list(reader)
-        for row in track(rows, description="Calculating scores..."):
-            try:
-                # Validate/Parse with Pydantic
-                # We need to handle potential type conversions or defaults handled by Pydantic
-                # Using 'construct' or 'model_validate'
-                # Note: TargetLocation expects 'lat', 'lon' as floats. CSV gives strings.
-                
-                # We can't pass extra fields if extra='ignore'. 
-                # So we filter or rely on Pydantic to ignore.
-                target = TargetLocation.model_validate(row)
-                
-                # Calculate Score
-                score = calculate_saturation_score(target, scraped_areas, max_proximity=max_proximity)
-                target.saturation_score = round(score, 2)
-                
-                # Update row dict with new values
-                # We use model_dump to get serialized values (rounded lat/lon)
-                dumped = target.model_dump(by_alias=True)
-                
-                # Merge back into row to preserve any extra fields not in model (if any exist and we want to keep them)
-                # But our model config says extra='ignore', so model_validate dropped them.
-                # If we want to preserve unknown columns, we should have used a different approach.
-                # Assuming the CSV structure is controlled by us and matches the model + extras we know.
-                # User said: "preserve all existing columns".
-                # My model defined all known columns. 
-                # If there are truly unknown columns, I should update the model to extra='allow'.
-                
-                # Let's check model config again. I set extra='ignore'.
-                # I should probably update model to extra='allow' in a previous step to be safe, 
-                # or just merge `dumped` into `row`.
-                row.update(dumped)
-                updated_rows.append(row)
-                
-            except Exception as e:
-                logger.error(f"Error processing row {row.get('name', 'UNKNOWN')}: {e}")
-                updated_rows.append(row) # Keep original row if failure?
+
+    # Validate/Parse with Pydantic first (CSV gives strings for lat/lon), then
+    # score every valid target against the scraped areas in one vectorized pass.
+    targets: List[TargetLocation] = []
+    target_rows: List[Dict[str, Any]] = []
+    for row in track(rows, description="Parsing targets..."):
+        try:
+            targets.append(TargetLocation.model_validate(row))
+            target_rows.append(row)
+        except Exception as e:
+            logger.error(f"Error processing row {row.get('name', 'UNKNOWN')}: {e}")
+
+    console.print("[bold blue]Calculating scores...[/bold blue]")
+    scores = calculate_saturation_scores(targets, scraped_areas, max_proximity=max_proximity)
+    for target, row, score in zip(targets, target_rows, scores):
+        target.saturation_score = round(float(score), 2)
+        # Merge the serialized values (rounded lat/lon) back into the row so
+        # columns the model ignores are preserved.
+        row.update(target.model_dump(by_alias=True))
+
+    # Rows that failed validation are written back unchanged
+    updated_rows = rows
 
     # Write back
     with open(csv_path, 'w', newline='', encoding='utf-8') as f:
@@ -68,3 +68,29 @@ async def test_company_selection_integration():
         await driver.pause(0.1)
         assert isinstance(company_detail, CompanyDetail)
         mock_company_service.assert_called_once_with("test-company")
+
+
+@pytest.mark.asyncio
+async def test_paging_seeks_after_the_last_slug():
+    """Next and previous pages of the listing pass the slug each page starts after."""
+    mock_search = MagicMock()
+    mock_search.return_value = [
+        SearchResult(name=f"Company {n}", slug=f"company-{n}", type="company", unique_id=f"company-{n}", display="")
+        for n in range(3)
+    ]
+    services = ServiceContainer(search_service=mock_search, sync_search=True)
+    app = CocliApp(services=services, auto_show=False)
+
+    async with app.run_test() as driver:
+        await driver.app.action_show_companies()
+        await driver.pause(0.5)
+        company_list_screen = await wait_for_widget(driver, CompanyList)
+        company_list_screen.action_next_page()
+        await driver.pause(0.1)
+        assert mock_search.call_args.kwargs["after"] == "company-2"
+        assert mock_search.call_args.kwargs["offset"] == company_list_screen.search_limit
+
+        company_list_screen.action_prev_page()
+        await driver.pause(0.1)
+        assert mock_search.call_args.kwargs["after"] is None
+        assert mock_search.call_args.kwargs["offset"] == 0
@@ -0,0 +1,110 @@
+from unittest.mock import patch
+
+import pytest
+
+from cocli.utils.browser_manager import BrowserContextPool
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+        self.healthy = True
+
+    def is_closed(self):
+        return self.closed
+
+    async def evaluate(self, expression):
+        if not self.healthy:
+            raise RuntimeError("Target crashed")
+        return 1
+
+    async def close(self):
+        self.closed = True
+        self.context.pages.remove(self)
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+async def test_pages_are_reused_until_max_uses():
+    browser = FakeBrowser()
+    async with BrowserContextPool(browser, size=1, max_uses=3) as pool:
+        assert len(browser.contexts) == 1  # Warmed up front
+        pages = []
+        for _ in range(4):
+            async with pool.page() as page:
+                pages.append(page)
+
+        assert pages[0] is pages[1] is pages[2]
+        assert pages[3] is not pages[0]
+        assert browser.contexts[0].closed
+        assert pool.metrics.leases == 4
+        assert pool.metrics.reuses == 2
+        assert pool.metrics.recycled == {"max_uses": 1}
+        assert pool.metrics.reuse_rate == pytest.approx(0.5)
+    assert all(c.closed for c in browser.contexts)
+
+
+async def test_unhealthy_context_is_replaced_and_failures_propagate():
+    browser = FakeBrowser()
+    pool = BrowserContextPool(browser, size=1, max_uses=10)
+    async with pool.page() as page:
+        first = page
+    first.healthy = False
+
+    async with pool.page() as page:
+        assert page is not first
+    assert pool.metrics.health_failures == 1
+    assert pool.metrics.recycled == {"unhealthy": 1}
+
+    with pytest.raises(ValueError):
+        async with pool.context():
+            raise ValueError("task failed")
+    # A failing task on a healthy context keeps it
+    assert pool.metrics.recycled == {"unhealthy": 1}
+    await pool.close()
+
+
+async def test_context_leases_close_stray_pages_and_respect_memory_ceiling():
+    browser = FakeBrowser()
+    pool = BrowserContextPool(browser, size=2, max_uses=10, max_process_rss_mb=500, memory_check_interval=0)
+    with patch("cocli.utils.browser_manager.chromium_max_rss_mb", return_value=100.0):
+        async with pool.context() as context:
+            await context.new_page()
+            await context.new_page()
+        assert context.pages == []
+        assert not context.closed
+
+    with patch("cocli.utils.browser_manager.chromium_max_rss_mb", return_value=900.0):
+        async with pool.context() as context:
+            pass
+    assert context.closed
+    assert pool.metrics.recycled == {"memory": 1}
+    assert len(browser.contexts) == 2  # Sequential leases share one context, plus the replacement
+    await pool.close()
@@ -0,0 +1,173 @@
+import threading
+
+from cocli.core import campaign_stats
+from cocli.core.campaign_stats import CampaignStatsStore
+from cocli.core.queue.filesystem import FilesystemGmListQueue, FilesystemQueue
+from cocli.core.scrape_index import ScrapeIndex
+from cocli.models.campaigns.queues.gm_list import ScrapeTask
+
+CAMPAIGN = "test/default"
+
+
+def _store_matches_recount(store: CampaignStatsStore, phrases: list) -> None:
+    counts = store.read()
+    assert counts is not None
+    fresh = CampaignStatsStore(CAMPAIGN)
+    fresh.snapshot_path = store.snapshot_path.with_name("fresh.snapshot.json")
+    recounted = fresh.recount(phrases)
+    assert recounted is not None
+    for queue, expected in recounted["local_queues"].items():
+        actual = counts["local_queues"][queue]
+        assert (actual["pending"], actual["inflight"], actual["completed"]) == (
+            expected["pending"], expected["inflight"], expected["completed"]
+        ), queue
+    assert counts["witness"] == recounted["witness"]
+
+
+def test_queue_events_keep_counts_current_between_recounts(mock_cocli_env):
+    queue = FilesystemQueue(CAMPAIGN, "enrichment")
+    queue.push("done", {"domain": "done.test"})
+    store = CampaignStatsStore(CAMPAIGN)
+    assert store.read() is None
+    assert store.recount([]) is not None
+
+    for task_id in ("a", "b", "c"):
+        queue.push(task_id, {"domain": f"{task_id}.test"})
+    assert queue._create_lease("a") and queue._create_lease("b") and queue._create_lease("done")
+    queue.ack("done")
+    queue.ack("a")
+    queue.nack("b")
+
+    counts = store.read()
+    assert counts is not None
+    enrichment = counts["local_queues"]["enrichment"]
+    assert (enrichment["pending"], enrichment["inflight"], enrichment["completed"]) == (2, 0, 2)
+    assert enrichment["last_completed_at"] is not None
+    _store_matches_recount(store, [])
+
+
+def test_scraped_mission_tiles_leave_gm_list_pending(mock_cocli_env):
+    queue = FilesystemGmListQueue(CAMPAIGN)
+    store = CampaignStatsStore(CAMPAIGN)
+    assert store.recount(["roofing"]) is not None
+
+    for lat in (30.2, 30.3):
+        queue.push(ScrapeTask(
+            latitude=lat, longitude=-97.7, zoom=15, search_phrase="roofing", campaign_name=CAMPAIGN, tile_id=f"{lat}_-97.7"
+        ))
+    (task,) = queue.poll(batch_size=1)
+    bounds = {"lat_min": task.latitude, "lat_max": task.latitude + 0.1, "lon_min": -97.7, "lon_max": -97.6}
+    ScrapeIndex(refresh_interval=None).add_area("roofing", bounds, 8.0, 8.0, items_found=3, tile_id=task.tile_id)
+    queue.ack(task)
+    # A repeated ack of the same tile is not a second completion
+    queue.ack(task)
+
+    counts = store.read()
+    assert counts is not None
+    gm_list = counts["local_queues"]["gm-list"]
+    assert (gm_list["pending"], gm_list["inflight"]) == (1, 0)
+    _store_matches_recount(store, ["roofing"])
+
+
+def test_witness_writes_update_anomaly_counts(mock_cocli_env):
+    store = CampaignStatsStore(CAMPAIGN)
+    store.recount(["roofing"])
+
+    index = ScrapeIndex(refresh_interval=None)
+    bounds = {"lat_min": 30.2, "lat_max": 30.3, "lon_min": -97.8, "lon_max": -97.7}
+    index.add_area("roofing", bounds, 8.0, 8.0, items_found=0, tile_id="30.2_-97.7")
+    index.add_area("roofing", bounds, 8.0, 8.0, items_found=0, tile_id="30.3_-97.7")
+    # Rescraping a tile replaces its witness
+    index.add_area("roofing", bounds, 8.0, 8.0, items_found=12, tile_id="30.2_-97.7")
+    index.add_area("plumbing", bounds, 8.0, 8.0, items_found=0, tile_id="30.2_-97.7")
+
+    counts = store.read()
+    assert counts is not None
+    assert counts["witness"] == {"roofing": [2, 1]}
+    _store_matches_recount(store, ["roofing"])
+
+
+def test_stale_snapshots_and_new_phrases_need_a_recount(mock_cocli_env, mocker):
+    store = CampaignStatsStore(CAMPAIGN)
+    snapshot = store.recount(["roofing"])
+    assert snapshot is not None
+    assert not store.is_stale(snapshot, ["roofing"])
+    assert store.is_stale(snapshot, ["roofing", "solar"])
+
+    mocker.patch.object(campaign_stats.time, "time", return_value=snapshot["counted_at"] + campaign_stats.RECOUNT_INTERVAL + 1)
+    assert store.is_stale(snapshot, ["roofing"])
+
+
+def test_recount_compacts_a_large_journal(mock_cocli_env, mocker):
+    mocker.patch.object(campaign_stats, "COMPACT_BYTES", 0)
+    store = CampaignStatsStore(CAMPAIGN)
+    queue = FilesystemQueue(CAMPAIGN, "to-call")
+    queue.push("a", {"slug": "a"})
+    store.recount([])
+    assert store.journal_path.stat().st_size == 0
+    assert store.read()["local_queues"]["to-call"]["pending"] == 1
+
+    queue.push("b", {"slug": "b"})
+    counts = store.read()
+    assert counts is not None
+    assert counts["local_queues"]["to-call"]["pending"] == 2
+
+
+def test_compaction_keeps_appends_and_other_campaigns_witness_offsets(mock_cocli_env, mocker):
+    index = ScrapeIndex(refresh_interval=None)
+    bounds = {"lat_min": 30.2, "lat_max": 30.3, "lon_min": -97.8, "lon_max": -97.7}
+    before = CampaignStatsStore("test/before")
+    before.recount(["roofing"])
+    index.add_area("roofing", bounds, 8.0, 8.0, items_found=3, tile_id="30.2_-97.7")
+    other = CampaignStatsStore("test/other")
+    other.recount(["roofing"])
+
+    mocker.patch.object(campaign_stats, "COMPACT_BYTES", 0)
+    store = CampaignStatsStore(CAMPAIGN)
+    snapshot = store.recount(["roofing"])
+    assert snapshot is not None
+    assert store.witness_journal_path.stat().st_size == 0
+
+    # Appends wait while a journal is being swapped, then land in the new one
+    with open(campaign_stats._lock_path(store.witness_journal_path), "a") as lock:
+        campaign_stats.fcntl.flock(lock, campaign_stats.fcntl.LOCK_EX)
+        writer = threading.Thread(
+            target=index.add_area,
+            args=("roofing", bounds, 8.0, 8.0),
+            kwargs={"items_found": 0, "tile_id": "30.3_-97.7"},
+        )
+        writer.start()
+        writer.join(0.2)
+        assert writer.is_alive()
+    writer.join()
+
+    expected = {"roofing": [2, 1]}
+    assert store.read()["witness"] == expected
+    # A snapshot at the cut resumes in the compacted journal
+    assert not other.is_stale(other.read(), ["roofing"])
+    assert other.read()["witness"] == expected
+    # One taken before it lost records: it needs a recount
+    assert before.is_stale(before.read(), ["roofing"])
+    before.recount(["roofing"])
+    assert before.read()["witness"] == expected
+
+
+def test_stale_counts_are_recounted_inline_unless_the_caller_stays_up(mock_cocli_env, mocker):
+    from cocli.core import reporting
+
+    mocker.patch.object(reporting, "get_data_bucket_name", return_value=None)
+    store = CampaignStatsStore(CAMPAIGN)
+    snapshot = store.recount([])
+    assert snapshot is not None
+    clock = mocker.patch.object(campaign_stats.time, "time")
+    clock.return_value = snapshot["counted_at"] + campaign_stats.RECOUNT_INTERVAL + 1
+    background = mocker.patch.object(campaign_stats, "start_background_recount")
+
+    # A short-lived command would exit before a background recount finished
+    stats = reporting.get_campaign_stats(CAMPAIGN)
+    background.assert_not_called()
+    assert stats["counted_at"] == clock.return_value
+
+    clock.return_value += campaign_stats.RECOUNT_INTERVAL + 1
+    assert reporting.get_campaign_stats(CAMPAIGN, background=True)["counted_at"] == stats["counted_at"]
+    background.assert_called_once()
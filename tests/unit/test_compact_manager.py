@@ -0,0 +1,165 @@
+import io
+import threading
+from pathlib import Path
+from typing import Any, Dict, Set
+from unittest.mock import patch
+
+from cocli.core.compact import CompactManager
+
+US = "\x1f"
+
+
+class InMemoryS3:
+    """Minimal thread-safe S3 stand-in for the calls CompactManager makes."""
+
+    def __init__(self) -> None:
+        self.objects: Dict[str, bytes] = {}
+        self.unreadable: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def get_paginator(self, name: str) -> "InMemoryS3":
+        return self
+
+    def paginate(self, Bucket: str, Prefix: str, Delimiter: str = "") -> Any:
+        with self._lock:
+            keys = sorted(k for k in self.objects if k.startswith(Prefix))
+        if Delimiter:
+            keys = [k for k in keys if Delimiter not in k[len(Prefix):]]
+        yield {"Contents": [{"Key": k, "Size": len(self.objects[k])} for k in keys]}
+
+    def copy_object(self, Bucket: str, Key: str, CopySource: Dict[str, str]) -> None:
+        with self._lock:
+            self.objects[Key] = self.objects[CopySource["Key"]]
+
+    def delete_objects(self, Bucket: str, Delete: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            for obj in Delete["Objects"]:
+                self.objects.pop(obj["Key"], None)
+        return {}
+
+    def get_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        if Key in self.unreadable:
+            raise ConnectionError(f"Connection reset reading {Key}")
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def upload_file(self, Filename: str, Bucket: str, Key: str, Config: Any = None) -> None:
+        self.objects[Key] = Path(Filename).read_bytes()
+
+
+# Columns of the canonical prospect USV (GoogleMapsPlace)
+WIDTH = 56
+
+
+def _row(place_id: str, updated_at: str, name: str) -> str:
+    fields = [place_id, place_id.lower(), name, "", "2026-01-01", updated_at, "1"]
+    return US.join(fields + [""] * (WIDTH - len(fields))) + "\n"
+
+
+def test_compaction_is_in_process_and_rewrites_only_changed_rows(tmp_path):
+    with patch('cocli.core.paths.paths.root', tmp_path):
+        s3 = InMemoryS3()
+        manager = CompactManager("test", s3_client=s3, bucket_name="bucket", max_workers=4)
+        prefix = manager.s3_index_prefix
+
+        manager.index_dir.mkdir(parents=True)
+        manager.checkpoint_path.write_text(
+            _row("ChIJa", "2026-01-01", "Alpha") + _row("ChIJb", "2026-03-01", "Beta")
+        )
+        s3.objects[prefix + "wal/aa/1.usv"] = _row("ChIJa", "2026-02-01", "Alpha v2").encode()
+        s3.objects[prefix + "wal/bb/2.usv"] = (
+            _row("ChIJb", "2026-02-01", "Beta stale") + _row("ChIJc", "2026-02-01", "Gamma")
+        ).encode()
+        s3.objects[prefix + "naked.usv"] = _row("ChIJd", "2026-02-01", "Delta").encode()
+        s3.objects[prefix + "prospects.checkpoint.usv"] = b"remote checkpoint"
+        s3.objects[prefix + "_meta.usv"] = b"kept"
+
+        assert manager.isolate_wal() == 3
+        assert not any(k.startswith(prefix + "wal/") for k in s3.objects)
+        assert prefix + "naked.usv" not in s3.objects
+        assert prefix + "_meta.usv" in s3.objects
+        assert len(manager.staging_keys()) == 3
+
+        manager.acquire_staging()
+        manager.merge()
+        rows = manager.checkpoint_path.read_text().splitlines()
+        # Updated in place, stale update ignored, new rows appended in place_id order
+        assert [r.split(US)[2] for r in rows] == ["Alpha v2", "Beta", "Gamma", "Delta"]
+
+        manager.commit_remote()
+        assert s3.objects[prefix + "prospects.checkpoint.usv"] == manager.checkpoint_path.read_bytes()
+
+        manager.cleanup()
+        assert manager.staging_keys() == []
+        assert set(manager.metrics) == {"isolate", "stage", "merge", "parquet", "commit", "cleanup"}
+        assert manager.metrics["stage"].objects == 3
+        assert manager.metrics["merge"].objects == 3
+
+
+def test_merge_appends_without_rewriting_when_nothing_is_replaced(tmp_path):
+    with patch('cocli.core.paths.paths.root', tmp_path):
+        s3 = InMemoryS3()
+        manager = CompactManager("test", s3_client=s3, bucket_name="bucket")
+        manager.index_dir.mkdir(parents=True)
+        manager.checkpoint_path.write_text(_row("ChIJa", "2026-01-01", "Alpha"))
+        inode = manager.checkpoint_path.stat().st_ino
+
+        s3.objects[manager.s3_proc_prefix + "1.usv"] = (
+            _row("ChIJa", "2026-01-01", "Alpha") + _row("ChIJz", "2026-01-01", "Zeta")
+        ).encode()
+        manager.acquire_staging()
+        manager.merge()
+
+        assert manager.checkpoint_path.stat().st_ino == inode
+        assert manager.checkpoint_path.read_text() == _row("ChIJa", "2026-01-01", "Alpha") + _row("ChIJz", "2026-01-01", "Zeta")
+
+        # A second pass with identical data changes nothing and skips the upload
+        manager.acquire_staging()
+        manager.merge()
+        manager.commit_remote()
+        assert manager.s3_index_prefix + "prospects.checkpoint.usv" not in s3.objects
+
+
+def test_merge_dedupes_the_checkpoint_and_drops_malformed_rows(tmp_path):
+    with patch('cocli.core.paths.paths.root', tmp_path):
+        s3 = InMemoryS3()
+        manager = CompactManager("test", s3_client=s3, bucket_name="bucket")
+        manager.index_dir.mkdir(parents=True)
+        manager.checkpoint_path.write_text(
+            _row("ChIJa", "2026-01-01", "Alpha")
+            + _row("ChIJb", "2026-01-01", "Beta old")
+            + US.join(["ChIJshort", "short", "Too few columns"]) + "\n"
+            + _row("ChIJb", "2026-02-01", "Beta")
+            + _row("ChIJc", "2026-01-01", "Gamma").replace(US + "1" + US, US + "one" + US, 1)
+        )
+        s3.objects[manager.s3_proc_prefix + "1.usv"] = (
+            _row("ChIJz", "2026-01-01", "Zeta") + _row("ChIJy", "2026-01-01", "Y" + US + "extra")
+        ).encode()
+        s3.objects[manager.s3_proc_prefix + "2.usv"] = _row("ChIJz", "2026-01-01", "Zeta 2").encode()
+
+        manager.acquire_staging()
+        manager.merge()
+
+        rows = manager.checkpoint_path.read_text().splitlines()
+        # Newest row per place_id; the later staged key wins the tie
+        assert [r.split(US)[2] for r in rows] == ["Alpha", "Beta", "Zeta 2"]
+        assert manager._checkpoint_changed
+
+
+def test_unreadable_staged_objects_go_back_to_the_wal(tmp_path):
+    with patch('cocli.core.paths.paths.root', tmp_path):
+        s3 = InMemoryS3()
+        manager = CompactManager("test", s3_client=s3, bucket_name="bucket", max_workers=2)
+        prefix = manager.s3_index_prefix
+        s3.objects[prefix + "wal/aa/ChIJa.usv"] = _row("ChIJa", "2026-01-01", "Alpha").encode()
+        s3.objects[prefix + "wal/bb/ChIJb.usv"] = _row("ChIJb", "2026-01-01", "Beta").encode()
+
+        assert manager.isolate_wal() == 2
+        s3.unreadable.add(manager.s3_proc_prefix + "bb/ChIJb.usv")
+        manager.acquire_staging()
+        manager.merge()
+        manager.cleanup()
+
+        assert [r.split(US)[2] for r in manager.checkpoint_path.read_text().splitlines()] == ["Alpha"]
+        assert manager.staging_keys() == []
+        returned = [k for k in s3.objects if k.startswith(prefix + "wal/")]
+        assert returned == [f"{prefix}wal/retry/{manager.run_id}/bb/ChIJb.usv"]
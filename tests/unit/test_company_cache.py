@@ -0,0 +1,70 @@
+from typing import Optional
+
+from cocli.core import cache
+from cocli.core.cache import CACHE_FILE_NAME, build_cache, get_cache_path, is_cache_valid
+from cocli.core.paths import paths
+
+
+def _company(slug: str, name: str, tags: str = "[test/default]") -> None:
+    company_dir = paths.companies / slug
+    company_dir.mkdir(parents=True, exist_ok=True)
+    (company_dir / "_index.md").write_text(f"---\nname: {name}\ntags: {tags}\n---")
+
+
+def _names(campaign: Optional[str]) -> list[str]:
+    lines = (get_cache_path(campaign) / CACHE_FILE_NAME).read_text().split("\n")
+    return sorted(line.split("\x1f")[1] for line in lines if line)
+
+
+def test_incremental_rebuild_reextracts_only_changed_entries(mock_cocli_env, mocker):
+    campaign = "test/default"
+    for i in range(5):
+        _company(f"co-{i}", f"Company {i}")
+    (paths.people.path / "jane.md").write_text("---\nname: Jane\ntags: [test/default]\n---")
+
+    build_cache(campaign=campaign)
+    assert is_cache_valid(campaign=campaign)
+    assert _names(campaign) == ["Company 0", "Company 1", "Company 2", "Company 3", "Company 4", "Jane"]
+
+    extract = mocker.spy(cache, "_fast_extract_metadata")
+    cache_file = get_cache_path(campaign) / CACHE_FILE_NAME
+    mtime = cache_file.stat().st_mtime_ns
+
+    # Nothing changed: no extraction and the cache file is left alone
+    build_cache(campaign=campaign)
+    assert extract.call_count == 0
+    assert cache_file.stat().st_mtime_ns == mtime
+
+    # An in-place edit of a nested file leaves the company dir mtime untouched
+    (paths.companies / "co-1" / "_index.md").write_text("---\nname: Company One\ntags: [test/default]\n---")
+    # tags.lst wins over frontmatter tags, dropping co-2 from the campaign
+    (paths.companies / "co-2" / "tags.lst").write_text("other\n")
+    assert not is_cache_valid(campaign=campaign)
+
+    build_cache(campaign=campaign)
+    assert extract.call_count == 2
+    assert is_cache_valid(campaign=campaign)
+    assert _names(campaign) == ["Company 0", "Company 3", "Company 4", "Company One", "Jane"]
+
+    # Removed sources drop out; excluded ones are remembered and not re-read
+    (paths.companies / "co-0" / "_index.md").unlink()
+    assert not is_cache_valid(campaign=campaign)
+    build_cache(campaign=campaign)
+    assert extract.call_count == 2
+    assert _names(campaign) == ["Company 3", "Company 4", "Company One", "Jane"]
+
+    # A full rebuild re-reads everything and yields the same rows
+    build_cache(campaign=campaign, full=True)
+    assert extract.call_count == 2 + 6
+    assert _names(campaign) == ["Company 3", "Company 4", "Company One", "Jane"]
+
+
+def test_cache_written_without_manifest_is_rebuilt(mock_cocli_env):
+    _company("co-a", "Alpha", "[x]")
+    build_cache()
+    assert is_cache_valid()
+
+    (get_cache_path() / CACHE_FILE_NAME).write_text("")
+    assert not is_cache_valid()
+    build_cache()
+    assert "Alpha" in _names(None)
@@ -0,0 +1,66 @@
+from unittest.mock import patch
+
+from cocli.compilers.base import BaseCompiler
+from cocli.compilers.enrichment_compiler import EnrichmentCompiler
+from cocli.core import company_loader
+from cocli.core.company_loader import CompanySnapshot, LoadStats, company_dirs, load_companies
+from cocli.core.paths import paths
+from cocli.core.wal import append_update
+from cocli.models.companies.company import Company
+
+
+def _populate(n: int) -> None:
+    for i in range(n):
+        company_dir = paths.companies / f"co-{i:04d}"
+        company_dir.mkdir(parents=True)
+        (company_dir / "_index.md").write_text(f"---\nname: Company {i}\ndomain: co{i}.test\n---\n")
+        (company_dir / "tags.lst").write_text("roofing\n" if i % 2 else "plumbing\n")
+    broken = paths.companies / "zz-broken"
+    broken.mkdir()
+    (broken / "_index.md").write_text("---\nname: [unclosed\n---\n")
+
+
+def test_parallel_load_matches_serial_and_applies_wal_updates(mock_cocli_env):
+    _populate(40)
+    append_update(paths.companies / "co-0003", "website_url", "https://co3.test/", campaign_name="test")
+
+    dirs = company_dirs()
+    with patch.object(company_loader, "MIN_PARALLEL_DIRS", 0):
+        stats = LoadStats()
+        parallel = list(load_companies(dirs, workers=3, chunk_size=8, stats=stats))
+    serial = list(load_companies(dirs, workers=1))
+
+    assert stats.workers == 3
+    assert (stats.loaded, stats.skipped) == (41, 1)  # includes the environment's watermark company
+    assert [d for d, _ in parallel] == dirs
+    assert [c.model_dump() if c else None for _, c in parallel] == [
+        c.model_dump() if c else None for _, c in serial
+    ]
+    loaded = dict(parallel)
+    assert loaded[paths.companies / "zz-broken"] is None
+    company = loaded[paths.companies / "co-0003"]
+    assert company is not None and company.website_url == "https://co3.test/"
+
+
+def test_compilers_share_one_snapshot(mock_cocli_env):
+    _populate(6)
+    seen = []
+
+    class Recorder(BaseCompiler):
+        def compile(self, company_dir, company=None):
+            seen.append(company)
+
+    compiler = EnrichmentCompiler()
+    compiler.compilers = [Recorder(), Recorder()]
+    with patch.object(Company, "from_directory", wraps=Company.from_directory) as from_directory:
+        compiler.run(campaign_name="roofing")
+
+    # One load per directory for the whole run, then only the campaign's companies are compiled
+    assert from_directory.call_count == 8
+    assert sorted(c.slug for c in seen[::2]) == ["co-0001", "co-0003", "co-0005"]
+    assert all(a is b for a, b in zip(seen[::2], seen[1::2]))
+
+    snapshot = CompanySnapshot.load()
+    assert len(snapshot) == 7
+    assert snapshot.get("co-0002") is not None
+    assert snapshot.get("zz-broken") is None
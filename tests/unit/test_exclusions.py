@@ -0,0 +1,32 @@
+from cocli.core import exclusions
+from cocli.core.exclusions import ExclusionManager
+
+
+def test_exclusions_are_parsed_once_until_changed(mock_cocli_env, mocker):
+    ExclusionManager("test/default").add_exclusion(slug="acme", reason="competitor")
+    load = mocker.spy(exclusions.json, "load")
+
+    assert ExclusionManager("test/default").is_excluded(slug="acme")
+    assert ExclusionManager("test/default").is_excluded(slug="acme")
+    assert load.call_count == 1
+
+    manager = ExclusionManager("test/default")
+    manager.add_exclusion(domain="example.com")
+    assert ExclusionManager("test/default").is_excluded(domain="example.com")
+    manager.remove_exclusion(slug="acme")
+    assert not ExclusionManager("test/default").is_excluded(slug="acme")
+
+
+def test_exclusion_files_rewritten_in_place_are_reloaded(mock_cocli_env):
+    ExclusionManager("test/default").add_exclusion(slug="acme")
+    exclude_dir = ExclusionManager("test/default").exclude_dir
+    dir_mtime = exclude_dir.stat().st_mtime_ns
+
+    # Another process rewrites the file in place: the directory mtime does not move
+    path = exclude_dir / "acme.json"
+    path.write_text(path.read_text().replace('"acme"', '"acme-corp"'))
+    assert exclude_dir.stat().st_mtime_ns == dir_mtime
+
+    manager = ExclusionManager("test/default")
+    assert manager.is_excluded(slug="acme-corp")
+    assert not manager.is_excluded(slug="acme")
@@ -0,0 +1,97 @@
+import json
+import math
+from datetime import datetime, timedelta, UTC
+
+import numpy as np
+import pytest
+
+from cocli.commands.campaign.prospecting import _pending_tiles
+from cocli.core.scrape_index import ScrapeIndex
+from cocli.planning.generate_grid import (
+    TilePlan,
+    generate_global_grid,
+    tile_ids_to_keys,
+    unpack_tile_keys,
+)
+
+
+def test_grid_tiles_cover_the_circle_on_aligned_ids():
+    tiles = generate_global_grid(30.2672, -97.7431, 10)
+    ids = [t["id"] for t in tiles]
+    assert len(ids) == len(set(ids)) == 18
+    assert ids[0] == "30.1_-98.0"
+    assert tiles[0]["center_lat"] == 30.15 and tiles[0]["north_east_lon"] == -97.9
+    # Row-major: south to north, west to east
+    assert ids == sorted(ids, key=lambda i: (float(i.split("_")[0]), float(i.split("_")[1])))
+    assert all(t["est_width_miles"] == tiles[0]["est_width_miles"] for t in tiles)
+
+
+def test_tile_plan_keeps_first_seen_order_and_source_latitude():
+    locations = [
+        {"name": "a", "lat": 30.2, "lon": -97.7},
+        {"name": "bad", "lat": "north", "lon": -97.7},
+        {"name": "b", "lat": 30.5, "lon": -97.5},
+    ]
+    expected, seen = [], set()
+    for loc in (locations[0], locations[2]):
+        for tile in generate_global_grid(loc["lat"], loc["lon"], 15):
+            if tile["id"] not in seen:
+                seen.add(tile["id"])
+                expected.append(tile)
+
+    plan = TilePlan.for_locations(locations, 15)
+    assert list(plan) == expected
+    assert plan.tile_ids() == [t["id"] for t in expected]
+    assert np.array_equal(tile_ids_to_keys(plan.tile_ids()), plan.keys)
+    assert tile_ids_to_keys(["30.20_-97.7", "junk"]).size == 0
+    lat_k, lon_k = unpack_tile_keys(plan.keys[:1])
+    assert (lat_k[0], lon_k[0]) == (round(expected[0]["south_west_lat"] * 10), round(expected[0]["south_west_lon"] * 10))
+
+
+@pytest.fixture
+def scrape_index(tmp_path, mocker):
+    index_dir = tmp_path / "indexes" / "scraped_areas"
+    index_dir.mkdir(parents=True)
+    mocker.patch("cocli.core.scrape_index.get_scraped_areas_index_dir", return_value=index_dir)
+    mocker.patch("cocli.core.config.get_scraped_tiles_index_dir", return_value=tmp_path / "indexes" / "scraped-tiles")
+    return ScrapeIndex()
+
+
+@pytest.mark.parametrize("require_tile_id", [True, False])
+def test_pending_tiles_match_per_tile_checks(scrape_index, require_tile_id):
+    now = datetime.now(UTC)
+    plan = TilePlan.for_locations([{"name": "a", "lat": 30.25, "lon": -97.75}], 20)
+    tile_ids = plan.tile_ids()
+    for n, tile_id in enumerate(tile_ids[:12]):
+        lat, lon = (float(v) for v in tile_id.split("_"))
+        bounds = {"lat_min": lat, "lat_max": lat + 0.1, "lon_min": lon, "lon_max": lon + 0.1}
+        scrape_index.add_area("roofing", bounds, 8.0, 8.0, tile_id=tile_id,
+                              scrape_date=now - timedelta(days=5 if n % 2 else 45))
+    # A legacy overlap area without a tile id covering the last tiles
+    lat, lon = (float(v) for v in tile_ids[-1].split("_"))
+    grid_dir = scrape_index.index_dir / "roofing" / f"lat{math.floor(lat - 0.1)}_lon{math.floor(lon - 0.1)}"
+    grid_dir.mkdir(parents=True, exist_ok=True)
+    name = f"{lat - 0.1:.1f}_{lat + 0.1:.1f}_{lon - 0.1:.1f}_{lon + 0.1:.1f}"
+    (grid_dir / f"{name}.json").write_text(json.dumps({
+        "phrase": "roofing", "scrape_date": now.isoformat(), "lat_min": lat - 0.1, "lat_max": lat + 0.1,
+        "lon_min": lon - 0.1, "lon_max": lon + 0.1, "lat_miles": 13.8, "lon_miles": 12.0,
+    }))
+    scrape_index.refresh()
+
+    expected = []
+    for tile in plan:
+        if scrape_index.is_tile_scraped("roofing", tile["id"], ttl_days=30):
+            expected.append(False)
+            continue
+        bounds = {"lat_min": tile["center_lat"] - 0.05, "lat_max": tile["center_lat"] + 0.05,
+                  "lon_min": tile["center_lon"] - 0.05, "lon_max": tile["center_lon"] + 0.05}
+        match = scrape_index.is_area_scraped("roofing", bounds, overlap_threshold_percent=90.0)
+        expected.append(not (match and (not require_tile_id or match[0].tile_id)))
+
+    mask = _pending_tiles(plan, "roofing", scrape_index, ttl_days=30, require_tile_id=require_tile_id)
+    assert mask.tolist() == expected
+    # Six fresh witnesses; the legacy area only counts without require_tile_id
+    if require_tile_id:
+        assert mask.sum() == len(plan) - 6
+    else:
+        assert mask.sum() < len(plan) - 6
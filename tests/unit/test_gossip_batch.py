@@ -0,0 +1,94 @@
+import socket
+import time
+
+import pytest
+
+from cocli.core.gossip_batch import (
+    FLAG_ZLIB,
+    PeerSender,
+    decode_batch,
+    frame_batch,
+    header_size,
+    is_batch,
+    pack_records,
+)
+from cocli.models.wal.record import DatagramRecord
+
+
+def _records(n: int) -> list[bytes]:
+    return [
+        DatagramRecord(
+            timestamp=f"2026-01-01T00:00:{i % 60:02d}+00:00",
+            node_id="node-a",
+            campaign_name="test",
+            target=f"companies/company-{i}",
+            field="website_url",
+            value=f"https://company-{i}.test",
+        ).to_usv().encode("utf-8")
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_pack_and_decode_round_trip_within_mtu(compress):
+    records = _records(200)
+    mtu = 1400
+    journal = "20260101_node-a.usv"
+    packed = pack_records(records, mtu - header_size("node-a", journal), compress)
+
+    assert len(packed) < len(records)
+    assert sum(count for _, count, _, _ in packed) == len(records)
+    assert sum(raw_len for _, _, _, raw_len in packed) == sum(len(r) for r in records)
+    if compress:
+        assert any(flags & FLAG_ZLIB for flags, _, _, _ in packed)
+
+    decoded = []
+    for seq, (flags, count, payload, _) in enumerate(packed, start=1):
+        datagram = frame_batch("node-a", 42, seq, flags, count, payload, journal=journal, offset=seq * 10, span=5)
+        assert is_batch(datagram)
+        assert len(datagram) <= mtu
+        batch = decode_batch(datagram)
+        assert (batch.node_id, batch.epoch, batch.seq) == ("node-a", 42, seq)
+        assert (batch.journal, batch.offset, batch.span) == (journal, seq * 10, 5)
+        decoded.extend(batch.records)
+
+    assert [r.encode("utf-8") for r in decoded] == records
+
+
+def test_unbatched_framing_and_malformed_batches():
+    records = _records(3)
+    packed = pack_records(records, 0, compress=True)
+    assert [(flags, count) for flags, count, _, _ in packed] == [(0, 1)] * 3
+
+    datagram = frame_batch("node-a", 1, 1, 0, 2, b"".join(records))
+    with pytest.raises(ValueError):
+        decode_batch(datagram)  # declares 2 records, carries 3
+    with pytest.raises(ValueError):
+        decode_batch(datagram[:5])
+    # Old single-record datagrams are plain UTF-8 and never look like a batch
+    assert not is_batch(records[0])
+
+
+def test_peer_sender_delivers_in_order_over_loopback():
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(2.0)
+    sender_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    address = receiver.getsockname()
+
+    sender = PeerSender("peer", sender_sock, lambda: address, rate_bytes_per_sec=10 * 1024 * 1024)
+    try:
+        for seq in range(1, 21):
+            assert sender.offer(frame_batch("node-a", 7, seq, 0, 1, _records(1)[0]))
+        seqs = [decode_batch(receiver.recv(65535)).seq for _ in range(20)]
+        assert seqs == list(range(1, 21))
+
+        deadline = time.monotonic() + 2
+        while sender.datagrams_sent < 20 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sender.datagrams_sent == 20
+        assert sender.pending() == 0
+    finally:
+        sender.stop()
+        receiver.close()
+        sender_sock.close()
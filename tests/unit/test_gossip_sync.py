@@ -0,0 +1,74 @@
+from datetime import datetime, UTC
+
+from cocli.core.gossip_sync import (
+    AntiEntropyClient,
+    AntiEntropyServer,
+    RangeSet,
+    ReceivedRanges,
+    journal_vector,
+)
+
+
+def _record(i: int) -> bytes:
+    return f"2026-01-01T00:00:00+00:00\x1fnode-a\x1ftest\x1fdev\x1fcompanies/c-{i}\x1fname\x1fCompany {i}\x1e".encode()
+
+
+def test_range_set_merges_and_reports_gaps():
+    ranges = RangeSet()
+    ranges.add(10, 20)
+    ranges.add(30, 40)
+    ranges.add(20, 25)  # adjacent: merged
+    assert list(ranges) == [(10, 25), (30, 40)]
+    assert ranges.missing(50) == [(0, 10), (25, 30), (40, 50)]
+
+    ranges.add(5, 35)
+    assert list(ranges) == [(5, 40)]
+    assert ranges.missing(40) == [(0, 5)]
+
+
+def test_received_ranges_persist_and_reset_on_shrink(tmp_path):
+    state = tmp_path / "received.json"
+    received = ReceivedRanges(state)
+    received.add("node-a", "20260101_node-a.usv", 0, 100)
+    received.save()
+
+    reloaded = ReceivedRanges(state)
+    assert reloaded.missing("node-a", "20260101_node-a.usv", 150) == [(100, 150)]
+    # A rewritten journal is pulled again from the start
+    assert reloaded.missing("node-a", "20260101_node-a.usv", 60) == [(0, 60)]
+
+
+def test_reconcile_pulls_only_missing_ranges(tmp_path):
+    wal_a = tmp_path / "a"
+    wal_a.mkdir()
+    today = datetime.now(UTC).strftime("%Y%m%d")
+    journal = f"{today}_node-a.usv"
+    records = [_record(i) for i in range(10)]
+    # Trailing partial record: a writer is mid-append
+    (wal_a / journal).write_bytes(b"".join(records) + b"partial")
+    (wal_a / "remote_node-b.usv").write_bytes(_record(99))  # never served
+    (wal_a / "20200101_node-a.usv").write_bytes(_record(98))  # beyond the horizon
+
+    assert list(journal_vector(wal_a)) == [journal]
+
+    server = AntiEntropyServer(("127.0.0.1", 0), wal_a, "node-a")
+    server.start()
+    try:
+        received = ReceivedRanges(tmp_path / "b" / "received.json")
+        # Records 3-5 arrived over UDP; the rest were lost
+        start = sum(len(r) for r in records[:3])
+        end = start + sum(len(r) for r in records[3:6])
+        received.add("node-a", journal, start, end)
+
+        client = AntiEntropyClient(received, node_id="node-b")
+        pulled = list(client.reconcile(server.server_address))
+        data = b"".join(chunk for _, _, chunk in pulled)
+        assert data == b"".join(records[:3] + records[6:])
+        assert {(peer, name) for peer, name, _ in pulled} == {("node-a", journal)}
+        assert client.bytes_pulled == len(data)
+
+        # Converged: only the partial record is outstanding and nothing is pulled
+        assert list(client.reconcile(server.server_address)) == []
+        assert received.ranges("node-a", journal) == [(0, sum(len(r) for r in records))]
+    finally:
+        server.stop()
@@ -0,0 +1,98 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from cocli.enrichment.http_fast_path import HttpFetcher, detect_js_rendering
+from cocli.enrichment.website_scraper import WebsiteScraper
+from cocli.models.companies.website import Website
+
+NAV = '<nav><a href="/about-us">About Us</a> <a href="/contact">Contact</a></nav>'
+
+STATIC_HOME = """<html><head><title>Acme Roofing | Austin</title>
+<meta name="generator" content="WordPress 6.4"></head>
+<body>""" + NAV + """
+<h1>Acme Roofing</h1>
+<p>Family owned roofing contractor serving Austin and the surrounding Hill Country since 1987.
+We install, repair and inspect shingle, metal and tile roofs for homes and small businesses.</p>
+<a href="https://www.facebook.com/acmeroofing">Facebook</a>
+</body></html>"""
+
+CONTACT = """<html><body><main><p>Call us at (512) 555-0100 or write to
+Sales: sales@acme-roofing.test</p></main></body></html>"""
+
+SPA_SHELL = """<html><head><title>Acme</title><script src="/static/app.js"></script></head>
+<body><noscript>You need to enable JavaScript to run this app.</noscript><div id="root"></div></body></html>"""
+
+
+def test_detect_js_rendering():
+    assert detect_js_rendering(STATIC_HOME) is None
+    assert detect_js_rendering(SPA_SHELL) == "spa_shell"
+    assert detect_js_rendering("<html><body><script>render()</script><p>Loading</p></body></html>") == "thin_content"
+    assert detect_js_rendering("<html><head><title>Just a moment...</title></head><body></body></html>") == "bot_challenge"
+    # A short page without any scripts is just a short page
+    assert detect_js_rendering("<html><body><p>Under construction</p></body></html>") is None
+
+
+@pytest.fixture
+async def site():
+    pages = {"/": STATIC_HOME, "/contact": CONTACT, "/about-us": f"<html><body>{NAV}<main>Since 1987.</main></body></html>"}
+
+    async def handler(request):
+        html = pages.get(request.path)
+        if html is None:
+            raise web.HTTPNotFound()
+        return web.Response(text=html, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    yield pages, f"127.0.0.1:{server.port}"
+    await server.close()
+
+
+@pytest.fixture
+def no_index():
+    with patch("cocli.enrichment.website_scraper.WebsiteDomainCsvManager") as manager, \
+            patch.object(WebsiteScraper, "_save_witness"):
+        manager.return_value.get_by_domain.return_value = None
+        yield
+
+
+async def test_static_site_is_scraped_without_the_browser(site, no_index):
+    _, domain = site
+    browser = MagicMock()
+    async with HttpFetcher(per_host=2) as fetcher:
+        scraper = WebsiteScraper(processed_by="test", http_fetcher=fetcher)
+        scraper._scrape_with_context = AsyncMock()
+        website = await scraper.scrape_website_internal(browser, domain, Website(url=domain))
+
+    scraper._scrape_with_context.assert_not_called()
+    assert str(website.url).rstrip("/") == f"http://{domain}"
+    assert website.title == "Acme Roofing | Austin"
+    assert "WordPress 6.4" in website.tech_stack
+    # No email on the homepage, so the linked pages are fetched too
+    assert str(website.email) == "sales@acme-roofing.test"
+    assert website.email_contexts[website.email] == "Sales"
+    assert website.contact_url == f"http://{domain}/contact"
+    assert website.about_us_url == f"http://{domain}/about-us"
+    assert website.facebook_url == "https://www.facebook.com/acmeroofing"
+    assert fetcher.stats.served == 1 and fetcher.stats.fast_path_rate == 1.0
+
+
+async def test_js_rendered_site_falls_back_to_the_browser(site, no_index):
+    pages, domain = site
+    pages["/"] = SPA_SHELL
+    browser = MagicMock()
+    async with HttpFetcher() as fetcher:
+        scraper = WebsiteScraper(processed_by="test", http_fetcher=fetcher)
+        scraper._scrape_with_context = AsyncMock(side_effect=lambda context, d, website_data, *a: website_data)
+        website = await scraper.scrape_website_internal(browser, domain, Website(url=domain))
+
+    scraper._scrape_with_context.assert_awaited_once()
+    assert scraper._scrape_with_context.await_args.args[0] is browser
+    assert website.all_emails == []
+    assert fetcher.stats.domains == 1 and fetcher.stats.served == 0
+    assert fetcher.stats.fallbacks == {"spa_shell": 1}
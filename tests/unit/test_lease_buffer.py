@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock, patch
+
+from cocli.core.queue.filesystem import FilesystemGmDetailsQueue
+from cocli.core.queue.lease_buffer import LeaseBuffer
+from cocli.models.campaigns.queues.gm_details import GmItemTask
+
+
+def _push(q: FilesystemGmDetailsQueue, n: int) -> None:
+    for i in range(n):
+        q.push(GmItemTask(place_id=f"ChIJtest{i:04d}", campaign_name=q.campaign_name))
+
+
+def test_batch_poll_leases_concurrently_on_s3(tmp_path):
+    with patch('cocli.core.paths.paths.root', tmp_path):
+        s3 = MagicMock()
+        s3.put_object.return_value = {}
+        q = FilesystemGmDetailsQueue("test_batch", s3_client=s3, bucket_name="bucket")
+        _push(q, 5)
+
+        tasks = q.poll(batch_size=3)
+        assert len(tasks) == 3
+        lease_puts = [c for c in s3.put_object.call_args_list if c.kwargs.get("IfNoneMatch") == "*"]
+        assert len(lease_puts) == 3
+
+        q.heartbeat_many([t.ack_token for t in tasks])
+        assert s3.copy_object.call_count == 3
+
+
+async def test_lease_buffer_claims_in_blocks_and_releases_on_close(tmp_path):
+    with patch('cocli.core.paths.paths.root', tmp_path):
+        q = FilesystemGmDetailsQueue("test_batch")
+        _push(q, 5)
+
+        async with LeaseBuffer(q, block_size=3, ack_batch_size=10) as leases:
+            first = await leases.get()
+            second = await leases.get()
+            assert leases.polls == 1
+            assert first is not None and second is not None
+
+            await leases.ack(first)
+            # Ack is deferred until flush
+            assert q._get_task_dir(first.place_id).exists()
+            await leases.nack(second)
+
+        # Close flushed the ack and released the one prefetched-but-unused task
+        assert not q._get_task_dir(first.place_id).exists()
+        leased = [p for p in q.pending_dir.rglob("lease.json")]
+        assert leased == []
+        assert len(q.catalog) == 4
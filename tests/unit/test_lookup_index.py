@@ -0,0 +1,76 @@
+import csv
+import os
+from unittest.mock import patch
+
+from cocli.compilers.google_maps_compiler import GoogleMapsCompiler
+from cocli.core.lookup_index import GoogleMapsLookupIndex
+from cocli.core.paths import paths
+from cocli.models.companies.company import Company
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["Name", "slug", "Domain", "Place ID", "Full Address"])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _source_dir(base):
+    source = base / "campaigns" / "turboship" / "indexes" / "google_maps_prospects"
+    source.mkdir(parents=True)
+    return source
+
+
+def test_lookup_matches_first_row_of_a_scan_and_persists(tmp_path):
+    source = _source_dir(tmp_path)
+    _write_csv(source / "a.csv", [
+        {"Name": "Acme Roofing", "slug": "acme", "Domain": "acme.test", "Place ID": "ChIJacme"},
+        {"Name": "Acme Again", "slug": "acme", "Domain": "", "Place ID": ""},
+    ])
+    _write_csv(source / "b.csv", [
+        {"Name": "Beta by domain", "slug": "", "Domain": "beta.test", "Place ID": "ChIJbeta"},
+        {"Name": "Acme by domain", "slug": "other", "Domain": "acme.test", "Place ID": "ChIJacme"},
+    ])
+
+    with patch("cocli.core.lookup_index.get_cocli_base_dir", return_value=tmp_path):
+        index = GoogleMapsLookupIndex.for_campaign("turboship")
+        assert len(index) == 4
+        assert index.first(slug="acme", domain="acme.test")["Name"] == "Acme Roofing"
+        assert index.first(slug="beta", domain="beta.test")["Name"] == "Beta by domain"
+        assert index.first(slug="missing", domain=None) is None
+        assert index.first(place_id="ChIJbeta")["Name"] == "Beta by domain"
+        assert set(index.duplicates("place_id")) == {"ChIJacme"}
+
+        # Reloaded from the persisted state without reading the CSVs
+        with patch("cocli.core.lookup_index.csv.DictReader") as reader:
+            reloaded = GoogleMapsLookupIndex.for_campaign("turboship")
+        reader.assert_not_called()
+        assert reloaded.first(domain="beta.test") == index.first(domain="beta.test")
+
+        # A changed source rebuilds it
+        _write_csv(source / "b.csv", [{"Name": "Gamma", "slug": "gamma", "Domain": "", "Place ID": ""}])
+        os.utime(source / "b.csv", ns=(1, 1))
+        assert reloaded.is_stale()
+        rebuilt = GoogleMapsLookupIndex.for_campaign("turboship")
+        assert rebuilt.first(slug="gamma")["Name"] == "Gamma"
+        assert rebuilt.first(domain="beta.test") is None
+
+
+def test_compiler_fills_missing_fields_from_the_index(mock_cocli_env):
+    source = _source_dir(mock_cocli_env)
+    _write_csv(source / "prospects.csv", [
+        {"Name": "Acme Roofing LLC", "slug": "acme-test", "Domain": "", "Place ID": "",
+         "Full Address": "1 Main St, Austin, TX 78701"},
+    ])
+    company_dir = paths.companies / "acme-test"
+    company_dir.mkdir()
+    (company_dir / "_index.md").write_text("---\nname: acme-test\n---\n")
+
+    compiler = GoogleMapsCompiler()
+    with patch("cocli.core.lookup_index.get_cocli_base_dir", return_value=mock_cocli_env):
+        compiler.compile(company_dir)
+
+    company = Company.from_directory(company_dir)
+    assert company is not None
+    assert company.name == "Acme Roofing LLC"
+    assert company.full_address == "1 Main St, Austin, TX 78701"
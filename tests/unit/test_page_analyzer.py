@@ -0,0 +1,89 @@
+from pathlib import Path
+
+from selectolax.lexbor import LexborHTMLParser
+
+from cocli.enrichment.page_analyzer import (
+    BOUNDED_EMAIL_RE,
+    KeywordMatcher,
+    analyze_page,
+    find_emails,
+    single_string,
+)
+from cocli.enrichment.website_scraper import WebsiteScraper
+from cocli.models.companies.website import Website
+
+
+def test_analyze_page_on_saved_site():
+    html = Path("tests/data/websites/ace-installations.com.html").read_text()
+    analysis = analyze_page(html, ["Flooring", "Installations", "skateboards"])
+
+    assert "gisele@ace-installations.com" in analysis.emails
+    assert analysis.social_links["instagram"] == "https://www.instagram.com/ace_installationsny/"
+    assert analysis.keywords == ["Flooring", "Installations"]
+    # Scripts and styles are not part of the visible text
+    assert "<script" not in analysis.text and "function(" not in analysis.text
+
+
+def test_email_labels_and_tech():
+    html = """<html><head><meta name="generator" content="WordPress 6.4">
+    <link rel="stylesheet" href="/wp-content/themes/x.css"></head><body>
+    <p>Sales: sales@acme.test</p>
+    <a href="mailto:Office@Acme.test">Email the office</a>
+    <a href="mailto:info@acme.test">info@acme.test</a>
+    <script>var support = "help@acme.test";</script>
+    </body></html>"""
+    analysis = analyze_page(html)
+
+    assert analysis.emails == {
+        "office@acme.test": "Email the office",
+        "sales@acme.test": "Sales",
+        "info@acme.test": "",
+        "help@acme.test": "",
+    }
+    assert analysis.tech == ["WordPress", "WordPress 6.4"]
+
+
+def test_keyword_matcher():
+    matcher = KeywordMatcher(["Roof", "roof repair", "Gutters", ""])
+    assert matcher.find("Emergency ROOF REPAIR in Austin") == {"roof", "roof repair"}
+    assert not KeywordMatcher([])
+
+
+def test_find_emails_matches_the_full_scan():
+    for text in [
+        "write to a@b.co or x.y@mail.example.com.",
+        "@@@ a@@b.co éa@b.cd a@b.cdé user@host",
+        "url(x@2x.png) srcset='logo@2x.png 2x' jane.doe+crm@acme-roofing.test",
+    ]:
+        assert find_emails(text) == BOUNDED_EMAIL_RE.findall(text)
+
+
+def test_single_string():
+    parser = LexborHTMLParser("<h1><b>Acme Roofing</b></h1><h2>Acme <i>Roofing</i></h2>")
+    assert single_string(parser.css_first("h1")) == "Acme Roofing"
+    assert single_string(parser.css_first("h2")) is None
+
+
+class _Page:
+    def __init__(self, url, html):
+        self.url = url
+        self.html = html
+
+    async def content(self):
+        return self.html
+
+
+async def test_scrape_page_extracts_from_one_parse():
+    html = """<html><head><title>Hi</title></head><body>
+    <header><a href="/">Home</a></header><h1><span>Acme Roofing</span></h1>
+    <div class="about-us">We fix roofs.</div><p>Call 512-555-0100</p>
+    <a href="https://facebook.com/acme">fb</a></body></html>"""
+    website = Website(url="acme.test")
+    await WebsiteScraper()._scrape_page(_Page("https://acme.test/", html), website, None, ["roofs"])
+
+    assert website.company_name == "Acme Roofing"
+    assert website.navbar_html.startswith("<header>")
+    assert website.description == "We fix roofs."
+    assert website.phone is not None
+    assert website.facebook_url == "https://facebook.com/acme"
+    assert website.found_keywords == ["roofs"]
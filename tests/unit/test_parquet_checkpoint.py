@@ -0,0 +1,91 @@
+import json
+
+import duckdb
+
+from cocli.core.prospect_compactor import write_prospects_parquet
+from cocli.models.campaigns.indexes.google_maps_place import GoogleMapsPlace
+from cocli.models.campaigns.indexes.google_maps_prospect import GoogleMapsProspect
+from cocli.utils.duckdb_utils import fresh_parquet_glob, load_usv_to_duckdb, parquet_path_for
+
+
+def _write_checkpoint(path, n):
+    with open(path, "w") as f:
+        for i in range(n):
+            f.write(GoogleMapsProspect.model_validate({
+                "place_id": f"ChIJ0{'abcXYZ'[i % 6]}{i:015d}",
+                "company_slug": f"company-{i}",
+                "name": f"Company {i}",
+                "state": ["TX", "CA"][i % 2],
+                "first_category": "Roofer",
+                "reviews_count": i,
+                "average_rating": 4.5,
+            }).to_usv())
+
+
+def _datapackage(tmp_path):
+    dp = tmp_path / "datapackage.json"
+    dp.write_text(json.dumps({"resources": [{"schema": {"fields": GoogleMapsPlace.get_datapackage_fields()}}]}))
+    return dp
+
+
+def test_parquet_copy_is_typed_sorted_and_preferred_while_fresh(tmp_path):
+    checkpoint = tmp_path / "prospects.checkpoint.usv"
+    _write_checkpoint(checkpoint, 60)
+
+    parquet_dir = write_prospects_parquet(checkpoint)
+    assert parquet_dir == parquet_path_for(checkpoint)
+    # Partitioned by place_id shard, case-folded
+    assert sorted(p.name for p in parquet_dir.iterdir() if p.is_dir()) == [
+        "shard=a", "shard=b", "shard=c", "shard=x", "shard=y", "shard=z"
+    ]
+    glob = fresh_parquet_glob(checkpoint)
+    assert glob
+
+    con = duckdb.connect()
+    meta = con.execute(
+        f"SELECT path_in_schema, stats_min, stats_max, compression FROM parquet_metadata('{glob}') "
+        "WHERE path_in_schema IN ('place_id', 'state', 'first_category')"
+    ).fetchall()
+    assert {row[0] for row in meta} == {"place_id", "state", "first_category"}
+    assert all(row[1] is not None and row[2] is not None for row in meta)
+    assert {row[3] for row in meta} == {"ZSTD"}
+
+    dp = _datapackage(tmp_path)
+    load_usv_to_duckdb(con, "from_parquet", checkpoint, dp)
+    load_usv_to_duckdb(con, "from_usv", checkpoint, dp, prefer_parquet=False)
+    diff = con.execute(
+        "SELECT count(*) FROM (SELECT * FROM from_parquet EXCEPT SELECT * FROM from_usv)"
+    ).fetchone()
+    assert diff == (0,)
+    assert con.execute("SELECT typeof(reviews_count) FROM from_parquet LIMIT 1").fetchone() == ("BIGINT",)
+
+    # A direct append makes the copy stale; readers fall back to the USV
+    _write_checkpoint(checkpoint, 61)
+    assert fresh_parquet_glob(checkpoint) is None
+    load_usv_to_duckdb(con, "after_append", checkpoint, dp)
+    assert con.execute("SELECT count(*) FROM after_append").fetchone() == (61,)
+
+
+def test_worker_stats_agree_between_parquet_and_usv(mock_cocli_env):
+    from cocli.core import reporting
+    from cocli.core.prospects_csv_manager import ProspectsIndexManager
+
+    checkpoint = ProspectsIndexManager("test").index_dir / "prospects.checkpoint.usv"
+    checkpoint.parent.mkdir(parents=True, exist_ok=True)
+    with open(checkpoint, "w") as f:
+        for i, worker in enumerate(["local-worker", "fargate-worker", "fargate-worker", "laptop"]):
+            f.write(GoogleMapsProspect.model_validate({
+                "place_id": f"ChIJ0a{i:015d}",
+                "company_slug": f"company-{i}",
+                "name": f"Company {i}",
+                "reviews_count": 12,
+                "processed_by": worker,
+            }).to_usv())
+
+    from_usv = reporting._count_prospects("test")
+    assert from_usv == (4, {"local-worker": 1, "fargate-worker": 2, "unknown": 1})
+
+    write_prospects_parquet(checkpoint)
+    assert fresh_parquet_glob(checkpoint)
+    reporting._prospect_counts.clear()
+    assert reporting._count_prospects("test") == from_usv
@@ -0,0 +1,75 @@
+import json
+from unittest.mock import patch
+
+from cocli.core.queue.filesystem import FilesystemGmDetailsQueue
+from cocli.core.queue.pending_catalog import PendingCatalog
+from cocli.models.campaigns.queues.gm_details import GmItemTask
+
+
+def _task(place_id: str, campaign: str) -> GmItemTask:
+    return GmItemTask(place_id=place_id, campaign_name=campaign, name="Test Co")
+
+
+def test_push_poll_ack_maintain_catalog(tmp_path):
+    with patch('cocli.core.paths.paths.root', tmp_path):
+        campaign = "test_catalog"
+        q = FilesystemGmDetailsQueue(campaign)
+
+        ids = ["ChIJaaaaa1", "ChIJbbbbb2", "ChIJccccc3"]
+        for pid in ids:
+            q.push(_task(pid, campaign))
+
+        assert len(q.catalog) == 3
+        assert q.catalog.catalog_path.exists()
+
+        tasks = q.poll(batch_size=2)
+        assert len(tasks) == 2
+        assert {t.place_id for t in tasks} <= set(ids)
+
+        q.ack(tasks[0])
+        assert len(q.catalog) == 2
+        assert q._get_task_dir(tasks[0].place_id) not in q.catalog
+
+        # A fresh instance replays the journal instead of walking pending/
+        q2 = FilesystemGmDetailsQueue(campaign)
+        assert len(q2.catalog) == 2
+
+
+def test_refresh_picks_up_externally_synced_tasks(tmp_path):
+    with patch('cocli.core.paths.paths.root', tmp_path):
+        campaign = "test_catalog"
+        q = FilesystemGmDetailsQueue(campaign)
+        q.push(_task("ChIJaaaaa1", campaign))
+        q.catalog.refresh()
+
+        # Simulate smart_sync dropping a task directly into a new shard
+        synced_dir = q.pending_dir / "z" / "ChIJzzzzz9"
+        synced_dir.mkdir(parents=True)
+        (synced_dir / "task.json").write_text(
+            json.dumps(_task("ChIJzzzzz9", campaign).model_dump())
+        )
+
+        assert q.catalog.refresh() >= 1
+        assert synced_dir in q.catalog
+
+        tasks = q.poll(batch_size=10)
+        assert {t.place_id for t in tasks} == {"ChIJaaaaa1", "ChIJzzzzz9"}
+
+
+def test_stale_entries_are_discarded_and_rebuild_reconciles(tmp_path):
+    pending = tmp_path / "pending"
+    (pending / "a" / "task-1").mkdir(parents=True)
+    (pending / "a" / "task-1" / "task.json").write_text("{}")
+    (pending / "legacy-task").mkdir()
+
+    catalog = PendingCatalog(pending, tmp_path / "pending.catalog.usv")
+    assert catalog.rebuild() == 2
+    assert pending / "legacy-task" in catalog
+
+    catalog.discard("a", "task-1")
+    assert len(catalog) == 1
+
+    # Rebuild is the authority: it restores anything still on disk
+    reloaded = PendingCatalog(pending, tmp_path / "pending.catalog.usv")
+    assert reloaded.rebuild() == 2
+    assert sorted(tid for _, tid in reloaded.candidates()) == ["legacy-task", "task-1"]
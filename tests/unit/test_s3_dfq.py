@@ -104,3 +104,81 @@ def test_s3_ack_immediate_cleanup(tmp_path, mock_s3):
         keys = [obj['Key'] for obj in kwargs['Delete']['Objects']]
         assert any("task.json" in k for k in keys)
         assert any("lease.json" in k for k in keys)
+
+
+def test_s3_discovery_caches_shards_and_resumes_listing(tmp_path, mock_s3):
+    from cocli.core.queue.filesystem import FilesystemGmDetailsQueue
+
+    with patch('cocli.core.paths.paths.root', tmp_path):
+        campaign = "test_s3_campaign"
+        q = FilesystemGmDetailsQueue(campaign, s3_client=mock_s3, bucket_name="test-bucket")
+        prefix = f"campaigns/{campaign}/queues/gm-details/pending/"
+
+        paginator = MagicMock()
+        paginator.paginate.return_value = [{"CommonPrefixes": [{"Prefix": f"{prefix}a/"}]}]
+        mock_s3.get_paginator.return_value = paginator
+
+        now = datetime.now(UTC)
+        mock_s3.list_objects_v2.return_value = {
+            "IsTruncated": True,
+            "Contents": [
+                {"Key": f"{prefix}a/ChIJaaaaa1/task.json", "LastModified": now},
+                {"Key": f"{prefix}a/ChIJaaaaa2/lease.json", "LastModified": now},
+                {"Key": f"{prefix}a/ChIJaaaaa2/task.json", "LastModified": now},
+            ],
+        }
+
+        def fake_download(bucket, key, dest):
+            with open(dest, "w") as f:
+                json.dump({"place_id": key.split("/")[-2], "campaign_name": campaign}, f)
+
+        mock_s3.download_file.side_effect = fake_download
+
+        assert q._discover_tasks_from_s3() == 1
+        assert (q._get_task_dir("ChIJaaaaa1") / "task.json").exists()
+        assert q._get_task_dir("ChIJaaaaa1") in q.catalog
+
+        # Second round: shard listing comes from cache, shard listing resumes after the last key
+        q._discover_tasks_from_s3()
+        assert paginator.paginate.call_count == 1
+        _, kwargs = mock_s3.list_objects_v2.call_args
+        assert kwargs["StartAfter"] == f"{prefix}a/ChIJaaaaa2/task.json"
+
+
+def test_s3_discovery_keeps_lease_split_across_pages(tmp_path, mock_s3):
+    from cocli.core.queue.filesystem import FilesystemGmDetailsQueue
+
+    with patch('cocli.core.paths.paths.root', tmp_path):
+        campaign = "test_s3_campaign"
+        q = FilesystemGmDetailsQueue(campaign, s3_client=mock_s3, bucket_name="test-bucket")
+        prefix = f"campaigns/{campaign}/queues/gm-details/pending/"
+
+        paginator = MagicMock()
+        paginator.paginate.return_value = [{"CommonPrefixes": [{"Prefix": f"{prefix}a/"}]}]
+        mock_s3.get_paginator.return_value = paginator
+
+        now = datetime.now(UTC)
+        mock_s3.list_objects_v2.side_effect = [
+            {
+                "IsTruncated": True,
+                "Contents": [{"Key": f"{prefix}a/ChIJaaaaa1/lease.json", "LastModified": now}],
+            },
+            {
+                "IsTruncated": False,
+                "Contents": [
+                    {"Key": f"{prefix}a/ChIJaaaaa1/task.json", "LastModified": now},
+                    {"Key": f"{prefix}a/ChIJaaaaa2/task.json", "LastModified": now},
+                ],
+            },
+        ]
+
+        def fake_download(bucket, key, dest):
+            with open(dest, "w") as f:
+                json.dump({"place_id": key.split("/")[-2], "campaign_name": campaign}, f)
+
+        mock_s3.download_file.side_effect = fake_download
+
+        assert q._discover_tasks_from_s3() == 0
+        assert q._discover_tasks_from_s3() == 1
+        assert not (q._get_task_dir("ChIJaaaaa1") / "task.json").exists()
+        assert (q._get_task_dir("ChIJaaaaa2") / "task.json").exists()
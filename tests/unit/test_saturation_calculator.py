@@ -0,0 +1,50 @@
+import random
+from datetime import datetime, UTC
+
+import pytest
+
+from cocli.core.saturation_calculator import (
+    calculate_saturation_score,
+    calculate_saturation_scores,
+    get_min_max_distance,
+)
+from cocli.core.scrape_index import ScrapedArea
+from cocli.models.target_location import TargetLocation
+
+
+def _area(lat, lon, size=0.1):
+    return ScrapedArea("roofing", datetime.now(UTC), lat, lat + size, lon, lon + size, 7.0, 6.0, 0)
+
+
+def _reference_score(target, areas, max_proximity):
+    total = 0.0
+    for area in areas:
+        min_dist, max_dist = get_min_max_distance(target.lat, target.lon, area)
+        if min_dist <= max_proximity:
+            total += (max_dist - min_dist) / (1.0 + max(0.0, min_dist))
+    return total
+
+
+def test_vectorized_scores_match_per_area_loop():
+    rng = random.Random(7)
+    areas = [_area(rng.uniform(29.0, 31.0), rng.uniform(-98.0, -96.0)) for _ in range(400)]
+    # Areas straddling the antimeridian and near the pole
+    areas += [_area(rng.uniform(-10.0, 10.0), rng.uniform(179.5, 179.85)) for _ in range(50)]
+    areas.append(_area(-0.05, 179.88))
+    areas += [_area(89.8, rng.uniform(-180.0, 179.8)) for _ in range(20)]
+
+    targets = [TargetLocation(name=f"t{i}", lat=rng.uniform(28.5, 31.5), lon=rng.uniform(-98.5, -95.5)) for i in range(60)]
+    targets += [TargetLocation(name="dateline", lat=0.0, lon=-179.9), TargetLocation(name="pole", lat=89.95, lon=10.0)]
+    targets += [TargetLocation(name="far", lat=-40.0, lon=20.0)]
+
+    scores = calculate_saturation_scores(targets, areas, max_proximity=20.0)
+    expected = [_reference_score(t, areas, 20.0) for t in targets]
+    assert list(scores) == pytest.approx(expected, rel=1e-9, abs=1e-9)
+    assert scores[-3] > 0 and scores[-2] > 0 and scores[-1] == 0.0
+    assert calculate_saturation_score(targets[0], areas) == pytest.approx(expected[0])
+
+
+def test_empty_inputs_score_zero():
+    target = TargetLocation(name="t", lat=30.0, lon=-97.0)
+    assert list(calculate_saturation_scores([target], [])) == [0.0]
+    assert len(calculate_saturation_scores([], [_area(30.0, -97.0)])) == 0
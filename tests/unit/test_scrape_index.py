@@ -1,3 +1,6 @@
+import math
+from datetime import datetime, timedelta, UTC
+
 from cocli.core.scrape_index import ScrapeIndex, _calculate_overlap_area
 from pathlib import Path
 import pytest
@@ -49,3 +52,96 @@ def test_calculate_overlap_area():
     bounds2 = {'lat_min': 15.0, 'lat_max': 18.0, 'lon_min': 30.0, 'lon_max': 40.0}
     expected_overlap = (18.0 - 15.0) * (40.0 - 30.0) # 3 * 10 = 30
     assert _calculate_overlap_area(bounds1, bounds2) == pytest.approx(expected_overlap)
+
+
+@pytest.fixture
+def isolated_scrape_index(temp_scrape_index_dir, mocker):
+    """ScrapeIndex over temporary legacy and witness trees."""
+    witness_dir = temp_scrape_index_dir.parent / "scraped-tiles"
+    mocker.patch("cocli.core.config.get_scraped_tiles_index_dir", return_value=witness_dir)
+    return ScrapeIndex()
+
+
+def _write_legacy(index_dir, phrase, name, scrape_date, tile_id=None):
+    import json
+    lat_min, lat_max, lon_min, lon_max = (float(p) for p in name.split("_"))
+    grid_dir = index_dir / phrase / f"lat{math.floor(lat_min)}_lon{math.floor(lon_min)}"
+    grid_dir.mkdir(parents=True, exist_ok=True)
+    (grid_dir / f"{name}.json").write_text(json.dumps({
+        "phrase": phrase, "scrape_date": scrape_date.isoformat(),
+        "lat_min": lat_min, "lat_max": lat_max, "lon_min": lon_min, "lon_max": lon_max,
+        "lat_miles": 7.0, "lon_miles": 6.0, "items_found": 3, "tile_id": tile_id,
+    }))
+
+
+def test_area_overlap_threshold_and_ttl(isolated_scrape_index, temp_scrape_index_dir):
+    now = datetime.now(UTC)
+    _write_legacy(temp_scrape_index_dir, "roofing", "30.0_30.5_-98.0_-97.5", now - timedelta(days=40))
+    _write_legacy(temp_scrape_index_dir, "roofing", "30.0_30.1_-97.5_-97.4", now)
+
+    old_box = {'lat_min': 30.0, 'lat_max': 30.5, 'lon_min': -98.0, 'lon_max': -97.5}
+    match = isolated_scrape_index.is_area_scraped("Roofing", old_box, overlap_threshold_percent=90.0)
+    assert match is not None
+    assert match[0].items_found == 3
+    assert match[1] == pytest.approx(100.0)
+    assert isolated_scrape_index.is_area_scraped("roofing", old_box, ttl_days=30, overlap_threshold_percent=1.0) is None
+
+    half = {'lat_min': 30.0, 'lat_max': 30.1, 'lon_min': -97.55, 'lon_max': -97.45}
+    assert isolated_scrape_index.is_area_scraped("roofing", half, overlap_threshold_percent=60.0) is None
+    results = isolated_scrape_index.query_many(
+        "roofing", [half, old_box], ttl_days=30, overlap_threshold_percent=40.0
+    )
+    assert results[0] is not None and results[0][1] == pytest.approx(50.0)
+    assert results[1] is None
+    assert isolated_scrape_index.is_area_scraped("plumbing", old_box) is None
+
+
+def test_witness_tiles_are_indexed_incrementally(isolated_scrape_index):
+    index = isolated_scrape_index
+    assert index.is_tile_scraped("roofing", "30.2_-97.7") is None
+
+    index.add_area("roofing", {'lat_min': 30.15, 'lat_max': 30.25, 'lon_min': -97.75, 'lon_max': -97.65},
+                   8.0, 8.0, items_found=12, tile_id="30.2_-97.7", processed_by="worker-1",
+                   scrape_date=datetime.now(UTC) - timedelta(days=10))
+
+    area = index.is_tile_scraped("roofing", "30.2_-97.7")
+    assert area is not None
+    assert (area.items_found, area.processed_by) == (12, "worker-1")
+    assert index.is_tile_scraped("roofing", "30.2_-97.7", ttl_days=5) is None
+    assert [a.tile_id for a in index.get_all_scraped_areas()] == ["30.2_-97.7"]
+
+
+def test_snapshot_skips_unchanged_files(isolated_scrape_index, temp_scrape_index_dir, mocker):
+    now = datetime.now(UTC)
+    _write_legacy(temp_scrape_index_dir, "roofing", "30.0_30.5_-98.0_-97.5", now, tile_id="30.2_-97.7")
+    isolated_scrape_index.refresh()
+    assert isolated_scrape_index.snapshot_path.exists()
+
+    fresh = ScrapeIndex()
+    loader = mocker.spy(fresh, "_load_area_from_file")
+    assert len(fresh.get_all_areas_for_phrases(["roofing"])) == 1
+    loader.assert_not_called()
+
+    _write_legacy(temp_scrape_index_dir, "roofing", "31.0_31.5_-98.0_-97.5", now)
+    fresh.refresh()
+    assert loader.call_count == 1
+    assert len(fresh.get_all_areas_for_phrases(["roofing"])) == 2
+
+
+def test_tiles_written_elsewhere_are_seen_without_a_tree_scan(isolated_scrape_index, mocker):
+    index = isolated_scrape_index
+    bounds = {'lat_min': 30.15, 'lat_max': 30.25, 'lon_min': -97.75, 'lon_max': -97.65}
+    scan = mocker.spy(ScrapeIndex, "_scan_tree")
+    assert index.is_tile_scraped("roofing", "30.2_-97.7") is None
+    scan.assert_not_called()
+
+    # Another worker scrapes the tile
+    ScrapeIndex().add_area("roofing", bounds, 8.0, 8.0, items_found=4, tile_id="30.2_-97.7")
+    area = index.is_tile_scraped("roofing", "30.2_-97.7")
+    assert area is not None and area.items_found == 4
+
+    # A loaded index does not wait for its next re-scan either
+    index.refresh()
+    ScrapeIndex().add_area("roofing", bounds, 8.0, 8.0, items_found=0, tile_id="30.3_-97.7")
+    assert index.is_tile_scraped("roofing", "30.3_-97.7") is not None
+    assert [a.tile_id for a in index.get_all_scraped_areas()] == ["30.2_-97.7", "30.3_-97.7"]
@@ -0,0 +1,159 @@
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from cocli.core.search_index import SearchIndex, SearchSource, compacted_fallback_columns
+from cocli.models.campaigns.indexes.google_maps_place import GoogleMapsPlace
+
+PLACE_FIELDS = [f["name"] for f in GoogleMapsPlace.get_datapackage_fields()]
+
+
+def _datapackage(path: Path, fields: List[str]) -> Path:
+    path.write_text(json.dumps({"resources": [{"schema": {"fields": [{"name": f, "type": "string"}
+                                                                      for f in fields]}}]}))
+    return path
+
+
+def _usv(fields: List[str], rows: List[Dict[str, str]]) -> str:
+    return "".join("\x1f".join(row.get(f, "") for f in fields) + "\n" for row in rows)
+
+
+def _place(n: int, **extra: str) -> Dict[str, str]:
+    return {"place_id": f"ChIJ{n:04d}", "slug": f"company-{n}", "name": f"Company {n}",
+            "updated_at": "2026-01-01", **extra}
+
+
+@pytest.fixture
+def sources(tmp_path: Path) -> Dict[str, Path]:
+    cache_fields = ["slug", "name", "type", "domain", "email", "phone_number", "tags", "display"]
+    lifecycle_fields = ["place_id", "scraped_at", "enqueued_at"]
+    files = {
+        "cache": tmp_path / "cache.usv",
+        "cache_dp": _datapackage(tmp_path / "cache_dp.json", cache_fields),
+        "prospects": tmp_path / "prospects.checkpoint.usv",
+        "lifecycle": tmp_path / "lifecycle.usv",
+        "lifecycle_dp": _datapackage(tmp_path / "lifecycle_dp.json", lifecycle_fields),
+        "to_call": tmp_path / "to-call",
+    }
+    files["cache"].write_text(_usv(cache_fields, [{"slug": "company-1", "email": "a@company1.test", "tags": "roofing"},
+                                                  {"slug": "cache-only", "name": "Cache Only"}]))
+    files["prospects"].write_text(_usv(PLACE_FIELDS, [_place(n) for n in range(1, 5)]))
+    files["lifecycle"].write_text(_usv(lifecycle_fields, [{"place_id": "ChIJ0001", "scraped_at": "2026-01-02"}]))
+    files["to_call"].mkdir()
+    return files
+
+
+def _index(files: Dict[str, Path], db_path: Path | None = None) -> SearchIndex:
+    return SearchIndex(db_path, [
+        SearchSource("items_cache", files["cache"], files["cache_dp"]),
+        SearchSource("items_prospects", files["prospects"], append_only=True, place_schema=True),
+        SearchSource("items_venues", None, place_schema=True),
+        SearchSource("items_compacted", None, key="place_id", fallback_columns=compacted_fallback_columns()),
+        SearchSource("items_lifecycle", files["lifecycle"], files["lifecycle_dp"], key="place_id"),
+        SearchSource("items_to_call", files["to_call"]),
+    ])
+
+
+def _items(index: SearchIndex) -> List[tuple]:
+    return index.con.execute("SELECT * FROM items ORDER BY slug").fetchall()
+
+
+def _assert_matches_full_build(index: SearchIndex, files: Dict[str, Path]) -> None:
+    fresh = _index(files)
+    fresh.refresh()
+    assert _items(index) == _items(fresh)
+
+
+def test_checkpoint_append_is_loaded_as_delta(sources):
+    index = _index(sources)
+    assert index.refresh().rebuilt
+    assert not index.refresh().changed
+
+    with open(sources["prospects"], "a") as f:
+        f.write(_usv(PLACE_FIELDS, [_place(5), _place(1, updated_at="2026-02-01", phone="555-0100")]))
+        # Record still being written
+        f.write("ChIJ0006\x1fcompany-6")
+
+    stats = index.refresh()
+    assert stats.deltas == {"items_prospects": 2}
+    assert stats.reloaded == [] and not stats.rebuilt
+    assert stats.patched_slugs == 2
+    row = index.con.execute("SELECT phone_number, email FROM items WHERE slug = 'company-1'").fetchone()
+    assert row == ("555-0100", "a@company1.test")
+
+    with open(sources["prospects"], "a") as f:
+        f.write("\x1f" * (len(PLACE_FIELDS) - 2) + "\n")
+    assert index.refresh().deltas == {"items_prospects": 1}
+    _assert_matches_full_build(index, sources)
+
+
+def test_to_call_and_lifecycle_changes_patch_affected_slugs(sources):
+    index = _index(sources)
+    index.refresh()
+
+    (sources["to_call"] / "company-2.usv").write_text("")
+    stats = index.refresh()
+    assert stats.patched_slugs == 1 and not stats.rebuilt
+    assert index.con.execute("SELECT slug FROM items WHERE is_to_call").fetchall() == [("company-2",)]
+
+    # Rewritten sources are diffed on their key; place_ids map to slugs
+    sources["lifecycle"].write_text(_usv(["place_id", "scraped_at", "enqueued_at"],
+                                         [{"place_id": "ChIJ0001", "scraped_at": "2026-01-02"},
+                                          {"place_id": "ChIJ0003", "enqueued_at": "2026-03-01"}]))
+    stats = index.refresh()
+    assert stats.reloaded == ["items_lifecycle"]
+    assert stats.patched_slugs == 1 and not stats.rebuilt
+    _assert_matches_full_build(index, sources)
+
+    (sources["to_call"] / "company-2.usv").unlink()
+    index.refresh()
+    _assert_matches_full_build(index, sources)
+
+
+def test_schema_change_rebuilds_and_persisted_index_is_reused(sources, tmp_path):
+    db_path = tmp_path / "search.duckdb"
+    index = _index(sources, db_path)
+    index.refresh()
+    expected = _items(index)
+    index.close()
+
+    reopened = _index(sources, db_path)
+    assert not reopened.refresh().changed
+    assert _items(reopened) == expected
+
+    _datapackage(sources["lifecycle_dp"], ["place_id", "scraped_at", "enqueued_at", "enriched_at"])
+    sources["lifecycle"].write_text(_usv(["place_id", "scraped_at", "enqueued_at", "enriched_at"],
+                                         [{"place_id": "ChIJ0002", "enriched_at": "2026-04-01"}]))
+    assert reopened.refresh().rebuilt
+    row = reopened.con.execute("SELECT last_enriched FROM items WHERE slug = 'company-2'").fetchone()
+    assert row == ("2026-04-01",)
+    _assert_matches_full_build(reopened, sources)
+    reopened.close()
+
+
+def test_patches_reach_the_text_index(sources):
+    index = _index(sources)
+    index.refresh()
+    assert index.text_index().search("company 5") == []
+
+    with open(sources["prospects"], "a") as f:
+        f.write(_usv(PLACE_FIELDS, [_place(5), _place(2, name="Renamed Roofing", updated_at="2026-02-01")]))
+    index.refresh()
+    assert index.text_index().search("company 5") == ["company-5"]
+    assert index.text_index().search("roofing") == ["company-2", "company-1"]
+
+
+def test_refresh_only_stats_unchanged_sources(sources, mocker):
+    index = _index(sources)
+    index.refresh()
+    refresh_source = mocker.spy(index, "_refresh_source")
+
+    assert not index.refresh().changed
+    refresh_source.assert_not_called()
+
+    (sources["to_call"] / "company-2.usv").write_text("")
+    assert index.refresh().changed
+    assert refresh_source.call_count == len(index.sources)
+
@@ -1,8 +1,12 @@
+import time
+
 import pytest
 from slugify import slugify
 
+from cocli.application import search_service
 from cocli.application.search_service import get_fuzzy_search_results
 from cocli.core.paths import paths
+from cocli.core import cache
 from cocli.core.cache import build_cache
 
 
@@ -98,3 +102,67 @@ def test_get_fuzzy_search_results_namespaced_campaign(mock_cocli_env):
     )
     assert len(results) == 1
     assert results[0].name == comp_name
+
+
+def test_exclusions_are_applied_before_pagination(populated_env, mocker):
+    """Excluded items do not leave a page short."""
+    from cocli.models.campaigns.indexes.exclusion import Exclusion
+
+    mocker.patch(
+        "cocli.application.search_service.ExclusionManager.list_exclusions",
+        return_value=[Exclusion(domain=None, company_slug="bizkite", campaign="test/default")],
+    )
+
+    page = get_fuzzy_search_results(item_type="company", campaign_name="test/default", limit=2)
+    assert [r.slug for r in page] == ["green-energy", "tech-solutions"]
+
+    page = get_fuzzy_search_results(search_query="e", campaign_name="test/default", limit=2)
+    assert sorted(r.slug for r in page) == ["green-energy", "tech-solutions"]
+
+
+def test_keyset_pages_match_offset_pages(populated_env):
+    """Seeking after the last slug of a page returns the same rows as OFFSET."""
+    first = get_fuzzy_search_results(item_type="company", campaign_name="test/default", limit=2)
+    by_offset = get_fuzzy_search_results(item_type="company", campaign_name="test/default", limit=2, offset=2)
+    by_key = get_fuzzy_search_results(
+        item_type="company", campaign_name="test/default", limit=2, after=first[-1].slug
+    )
+    assert [r.slug for r in by_key] == [r.slug for r in by_offset] == ["tech-solutions"]
+    assert by_key[0].model_dump() == by_offset[0].model_dump()
+
+
+def test_searches_scan_company_sources_only_when_a_check_is_due(populated_env, mocker):
+    scan = mocker.spy(cache, "_scan_sources")
+    for query in ("B", "Bi", "Biz"):
+        results = get_fuzzy_search_results(search_query=query, campaign_name="test/default")
+        assert [r.slug for r in results] == ["bizkite"]
+    assert scan.call_count == 1
+
+    # A new company changes the companies directory: seen on the next keystroke
+    comp_dir = paths.companies / "bizbuzz"
+    comp_dir.mkdir()
+    (comp_dir / "_index.md").write_text("---\nname: BizBuzz\ntags:\n  - test/default\n---")
+    results = get_fuzzy_search_results(search_query="Biz", campaign_name="test/default")
+    assert sorted(r.slug for r in results) == ["bizbuzz", "bizkite"]
+    assert scan.call_count == 2
+
+    # In-place edits are seen once the interval has passed
+    (comp_dir / "_index.md").write_text("---\nname: BuzzCo\ntags:\n  - test/default\n---")
+    clock = mocker.patch.object(search_service.time, "monotonic", return_value=time.monotonic())
+    clock.return_value += search_service.FRESHNESS_INTERVAL + 1
+    assert [r.name for r in get_fuzzy_search_results(search_query="buzz", campaign_name="test/default")] == ["BuzzCo"]
+    assert scan.call_count == 3
+
+
+def test_exclusions_are_reloaded_when_they_change(populated_env, mocker):
+    from cocli.core.exclusions import ExclusionManager
+
+    load = mocker.spy(search_service.ExclusionManager, "list_exclusions")
+    for query in ("B", "Bi"):
+        assert get_fuzzy_search_results(search_query=query, campaign_name="test/default")
+    assert load.call_count == 1
+
+    ExclusionManager("test/default").add_exclusion(slug="bizkite")
+    assert get_fuzzy_search_results(search_query="Biz", campaign_name="test/default") == []
+    assert load.call_count == 2
+
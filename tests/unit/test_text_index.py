@@ -0,0 +1,83 @@
+from typing import List, Optional
+
+from cocli.core.text_index import TextFilter, TextIndex, TextRow
+
+
+def _row(slug: str, name: Optional[str], city: Optional[str] = None, tags: str = "", **attrs: bool) -> TextRow:
+    return TextRow(slug, name, f"{slug}.test", city, tags, "company",
+                   attrs.get("has_email", False), attrs.get("has_phone", False), attrs.get("is_to_call", False))
+
+
+ROWS = sorted([
+    _row("acme-roofing", "Acme Roofing", "Austin", has_email=True),
+    _row("roof-masters", "Roof Masters", "Dallas", has_phone=True),
+    _row("best-roofers", "Best Roofers", "Austin", tags="roofing,repair", has_email=True, has_phone=True),
+    _row("sunny-solar", "Sunny Solar", "Roofton", is_to_call=True),
+    _row("quiet-plumbing", "Quiet Plumbing", "Austin", tags="plumbing"),
+    _row("nameless", None, "Austin"),
+], key=lambda r: r.slug)
+
+
+def _brute(rows: List[TextRow], query: str, text_filter: TextFilter) -> List[str]:
+    q = query.lower()
+    tiers: List[List[str]] = [[], [], []]
+    for row in rows:
+        name = (row.name or "").lower()
+        other = " ".join((v or "").lower() for v in (row.slug, row.domain, row.city, row.tags))
+        if not text_filter.accepts(row):
+            continue
+        if name.startswith(q):
+            tiers[0].append(row.slug)
+        elif q in name:
+            tiers[1].append(row.slug)
+        elif q in other:
+            tiers[2].append(row.slug)
+    return sorted(tiers[0]) + sorted(tiers[1]) + sorted(tiers[2])
+
+
+def test_ranks_name_prefix_then_name_then_other_fields():
+    index = TextIndex(ROWS)
+    # Name prefix, then name substring, then city
+    assert index.search("roof") == ["roof-masters", "acme-roofing", "best-roofers", "sunny-solar"]
+    assert index.search("ROOF", limit=2, offset=1) == ["acme-roofing", "best-roofers"]
+    # Shorter than a trigram
+    assert index.search("Ac") == ["acme-roofing"]
+    assert index.search("austin") == ["acme-roofing", "best-roofers", "nameless", "quiet-plumbing"]
+    assert index.search("roofing,rep") == ["best-roofers"]
+
+
+def test_filters_and_updates_match_a_brute_force_scan():
+    index = TextIndex(ROWS)
+    filters = [TextFilter(), TextFilter(contact="any"), TextFilter(contact="both"), TextFilter(to_call=True),
+               TextFilter(item_type="venue")]
+    queries = ["r", "ro", "roof", "austin", ".test", "plumb", "solar"]
+    for text_filter in filters:
+        for query in queries:
+            assert index.search(query, text_filter) == _brute(ROWS, query, text_filter)
+
+    renamed = _row("acme-roofing", "Zeta Builders", "Austin")
+    added = _row("roofline", "Roofline Gutters", "Austin", has_email=True)
+    index.update(["acme-roofing", "roofline", "sunny-solar"], [renamed, added])
+    current = sorted([r for r in ROWS if r.slug not in ("acme-roofing", "sunny-solar")] + [renamed, added],
+                     key=lambda r: r.slug)
+    assert len(index) == len(current)
+    for text_filter in filters:
+        for query in queries + ["zeta", "gutter"]:
+            assert index.search(query, text_filter) == _brute(current, query, text_filter)
+
+
+def test_falls_back_to_trigram_similarity_for_typos():
+    index = TextIndex(ROWS)
+    assert index.search("plumbnig")[0] == "quiet-plumbing"
+    assert index.search("zzzz") == []
+
+
+def test_excluded_slugs_and_domains_are_left_out():
+    index = TextIndex(ROWS)
+    index.exclude(frozenset({"acme-roofing"}), frozenset({"roof-masters.test", "roofline.test"}))
+    assert index.search("roof") == ["best-roofers", "sunny-solar"]
+
+    index.update(["roofline"], [_row("roofline", "Roofline Gutters")])
+    assert index.search("roof") == ["best-roofers", "sunny-solar"]
+    index.exclude(frozenset(), frozenset())
+    assert index.search("roof") == ["roof-masters", "roofline", "acme-roofing", "best-roofers", "sunny-solar"]
@@ -0,0 +1,65 @@
+from datetime import datetime, UTC
+
+from cocli.models.campaigns.indexes.domains import WebsiteDomainCsv
+from cocli.models.campaigns.indexes.google_maps_prospect import GoogleMapsProspect
+from cocli.models.usv_codec import sanitize_usv_value
+
+
+def _prospect() -> GoogleMapsProspect:
+    return GoogleMapsProspect(
+        place_id="ChIJabcdefghijk1234567",
+        company_slug="acme-roofing",
+        name="Acme Roofing, Inc.",
+        phone="+1 (555) 123-4567",
+        website="https://acme.example.com/",
+        full_address="123 Main St, Austin, TX 78701",
+        reviews_count=12,
+        average_rating=4.5,
+        hours="Mon 9-5\r\nTue 9-5\x1fclosed\rWed",
+        created_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+        updated_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+    )
+
+
+def test_sanitize_matches_replace_chain():
+    for raw in ["plain", "a\r\nb", "a\r\r\nb\n\rc", "x\x1fy", ""]:
+        expected = (
+            raw.replace("\r\n", "<br>").replace("\n", "<br>").replace("\r", "<br>").replace("\x1f", " ")
+        )
+        assert sanitize_usv_value(raw) == expected
+
+
+def test_prospect_row_format_is_unchanged():
+    row = _prospect().to_usv()
+    cells = row.rstrip("\n").split("\x1f")
+
+    assert row.endswith("\n") and "\x1e" not in row
+    assert len(cells) == len(GoogleMapsProspect.model_fields)
+    assert cells[3] == "15551234567"
+    assert cells[4] == "2026-01-02T03:04:05+00:00"
+    assert "Mon 9-5<br>Tue 9-5 closed<br>Wed" in cells
+
+
+def test_trusted_parse_matches_validated_parse():
+    row = _prospect().to_usv()
+
+    validated = GoogleMapsProspect.from_usv(row)
+    trusted = GoogleMapsProspect.from_usv(row, trusted=True)
+
+    assert trusted.model_dump() == validated.model_dump()
+    assert trusted.to_usv() == row
+    assert isinstance(trusted.reviews_count, int)
+    assert trusted.created_at.tzinfo is not None
+
+
+def test_bulk_round_trip_with_lists_and_invalid_rows():
+    items = [
+        WebsiteDomainCsv(domain=f"site{i}.com", company_name="Co", tags=["a", "b;c"])
+        for i in range(3)
+    ]
+    lines = list(WebsiteDomainCsv.to_usv_many(items))
+    assert lines == [item.to_usv() for item in items]
+
+    parsed = list(WebsiteDomainCsv.from_usv_many(lines + ["\n", "\x1f\x1f\n"], trusted=True, skip_invalid=True))
+    assert [p.domain for p in parsed] == ["site0.com", "site1.com", "site2.com"]
+    assert parsed[0].tags == ["a", "b", "c"]
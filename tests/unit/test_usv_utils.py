@@ -0,0 +1,50 @@
+import io
+
+import pytest
+
+from cocli.utils.usv_utils import USVDictReader, USVReader
+
+CONTENT = "name\x1fcity\n\nacme\x1fAustin\x1e\nglobex\x1fDallas\x1einitech\x1fHouston"
+ROWS = [["name", "city"], ["acme", "Austin"], ["globex", "Dallas"], ["initech", "Houston"]]
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_binary_reader_handles_mixed_separators(tmp_path, use_mmap):
+    path = tmp_path / "mixed.usv"
+    path.write_text(CONTENT, encoding="utf-8")
+
+    with USVReader.open(path, use_mmap=use_mmap) as reader:
+        assert list(reader) == ROWS
+        assert reader.tell() == path.stat().st_size
+
+
+def test_text_reader_streams_across_small_chunks():
+    reader = USVReader(io.StringIO(CONTENT), chunk_size=3)
+    assert list(reader) == ROWS
+
+
+def test_binary_reader_small_chunks_and_seek(tmp_path):
+    path = tmp_path / "mixed.usv"
+    path.write_text(CONTENT, encoding="utf-8")
+
+    with open(path, "rb") as f:
+        reader = USVReader(f, use_mmap=False, chunk_size=4)
+        assert next(reader) == ROWS[0]
+        assert next(reader) == ROWS[1]
+        resume_at = reader.tell()
+        assert list(reader) == ROWS[2:]
+
+        reader.seek(resume_at)
+        assert list(reader) == ROWS[2:]
+
+    with USVReader.open(path, offset=resume_at) as resumed:
+        assert list(resumed) == ROWS[2:]
+
+
+def test_dict_reader_on_streaming_reader():
+    rows = list(USVDictReader(io.StringIO(CONTENT)))
+    assert rows[0] == {"name": "acme", "city": "Austin"}
+    assert len(rows) == 3
+
+    with pytest.raises(ValueError):
+        USVReader(io.StringIO(CONTENT), offset=10)
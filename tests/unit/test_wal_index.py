@@ -0,0 +1,149 @@
+import time
+import threading
+from unittest.mock import patch
+
+from cocli.core.paths import paths
+from cocli.core.wal import WalWriter, append_update, read_updates, read_updates_many, wal_index
+from cocli.core.wal_index import WalIndex, WalTail
+from cocli.models.companies.company import Company
+from cocli.models.wal.record import DatagramRecord
+
+
+def _raw(target: str, field: str, value: str, ts: str = "2026-01-01T00:00:00+00:00") -> str:
+    return DatagramRecord(
+        timestamp=ts, node_id="peer", campaign_name="test", target=target, field=field, value=value
+    ).to_usv()
+
+
+def test_index_tracks_local_and_external_appends(tmp_path):
+    with patch('cocli.core.paths.paths.root', tmp_path):
+        acme = tmp_path / "companies" / "acme"
+        globex = tmp_path / "companies" / "globex"
+
+        append_update(acme, "phone_number", "555-0199", campaign_name="test")
+        append_update(globex, "website_url", "https://globex.test", campaign_name="test")
+        assert [r.field for r in read_updates(acme)] == ["phone_number"]
+
+        # Indexed on write, no rescan needed
+        append_update(acme, "website_url", "https://acme.test", campaign_name="test")
+        assert len(wal_index().locations("companies/acme")) == 2
+
+        # Another process (or smart_sync) writes a journal behind our back
+        remote = paths.wal_remote_journal("peer")
+        remote.write_text(_raw("companies/globex", "name", "Globex") + _raw("companies/other", "name", "Other"))
+
+        results = read_updates_many([acme, globex])
+        assert [r.value for r in results[acme]] == ["555-0199", "https://acme.test"]
+        assert sorted(r.field for r in results[globex]) == ["name", "website_url"]
+
+        # A rewritten journal is forgotten and re-indexed
+        remote.write_text(_raw("companies/other", "name", "Other"))
+        assert [r.field for r in read_updates(globex)] == ["website_url"]
+
+
+def test_tail_only_reads_complete_new_records(tmp_path):
+    journal = tmp_path / "20260101_peer.usv"
+    first = _raw("companies/a", "f", "1")
+    second = _raw("companies/a", "f", "2")
+    journal.write_text(first + second[:10])
+
+    tail = WalTail(tmp_path)
+    assert [r.value for r in tail.read_new()] == ["1"]
+
+    with open(journal, "a") as f:
+        f.write(second[10:])
+    assert [r.value for r in tail.read_new()] == ["2"]
+    assert tail.read_new() == []
+    assert tail.offset(journal.name) == len((first + second).encode("utf-8"))
+
+
+def test_wal_writer_group_commits_batches(tmp_path):
+    with patch('cocli.core.paths.paths.root', tmp_path):
+        company_dir = tmp_path / "companies" / "acme"
+        writer = WalWriter(max_records=3, flush_interval=None)
+
+        with writer:
+            writer.append(company_dir, "a", "1", campaign_name="test")
+            writer.append(company_dir, "b", "2", campaign_name="test")
+            assert not paths.wal.exists()
+            writer.append(company_dir, "c", "3", campaign_name="test")
+            # Size threshold commits inside the batch
+            assert writer.commits == 1 and len(writer) == 0
+            writer.append(company_dir, "d", "4", campaign_name="test")
+            assert len(writer) == 1
+
+        assert writer.commits == 2
+        assert [r.field for r in read_updates(company_dir)] == ["a", "b", "c", "d"]
+        assert len(list(paths.wal.glob("*.usv"))) == 1
+
+
+def test_wal_writer_time_threshold(tmp_path):
+    with patch('cocli.core.paths.paths.root', tmp_path):
+        writer = WalWriter(flush_interval=0.05, fsync=True)
+        writer.append(tmp_path / "companies" / "acme", "a", "1", campaign_name="test")
+        assert len(writer) == 1
+
+        deadline = time.monotonic() + 2
+        while len(writer) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(writer) == 0
+        writer.close()
+
+
+def test_read_skips_only_the_malformed_record(tmp_path):
+    journal = tmp_path / "20260101_peer.usv"
+    journal.write_text(
+        _raw("companies/a", "f", "1") + _raw("companies/b", "f", "corrupt") + _raw("companies/a", "f", "2")
+        + _raw("companies/b", "f", "3")
+    )
+    parse = DatagramRecord.from_usv
+
+    def from_usv(raw: str) -> DatagramRecord:
+        if "corrupt" in raw:
+            raise ValueError("corrupt record")
+        return parse(raw)
+
+    index = WalIndex(tmp_path)
+    with patch.object(DatagramRecord, "from_usv", side_effect=from_usv):
+        results = index.read(["companies/a", "companies/b"])
+    assert [r.value for r in results["companies/a"]] == ["1", "2"]
+    assert [r.value for r in results["companies/b"]] == ["3"]
+
+
+def test_wal_writer_batches_are_per_thread(tmp_path):
+    with patch('cocli.core.paths.paths.root', tmp_path):
+        company_dir = tmp_path / "companies" / "acme"
+        writer = WalWriter(flush_interval=None, autocommit=True)
+
+        with writer:
+            writer.append(company_dir, "a", "1", campaign_name="test")
+            assert len(writer) == 1
+
+            # Another thread without a batch of its own commits right away
+            other = threading.Thread(target=writer.append, args=(company_dir, "b", "2"), kwargs={"campaign_name": "test"})
+            other.start()
+            other.join()
+            assert len(writer) == 0
+
+        assert [r.field for r in read_updates(company_dir)] == ["a", "b"]
+
+
+def test_company_saves_stay_out_of_the_wal(mock_cocli_env):
+    company_dir = paths.companies / "acme"
+    Company(name="Acme", slug="acme").save(email_sync=False)
+
+    company = Company.from_directory(company_dir)
+    assert company is not None
+    company.website_url = "https://one.test/"
+    company.save(email_sync=False)
+    assert read_updates(company_dir) == []
+
+    # Hand edits and cleared fields survive the next load
+    index_path = company_dir / "_index.md"
+    index_path.write_text(index_path.read_text().replace("https://one.test/", "https://three.test/"))
+    company = Company.from_directory(company_dir)
+    assert company is not None and company.website_url == "https://three.test/"
+    company.website_url = None
+    company.save(email_sync=False)
+    reloaded = Company.from_directory(company_dir)
+    assert reloaded is not None and reloaded.website_url is None